@@ -6,31 +6,58 @@ Claude Code SubAgent - Backend Agent
 """
 
 import sys
+import glob
+import time
+import shlex
+import fnmatch
 import argparse
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 # 프로젝트 루트 경로를 sys.path에 추가
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root / 'scripts'))
 
 from config import get_config
+from tracing import init_tracing, span
+from sandbox import failure_reason, sandbox_from_config
+from step_cache import git_tree_hash
+from diff_stats import changed_paths, diff_stats, workspace_excludes
+from build_cache import BuildCache, build_key, collect_artifacts, detect_build, toolchain_fingerprint
+from base_agent import BaseAgent, ProgressCallback, checkpoint_progress
 
 
-class BackendAgent:
+class BackendAgent(BaseAgent):
     """백엔드 개발 자동화 에이전트"""
 
-    def __init__(self, ticket_id: str, context: Dict[str, Any]):
+    step_name = "backend_dev"
+
+    SUB_STEPS = [
+        ("requirements", "_analyze_requirements"),
+        ("code", "_write_code"),
+        ("build", "_build_project"),
+    ]
+
+    def __init__(
+        self,
+        ticket_id: str,
+        context: Dict[str, Any],
+        sub_steps: Optional[Dict[str, Dict[str, Any]]] = None,
+        on_progress: Optional[ProgressCallback] = None
+    ):
         """
         Backend Agent 초기화
 
         Args:
             ticket_id: JIRA 티켓 ID
             context: JIRA 티켓 정보 및 메타데이터
+            sub_steps: 이전 실행의 하위 단계 상태 (재개 시)
+            on_progress: 하위 단계 진행 상황 콜백
         """
-        self.ticket_id = ticket_id
+        super().__init__(ticket_id, sub_steps, on_progress)
         self.context = context
         self.config = get_config()
+        self.workdir = Path('.')
 
         # JIRA 정보 추출
         self.summary = context.get('summary', '')
@@ -53,14 +80,8 @@ class BackendAgent:
         print("=" * 60)
 
         try:
-            # 1. 요구사항 분석
-            self._analyze_requirements()
-
-            # 2. 코드 작성
-            self._write_code()
-
-            # 3. 로컬 빌드
-            self._build_project()
+            # 1~3. 요구사항 분석, 코드 작성, 로컬 빌드 (완료된 하위 단계는 건너뜀)
+            self.run_sub_steps()
 
             print("\n✅ Backend 개발 완료!")
             return True
@@ -69,7 +90,7 @@ class BackendAgent:
             print(f"\n❌ Backend 개발 실패: {e}")
             return False
 
-    def _analyze_requirements(self):
+    def _analyze_requirements(self) -> Dict[str, Any]:
         """JIRA 티켓 기반 요구사항 분석"""
         print("\n[1/3] 요구사항 분석 중...")
 
@@ -88,7 +109,9 @@ class BackendAgent:
         print(f"   작업 타입: {work_type}")
         print(f"   요구사항: {self.description[:100]}...")
 
-    def _write_code(self):
+        return {'work_type': work_type}
+
+    def _write_code(self) -> Dict[str, Any]:
         """코드 작성"""
         print("\n[2/3] 코드 작성 중...")
 
@@ -103,15 +126,111 @@ class BackendAgent:
         print("   ✅ Repository 레이어 구현")
         print("   ✅ DTO/Entity 클래스 생성")
 
-    def _build_project(self):
-        """프로젝트 빌드"""
-        print("\n[3/3] 프로젝트 빌드 중...")
+        return {}
+
+    def _docs_only(self) -> Optional[List[str]]:
+        """
+        베이스 브랜치 대비 변경 파일이 모두 BUILD_SKIP_PATTERNS 에 해당하면 그 목록
+
+        Returns:
+            변경 파일 목록 (문서 전용 변경이 아니거나 비교할 수 없으면 None)
+        """
+        settings = self.config.build
+        stats = diff_stats(
+            self.workdir,
+            settings.base_branch,
+            exclude=workspace_excludes(self.config),
+            cache_dir=self.config.step_cache_dir
+        )
+        if not stats or not stats['files']:
+            return None
+
+        paths = changed_paths(stats)
+        if all(any(fnmatch.fnmatch(path, pattern) for pattern in settings.skip_patterns) for path in paths):
+            return paths
+        return None
+
+    def _build_project(self) -> Dict[str, Any]:
+        """
+        프로젝트 빌드 (빌드 캐시 적중 시 산출물만 복원)
 
-        # TODO: 실제 빌드 명령 실행
-        # - Gradle/Maven 빌드
-        # - 컴파일 오류 확인
+        캐시 키는 소스 tree 해시 + 툴체인 버전 + 빌드 명령/산출물 설정이므로,
+        재실행/--restart/같은 소스의 다른 티켓은 빌드하지 않고 저장된 산출물을 씁니다.
+        """
+        print("\n[3/3] 프로젝트 빌드 중...")
 
-        print("   ✅ 빌드 성공")
+        settings = self.config.build
+
+        docs = self._docs_only()
+        if docs is not None:
+            print(f"   ⏭️  문서만 변경됨 ({len(docs)}개 파일) - 빌드 생략")
+            return {'success': True, 'skipped': 'docs_only', 'files': docs[:20]}
+
+        detected = detect_build(self.workdir)
+        command = settings.command or (detected[0] if detected else None)
+        if not command:
+            print("   ⏭️  빌드 파일 없음 (BUILD_CMD, gradlew, build.gradle, pom.xml) - 빌드 생략")
+            return {'success': True, 'skipped': 'no_build'}
+        artifacts = settings.artifacts or (detected[1] if detected else [])
+
+        cache = key = None
+        if settings.cache_enabled:
+            cache = BuildCache(settings.cache_dir, settings.cache_max_mb * 1024 * 1024, settings.shared_cache_dir)
+            # 산출물 디렉토리(build/, target/)는 빌드 결과이므로 소스 해시에서 제외
+            roots = {pattern.split('/', 1)[0] for pattern in artifacts if '/' in pattern}
+            outputs = [self.workdir / root for root in sorted(roots) if not glob.has_magic(root)]
+            tree = git_tree_hash(self.workdir, exclude=workspace_excludes(self.config) + outputs)
+            if tree is not None:
+                key = build_key(tree, toolchain_fingerprint(settings.toolchain_commands), command, artifacts)
+                entry = cache.get(key)
+                if entry is not None:
+                    restored = cache.restore(key, self.workdir)
+                    print(
+                        f"   ♻️  빌드 캐시 적중 ({key[:12]}): 산출물 {len(restored)}개 복원, "
+                        f"빌드 {entry['duration_seconds']}초 생략"
+                    )
+                    return {
+                        'success': True,
+                        'cached': True,
+                        'key': key,
+                        'command': command,
+                        'artifacts': restored,
+                        'saved_seconds': entry['duration_seconds'],
+                    }
+
+        print(f"   $ {command}")
+        started = time.monotonic()
+        # 빌드 출력은 로그 파일로 흘려 쓰고 끝부분만 메모리에 (BUILD_TIMEOUT 초과 시 프로세스 그룹 종료)
+        result = sandbox_from_config(self.config).run(
+            shlex.split(command),
+            cwd=self.workdir,
+            timeout=settings.timeout,
+            name=f"build-{self.ticket_id}"
+        )
+        duration = round(time.monotonic() - started, 3)
+
+        if not result['success']:
+            tail = (result['stdout'] + result['stderr']).strip().splitlines()[-20:]
+            for line in tail:
+                print(f"   | {line}")
+            print(f"   📄 빌드 로그: {result['log']}")
+            raise RuntimeError(f"빌드 실패 ({failure_reason(result)}): {command}")
+
+        built = collect_artifacts(self.workdir, artifacts)
+        print(f"   ✅ 빌드 성공 ({duration}초), 산출물 {len(built)}개")
+
+        if cache is not None and key is not None:
+            size = cache.put(key, self.workdir, built, {'command': command, 'duration_seconds': duration})
+            print(f"   💾 빌드 캐시 저장 ({key[:12]}, {size / 1024 / 1024:.1f}MB)")
+
+        return {
+            'success': True,
+            'cached': False,
+            'key': key,
+            'command': command,
+            'artifacts': built,
+            'duration_seconds': duration,
+        }
 
 
 def main():
@@ -123,6 +242,7 @@ def main():
     parser.add_argument("--summary", default="", help="티켓 요약")
     parser.add_argument("--description", default="", help="티켓 설명")
     parser.add_argument("--labels", default="", help="라벨 (콤마 구분)")
+    parser.add_argument("--resume", action="store_true", help="완료된 하위 단계 건너뛰기")
 
     args = parser.parse_args()
 
@@ -132,8 +252,15 @@ def main():
         'labels': args.labels.split(',') if args.labels else []
     }
 
-    agent = BackendAgent(args.ticket_id, context)
-    success = agent.run()
+    # MainAgent가 TRACEPARENT로 넘겨준 컨텍스트가 있으면 그 아래에 span 기록
+    init_tracing('backend-agent')
+
+    sub_steps, on_progress = checkpoint_progress(
+        args.ticket_id, BackendAgent.step_name, get_config().checkpoint_dir, resume=args.resume
+    )
+    agent = BackendAgent(args.ticket_id, context, sub_steps, on_progress)
+    with span('agent.backend', **{'workflow.ticket_id': args.ticket_id}):
+        success = agent.run()
 
     sys.exit(0 if success else 1)
 
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Claude Code SubAgent - Base Agent
+
+SubAgent 공통 인터페이스 (하위 단계 체크포인트)
+
+각 SubAgent는 SUB_STEPS 에 하위 단계를 실행 순서대로 선언하고,
+하위 단계 메서드는 결과(output) 딕셔너리를 반환합니다.
+진행 상황은 체크포인트의 steps.<단계>.sub_steps 에 기록되며,
+재개 시 완료된 하위 단계는 저장된 결과만 다시 적용하고 건너뜁니다.
+PARALLEL_SUB_STEPS 에 선언된 하위 단계가 연속으로 나오면 스레드로 동시에 실행합니다.
+
+    {
+        "steps": {
+            "qa_test": {
+                "status": "failed",
+                "sub_steps": {
+                    "unit": {"status": "completed", "output": {...}, "duration_seconds": 12.3},
+                    "integration": {"status": "failed", "error": "..."}
+                }
+            }
+        }
+    }
+"""
+
+import sys
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# 프로젝트 루트 경로를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / 'scripts'))
+
+import timeline
+from tracing import span
+
+# 하위 단계 상태 (MainAgent WorkflowStatus와 같은 값)
+SUB_STEP_IN_PROGRESS = "in_progress"
+SUB_STEP_COMPLETED = "completed"
+SUB_STEP_FAILED = "failed"
+
+# 진행 상황 콜백: 하위 단계 상태 딕셔너리 전체를 전달
+ProgressCallback = Callable[[Dict[str, Dict[str, Any]]], None]
+
+
+class BaseAgent:
+    """하위 단계 체크포인트를 지원하는 SubAgent 기반 클래스"""
+
+    # MainAgent 단계 이름 (state["steps"]의 키)
+    step_name: str = ""
+
+    # (하위 단계 이름, 메서드 이름) 실행 순서대로
+    SUB_STEPS: List[Tuple[str, str]] = []
+
+    # 서로 독립적이라 동시에 실행해도 되는 하위 단계 이름
+    PARALLEL_SUB_STEPS: Tuple[str, ...] = ()
+
+    def __init__(
+        self,
+        ticket_id: str,
+        sub_steps: Optional[Dict[str, Dict[str, Any]]] = None,
+        on_progress: Optional[ProgressCallback] = None
+    ):
+        """
+        Base Agent 초기화
+
+        Args:
+            ticket_id: JIRA 티켓 ID
+            sub_steps: 이전 실행의 하위 단계 상태 (재개 시)
+            on_progress: 하위 단계 상태가 바뀔 때마다 호출되는 콜백 (체크포인트 저장)
+        """
+        self.ticket_id = ticket_id
+        self.sub_steps: Dict[str, Dict[str, Any]] = dict(sub_steps or {})
+        self.on_progress = on_progress
+        self._lock = threading.RLock()
+
+    def run_sub_steps(self) -> None:
+        """
+        선언된 하위 단계를 순서대로 실행 (완료된 하위 단계는 건너뜀)
+
+        PARALLEL_SUB_STEPS 에 속한 하위 단계가 연속으로 대기 중이면 함께 실행하고,
+        모두 끝난 뒤 다음 하위 단계로 넘어갑니다.
+
+        Raises:
+            Exception: 하위 단계에서 발생한 예외 (실패로 기록 후 다시 던짐)
+        """
+        total = len(self.SUB_STEPS)
+        group: List[Tuple[str, str]] = []
+
+        for index, (name, method_name) in enumerate(self.SUB_STEPS, 1):
+            previous = self.sub_steps.get(name, {})
+            if previous.get("status") == SUB_STEP_COMPLETED:
+                print(f"\n⏭️  [{index}/{total}] {name} 이미 완료됨 - 건너뜀")
+                self._apply_sub_step(name, previous.get("output"))
+                continue
+
+            parallel = name in self.PARALLEL_SUB_STEPS
+            if group and not (parallel and group[-1][0] in self.PARALLEL_SUB_STEPS):
+                self._run_group(group)
+                group = []
+            group.append((name, method_name))
+
+        if group:
+            self._run_group(group)
+
+    def _run_group(self, group: List[Tuple[str, str]]) -> None:
+        """하위 단계 묶음 실행 (2개 이상이면 동시에 실행, 첫 번째 예외를 다시 던짐)"""
+        if len(group) == 1:
+            self._run_sub_step(*group[0])
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=len(group),
+            thread_name_prefix=self.step_name or "substep"
+        ) as executor:
+            # 하위 단계 span 이 현재 span 아래에 기록되도록 컨텍스트 복사
+            futures = [
+                executor.submit(contextvars.copy_context().run, self._run_sub_step, name, method_name)
+                for name, method_name in group
+            ]
+            errors = [future.exception() for future in futures]
+
+        for error in errors:
+            if error is not None:
+                raise error
+
+    def _run_sub_step(self, name: str, method_name: str) -> None:
+        """하위 단계 하나 실행 후 상태 기록"""
+        self._record(name, SUB_STEP_IN_PROGRESS)
+        try:
+            with timeline.span(f"{self.step_name}.{name}", 'substep'), span(
+                f"agent.substep {name}",
+                **{'workflow.ticket_id': self.ticket_id, 'workflow.step': self.step_name}
+            ):
+                output = getattr(self, method_name)()
+        except Exception as e:
+            self._record(name, SUB_STEP_FAILED, error=str(e))
+            raise
+
+        with self._lock:
+            self._apply_sub_step(name, output)
+            status = SUB_STEP_COMPLETED if self._sub_step_succeeded(name, output) else SUB_STEP_FAILED
+            self._record(name, status, output=output)
+
+    def outputs(self) -> Dict[str, Any]:
+        """완료된 하위 단계의 결과 (MainAgent 단계 출력/캐시용)"""
+        return {name: entry.get("output") for name, entry in self.sub_steps.items()}
+
+    def _apply_sub_step(self, name: str, output: Optional[Dict[str, Any]]) -> None:
+        """하위 단계 결과를 에이전트 상태에 반영 (실행 직후와 재개 시 모두 호출)"""
+
+    def _sub_step_succeeded(self, name: str, output: Optional[Dict[str, Any]]) -> bool:
+        """하위 단계 성공 여부 (실패한 하위 단계는 재개 시 다시 실행)"""
+        return True
+
+    def _record(
+        self,
+        name: str,
+        status: str,
+        error: Optional[str] = None,
+        output: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """하위 단계 상태 기록 후 진행 상황 콜백 호출 (동시 실행 중에도 순서대로 저장)"""
+        with self._lock:
+            now = datetime.now()
+            entry = self.sub_steps.get(name, {})
+
+            if status == SUB_STEP_IN_PROGRESS:
+                entry = {"status": status, "started_at": now.isoformat()}
+            else:
+                entry = dict(entry, status=status, error=error, output=output, ended_at=now.isoformat())
+                if entry.get("started_at"):
+                    started = datetime.fromisoformat(entry["started_at"])
+                    entry["duration_seconds"] = round((now - started).total_seconds(), 3)
+
+            self.sub_steps[name] = entry
+
+            if self.on_progress:
+                self.on_progress(dict(self.sub_steps))
+
+
+def checkpoint_progress(
+    ticket_id: str,
+    step_name: str,
+    checkpoint_dir: str,
+    resume: bool = False
+) -> Tuple[Dict[str, Dict[str, Any]], ProgressCallback]:
+    """
+    SubAgent 단독 실행용 체크포인트 연동
+
+    MainAgent 없이 SubAgent를 직접 실행할 때 같은 체크포인트 파일의
+    steps.<step_name>.sub_steps 를 읽고 씁니다.
+
+    Args:
+        ticket_id: JIRA 티켓 ID
+        step_name: MainAgent 단계 이름
+        checkpoint_dir: 체크포인트 디렉토리
+        resume: 이전 하위 단계 상태를 이어받을지 여부
+
+    Returns:
+        (이전 하위 단계 상태, 진행 상황 콜백)
+    """
+    import json
+
+    checkpoint_file = Path(checkpoint_dir) / f"{ticket_id}.json"
+
+    def load_state() -> Dict[str, Any]:
+        if not checkpoint_file.exists():
+            return {"ticket_id": ticket_id, "steps": {}}
+        with open(checkpoint_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    previous: Dict[str, Dict[str, Any]] = {}
+    if resume:
+        previous = load_state().get("steps", {}).get(step_name, {}).get("sub_steps", {})
+
+    def save(sub_steps: Dict[str, Dict[str, Any]]) -> None:
+        state = load_state()
+        state.setdefault("steps", {}).setdefault(step_name, {})["sub_steps"] = sub_steps
+        state["updated_at"] = datetime.now().isoformat()
+
+        checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(checkpoint_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2, ensure_ascii=False)
+
+    return previous, save
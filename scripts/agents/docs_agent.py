@@ -3,39 +3,80 @@
 Claude Code SubAgent - Docs Agent
 
 자동 문서화를 수행하는 에이전트
+
+API/코드 문서는 마지막 문서 빌드 이후 바뀐 모듈만 다시 분석하고 해당 페이지만 다시 씁니다 (docs_builder).
 """
 
 import sys
 import argparse
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 # 프로젝트 루트 경로를 sys.path에 추가
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root / 'scripts'))
 
 from config import get_config
+from tracing import init_tracing, span
+from diff_stats import merge_base, workspace_excludes
+from changelog import build_changelog, write_section
+from docs_builder import DocsBuilder, endpoint_table, write_if_changed
+from base_agent import BaseAgent, ProgressCallback, checkpoint_progress
+
+# README 에서 API 엔드포인트 표로 바꿔 쓸 구간
+README_API_START = '<!-- tkm:api-start -->'
+README_API_END = '<!-- tkm:api-end -->'
 
 
-class DocsAgent:
+class DocsAgent(BaseAgent):
     """문서화 자동화 에이전트"""
 
-    def __init__(self, ticket_id: str, context: Dict[str, Any]):
+    step_name = "documentation"
+
+    SUB_STEPS = [
+        ("api_docs", "_generate_api_docs"),
+        ("code_docs", "_generate_code_docs"),
+        ("readme", "_update_readme"),
+        ("changelog", "_write_changelog"),
+    ]
+
+    # API/코드 문서는 같은 분석 결과를 쓰므로 동시에 실행 (분석은 한 번만)
+    PARALLEL_SUB_STEPS = ("api_docs", "code_docs")
+
+    def __init__(
+        self,
+        ticket_id: str,
+        context: Dict[str, Any],
+        sub_steps: Optional[Dict[str, Dict[str, Any]]] = None,
+        on_progress: Optional[ProgressCallback] = None
+    ):
         """
         Docs Agent 초기화
 
         Args:
             ticket_id: JIRA 티켓 ID
             context: 워크플로우 컨텍스트 정보
+            sub_steps: 이전 실행의 하위 단계 상태 (재개 시)
+            on_progress: 하위 단계 진행 상황 콜백
         """
-        self.ticket_id = ticket_id
+        super().__init__(ticket_id, sub_steps, on_progress)
         self.context = context
         self.config = get_config()
 
         # 문서 생성 경로
-        self.docs_dir = Path("docs")
+        self.docs_dir = Path(self.config.docs.dir)
         self.docs_dir.mkdir(exist_ok=True)
 
+        # API/코드 문서 공유: 변경 모듈 분석과 프로세스 풀은 처음 필요할 때 한 번만 준비
+        self.workdir = Path('.')
+        self._builder: Optional[DocsBuilder] = None
+        self._scan: Optional[Dict[str, Any]] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._prepare_lock = threading.Lock()
+
     def run(self) -> bool:
         """
         문서화 실행
@@ -50,17 +91,12 @@ class DocsAgent:
         print("=" * 60)
 
         try:
-            # 1. API 문서 생성
-            self._generate_api_docs()
+            # 1~4. API 문서, 코드 문서, README, 변경 로그 (완료된 하위 단계는 건너뜀)
+            self.run_sub_steps()
 
-            # 2. README 업데이트
-            self._update_readme()
-
-            # 3. 변경 로그 작성
-            self._write_changelog()
-
-            # 4. Javadoc/JSDoc 생성
-            self._generate_code_docs()
+            # 다음 빌드의 비교 기준 (모든 하위 단계가 성공했을 때만 저장)
+            if self._builder is not None:
+                self._builder.save_manifest()
 
             print("\n✅ 문서화 완료!")
             return True
@@ -69,67 +105,139 @@ class DocsAgent:
             print(f"\n❌ 문서화 실패: {e}")
             return False
 
-    def _generate_api_docs(self):
-        """API 문서 생성"""
-        print("\n[1/4] API 문서 생성 중...")
-
-        # TODO: API 문서 자동 생성
-        # - Swagger/OpenAPI Spec
-        # - Postman Collection
-        # - API Blueprint
-
-        print("   ✅ API 문서 생성 완료")
-        print("   - Swagger UI: /api/swagger-ui")
-        print("   - OpenAPI Spec: /api/openapi.json")
-
-    def _update_readme(self):
-        """README 업데이트"""
-        print("\n[2/4] README 업데이트 중...")
-
-        # TODO: README.md 업데이트
-        # - 새로운 기능 추가
-        # - 사용 예시 업데이트
-        # - 설치/실행 가이드 업데이트
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        """분석용 프로세스 풀 (바뀐 모듈이 많을 때만 생성)"""
+        if self._executor is None:
+            # 하위 단계 스레드가 도는 중에 fork 하지 않도록 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.config.docs.max_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return self._executor
+
+    def _changed_modules(self) -> DocsBuilder:
+        """마지막 문서 빌드 이후 바뀐 모듈 분석 (하위 단계 간 한 번만)"""
+        with self._prepare_lock:
+            if self._builder is None:
+                settings = self.config.docs
+                builder = DocsBuilder(
+                    self.workdir,
+                    settings.dir,
+                    settings.cache_dir,
+                    settings.source_patterns,
+                    exclude_patterns=settings.exclude_patterns,
+                    exclude=workspace_excludes(self.config),
+                    max_workers=settings.max_workers
+                )
+                self._scan = builder.scan(self._process_pool)
+                print(
+                    f"   🔍 모듈 {self._scan['modules']}개 중 변경 {self._scan['changed']}개 "
+                    f"(분석 {self._scan['analyzed']}개, 캐시 {self._scan['cached']}개), 삭제 {self._scan['removed']}개"
+                )
+                self._builder = builder
+            return self._builder
+
+    def _generate_api_docs(self) -> Dict[str, Any]:
+        """API 문서 생성 (엔드포인트가 바뀐 소스의 페이지만)"""
+        print(f"\n[1/{len(self.SUB_STEPS)}] API 문서 생성 중...")
+
+        result = self._changed_modules().write_api_docs(self.config.docs.api_title)
+
+        api_dir = self.docs_dir / 'api'
+        print(
+            f"   ✅ API 문서 생성 완료: 엔드포인트 {result['endpoints']}개, "
+            f"페이지 {result['written']}개 갱신, {result['removed']}개 삭제"
+        )
+        print(f"   - OpenAPI Spec: {api_dir / 'openapi.json'}")
+
+        return dict(result, openapi_spec=str(api_dir / 'openapi.json'))
+
+    def _generate_code_docs(self) -> Dict[str, Any]:
+        """코드 문서 생성 (바뀐 모듈의 페이지만)"""
+        print(f"\n[2/{len(self.SUB_STEPS)}] 코드 문서 생성 중...")
+
+        builder = self._changed_modules()
+        result = builder.write_code_docs()
+
+        print(
+            f"   ✅ 코드 문서 생성 완료: 페이지 {result['written']}개 갱신, {result['removed']}개 삭제"
+        )
+        for path in result['errors'][:10]:
+            print(f"   ⚠️  분석 실패: {path} ({builder.modules[path]['error']})")
+        print(f"   - 모듈 목록: {self.docs_dir / 'code' / 'index.md'}")
+
+        return dict(
+            self._scan,
+            written=result['written'],
+            removed_pages=result['removed'],
+            errors=result['errors'],
+            index=str(self.docs_dir / 'code' / 'index.md')
+        )
+
+    def _update_readme(self) -> Dict[str, Any]:
+        """README 업데이트 (API 엔드포인트 표 구간)"""
+        print(f"\n[3/{len(self.SUB_STEPS)}] README 업데이트 중...")
 
         readme_path = Path("README.md")
-        if readme_path.exists():
-            print("   ✅ README.md 업데이트 완료")
-        else:
+        if not readme_path.exists():
             print("   ℹ️  README.md 없음 - 건너뜀")
-
-    def _write_changelog(self):
-        """변경 로그 작성"""
-        print("\n[3/4] 변경 로그 작성 중...")
-
-        # TODO: CHANGELOG.md 업데이트
-        # - Git 커밋 메시지 기반 변경사항 추출
-        # - 버전별 변경사항 정리
-
-        changelog_entry = f"""
-## [{self.ticket_id}] - 2025-11-07
-
-### Added
-- 새로운 기능 추가
-
-### Changed
-- 기존 기능 개선
-
-### Fixed
-- 버그 수정
-"""
-        print("   ✅ CHANGELOG.md 작성 완료")
-
-    def _generate_code_docs(self):
-        """코드 문서 생성"""
-        print("\n[4/4] 코드 문서 생성 중...")
-
-        # TODO: 코드 문서 자동 생성
-        # - Javadoc (Java)
-        # - JSDoc (JavaScript/TypeScript)
-        # - Sphinx (Python)
-
-        print("   ✅ 코드 문서 생성 완료")
-        print("   - Javadoc: docs/javadoc/")
+            return {'updated': False}
+
+        text = readme_path.read_text(encoding='utf-8')
+        start, end = text.find(README_API_START), text.find(README_API_END)
+        if start < 0 or end < start:
+            print(f"   ℹ️  README.md 에 {README_API_START} ... {README_API_END} 구간 없음 - 건너뜀")
+            return {'updated': False}
+
+        table = '\n'.join(endpoint_table(self._changed_modules().endpoints()))
+        updated = write_if_changed(
+            readme_path,
+            f"{text[:start + len(README_API_START)]}\n{table}\n{text[end:]}"
+        )
+        print(f"   ✅ README.md {'업데이트 완료' if updated else '변경 없음'}")
+
+        return {'updated': updated}
+
+    def _write_changelog(self) -> Dict[str, Any]:
+        """변경 로그 작성 (베이스 브랜치 이후 커밋을 티켓/유형별로 묶어 CHANGELOG.md 맨 위에 기록)"""
+        print(f"\n[4/{len(self.SUB_STEPS)}] 변경 로그 작성 중...")
+
+        settings = self.config.docs
+        base = merge_base(self.workdir, settings.changelog_base_branch)
+        if base is None:
+            print(f"   ℹ️  베이스 브랜치({settings.changelog_base_branch})와 비교할 수 없음 - 건너뜀")
+            return {'updated': False}
+
+        known = {}
+        if self.context.get('summary'):
+            known[self.ticket_id] = {'summary': self.context['summary']}
+
+        result = build_changelog(
+            self.workdir,
+            base,
+            'HEAD',
+            title=self.ticket_id,
+            projects=settings.changelog_projects,
+            default_ticket=self.ticket_id,
+            known_summaries=known
+        )
+        updated = write_section(Path(settings.changelog_path), result['markdown'])
+
+        print(
+            f"   ✅ {settings.changelog_path} {'작성 완료' if updated else '변경 없음'}: "
+            f"커밋 {result['commits']}개, 티켓 {len(result['tickets'])}개 ({result['duration_seconds']}초)"
+        )
+
+        return {
+            'path': settings.changelog_path,
+            'updated': updated,
+            'commits': result['commits'],
+            'tickets': result['tickets'],
+        }
 
 
 def main():
@@ -138,12 +246,20 @@ def main():
         description="Claude Code SubAgent - Documentation Agent"
     )
     parser.add_argument("ticket_id", help="JIRA 티켓 ID")
+    parser.add_argument("--resume", action="store_true", help="완료된 하위 단계 건너뛰기")
 
     args = parser.parse_args()
 
     context = {}
-    agent = DocsAgent(args.ticket_id, context)
-    success = agent.run()
+    # MainAgent가 TRACEPARENT로 넘겨준 컨텍스트가 있으면 그 아래에 span 기록
+    init_tracing('docs-agent')
+
+    sub_steps, on_progress = checkpoint_progress(
+        args.ticket_id, DocsAgent.step_name, get_config().checkpoint_dir, resume=args.resume
+    )
+    agent = DocsAgent(args.ticket_id, context, sub_steps, on_progress)
+    with span('agent.docs', **{'workflow.ticket_id': args.ticket_id}):
+        success = agent.run()
 
     sys.exit(0 if success else 1)
 
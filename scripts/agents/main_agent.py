@@ -9,15 +9,23 @@ import sys
 import os
 import json
 import argparse
+import time
+from contextlib import nullcontext
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional, Tuple
 
 # 프로젝트 루트 경로를 sys.path에 추가
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root / 'scripts'))
 
 from config import get_config
+from step_cache import StepCache, git_tree_hash, input_key
+from diff_stats import merge_base, workspace_excludes
+from tracing import init_tracing, span
+import metrics
+import timeline
+from resource_monitor import ResourceMonitor, format_table
 
 
 class WorkflowStatus:
@@ -32,7 +40,24 @@ class WorkflowStatus:
 class MainAgent:
     """메인 오케스트레이션 에이전트"""
 
-    def __init__(self, ticket_id: str, resume: bool = False, restart: bool = False):
+    # 단계별 캐시 입력 선언 (ticket: 티켓 ID/필드, tree: Git 작업 트리, base: 베이스 브랜치 merge-base,
+    # config: 품질/테스트 설정)
+    # 여기 없는 단계는 외부 상태를 바꾸거나 조회하므로 매번 실행
+    # (documentation 은 결과가 작업 디렉토리에 쓰는 파일이라 캐시 출력만으로 복원할 수 없음)
+    CACHEABLE_STEPS = {
+        "qa_test": ("tree", "base", "config"),
+        "code_review": ("tree", "base", "config"),
+    }
+
+    def __init__(
+        self,
+        ticket_id: str,
+        resume: bool = False,
+        restart: bool = False,
+        trace: bool = False,
+        use_cache: bool = True,
+        workspace: Optional[str] = None
+    ):
         """
         Main Agent 초기화
 
@@ -40,19 +65,32 @@ class MainAgent:
             ticket_id: JIRA 티켓 ID (예: FINOPS-350)
             resume: 체크포인트에서 재개 여부
             restart: 처음부터 재시작 여부
+            trace: Chrome trace-event 타임라인 기록 여부
+            use_cache: 입력 해시가 같은 단계의 이전 결과 재사용 여부
+            workspace: 대여한 작업 디렉토리 이름 (체크포인트에 기록해 --resume 때 다시 빌림)
         """
         self.ticket_id = ticket_id
         self.resume = resume
         self.restart = restart
+        self.trace = trace
         self.config = get_config()
 
         # 체크포인트 파일 경로
         self.checkpoint_dir = Path(self.config.checkpoint_dir)
         self.checkpoint_dir.mkdir(exist_ok=True)
         self.checkpoint_file = self.checkpoint_dir / f"{ticket_id}.json"
+        self.trace_file = timeline.trace_path(self.checkpoint_dir, ticket_id)
+
+        # 단계 캐시 (입력 해시 → 출력)
+        self.repo_path = Path('.')
+        self.step_cache = (
+            StepCache(self.config.step_cache_dir)
+            if use_cache and self.config.step_cache_enabled else None
+        )
 
         # 워크플로우 상태
         self.state = self._load_checkpoint() if resume else self._init_state()
+        self.state["metadata"]["workspace"] = workspace
 
         # Agent 활성화 상태
         self.agents_enabled = {
@@ -84,7 +122,10 @@ class MainAgent:
                 "jira_description": None,
                 "jira_labels": [],
                 "pr_url": None,
-            }
+                "workspace": None,
+            },
+            # 단계별 출력 (단계 캐시에 저장/복원되는 값)
+            "outputs": {}
         }
 
     def _load_checkpoint(self) -> Dict[str, Any]:
@@ -108,20 +149,48 @@ class MainAgent:
         """현재 상태를 체크포인트 파일에 저장"""
         self.state["updated_at"] = datetime.now().isoformat()
 
+        start = time.perf_counter()
         try:
-            with open(self.checkpoint_file, 'w', encoding='utf-8') as f:
-                json.dump(self.state, f, indent=2, ensure_ascii=False)
+            with timeline.span("checkpoint.save", 'checkpoint'):
+                with open(self.checkpoint_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.state, f, indent=2, ensure_ascii=False)
+            metrics.observe_checkpoint_write(time.perf_counter() - start)
             print(f"💾 체크포인트 저장: {self.checkpoint_file}")
         except Exception as e:
             print(f"❌ 체크포인트 저장 실패: {e}")
 
-    def _update_step(self, step_name: str, status: str, error: Optional[str] = None):
-        """단계 상태 업데이트"""
-        self.state["steps"][step_name] = {
+    def _update_step(
+        self,
+        step_name: str,
+        status: str,
+        error: Optional[str] = None,
+        **extra: Any
+    ):
+        """단계 상태 업데이트 (시작/종료 시각 기록, extra는 단계 항목에 추가)"""
+        now = datetime.now()
+        previous = self.state["steps"].get(step_name, {})
+
+        step = {
             "status": status,
             "error": error,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now.isoformat(),
+            "started_at": previous.get("started_at"),
+            "ended_at": None,
         }
+
+        # SubAgent가 기록한 하위 단계 진행 상황 유지 (재개 시 완료된 하위 단계 건너뜀)
+        if "sub_steps" in previous:
+            step["sub_steps"] = previous["sub_steps"]
+
+        if status == WorkflowStatus.IN_PROGRESS:
+            step["started_at"] = now.isoformat()
+        elif step["started_at"]:
+            step["ended_at"] = now.isoformat()
+            started = datetime.fromisoformat(step["started_at"])
+            step["duration_seconds"] = round((now - started).total_seconds(), 3)
+
+        step.update(extra)
+        self.state["steps"][step_name] = step
         self._save_checkpoint()
 
     def run(self):
@@ -134,38 +203,72 @@ class MainAgent:
         print(f"Branch: {self.state['branch']}")
         print("=" * 60)
 
+        if self.trace:
+            timeline.start(self.ticket_id)
+
+        try:
+            with timeline.span(
+                "workflow.run", 'workflow', ticket_id=self.ticket_id, mode=self._mode_name()
+            ), span(
+                "workflow.run",
+                **{'workflow.ticket_id': self.ticket_id, 'workflow.mode': self._mode_name()}
+            ):
+                self._run_workflow()
+        finally:
+            if self.trace:
+                self._export_timeline()
+
+    def _export_timeline(self):
+        """타임라인을 체크포인트 옆에 Chrome trace-event JSON 으로 저장"""
+        recorded = timeline.stop()
+        if recorded is None:
+            return
+
+        try:
+            recorded.export(self.trace_file)
+            print(f"🧭 타임라인 저장: {self.trace_file} (https://ui.perfetto.dev 에서 열기)")
+        except Exception as e:
+            print(f"❌ 타임라인 저장 실패: {e}")
+
+    def _mode_name(self) -> str:
+        """실행 모드 이름"""
+        return 'resume' if self.resume else 'restart' if self.restart else 'new'
+
+    def _run_workflow(self):
+        """단계별 워크플로우 실행"""
         try:
             # 1. JIRA 티켓 조회/생성
             if self._should_run_step("jira_fetch"):
-                self._run_jira_fetch()
+                self._execute_step("jira_fetch", self._run_jira_fetch)
 
             # 2. Git 브랜치 생성
             if self._should_run_step("git_branch"):
-                self._run_git_branch()
+                self._execute_step("git_branch", self._run_git_branch)
 
             # 3. Backend Agent 실행
             if self.agents_enabled['backend'] and self._should_run_step("backend_dev"):
-                self._run_backend_agent()
+                self._execute_step("backend_dev", self._run_backend_agent)
 
             # 4. QA Agent 실행
             if self.agents_enabled['qa'] and self._should_run_step("qa_test"):
-                self._run_qa_agent()
+                self._execute_step("qa_test", self._run_qa_agent)
 
             # 5. Review Agent 실행
             if self.agents_enabled['review'] and self._should_run_step("code_review"):
-                self._run_review_agent()
+                self._execute_step("code_review", self._run_review_agent)
 
             # 6. Docs Agent 실행
             if self.agents_enabled['docs'] and self._should_run_step("documentation"):
-                self._run_docs_agent()
+                self._execute_step("documentation", self._run_docs_agent)
 
             # 7. PR 생성
             if self._should_run_step("pr_creation"):
-                self._run_pr_creation()
+                self._execute_step("pr_creation", self._run_pr_creation)
 
             # 워크플로우 완료
             self.state["status"] = WorkflowStatus.COMPLETED
             self._save_checkpoint()
+            metrics.count_workflow_run(WorkflowStatus.COMPLETED)
 
             print("\n" + "=" * 60)
             print("✅ 워크플로우 완료!")
@@ -176,14 +279,234 @@ class MainAgent:
             print("\n⚠️  사용자에 의해 중단되었습니다.")
             self.state["status"] = WorkflowStatus.FAILED
             self._save_checkpoint()
+            metrics.count_workflow_run(WorkflowStatus.FAILED)
             sys.exit(1)
 
         except Exception as e:
             print(f"\n❌ 워크플로우 실패: {e}")
             self.state["status"] = WorkflowStatus.FAILED
+            self._report_failure(e)
             self._save_checkpoint()
+            metrics.count_workflow_run(WorkflowStatus.FAILED)
             sys.exit(1)
 
+    def _failure_log(self, step_name: str) -> Optional[str]:
+        """실패한 단계의 로그 파일 (QA: 실패한 첫 샤드 로그)"""
+        outputs = self.state.get("outputs", {}).get(step_name) or {}
+        for output in outputs.values():
+            if isinstance(output, dict) and output.get('failed'):
+                for log in output.get('logs') or []:
+                    if Path(log).exists():
+                        return log
+        return None
+
+    def _report_failure(self, error: Exception):
+        """
+        실패 알림 (Slack/JIRA)
+
+        실패 시그니처를 FailureDB 에 기록하고, 처음 보는 시그니처(또는 재알림 시간이 지난 경우)일 때만
+        알립니다. 공통 원인으로 여러 티켓이 같은 에러로 실패하면 첫 티켓만 알리고
+        나머지는 발생 횟수만 누적합니다. 알림 실패는 워크플로우 실패 처리를 막지 않습니다.
+
+        Args:
+            error: 워크플로우를 중단시킨 예외
+        """
+        if not self.config.failure_alerts:
+            return
+
+        step_name = next(
+            (name for name, step in self.state["steps"].items() if step["status"] == WorkflowStatus.FAILED),
+            None
+        )
+        error_message = str(error)
+        if step_name and self.state["steps"][step_name].get("error"):
+            error_message = self.state["steps"][step_name]["error"]
+
+        try:
+            from log_analyzer import analyze_log, analyze_text
+            from failure_db import FailureDB
+
+            log_path = self._failure_log(step_name) if step_name else None
+            signature = analyze_log(log_path) if log_path else analyze_text(error_message)
+            occurrence = FailureDB(
+                self.config.failure_db,
+                realert_hours=self.config.failure_realert_hours
+            ).record(signature, self.ticket_id, step_name or "workflow")
+        except Exception as e:
+            print(f"⚠️  실패 시그니처 기록 실패: {e}")
+            return
+
+        self.state["metadata"]["failure_fingerprint"] = occurrence['fingerprint']
+        if not occurrence['notify']:
+            print(
+                f"🔕 동일 실패 시그니처 {occurrence['fingerprint']} - 알림 생략 "
+                f"({occurrence['occurrences']}회째, 티켓 {occurrence['tickets']}개, 최초: {occurrence['first_ticket']})"
+            )
+            return
+
+        signature.update(occurrences=occurrence['occurrences'], tickets=occurrence['tickets'])
+
+        if self.config.slack_webhook_url:
+            try:
+                from slack_notifier import SlackNotifier
+                notifier = SlackNotifier()
+                if step_name == "qa_test":
+                    notifier.notify_test_failed(self.ticket_id, error_message, self.state['branch'], signature=signature)
+                else:
+                    notifier.notify_error(self.ticket_id, error_message, step=step_name, signature=signature)
+            except Exception as e:
+                print(f"⚠️  Slack 실패 알림 전송 실패: {e}")
+
+        if self.config.jira_url:
+            repeated = (
+                f"\n\n동일 실패 누적 {occurrence['occurrences']}회 (티켓 {occurrence['tickets']}개, "
+                f"최초: {occurrence['first_ticket']})"
+                if occurrence['occurrences'] > 1 else ""
+            )
+            comment = (
+                f"## 워크플로우 실패: {step_name or 'workflow'} ❌\n\n"
+                f"시그니처: {occurrence['fingerprint']}\n\n{signature['excerpt']}{repeated}"
+            )
+            try:
+                from jira_client import JiraClient
+                JiraClient().add_comment(self.ticket_id, comment)
+            except Exception as e:
+                print(f"⚠️  JIRA 실패 코멘트 추가 실패: {e}")
+
+    def _execute_step(self, step_name: str, runner: Callable[[], None]):
+        """
+        단계 실행 (span 기록)
+
+        Args:
+            step_name: 단계 이름 (state["steps"]의 키)
+            runner: 단계 실행 함수
+        """
+        start = time.perf_counter()
+        workflow = self.config.workflow
+        monitor = ResourceMonitor(workflow.resource_sample_interval) if workflow.resource_monitor else None
+        try:
+            with timeline.span(step_name, 'step') as event_args, span(
+                f"workflow.step {step_name}",
+                **{'workflow.ticket_id': self.ticket_id, 'workflow.step': step_name}
+            ):
+                with monitor or nullcontext():
+                    cache_key, inputs = self._step_cache_key(step_name)
+
+                    if cache_key and self._restore_cached_step(step_name, cache_key):
+                        event_args['cached'] = True
+                    else:
+                        runner()
+                        if cache_key and self.state["steps"][step_name]["status"] == WorkflowStatus.COMPLETED:
+                            self.step_cache.put(
+                                cache_key,
+                                step_name,
+                                inputs,
+                                self.state.setdefault("outputs", {}).get(step_name)
+                            )
+
+                event_args['status'] = self.state["steps"][step_name]["status"]
+                if monitor:
+                    event_args.update(monitor.result)
+        finally:
+            # 실패한 단계도 기록 (어디서 자원을 쓰다 실패했는지)
+            if monitor and monitor.result:
+                self.state["steps"][step_name]["resources"] = monitor.result
+                self._save_checkpoint()
+            metrics.observe_step(
+                step_name,
+                self.state["steps"][step_name]["status"],
+                time.perf_counter() - start
+            )
+
+    def _step_inputs(self, step_name: str) -> Optional[Dict[str, Any]]:
+        """
+        단계가 선언한 입력 수집
+
+        Returns:
+            입력 딕셔너리 (Git 저장소가 아니어서 트리 해시나 merge-base 를 구할 수 없으면 None)
+        """
+        inputs: Dict[str, Any] = {}
+
+        for kind in self.CACHEABLE_STEPS[step_name]:
+            if kind == "ticket":
+                metadata = self.state["metadata"]
+                inputs["ticket"] = {
+                    "id": self.ticket_id,
+                    "summary": metadata.get("jira_summary"),
+                    "description": metadata.get("jira_description"),
+                    "labels": metadata.get("jira_labels"),
+                }
+            elif kind == "tree":
+                tree = git_tree_hash(self.repo_path, exclude=workspace_excludes(self.config))
+                if tree is None:
+                    return None
+                inputs["tree"] = tree
+            elif kind == "base":
+                # 영향 분석 테스트 선택, 리뷰 대상 파일, 변경 라인 커버리지는 merge-base 기준
+                bases = {}
+                for section in ("qa", "review"):
+                    branch = getattr(self.config, section).base_branch
+                    bases[section] = merge_base(self.repo_path, branch)
+                    if bases[section] is None:
+                        return None
+                inputs["base"] = bases
+            elif kind == "config":
+                inputs["config"] = {
+                    "min_code_coverage": self.config.min_code_coverage,
+                    "sonarqube_url": self.config.sonarqube_url,
+                    "sonarqube_project_key": self.config.review.sonarqube_project_key,
+                    "test_timeout": self.config.test_timeout,
+                    "test_retry_count": self.config.test_retry_count,
+                    "qa_suites": self.config.qa.suites,
+                    "qa_selection": [
+                        self.config.qa.impact_analysis,
+                        self.config.qa.base_branch,
+                        self.config.qa.impact_ignore,
+                        self.config.qa.test_patterns,
+                    ],
+                    "qa_coverage": [
+                        self.config.qa.coverage_reports,
+                        self.config.qa.min_diff_coverage,
+                        self.config.qa.coverage_required,
+                    ],
+                    "review_phases": self.config.review.phases,
+                    "review_limits": [
+                        self.config.review.base_branch,
+                        self.config.review.max_line_length,
+                        self.config.review.max_complexity,
+                        self.config.review.fail_on,
+                    ],
+                }
+
+        return inputs
+
+    def _step_cache_key(self, step_name: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """캐시 대상 단계의 (캐시 키, 입력) 반환 (대상이 아니면 (None, None))"""
+        if self.step_cache is None or step_name not in self.CACHEABLE_STEPS:
+            return None, None
+
+        inputs = self._step_inputs(step_name)
+        if inputs is None:
+            return None, None
+        return input_key(step_name, inputs), inputs
+
+    def _restore_cached_step(self, step_name: str, cache_key: str) -> bool:
+        """
+        캐시에 같은 입력의 성공 결과가 있으면 단계를 완료 처리
+
+        Returns:
+            재사용 여부
+        """
+        entry = self.step_cache.get(cache_key)
+        metrics.count_step_cache(step_name, entry is not None)
+        if entry is None:
+            return False
+
+        print(f"\n♻️  [{step_name}] 입력 변경 없음 - 캐시 재사용 ({cache_key[:12]})")
+        self.state.setdefault("outputs", {})[step_name] = entry.get("outputs")
+        self._update_step(step_name, WorkflowStatus.COMPLETED, cached=True, cache_key=cache_key)
+        return True
+
     def _should_run_step(self, step_name: str) -> bool:
         """단계 실행 여부 판단"""
         step_status = self.state["steps"][step_name]["status"]
@@ -202,14 +525,19 @@ class MainAgent:
         self._update_step("jira_fetch", WorkflowStatus.IN_PROGRESS)
 
         try:
-            # TODO: JIRA API 호출 로직 구현
-            # jira_client를 통해 티켓 정보 조회
+            from jira_client import JiraClient
+
+            issue = JiraClient().get_issue(self.ticket_id)
+            if issue is None:
+                raise RuntimeError(f"JIRA 티켓을 조회할 수 없습니다: {self.ticket_id}")
+
+            fields = issue.get('fields', {})
             print(f"✅ JIRA 티켓 조회 완료")
 
             # 메타데이터 업데이트
-            self.state["metadata"]["jira_summary"] = "Sample JIRA Ticket"
-            self.state["metadata"]["jira_description"] = "Description here"
-            self.state["metadata"]["jira_labels"] = ["backend", "api"]
+            self.state["metadata"]["jira_summary"] = fields.get('summary')
+            self.state["metadata"]["jira_description"] = fields.get('description')
+            self.state["metadata"]["jira_labels"] = fields.get('labels', [])
 
             self._update_step("jira_fetch", WorkflowStatus.COMPLETED)
 
@@ -237,7 +565,8 @@ class MainAgent:
         self._update_step("backend_dev", WorkflowStatus.IN_PROGRESS)
 
         try:
-            # TODO: Backend Agent 호출
+            from backend_agent import BackendAgent
+            self._run_sub_agent("backend_dev", BackendAgent, self._ticket_context())
             print(f"✅ Backend 개발 완료")
             self._update_step("backend_dev", WorkflowStatus.COMPLETED)
 
@@ -251,7 +580,8 @@ class MainAgent:
         self._update_step("qa_test", WorkflowStatus.IN_PROGRESS)
 
         try:
-            # TODO: QA Agent 호출
+            from qa_agent import QAAgent
+            self._run_sub_agent("qa_test", QAAgent, self.state['branch'])
             print(f"✅ 테스트 완료")
             self._update_step("qa_test", WorkflowStatus.COMPLETED)
 
@@ -265,7 +595,8 @@ class MainAgent:
         self._update_step("code_review", WorkflowStatus.IN_PROGRESS)
 
         try:
-            # TODO: Review Agent 호출
+            from review_agent import ReviewAgent
+            self._run_sub_agent("code_review", ReviewAgent, self.state['branch'])
             print(f"✅ 코드 리뷰 완료")
             self._update_step("code_review", WorkflowStatus.COMPLETED)
 
@@ -279,7 +610,8 @@ class MainAgent:
         self._update_step("documentation", WorkflowStatus.IN_PROGRESS)
 
         try:
-            # TODO: Docs Agent 호출
+            from docs_agent import DocsAgent
+            self._run_sub_agent("documentation", DocsAgent, self._ticket_context())
             print(f"✅ 문서화 완료")
             self._update_step("documentation", WorkflowStatus.COMPLETED)
 
@@ -287,6 +619,58 @@ class MainAgent:
             self._update_step("documentation", WorkflowStatus.FAILED, str(e))
             raise
 
+    def _ticket_context(self) -> Dict[str, Any]:
+        """SubAgent에 전달할 티켓 정보 (ADF 설명은 일반 텍스트로 변환)"""
+        metadata = self.state["metadata"]
+        description = metadata.get("jira_description") or ""
+
+        if isinstance(description, dict):
+            texts = []
+            stack = [description]
+            while stack:
+                node = stack.pop()
+                if node.get("type") == "text":
+                    texts.append(node.get("text", ""))
+                stack.extend(reversed(node.get("content", [])))
+            description = " ".join(texts)
+
+        return {
+            "summary": metadata.get("jira_summary") or "",
+            "description": description,
+            "labels": metadata.get("jira_labels") or [],
+        }
+
+    def _run_sub_agent(self, step_name: str, agent_class: type, *args: Any):
+        """
+        SubAgent 실행 (하위 단계 진행 상황을 체크포인트에 기록)
+
+        이전 실행에서 완료된 하위 단계는 SubAgent가 건너뛰고,
+        완료된 하위 단계의 결과는 단계 출력(state["outputs"])으로 저장됩니다.
+
+        Args:
+            step_name: 단계 이름
+            agent_class: BaseAgent 하위 클래스
+            *args: ticket_id 다음에 전달할 생성자 인자
+
+        Raises:
+            RuntimeError: SubAgent가 실패를 반환한 경우
+        """
+        def save_sub_steps(sub_steps: Dict[str, Dict[str, Any]]):
+            self.state["steps"][step_name]["sub_steps"] = dict(sub_steps)
+            self._save_checkpoint()
+
+        agent = agent_class(
+            self.ticket_id,
+            *args,
+            sub_steps=self.state["steps"][step_name].get("sub_steps"),
+            on_progress=save_sub_steps
+        )
+        success = agent.run()
+        self.state.setdefault("outputs", {})[step_name] = agent.outputs()
+
+        if not success:
+            raise RuntimeError(f"{agent_class.__name__} 실패")
+
     def _run_pr_creation(self):
         """PR 생성"""
         print(f"\n🔀 [7/7] PR 생성")
@@ -316,6 +700,7 @@ class MainAgent:
 
         print(f"\n단계별 상태:")
         for step_name, step_data in self.state["steps"].items():
+            cached = " (cached)" if step_data.get("cached") else ""
             status_icon = {
                 WorkflowStatus.COMPLETED: "✅",
                 WorkflowStatus.IN_PROGRESS: "🔄",
@@ -324,7 +709,13 @@ class MainAgent:
                 WorkflowStatus.SKIPPED: "⏭️",
             }.get(step_data["status"], "❓")
 
-            print(f"  {status_icon} {step_name}: {step_data['status']}")
+            print(f"  {status_icon} {step_name}: {step_data['status']}{cached}")
+
+        resources = format_table(self.state["steps"])
+        if resources:
+            print("\n단계별 자원 사용량:")
+            for line in resources:
+                print(line)
 
 
 def main():
@@ -346,6 +737,22 @@ def main():
         action="store_true",
         help="처음부터 재시작"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="단계 캐시를 사용하지 않고 모든 단계 실행"
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="/metrics 엔드포인트 포트 (장시간 실행 시 스크레이프용)"
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="단계/외부 호출 타임라인을 Chrome trace JSON 으로 저장 (체크포인트 옆)"
+    )
 
     args = parser.parse_args()
 
@@ -354,14 +761,28 @@ def main():
         print("❌ --resume과 --restart는 동시에 사용할 수 없습니다.")
         sys.exit(1)
 
-    # Main Agent 실행
-    agent = MainAgent(
-        ticket_id=args.ticket_id,
-        resume=args.resume,
-        restart=args.restart
-    )
-
-    agent.run()
+    init_tracing('main-agent')
+
+    if args.metrics_port:
+        metrics.start_metrics_server(args.metrics_port)
+
+    from workspace_pool import warm_workspace
+
+    try:
+        # WORKSPACE_POOL_SIZE > 0 이면 준비된 작업 디렉토리를 빌려 그 안에서 실행
+        with warm_workspace(args.ticket_id, resume=args.resume) as lease:
+            agent = MainAgent(
+                ticket_id=args.ticket_id,
+                resume=args.resume,
+                restart=args.restart,
+                trace=args.trace,
+                use_cache=not args.no_cache,
+                workspace=lease.name if lease else None
+            )
+            agent.run()
+    finally:
+        # 단발성 실행: METRICS_TEXTFILE / PUSHGATEWAY_URL 로 내보내기
+        metrics.flush()
 
 
 if __name__ == "__main__":
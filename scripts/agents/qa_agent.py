@@ -7,31 +7,89 @@ Claude Code SubAgent - QA Agent
 
 import sys
 import argparse
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from xml.etree.ElementTree import ParseError
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Set
 
 # 프로젝트 루트 경로를 sys.path에 추가
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root / 'scripts'))
 
 from config import get_config
+from tracing import init_tracing, span
+from suite_runner import TEST_FAILED, TEST_PASSED, SuiteRunner, discover_tests
+from sandbox import sandbox_from_config
+from flake_db import FlakeDB
+from impact_map import ImpactMap, changed_files, changed_lines
+from diff_stats import workspace_excludes
+from report_parser import CoverageReport
+from base_agent import BaseAgent, ProgressCallback, checkpoint_progress
 
 
-class QAAgent:
+class QAAgent(BaseAgent):
     """QA 테스트 자동화 에이전트"""
 
-    def __init__(self, ticket_id: str, branch: str):
+    step_name = "qa_test"
+
+    SUB_STEPS = [
+        ("unit", "_run_unit_tests"),
+        ("integration", "_run_integration_tests"),
+        ("api", "_run_api_tests"),
+        ("coverage", "_check_coverage"),
+    ]
+
+    # 세 스위트는 동시에 실행 (QA_PARALLEL_SUITES=false 면 순서대로)
+    PARALLEL_SUB_STEPS = ("unit", "integration", "api")
+
+    def __init__(
+        self,
+        ticket_id: str,
+        branch: str,
+        sub_steps: Optional[Dict[str, Dict[str, Any]]] = None,
+        on_progress: Optional[ProgressCallback] = None,
+        full_run: bool = False
+    ):
         """
         QA Agent 초기화
 
         Args:
             ticket_id: JIRA 티켓 ID
             branch: Git 브랜치명
+            sub_steps: 이전 실행의 하위 단계 상태 (재개 시)
+            on_progress: 하위 단계 진행 상황 콜백
+            full_run: 테스트 영향 분석 없이 전체 테스트 실행
         """
-        self.ticket_id = ticket_id
+        super().__init__(ticket_id, sub_steps, on_progress)
         self.branch = branch
+        self.full_run = full_run
         self.config = get_config()
 
+        if not self.config.qa.parallel_suites:
+            self.PARALLEL_SUB_STEPS = ()
+
+        # 스위트 간 공유: 동시 러너 프로세스 수와 TEST_TIMEOUT 을 함께 제한
+        self.workdir = Path('.')
+        self.runner = SuiteRunner(
+            self.workdir,
+            self.config.qa.results_dir,
+            timeout=self.config.test_timeout,
+            max_workers=self.config.qa.max_workers,
+            deselect_format=self.config.qa.deselect_format,
+            sandbox=sandbox_from_config(self.config)
+        )
+        self.flake_db = FlakeDB(
+            self.config.qa.flake_db,
+            quarantine_threshold=self.config.qa.quarantine_threshold,
+            release_passes=self.config.qa.quarantine_release_passes
+        )
+
+        # 테스트 영향 분석: None 이면 전체 실행, 아니면 실행할 테스트 파일
+        self.impact = ImpactMap(Path(self.config.qa.results_dir) / 'impact-map.json')
+        self.selected: Optional[Set[str]] = None
+        self.ran_suites: Set[str] = set()
+
         # 테스트 결과
         self.test_results: List[Dict[str, Any]] = []
         self.passed = 0
@@ -52,17 +110,15 @@ class QAAgent:
         print("=" * 60)
 
         try:
-            # 1. 단위 테스트
-            self._run_unit_tests()
-
-            # 2. 통합 테스트
-            self._run_integration_tests()
+            # 0. 테스트 영향 분석 (변경 파일에 영향받는 테스트만 선택)
+            if self.config.qa.impact_analysis:
+                self._select_tests()
 
-            # 3. API 테스트
-            self._run_api_tests()
+            # 1~4. 단위/통합/API 테스트, 코드 커버리지 (완료된 하위 단계는 건너뜀)
+            self.run_sub_steps()
 
-            # 4. 코드 커버리지 확인
-            self._check_coverage()
+            if self.config.qa.impact_analysis:
+                self._update_impact_map()
 
             # 5. 테스트 결과 요약
             self._print_summary()
@@ -74,79 +130,336 @@ class QAAgent:
             print(f"\n❌ 테스트 실패: {e}")
             return False
 
-    def _run_unit_tests(self):
-        """단위 테스트 실행"""
-        print("\n[1/4] 단위 테스트 실행 중...")
+    def _apply_sub_step(self, name: str, output: Optional[Dict[str, Any]]):
+        """하위 단계 결과를 테스트 집계에 반영"""
+        if not output:
+            return
 
-        # TODO: 실제 테스트 프레임워크 실행
-        # - JUnit (Java/Kotlin)
-        # - pytest (Python)
-        # - Jest (JavaScript/TypeScript)
+        if name == "coverage":
+            if not output['passed']:
+                self.failed += 1
+            return
 
-        print("   ✅ 단위 테스트: 25 passed")
-        self.passed += 25
+        self.passed += output['passed']
+        self.failed += output['failed']
+        self.test_results.append(output)
 
-        self.test_results.append({
-            'type': 'unit',
-            'passed': 25,
-            'failed': 0
-        })
+    def _sub_step_succeeded(self, name: str, output: Optional[Dict[str, Any]]) -> bool:
+        """실패한 테스트가 있거나 커버리지 미달이면 재개 시 다시 실행"""
+        if name == "coverage":
+            return bool(output and output['passed'])
+        return bool(output) and output['failed'] == 0
 
-    def _run_integration_tests(self):
-        """통합 테스트 실행"""
-        print("\n[2/4] 통합 테스트 실행 중...")
+    def _configured_suites(self) -> List[str]:
+        """실행 명령이 설정된 스위트"""
+        return [name for name, suite in self.config.qa.suites.items() if suite['command']]
 
-        # TODO: 통합 테스트 실행
-        # - Spring Boot Test
-        # - Testcontainers (DB 통합 테스트)
+    def _select_tests(self):
+        """
+        테스트 영향 분석
 
-        print("   ✅ 통합 테스트: 15 passed")
-        self.passed += 15
+        베이스 브랜치 대비 변경 파일을 영향 맵으로 테스트 파일에 대응시킵니다.
+        맵이 없거나 오래됐거나 맵에 없는 파일이 바뀌었으면 전체 실행합니다.
+        """
+        qa = self.config.qa
 
-        self.test_results.append({
-            'type': 'integration',
-            'passed': 15,
-            'failed': 0
-        })
+        if self.full_run:
+            reason = "--full 지정"
+        else:
+            reason = self.impact.full_run_reason(qa.full_run_every, qa.full_run_max_age_hours)
+
+        if reason is None:
+            changed = changed_files(
+                self.workdir,
+                qa.base_branch,
+                exclude=workspace_excludes(self.config),
+                cache_dir=self.config.step_cache_dir
+            )
+            if changed is None:
+                reason = f"{qa.base_branch} 브랜치와 비교 실패"
+            else:
+                test_files = [
+                    test
+                    for name in self._configured_suites()
+                    for test in discover_tests(self.workdir, qa.suites[name]['paths'], qa.test_patterns)
+                ]
+                affected, unmapped = self.impact.affected_tests(changed, test_files, qa.impact_ignore)
+                if affected is None:
+                    reason = f"영향 맵에 없는 파일 변경: {unmapped}"
+
+        if reason:
+            print(f"\n🎯 테스트 영향 분석: 전체 실행 ({reason})")
+            return
+
+        self.selected = affected
+        print(f"\n🎯 테스트 영향 분석: 변경 파일 {len(changed)}개 → 테스트 파일 {len(affected)}개")
+
+    def _update_impact_map(self):
+        """전체 실행이었으면 coverage 데이터로 영향 맵 갱신, 실행 기록 저장"""
+        configured = set(self._configured_suites())
+        full = self.selected is None and bool(configured) and configured <= self.ran_suites
+
+        if full:
+            coverage_files = [
+                path for name in sorted(configured) for path in self.runner.coverage_files(name)
+            ]
+            count = self.impact.refresh(coverage_files, self.workdir)
+            if count:
+                print(f"\n🗺️  테스트 영향 맵 갱신: 소스 파일 {count}개")
+            else:
+                print("\nℹ️  테스트별 coverage 데이터 없음 - 영향 맵 갱신 건너뜀 (--cov-context=test 필요)")
+
+        self.impact.record_run(full)
+
+    def _run_unit_tests(self) -> Dict[str, Any]:
+        """단위 테스트 실행"""
+        return self._run_suite("unit", "단위 테스트", 1)
 
-    def _run_api_tests(self):
+    def _run_integration_tests(self) -> Dict[str, Any]:
+        """통합 테스트 실행"""
+        return self._run_suite("integration", "통합 테스트", 2)
+
+    def _run_api_tests(self) -> Dict[str, Any]:
         """API 테스트 실행"""
-        print("\n[3/4] API 테스트 실행 중...")
+        return self._run_suite("api", "API 테스트", 3)
 
-        # TODO: API 테스트 실행
-        # - REST Assured
-        # - Postman/Newman
-        # - curl 스크립트
+    def _run_suite(self, suite: str, label: str, index: int) -> Dict[str, Any]:
+        """
+        테스트 스위트 실행 (테스트 파일을 샤드로 나눠 러너 프로세스를 동시에 실행)
 
-        print("   ✅ API 테스트: 10 passed")
-        self.passed += 10
+        Args:
+            suite: 스위트 이름 (unit, integration, api)
+            label: 출력용 이름
+            index: 하위 단계 번호
 
-        self.test_results.append({
-            'type': 'api',
-            'passed': 10,
-            'failed': 0
-        })
+        Returns:
+            스위트 결과 (SuiteRunner.run_suite 참고)
+        """
+        print(f"\n[{index}/4] {label} 실행 중...")
+
+        settings = self.config.qa.suites[suite]
+        command = settings['command']
+        skipped = {'type': suite, 'passed': 0, 'failed': 0, 'skipped': 0, 'shards': 0}
+
+        if not command:
+            print(f"   ℹ️  {label}: QA_{suite.upper()}_TEST_CMD 미설정 - 건너뜀")
+            return skipped
+
+        tests = discover_tests(self.workdir, settings['paths'], self.config.qa.test_patterns)
+        if '{tests}' in command and not tests:
+            print(f"   ℹ️  {label}: 테스트 파일 없음 ({', '.join(settings['paths'])}) - 건너뜀")
+            return skipped
+
+        if self.selected is not None and '{tests}' in command:
+            affected = [test for test in tests if test in self.selected]
+            print(f"   🎯 {label}: 영향받는 테스트 파일 {len(affected)}/{len(tests)}개")
+            if not affected:
+                return dict(skipped, impacted=0)
+            tests = affected
+
+        self.ran_suites.add(suite)
+        result = self._run_lanes(suite, label, command, tests, settings['shards'])
+        if self.selected is not None:
+            result['impacted'] = len(tests)
+
+        self._retry_failures(suite, label, command, result)
+
+        icon = "✅" if result['failed'] == 0 else "❌"
+        print(
+            f"   {icon} {label}: {result['passed']} passed, {result['failed']} failed, "
+            f"{result['skipped']} skipped ({result['shards']} shards, {result['duration']}s)"
+        )
+        if result['timed_out']:
+            print(f"   ⏱️  {label}: 타임아웃 ({self.config.test_timeout}초)")
+        for failure in result['failures'][:10]:
+            print(f"   - {failure['id']}")
+
+        if not result['failed'] and not result['timed_out']:
+            # 재시도로 모두 통과했으면 알림에 쓸 실패 로그도 없음
+            result['logs'] = []
+
+        # 테스트별 결과는 체크포인트에 저장하지 않음 (실패 ID만 failures 로 유지)
+        result.pop('tests', None)
+        return result
+
+    def _run_lanes(
+        self,
+        suite: str,
+        label: str,
+        command: str,
+        tests: List[str],
+        shards: int
+    ) -> Dict[str, Any]:
+        """
+        본 레인과 격리 레인 실행
 
-    def _check_coverage(self):
-        """코드 커버리지 확인"""
-        print("\n[4/4] 코드 커버리지 확인 중...")
+        격리된 flaky 테스트는 본 레인에서 제외({deselect})하고 격리 레인에서 동시에 실행합니다.
+        격리된 테스트의 실패는 기록만 하고 QA 실패로 세지 않습니다.
+        명령에 {deselect} 가 없으면 본 레인에서 함께 실행하고 결과만 분리합니다.
 
-        # TODO: 실제 커버리지 도구 실행
-        # - JaCoCo (Java)
-        # - pytest-cov (Python)
-        # - Istanbul/NYC (JavaScript)
+        Returns:
+            본 레인 결과 (격리된 테스트 결과는 'quarantined' 에 포함)
+        """
+        files = set(tests)
+        quarantined = [
+            test_id for test_id in self.flake_db.quarantined(suite)
+            if test_id.split('::', 1)[0] in files
+        ]
+        separate = bool(quarantined) and '{deselect}' in command and '{tests}' in command
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"qa-{suite}-quarantine") as executor:
+            lane = None
+            if separate:
+                print(f"   🚧 {label}: 격리된 flaky 테스트 {len(quarantined)}개 별도 레인 실행")
+                lane = executor.submit(
+                    contextvars.copy_context().run,
+                    self.runner.run_suite, suite, command, quarantined, 0, f"{suite}.quarantine"
+                )
+            result = self.runner.run_suite(
+                suite, command, tests, shards=shards, deselect=quarantined if separate else []
+            )
+            lane_tests = lane.result()['tests'] if lane else result['tests']
+
+        if not quarantined:
+            return result
+
+        # 격리된 테스트 결과 분리 (실패해도 QA 실패로 세지 않음)
+        outcomes = {t['id']: t['status'] != TEST_FAILED for t in lane_tests if t['id'] in quarantined}
+        if not separate:
+            result['failures'] = [f for f in result['failures'] if f['id'] not in outcomes]
+            result['failed'] = sum(1 for t in result['tests'] if t['status'] == TEST_FAILED and t['id'] not in outcomes)
+            result['passed'] -= sum(1 for passed in outcomes.values() if passed)
+
+        result['quarantined'] = [{'id': test_id, 'passed': passed} for test_id, passed in sorted(outcomes.items())]
+        failed = sum(1 for passed in outcomes.values() if not passed)
+        if failed:
+            print(f"   🚧 {label}: 격리된 테스트 {failed}개 실패 (QA 결과에 미반영)")
+
+        for test_id in self.flake_db.record_quarantine_results(outcomes):
+            print(f"   🔓 {label}: 연속 통과로 격리 해제 - {test_id}")
+
+        return result
+
+    def _retry_failures(self, suite: str, label: str, command: str, result: Dict[str, Any]):
+        """
+        실패한 테스트 ID만 TEST_RETRY_COUNT 회까지 재실행
 
-        coverage = 85.5
-        min_coverage = self.config.min_code_coverage
+        재시도에서 통과한 테스트는 flaky 로 기록하고 통과로 집계합니다.
+        타임아웃/종료 코드 같은 샤드 단위 실패는 테스트 ID가 없어 재시도하지 않습니다.
+        """
+        retry_count = self.config.test_retry_count
+        if '{tests}' not in command:
+            return
+
+        result.setdefault('flaky', [])
+        quarantined = {q['id'] for q in result.get('quarantined', [])}
+        failing = [
+            t for t in result['tests']
+            if t['status'] == TEST_FAILED and t['file'] and t['id'] not in quarantined
+        ]
+
+        for attempt in range(1, retry_count + 1):
+            if not failing:
+                break
+
+            ids = [t['id'] for t in failing]
+            print(f"   🔁 {label}: 실패한 테스트 {len(ids)}개만 재시도 ({attempt}/{retry_count})")
+            retry = self.runner.run_suite(suite, command, ids, label=f"{suite}.retry{attempt}")
+
+            passed = [t['id'] for t in retry['tests'] if t['status'] == TEST_PASSED and t['id'] in ids]
+            failing = [t for t in retry['tests'] if t['status'] == TEST_FAILED and t['id'] in ids]
+            result['retries'] = attempt
+            if not passed:
+                continue
+
+            result['flaky'].extend(passed)
+            result['passed'] += len(passed)
+            result['failed'] -= len(passed)
+            result['failures'] = [f for f in result['failures'] if f['id'] not in passed]
+            print(f"   ⚠️  {label}: 재시도에서 통과 (flaky) {len(passed)}개")
+
+            for test_id in self.flake_db.record_flaky(suite, passed, self.ticket_id, attempt):
+                print(f"   🚧 {label}: flaky 테스트 격리 - {test_id}")
+
+    def _coverage_reports(self) -> List[Path]:
+        """커버리지 리포트 파일 (QA_COVERAGE_REPORTS + 러너가 남긴 샤드별 리포트)"""
+        reports = set()
+        for pattern in self.config.qa.coverage_reports:
+            reports.update(path for path in self.workdir.glob(pattern) if path.is_file())
+        reports.update(Path(self.config.qa.results_dir).glob("*.coverage.xml"))
+        return sorted(reports)
+
+    def _check_coverage(self) -> Dict[str, Any]:
+        """
+        코드 커버리지 확인
 
-        print(f"   현재 커버리지: {coverage}%")
-        print(f"   최소 요구 커버리지: {min_coverage}%")
+        Cobertura/JaCoCo 리포트를 스트리밍으로 합산해 전체 라인 커버리지를 MIN_CODE_COVERAGE 와,
+        베이스 브랜치 대비 변경 라인 커버리지를 QA_MIN_DIFF_COVERAGE 와 비교합니다.
 
-        if coverage >= min_coverage:
-            print(f"   ✅ 커버리지 기준 통과")
+        테스트 영향 분석으로 일부 테스트만 실행했으면 전체 커버리지는 낮게 나오는 게 정상이므로
+        전체 기준은 건너뛰고 변경 라인 커버리지만 판정합니다 (QA_MIN_DIFF_COVERAGE 가 0 이면 MIN_CODE_COVERAGE).
+        """
+        print("\n[4/4] 코드 커버리지 확인 중...")
+
+        min_coverage = self.config.min_code_coverage
+        min_diff = self.config.qa.min_diff_coverage
+        partial = self.selected is not None
+
+        report = CoverageReport(self.workdir)
+        for path in self._coverage_reports():
+            try:
+                report.add(path)
+            except (ParseError, ValueError) as e:
+                print(f"   ⚠️  커버리지 리포트 읽기 실패 ({path}): {e}")
+
+        coverage = report.percent
+        if coverage is None:
+            required = self.config.qa.coverage_required
+            print(
+                f"   {'❌' if required else '⚠️ '} 커버리지 리포트 없음 - 기준 검사 불가 "
+                f"(QA_COVERAGE_REPORTS: {', '.join(self.config.qa.coverage_reports)})"
+            )
+            if not required:
+                print("   ⚠️  커버리지 기준이 적용되지 않았습니다. 테스트 명령이 리포트를 남기는지 확인하세요")
+            return {'coverage': None, 'min_coverage': min_coverage, 'passed': not required, 'reports': 0}
+
+        print(f"   현재 커버리지: {coverage}% ({report.covered_lines}/{report.total_lines} 라인, 리포트 {report.reports}개)")
+        if partial:
+            print("   ℹ️  영향받는 테스트만 실행 - 전체 커버리지 기준 생략, 변경 라인 커버리지로 판정")
+            min_diff = min_diff or min_coverage
+            passed = True
         else:
-            print(f"   ❌ 커버리지 기준 미달")
-            self.failed += 1
+            print(f"   최소 요구 커버리지: {min_coverage}%")
+            passed = coverage >= min_coverage
+
+        # 변경 라인 커버리지
+        diff_coverage = None
+        changed = changed_lines(self.workdir, self.config.qa.base_branch)
+        if changed is not None:
+            covered, total = report.diff_coverage(changed)
+            if total:
+                diff_coverage = round(covered * 100 / total, 2)
+                print(f"   변경 라인 커버리지: {diff_coverage}% ({covered}/{total} 라인)")
+                if min_diff:
+                    print(f"   최소 요구 변경 라인 커버리지: {min_diff}%")
+                    passed = passed and diff_coverage >= min_diff
+        elif partial:
+            print(f"   ⚠️  {self.config.qa.base_branch} 브랜치와 비교할 수 없어 변경 라인 커버리지를 판정하지 못했습니다")
+
+        if passed:
+            print("   ✅ 커버리지 기준 통과")
+        else:
+            print("   ❌ 커버리지 기준 미달")
+
+        return {
+            'coverage': coverage,
+            'min_coverage': None if partial else min_coverage,
+            'diff_coverage': diff_coverage,
+            'min_diff_coverage': min_diff or None,
+            'partial': partial,
+            'reports': report.reports,
+            'passed': passed
+        }
 
     def _print_summary(self):
         """테스트 결과 요약"""
@@ -161,6 +474,10 @@ class QAAgent:
             total = passed + failed
 
             print(f"  {test_type.upper()}: {passed}/{total} passed")
+            if result.get('flaky'):
+                print(f"    ⚠️  flaky (재시도 통과): {len(result['flaky'])}개")
+            if result.get('quarantined'):
+                print(f"    🚧 격리됨: {len(result['quarantined'])}개")
 
         print("-" * 60)
         total = self.passed + self.failed
@@ -181,11 +498,20 @@ def main():
     )
     parser.add_argument("ticket_id", help="JIRA 티켓 ID")
     parser.add_argument("--branch", default="", help="Git 브랜치명")
+    parser.add_argument("--resume", action="store_true", help="완료된 하위 단계 건너뛰기")
+    parser.add_argument("--full", action="store_true", help="테스트 영향 분석 없이 전체 테스트 실행")
 
     args = parser.parse_args()
 
-    agent = QAAgent(args.ticket_id, args.branch)
-    success = agent.run()
+    # MainAgent가 TRACEPARENT로 넘겨준 컨텍스트가 있으면 그 아래에 span 기록
+    init_tracing('qa-agent')
+
+    sub_steps, on_progress = checkpoint_progress(
+        args.ticket_id, QAAgent.step_name, get_config().checkpoint_dir, resume=args.resume
+    )
+    agent = QAAgent(args.ticket_id, args.branch, sub_steps, on_progress, full_run=args.full)
+    with span('agent.qa', **{'workflow.ticket_id': args.ticket_id}):
+        success = agent.run()
 
     sys.exit(0 if success else 1)
 
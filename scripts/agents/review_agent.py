@@ -7,31 +7,78 @@ Claude Code SubAgent - Review Agent
 
 import sys
 import argparse
+import threading
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 # 프로젝트 루트 경로를 sys.path에 추가
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root / 'scripts'))
 
 from config import get_config
+from tracing import init_tracing, span, traced_run
+from diff_stats import changed_paths, diff_stats, workspace_excludes
+from lint_runner import SEVERITY_ERROR, SEVERITY_WARNING, LintRunner
+from sandbox import sandbox_from_config
+from sonarqube_client import SonarQubeClient
+from base_agent import SUB_STEP_COMPLETED, BaseAgent, ProgressCallback, checkpoint_progress
 
+# 하위 단계 출력(체크포인트)에 저장할 검사별 최대 이슈 수 (변경 통계의 파일 목록도 같은 한도)
+MAX_REPORTED_ISSUES = 200
 
-class ReviewAgent:
+
+class ReviewAgent(BaseAgent):
     """코드 리뷰 자동화 에이전트"""
 
-    def __init__(self, ticket_id: str, branch: str):
+    step_name = "code_review"
+
+    SUB_STEPS = [
+        ("static_analysis", "_run_static_analysis"),
+        ("coding_style", "_check_coding_style"),
+        ("security", "_check_security"),
+        ("complexity", "_analyze_complexity"),
+        ("git_changes", "_review_git_changes"),
+        ("sonarqube", "_check_sonarqube"),
+    ]
+
+    # 네 검사는 동시에 실행 (REVIEW_PARALLEL_PHASES=false 면 순서대로, 파일 검사는 어느 쪽이든 프로세스 풀)
+    PARALLEL_SUB_STEPS = ("static_analysis", "coding_style", "security", "complexity")
+
+    def __init__(
+        self,
+        ticket_id: str,
+        branch: str,
+        sub_steps: Optional[Dict[str, Dict[str, Any]]] = None,
+        on_progress: Optional[ProgressCallback] = None
+    ):
         """
         Review Agent 초기화
 
         Args:
             ticket_id: JIRA 티켓 ID
             branch: Git 브랜치명
+            sub_steps: 이전 실행의 하위 단계 상태 (재개 시)
+            on_progress: 하위 단계 진행 상황 콜백
         """
-        self.ticket_id = ticket_id
+        super().__init__(ticket_id, sub_steps, on_progress)
         self.branch = branch
         self.config = get_config()
 
+        if not self.config.review.parallel_phases:
+            self.PARALLEL_SUB_STEPS = ()
+
+        # 검사 간 공유: 변경 통계/파일 목록과 프로세스 풀은 처음 필요할 때 한 번만 준비
+        self.workdir = Path('.')
+        self._stats: Optional[Dict[str, Any]] = None
+        self._files: Optional[List[str]] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._prepare_lock = threading.Lock()
+
+        # SonarQube 분석은 run() 시작 시 백그라운드로 제출하고 마지막 하위 단계에서 결과만 기다림
+        self._sonarqube: Optional[Future] = None
+
         # 리뷰 결과
         self.issues: List[Dict[str, Any]] = []
         self.warnings = 0
@@ -52,22 +99,13 @@ class ReviewAgent:
         print("=" * 60)
 
         try:
-            # 1. 정적 분석
-            self._run_static_analysis()
-
-            # 2. 코딩 컨벤션 검사
-            self._check_coding_style()
-
-            # 3. 보안 취약점 검사
-            self._check_security()
+            # SonarQube 분석 제출 (CE 작업 대기는 아래 검사들과 동시에 진행)
+            self._start_sonarqube()
 
-            # 4. 코드 복잡도 분석
-            self._analyze_complexity()
+            # 1~6. 정적 분석, 코딩 컨벤션, 보안, 복잡도, Git 변경사항, SonarQube (완료된 하위 단계는 건너뜀)
+            self.run_sub_steps()
 
-            # 5. Git 변경사항 검토
-            self._review_git_changes()
-
-            # 6. 리뷰 결과 요약
+            # 7. 리뷰 결과 요약
             self._print_summary()
 
             # 에러가 없으면 통과
@@ -77,74 +115,257 @@ class ReviewAgent:
             print(f"\n❌ 코드 리뷰 실패: {e}")
             return False
 
-    def _run_static_analysis(self):
-        """정적 분석 도구 실행"""
-        print("\n[1/5] 정적 분석 중...")
-
-        # TODO: 실제 정적 분석 도구 실행
-        # - SonarQube
-        # - PMD/SpotBugs (Java)
-        # - ESLint (JavaScript/TypeScript)
-        # - pylint/flake8 (Python)
-
-        print("   ✅ 정적 분석 완료")
-        print("   - 버그: 0개")
-        print("   - 코드 스멜: 2개")
-        print("   - 보안 취약점: 0개")
-
-        self.warnings += 2
-
-    def _check_coding_style(self):
-        """코딩 컨벤션 검사"""
-        print("\n[2/5] 코딩 스타일 검사 중...")
-
-        # TODO: 코딩 스타일 체커 실행
-        # - Checkstyle (Java)
-        # - Prettier/ESLint (JavaScript/TypeScript)
-        # - Black/isort (Python)
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
 
-        print("   ✅ 코딩 스타일 검사 완료")
-        print("   - 컨벤션 위반: 0개")
+    def _apply_sub_step(self, name: str, output: Optional[Dict[str, Any]]):
+        """하위 단계 결과를 에러/경고 집계에 반영"""
+        if not output:
+            return
 
-    def _check_security(self):
-        """보안 취약점 검사"""
-        print("\n[3/5] 보안 검사 중...")
+        self.errors += output.get('errors', 0)
+        self.warnings += output.get('warnings', 0)
+        self.issues.extend(output.get('issues', []))
 
-        # TODO: 보안 스캐너 실행
-        # - OWASP Dependency Check
-        # - Snyk
-        # - npm audit / pip-audit
+    def _sub_step_succeeded(self, name: str, output: Optional[Dict[str, Any]]) -> bool:
+        """에러가 있으면 재개 시 다시 실행"""
+        return not output or output.get('errors', 0) == 0
 
-        print("   ✅ 보안 검사 완료")
-        print("   - 취약한 의존성: 0개")
-        print("   - 보안 이슈: 0개")
-
-    def _analyze_complexity(self):
-        """코드 복잡도 분석"""
-        print("\n[4/5] 복잡도 분석 중...")
+    def _diff_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        베이스 브랜치 대비 변경 통계 (호출 시 _prepare_lock 보유)
 
-        # TODO: 복잡도 분석 도구 실행
-        # - SonarQube Cognitive Complexity
-        # - radon (Python)
-        # - complexity-report (JavaScript)
+        (base SHA, 작업 디렉토리 tree 해시) 기준으로 캐시되므로 QA/PR 단계와 결과를 공유합니다.
+        """
+        if self._stats is None:
+            self._stats = diff_stats(
+                self.workdir,
+                self.config.review.base_branch,
+                exclude=workspace_excludes(self.config),
+                cache_dir=self.config.step_cache_dir
+            ) or {}
+        return self._stats or None
+
+    def _changed_files(self) -> List[str]:
+        """
+        검사 대상 파일 (베이스 브랜치 대비 변경된, 현재 존재하는 파일)
 
-        print("   ✅ 복잡도 분석 완료")
-        print("   - 평균 복잡도: 3.2")
-        print("   - 높은 복잡도 함수: 0개")
+        베이스 브랜치와 비교할 수 없으면 추적 중인 전체 파일로 되돌아갑니다.
+        """
+        with self._prepare_lock:
+            if self._files is None:
+                stats = self._diff_stats()
+                if stats is None:
+                    print(f"   ⚠️  베이스 브랜치({self.config.review.base_branch})와 비교할 수 없어 전체 파일을 검사합니다")
+                    result = traced_run(
+                        ['git', 'ls-files', '-z'],
+                        cwd=self.workdir,
+                        capture_output=True,
+                        text=True,
+                        check=False
+                    )
+                    files = [path for path in result.stdout.split('\0') if path]
+                else:
+                    files = changed_paths(stats, include_deleted=False)
+                self._files = [path for path in files if (self.workdir / path).is_file()]
+            return self._files
+
+    def _lint_runner(self) -> LintRunner:
+        """검사 간 공유하는 프로세스 풀 기반 LintRunner"""
+        settings = self.config.review
+        with self._prepare_lock:
+            if self._executor is None:
+                # 하위 단계 스레드가 도는 중에 fork 하지 않도록 spawn 사용
+                self._executor = ProcessPoolExecutor(
+                    max_workers=settings.max_workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+        return LintRunner(
+            self.workdir,
+            settings.cache_dir,
+            self._executor,
+            options={
+                'max_line_length': settings.max_line_length,
+                'max_complexity': settings.max_complexity,
+                'fail_on': settings.fail_on,
+            },
+            timeout=settings.timeout,
+            max_workers=settings.max_workers,
+            sandbox=sandbox_from_config(self.config),
+            log_name=f"review-{self.ticket_id}"
+        )
+
+    def _run_phase(self, phase: str, label: str, index: int) -> Dict[str, Any]:
+        """
+        검사 하나 실행 (변경 파일 대상, 파일 내용 해시 캐시)
 
-    def _review_git_changes(self):
-        """Git 변경사항 검토"""
-        print("\n[5/5] Git 변경사항 검토 중...")
+        Args:
+            phase: 검사 이름 (REVIEW_<검사>_CMD 설정 키)
+            label: 출력용 이름
+            index: 하위 단계 번호
 
-        # TODO: Git diff 분석
-        # - 변경된 파일 목록
-        # - 추가/삭제 라인 수
-        # - 커밋 메시지 검증
+        Returns:
+            {'errors', 'warnings', 'files', 'cached', 'issues', ...검사별 지표}
+        """
+        print(f"\n[{index}/{len(self.SUB_STEPS)}] {label} 중...")
+
+        files = self._changed_files()
+        settings = self.config.review.phases[phase]
+        result = self._lint_runner().run_phase(phase, settings['command'], settings['patterns'], files)
+
+        tool = settings['command'].split()[0] if settings['command'] else "내장 검사"
+        icon = "✅" if result['errors'] == 0 else "❌"
+        print(
+            f"   {icon} {label} 완료 ({tool}): 파일 {result['files']}개 (캐시 {result['cached']}개), "
+            f"에러 {result['errors']}개, 경고 {result['warnings']}개"
+        )
+        for issue in result['issues'][:10]:
+            print(f"   - {issue['file']}:{issue['line']} [{issue['rule']}] {issue['message']}")
+
+        output = {
+            'errors': result['errors'],
+            'warnings': result['warnings'],
+            'files': result['files'],
+            'cached': result['cached'],
+            'issues': [dict(issue, phase=phase) for issue in result['issues'][:MAX_REPORTED_ISSUES]],
+        }
+        metrics = result['metrics']
+        if metrics.get('functions'):
+            output['average_complexity'] = round(metrics['complexity'] / metrics['functions'], 2)
+        return output
+
+    def _run_static_analysis(self) -> Dict[str, Any]:
+        """정적 분석 (REVIEW_STATIC_CMD, 예: pylint/flake8/ruff)"""
+        return self._run_phase('static_analysis', "정적 분석", 1)
+
+    def _check_coding_style(self) -> Dict[str, Any]:
+        """코딩 컨벤션 검사 (REVIEW_STYLE_CMD, 예: flake8 --select=E,W / eslint)"""
+        return self._run_phase('coding_style', "코딩 스타일 검사", 2)
+
+    def _check_security(self) -> Dict[str, Any]:
+        """보안 취약점 검사 (REVIEW_SECURITY_CMD, 예: bandit)"""
+        return self._run_phase('security', "보안 검사", 3)
+
+    def _analyze_complexity(self) -> Dict[str, Any]:
+        """코드 복잡도 분석 (REVIEW_COMPLEXITY_CMD, 예: radon/flake8 --max-complexity)"""
+        return self._run_phase('complexity', "복잡도 분석", 4)
+
+    def _review_git_changes(self) -> Dict[str, Any]:
+        """Git 변경사항 검토 (파일별 추가/삭제 라인, 이름 변경, 바이너리)"""
+        print(f"\n[5/{len(self.SUB_STEPS)}] Git 변경사항 검토 중...")
+
+        with self._prepare_lock:
+            stats = self._diff_stats()
+
+        if stats is None:
+            print(f"   ⚠️  베이스 브랜치({self.config.review.base_branch})와 비교할 수 없어 건너뜁니다")
+            return {'errors': 0, 'warnings': 0, 'files_changed': 0, 'additions': 0, 'deletions': 0}
 
         print("   ✅ Git 변경사항 검토 완료")
-        print("   - 변경된 파일: 5개")
-        print("   - 추가: +120 라인")
-        print("   - 삭제: -30 라인")
+        print(f"   - 비교: {stats['base'][:10]}..{stats['head'][:10]} (작업 디렉토리)")
+        print(f"   - 변경된 파일: {stats['files_changed']}개 (이름 변경 {stats['renames']}개, 바이너리 {stats['binary']}개)")
+        print(f"   - 추가: +{stats['additions']} 라인")
+        print(f"   - 삭제: -{stats['deletions']} 라인")
+
+        files = sorted(stats['files'], key=lambda f: f['added'] + f['deleted'], reverse=True)
+        for entry in files[:5]:
+            path = f"{entry['old_path']} → {entry['path']}" if entry['old_path'] else entry['path']
+            counts = "바이너리" if entry['binary'] else f"+{entry['added']} -{entry['deleted']}"
+            print(f"     {entry['status']} {path} ({counts})")
+
+        return {
+            'errors': 0,
+            'warnings': 0,
+            'base': stats['base'],
+            'head': stats['head'],
+            'files_changed': stats['files_changed'],
+            'additions': stats['additions'],
+            'deletions': stats['deletions'],
+            'renames': stats['renames'],
+            'binary': stats['binary'],
+            'files': files[:MAX_REPORTED_ISSUES],
+        }
+
+    def _start_sonarqube(self) -> None:
+        """SonarQube 가 설정되어 있고 이전 실행에서 완료되지 않았으면 분석을 백그라운드로 시작"""
+        settings = self.config.review
+        if not self.config.sonarqube_url or not settings.sonarqube_project_key:
+            return
+        if self.sub_steps.get("sonarqube", {}).get("status") == SUB_STEP_COMPLETED:
+            return
+
+        print(f"🔭 SonarQube 분석 제출 ({settings.sonarqube_project_key}) - 결과는 다른 검사와 동시에 대기")
+        self._sonarqube = SonarQubeClient(
+            self.config.sonarqube_url,
+            self.config.sonarqube_token,
+            settings.sonarqube_project_key,
+            workdir=self.workdir,
+            scanner=settings.sonarqube_scanner,
+            timeout=settings.sonarqube_timeout,
+            poll_interval=settings.sonarqube_poll_interval,
+            max_poll_interval=settings.sonarqube_max_poll_interval,
+            max_issues=MAX_REPORTED_ISSUES,
+            sandbox=sandbox_from_config(self.config),
+            log_name=f"sonar-scanner-{self.ticket_id}"
+        ).start()
+
+    def _check_sonarqube(self) -> Dict[str, Any]:
+        """SonarQube 품질 게이트 및 신규 코드 이슈 (게이트 ERROR 는 에러, 신규 이슈는 경고)"""
+        print(f"\n[6/{len(self.SUB_STEPS)}] SonarQube 품질 게이트 확인 중...")
+
+        if self._sonarqube is None:
+            print("   ⏭️  SonarQube 미설정 (SONARQUBE_URL, SONARQUBE_PROJECT_KEY) - 건너뜀")
+            return {'errors': 0, 'warnings': 0, 'skipped': True}
+
+        result = self._sonarqube.result()
+        gate = result['quality_gate']
+        icon = "❌" if gate == 'ERROR' else "✅"
+        print(
+            f"   {icon} 품질 게이트: {gate} (분석 {result['duration_seconds']}초, 작업 조회 {result['polls']}회), "
+            f"신규 코드 이슈 {result['new_issues']}개"
+        )
+        for condition in result['conditions']:
+            print(
+                f"   - {condition.get('metricKey')}: {condition.get('actualValue')} "
+                f"({condition.get('comparator')} {condition.get('errorThreshold')}, {condition.get('status')})"
+            )
+        for issue in result['issues'][:10]:
+            print(f"   - {issue['file']}:{issue['line']} [{issue['rule']}] {issue['severity']} {issue['message']}")
+        if result['dashboard']:
+            print(f"   - 대시보드: {result['dashboard']}")
+
+        issues = [
+            {
+                'file': issue['file'],
+                'line': issue['line'],
+                'rule': issue['rule'],
+                'message': f"[{issue['severity']}] {issue['message']}",
+                'severity': SEVERITY_WARNING,
+                'phase': 'sonarqube',
+            }
+            for issue in result['issues']
+        ]
+        if gate == 'ERROR':
+            failed = ', '.join(condition.get('metricKey', '?') for condition in result['conditions'])
+            issues.insert(0, {
+                'file': None,
+                'line': None,
+                'rule': 'quality_gate',
+                'message': f"SonarQube 품질 게이트 실패: {failed}",
+                'severity': SEVERITY_ERROR,
+                'phase': 'sonarqube',
+            })
+
+        return {
+            'errors': 1 if gate == 'ERROR' else 0,
+            'warnings': result['new_issues'],
+            'quality_gate': gate,
+            'task': result['task'],
+            'dashboard': result['dashboard'],
+            'conditions': result['conditions'],
+            'issues': issues,
+        }
 
     def _print_summary(self):
         """리뷰 결과 요약"""
@@ -171,11 +392,19 @@ def main():
     )
     parser.add_argument("ticket_id", help="JIRA 티켓 ID")
     parser.add_argument("--branch", default="", help="Git 브랜치명")
+    parser.add_argument("--resume", action="store_true", help="완료된 하위 단계 건너뛰기")
 
     args = parser.parse_args()
 
-    agent = ReviewAgent(args.ticket_id, args.branch)
-    success = agent.run()
+    # MainAgent가 TRACEPARENT로 넘겨준 컨텍스트가 있으면 그 아래에 span 기록
+    init_tracing('review-agent')
+
+    sub_steps, on_progress = checkpoint_progress(
+        args.ticket_id, ReviewAgent.step_name, get_config().checkpoint_dir, resume=args.resume
+    )
+    agent = ReviewAgent(args.ticket_id, args.branch, sub_steps, on_progress)
+    with span('agent.review', **{'workflow.ticket_id': args.ticket_id}):
+        success = agent.run()
 
     sys.exit(0 if success else 1)
 
@@ -5,7 +5,7 @@ Claude Code SubAgent - Backlog Manager
 JIRA JQL을 사용한 백로그 조회 및 관리
 """
 
-import requests
+import http_client
 import base64
 from typing import Optional, Dict, Any, List
 from config import get_config
@@ -16,7 +16,7 @@ class BacklogManager:
 
     def __init__(self):
         """Backlog Manager 초기화"""
-        self.config = get_config()
+        self.config = get_config(require=('jira',))
         self.base_url = self.config.jira_url
         self.email = self.config.jira_email
         self.api_token = self.config.jira_api_token
@@ -44,8 +44,10 @@ class BacklogManager:
             url = f"{self.base_url}/rest/agile/1.0/board"
             params = {"projectKeyOrId": self.project_key}
 
-            response = requests.get(
+            response = http_client.get(
                 url,
+                endpoint='/rest/agile/1.0/board',
+                service='jira',
                 headers=self.headers,
                 params=params,
                 timeout=10
@@ -93,8 +95,10 @@ class BacklogManager:
                 'fields': 'summary,status,priority,assignee,labels,created,updated'
             }
 
-            response = requests.get(
+            response = http_client.get(
                 url,
+                endpoint='/rest/agile/1.0/board/{boardId}/backlog',
+                service='jira',
                 headers=self.headers,
                 params=params,
                 timeout=10
@@ -160,8 +164,10 @@ class BacklogManager:
                 'fields': ['summary', 'status', 'priority', 'assignee', 'labels', 'created', 'updated']
             }
 
-            response = requests.post(
+            response = http_client.post(
                 url,
+                endpoint='/rest/api/2/search',
+                service='jira',
                 json=payload,
                 headers=self.headers,
                 timeout=10
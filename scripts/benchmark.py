@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+"""
+Claude Code SubAgent - Benchmark
+
+로컬 스텁 서버(stub_server.py)를 대상으로 자동화 계층의 성능을 측정하고
+JSON 기준선(baseline)과 비교하여 회귀를 찾아냅니다.
+
+시나리오:
+    jira_fetch       단일 이슈 조회 지연 시간
+    bulk_update      티켓 100개 상태 전환 + 코멘트 (update_jira.py 방식)
+    backlog_create   Epic/Story/Task 60개 백로그 생성 (JiraMultiClusterSetup 방식)
+    sprint_planning  스프린트 생성 → 이슈 배정 → 시작
+    checkpoint_ops   체크포인트 저장/로드/목록 1,000회
+    main_agent       MainAgent 전체 워크플로우 N개 티켓 (티켓마다 일회용 clone, 캐시 없이)
+
+사용법:
+    python scripts/benchmark.py run --output benchmarks/latest.json
+    python scripts/benchmark.py run --scenario jira_fetch --scenario bulk_update --latency-ms 20
+    python scripts/benchmark.py run --save-baseline
+    python scripts/benchmark.py compare benchmarks/baseline.json benchmarks/latest.json --threshold 0.15
+
+기준선은 실행 머신에 따라 달라지므로 CI에서는 같은 러너에서 만든 기준선과 비교하세요.
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import subprocess
+from contextlib import contextmanager, redirect_stdout
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# scripts/ 및 scripts/agents/ 를 sys.path에 추가
+SCRIPTS_DIR = Path(__file__).resolve().parent
+for _path in (SCRIPTS_DIR, SCRIPTS_DIR / 'agents'):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+from stub_server import StubFaults, StubServer
+
+DEFAULT_BASELINE = Path('benchmarks/baseline.json')
+DEFAULT_OUTPUT = Path('benchmarks/latest.json')
+
+# 비교 대상 지표 (값이 클수록 나쁨)
+COMPARED_METRICS = ('p50_ms', 'p95_ms', 'total_s')
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """최근접 순위(nearest-rank) 백분위수"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def summarize(samples: List[float], total: float) -> Dict[str, float]:
+    """
+    구간별 소요 시간(초) 목록을 통계로 요약
+
+    Args:
+        samples: 연산 1회당 소요 시간 (초)
+        total: 시나리오 전체 소요 시간 (초)
+
+    Returns:
+        ops, total_s, ops_per_sec, mean/p50/p95/p99/max (ms)
+    """
+    ms = [s * 1000 for s in samples]
+    return {
+        'ops': len(ms),
+        'total_s': round(total, 4),
+        'ops_per_sec': round(len(ms) / total, 2) if total > 0 else 0.0,
+        'mean_ms': round(sum(ms) / len(ms), 3) if ms else 0.0,
+        'p50_ms': round(percentile(ms, 50), 3),
+        'p95_ms': round(percentile(ms, 95), 3),
+        'p99_ms': round(percentile(ms, 99), 3),
+        'max_ms': round(max(ms), 3) if ms else 0.0,
+    }
+
+
+class Recorder:
+    """연산 단위 소요 시간 수집기"""
+
+    def __init__(self):
+        self.samples: List[float] = []
+        self.failures = 0
+
+    def measure(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """함수를 실행하고 소요 시간 기록 (None/False 반환은 실패로 집계)"""
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        self.samples.append(time.perf_counter() - start)
+        if result is None or result is False:
+            self.failures += 1
+        return result
+
+
+class BenchContext:
+    """시나리오 실행 환경 (스텁 서버, 작업 디렉토리, 옵션)"""
+
+    def __init__(self, server: StubServer, workdir: Path, args: argparse.Namespace):
+        self.server = server
+        self.workdir = workdir
+        self.args = args
+
+    def api_calls(self) -> int:
+        """스텁 서버가 받은 API 요청 수 (관리용 엔드포인트 제외)"""
+        with self.server.state.lock:
+            return sum(self.server.state.requests.values())
+
+
+def clone_workspace(dest: Path) -> Path:
+    """
+    워크플로우를 실행할 일회용 작업 디렉토리 (이 저장소 HEAD 의 --shared clone)
+
+    MainAgent 하위 에이전트는 현재 디렉토리에서 리뷰/문서 생성/브랜치 작업을 하므로
+    개발 중인 작업 트리에 산출물(docs/, 브랜치 등)이 남지 않도록 분리합니다.
+
+    Args:
+        dest: clone 할 경로 (없어야 함)
+
+    Returns:
+        dest
+    """
+    root = subprocess.run(
+        ['git', 'rev-parse', '--show-toplevel'],
+        cwd=SCRIPTS_DIR,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout.strip()
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    subprocess.run(['git', 'clone', '--quiet', '--shared', root, str(dest)], check=True)
+    return dest
+
+
+@contextmanager
+def isolated_workspace(workspace: Path):
+    """
+    일회용 작업 디렉토리에서 캐시 없이 실행 (cwd, 체크포인트/캐시 디렉토리, 단계 캐시 끔)
+
+    체크포인트와 리뷰/빌드/문서 캐시도 작업 디렉토리 안(.tkm)에 두어 이전 티켓의 결과를 재사용하지 않습니다.
+    """
+    from config import get_config
+
+    saved_cwd = os.getcwd()
+    saved_env = {name: os.environ.get(name) for name in ('CHECKPOINT_DIR', 'STEP_CACHE_ENABLED')}
+    os.chdir(workspace)
+    os.environ['CHECKPOINT_DIR'] = str(workspace / '.tkm')
+    os.environ['STEP_CACHE_ENABLED'] = 'false'
+    get_config(reload=True)
+    try:
+        yield workspace
+    finally:
+        os.chdir(saved_cwd)
+        for name, value in saved_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        get_config(reload=True)
+
+
+# 시나리오 이름 → 실행 함수
+SCENARIOS: Dict[str, Callable[[BenchContext, Recorder], None]] = {}
+
+
+def scenario(name: str):
+    """시나리오 등록 데코레이터"""
+    def register(func: Callable[[BenchContext, Recorder], None]):
+        SCENARIOS[name] = func
+        return func
+    return register
+
+
+@scenario('jira_fetch')
+def bench_jira_fetch(ctx: BenchContext, rec: Recorder) -> None:
+    """단일 이슈 조회"""
+    from jira_client import JiraClient
+
+    key = ctx.server.state.seed_issues(1)[0]
+    client = JiraClient()
+    for _ in range(ctx.args.iterations):
+        rec.measure(client.get_issue, key)
+
+
+@scenario('bulk_update')
+def bench_bulk_update(ctx: BenchContext, rec: Recorder) -> None:
+    """티켓 100개 상태 전환 + 결과 코멘트 (update_jira.py 방식)"""
+    from jira_client import JiraClient
+
+    client = JiraClient()
+    keys = ctx.server.state.seed_issues(100)
+
+    def update_ticket(key: str) -> bool:
+        commented = client.add_comment(key, f"## 테스트 결과: 성공 ✅\n\n{key} 검증 완료")
+        return client.update_status(key, '완료') and commented
+
+    for key in keys:
+        rec.measure(update_ticket, key)
+
+
+@scenario('backlog_create')
+def bench_backlog_create(ctx: BenchContext, rec: Recorder) -> None:
+    """Epic 4 / Story 8 / Task 48 = 60개 백로그 생성 (JiraMultiClusterSetup 방식)"""
+    from config import get_config
+    import http_client
+
+    jira = get_config().jira
+    url = f"{jira.url}/rest/api/2/issue"
+    auth = (jira.email, jira.api_token)
+
+    def create(fields: Dict[str, Any]) -> Optional[str]:
+        fields = {'project': {'key': jira.project_key}, 'description': 'benchmark', **fields}
+        response = http_client.post(
+            url,
+            endpoint='/rest/api/2/issue',
+            service='jira',
+            json={'fields': fields},
+            auth=auth,
+            timeout=10
+        )
+        return response.json()['key'] if response.status_code == 201 else None
+
+    for e in range(4):
+        epic = rec.measure(create, {
+            'summary': f"Epic {e + 1}",
+            'issuetype': {'name': 'Epic'},
+            'priority': {'name': 'High'},
+        })
+        for s in range(2):
+            story = rec.measure(create, {
+                'summary': f"Story {e + 1}.{s + 1}",
+                'issuetype': {'name': 'Story'},
+                'priority': {'name': 'Medium'},
+                'customfield_10014': epic,
+                'customfield_10016': 5,
+                'labels': ['multi-cluster'],
+            })
+            for t in range(6):
+                rec.measure(create, {
+                    'summary': f"Task {e + 1}.{s + 1}.{t + 1}",
+                    'issuetype': {'name': 'Task'},
+                    'parent': {'key': story},
+                    'priority': {'name': 'Medium'},
+                })
+
+
+@scenario('sprint_planning')
+def bench_sprint_planning(ctx: BenchContext, rec: Recorder) -> None:
+    """스프린트 3개 생성 → 백로그 60개 배정 → 첫 스프린트 시작"""
+    from sprint_manager import SprintManager
+    from backlog_manager import BacklogManager
+
+    ctx.server.state.seed_issues(60)
+    sprints = SprintManager()
+    backlog = BacklogManager()
+
+    issues = rec.measure(backlog.get_backlog_issues, max_results=60) or []
+    keys = [issue['key'] for issue in issues]
+
+    created = []
+    for i in range(3):
+        sprint = rec.measure(sprints.create_sprint, f"Sprint {i + 1}", f"Goal {i + 1}")
+        if sprint:
+            created.append(sprint['id'])
+
+    for i, sprint_id in enumerate(created):
+        rec.measure(sprints.add_issues_to_sprint, sprint_id, keys[i * 20:(i + 1) * 20])
+
+    if created:
+        rec.measure(sprints.start_sprint, created[0], 14)
+    rec.measure(sprints.get_sprints)
+
+
+@scenario('checkpoint_ops')
+def bench_checkpoint_ops(ctx: BenchContext, rec: Recorder) -> None:
+    """체크포인트 저장/로드/목록 1,000회 (저장 500 + 로드 400 + 목록 100)"""
+    from checkpoint_manager import CheckpointManager
+
+    manager = CheckpointManager(str(ctx.workdir / 'checkpoint_ops'))
+    state = {
+        'ticket_id': None,
+        'status': 'in_progress',
+        'steps': {name: {'status': 'completed', 'error': None} for name in (
+            'jira_fetch', 'git_branch', 'backend_dev', 'qa_test',
+            'code_review', 'documentation', 'pr_creation'
+        )},
+        'metadata': {'jira_summary': 'x' * 200, 'jira_labels': ['backend', 'api']},
+    }
+
+    tickets = [f"BENCH-{i}" for i in range(50)]
+    for i in range(500):
+        ticket = tickets[i % len(tickets)]
+        rec.measure(manager.save, ticket, dict(state, ticket_id=ticket))
+    for i in range(400):
+        rec.measure(manager.load, tickets[i % len(tickets)])
+    for _ in range(100):
+        rec.measure(manager.list_checkpoints)
+
+
+@scenario('main_agent')
+def bench_main_agent(ctx: BenchContext, rec: Recorder) -> None:
+    """MainAgent 전체 워크플로우 N개 티켓 (티켓마다 일회용 clone, 단계 캐시 없이)"""
+    from main_agent import MainAgent
+
+    def run_ticket(key: str) -> bool:
+        agent = MainAgent(key, use_cache=False)
+        try:
+            agent.run()
+        except SystemExit:
+            # 워크플로우 실패 시 MainAgent는 sys.exit(1) 호출
+            return False
+        return agent.state['status'] == 'completed'
+
+    for key in ctx.server.state.seed_issues(ctx.args.tickets):
+        # clone 은 측정 구간 밖에서 준비
+        workspace = clone_workspace(ctx.workdir / 'workspaces' / key)
+        with isolated_workspace(workspace):
+            rec.measure(run_ticket, key)
+
+
+def _git_sha() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=SCRIPTS_DIR,
+            capture_output=True,
+            text=True,
+            check=False
+        )
+        return result.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def run_benchmarks(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    선택한 시나리오를 스텁 서버 대상으로 실행
+
+    Returns:
+        결과 딕셔너리 (메타데이터 + 시나리오별 통계)
+    """
+    from config import get_config
+
+    names = args.scenario or list(SCENARIOS)
+    faults = StubFaults(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, seed=0)
+    results: Dict[str, Any] = {}
+
+    with tempfile.TemporaryDirectory(prefix='tkm-bench-') as tmp, StubServer(faults=faults) as server:
+        workdir = Path(tmp)
+        os.environ.update(server.env())
+        os.environ['CHECKPOINT_DIR'] = str(workdir / 'checkpoints')
+        get_config(reload=True)
+
+        ctx = BenchContext(server, workdir, args)
+        for name in names:
+            server.state.reset()
+            rec = Recorder()
+            calls_before = ctx.api_calls()
+
+            print(f"⏱️  {name} ...", end=' ', flush=True)
+            start = time.perf_counter()
+            with redirect_stdout(io.StringIO()):
+                SCENARIOS[name](ctx, rec)
+            total = time.perf_counter() - start
+
+            stats = summarize(rec.samples, total)
+            stats['failures'] = rec.failures
+            stats['api_calls'] = ctx.api_calls() - calls_before
+            results[name] = stats
+            print(f"{stats['ops']} ops, p50 {stats['p50_ms']}ms, p95 {stats['p95_ms']}ms, "
+                  f"{stats['api_calls']} API calls")
+
+    return {
+        'created_at': datetime.now().isoformat(),
+        'git_sha': _git_sha(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'options': {
+            'iterations': args.iterations,
+            'tickets': args.tickets,
+            'latency_ms': args.latency_ms,
+            'jitter_ms': args.jitter_ms,
+        },
+        'scenarios': results,
+    }
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float,
+    min_delta_ms: float = 0.5
+) -> List[str]:
+    """
+    기준선 대비 회귀 목록 반환
+
+    지연 시간 지표는 threshold(비율)와 min_delta_ms(절대값)를 모두 넘어 증가하면,
+    API 호출 수와 실패 수는 조금이라도 증가하면 회귀로 판단합니다.
+
+    Args:
+        baseline: 기준선 결과
+        current: 현재 결과
+        threshold: 허용 증가율 (0.10 = 10%)
+        min_delta_ms: 무시할 절대 증가량 (sub-ms 지표의 측정 잡음 방지)
+
+    Returns:
+        회귀 설명 문자열 리스트
+    """
+    regressions = []
+
+    for name, now in current.get('scenarios', {}).items():
+        before = baseline.get('scenarios', {}).get(name)
+        if before is None:
+            print(f"  ➕ {name}: 기준선 없음")
+            continue
+
+        print(f"  {name}")
+        for metric in COMPARED_METRICS:
+            old, new = before.get(metric, 0.0), now.get(metric, 0.0)
+            change = (new - old) / old if old else 0.0
+            delta_ms = (new - old) * (1000 if metric.endswith('_s') else 1)
+            regressed = change > threshold and delta_ms > min_delta_ms
+            icon = '❌' if regressed else '✅'
+            print(f"    {icon} {metric:10s} {old:10.3f} → {new:10.3f} ({change:+.1%})")
+            if regressed:
+                regressions.append(f"{name}.{metric}: {old:.3f} → {new:.3f} ({change:+.1%})")
+
+        for metric in ('api_calls', 'failures'):
+            old, new = before.get(metric, 0), now.get(metric, 0)
+            if new > old:
+                print(f"    ❌ {metric:10s} {old:10d} → {new:10d}")
+                regressions.append(f"{name}.{metric}: {old} → {new}")
+
+    return regressions
+
+
+def _load(path: Path) -> Dict[str, Any]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write(path: Path, data: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    print(f"💾 결과 저장: {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="자동화 계층 벤치마크 (로컬 스텁 서버 대상)")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='벤치마크 실행')
+    run_parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS),
+                            help='실행할 시나리오 (반복 지정 가능, 기본: 전체)')
+    run_parser.add_argument('--iterations', type=int, default=100, help='jira_fetch 반복 횟수')
+    run_parser.add_argument('--tickets', type=int, default=10, help='main_agent 티켓 수')
+    run_parser.add_argument('--latency-ms', type=float, default=0.0, help='스텁 응답 지연 (ms)')
+    run_parser.add_argument('--jitter-ms', type=float, default=0.0, help='스텁 추가 무작위 지연 (ms)')
+    run_parser.add_argument('--output', type=Path, default=DEFAULT_OUTPUT, help='결과 JSON 경로')
+    run_parser.add_argument('--save-baseline', action='store_true',
+                            help=f'결과를 기준선({DEFAULT_BASELINE})으로도 저장')
+    run_parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE, help='기준선 JSON 경로')
+
+    compare_parser = subparsers.add_parser('compare', help='기준선과 비교')
+    compare_parser.add_argument('baseline', type=Path, nargs='?', default=DEFAULT_BASELINE)
+    compare_parser.add_argument('current', type=Path, nargs='?', default=DEFAULT_OUTPUT)
+    compare_parser.add_argument('--threshold', type=float, default=0.10,
+                                help='회귀로 판단할 증가율 (기본 0.10 = 10%%)')
+    compare_parser.add_argument('--min-delta-ms', type=float, default=0.5,
+                                help='회귀로 판단할 최소 절대 증가량 (ms)')
+
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        result = run_benchmarks(args)
+        _write(args.output, result)
+        if args.save_baseline:
+            _write(args.baseline, result)
+        return
+
+    print(f"📊 {args.baseline} → {args.current} (허용 {args.threshold:.0%})")
+    regressions = compare(
+        _load(args.baseline), _load(args.current), args.threshold, args.min_delta_ms
+    )
+
+    print()
+    if regressions:
+        print(f"❌ 회귀 {len(regressions)}건")
+        for regression in regressions:
+            print(f"   - {regression}")
+        sys.exit(1)
+
+    print("✅ 회귀 없음")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Claude Code SubAgent - Build Cache
+
+content-addressed 빌드 산출물 캐시 (Backend Agent 빌드 단계용)
+
+키는 소스 tree 해시 + 툴체인 버전 + 빌드 명령/산출물 설정의 해시이며,
+키가 같으면 Gradle/Maven 빌드를 다시 실행하지 않고 저장해 둔 산출물(jar 등)을 작업 디렉토리에 복원합니다.
+로컬 캐시는 마지막 사용 시각(manifest mtime) 기준 LRU 로 BUILD_CACHE_MAX_MB 이하를 유지하고,
+BUILD_SHARED_CACHE_DIR 이 있으면 로컬에 없을 때 공유 디렉토리에서 가져오고 저장할 때 함께 기록합니다.
+
+저장 구조:
+    <cache_dir>/<key[:2]>/<key>.tar     산출물 (작업 디렉토리 기준 상대 경로)
+    <cache_dir>/<key[:2]>/<key>.json    manifest (명령, 툴체인, 산출물 목록, 빌드 시간, 크기)
+"""
+
+import os
+import json
+import glob
+import shlex
+import shutil
+import tarfile
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from step_cache import input_key
+from tracing import traced_run
+
+# 빌드 파일 → (빌드 명령, 기본 산출물 glob). 테스트는 QA 단계에서 실행하므로 빌드는 패키징까지만
+BUILD_TOOLS: List[Tuple[str, str, List[str]]] = [
+    ('gradlew', './gradlew assemble', ['build/libs/*', '*/build/libs/*']),
+    ('build.gradle.kts', 'gradle assemble', ['build/libs/*', '*/build/libs/*']),
+    ('build.gradle', 'gradle assemble', ['build/libs/*', '*/build/libs/*']),
+    ('pom.xml', 'mvn -B -q -DskipTests package', ['target/*.jar', '*/target/*.jar']),
+]
+
+# 툴체인 버전 출력 캐시: {명령: 출력}
+_toolchain: Dict[str, str] = {}
+_toolchain_lock = threading.Lock()
+
+
+def detect_build(workdir: Path) -> Optional[Tuple[str, List[str]]]:
+    """
+    작업 디렉토리의 빌드 도구 감지
+
+    Args:
+        workdir: 작업 디렉토리
+
+    Returns:
+        (빌드 명령, 기본 산출물 glob) 또는 None (빌드 파일 없음)
+    """
+    for marker, command, artifacts in BUILD_TOOLS:
+        if (Path(workdir) / marker).exists():
+            return command, artifacts
+    return None
+
+
+def toolchain_fingerprint(commands: Iterable[str]) -> Dict[str, str]:
+    """
+    툴체인 버전 (캐시 키용, 프로세스당 한 번만 실행)
+
+    Args:
+        commands: 버전 확인 명령 (예: 'java -version')
+
+    Returns:
+        {명령: 버전 출력} (명령이 없으면 'missing')
+    """
+    fingerprint = {'JAVA_HOME': os.environ.get('JAVA_HOME', '')}
+    for command in commands:
+        with _toolchain_lock:
+            if command not in _toolchain:
+                try:
+                    result = traced_run(
+                        shlex.split(command),
+                        capture_output=True,
+                        text=True,
+                        errors='replace',
+                        timeout=60,
+                        check=False
+                    )
+                    # java -version 은 stderr 로 출력
+                    _toolchain[command] = (result.stdout + result.stderr).strip()
+                except (OSError, ValueError):
+                    _toolchain[command] = 'missing'
+            fingerprint[command] = _toolchain[command]
+    return fingerprint
+
+
+def build_key(tree: str, toolchain: Dict[str, str], command: str, artifacts: List[str]) -> str:
+    """
+    빌드 캐시 키
+
+    Args:
+        tree: 소스 tree 해시 (step_cache.git_tree_hash)
+        toolchain: toolchain_fingerprint() 결과
+        command: 빌드 명령
+        artifacts: 산출물 glob
+
+    Returns:
+        SHA-256 hex digest
+    """
+    return input_key('build', {
+        'tree': tree,
+        'toolchain': toolchain,
+        'command': command,
+        'artifacts': sorted(artifacts),
+    })
+
+
+def collect_artifacts(workdir: Path, patterns: Iterable[str]) -> List[str]:
+    """
+    산출물 glob 에 해당하는 경로 (작업 디렉토리 기준, 정렬)
+
+    Args:
+        workdir: 작업 디렉토리
+        patterns: 산출물 glob
+
+    Returns:
+        상대 경로 목록
+    """
+    paths = set()
+    for pattern in patterns:
+        for path in glob.glob(pattern, root_dir=workdir):
+            paths.add(Path(path).as_posix())
+    return sorted(paths)
+
+
+class BuildCache:
+    """LRU 용량 제한 content-addressed 빌드 산출물 저장소"""
+
+    def __init__(self, cache_dir: str, max_bytes: int, shared_dir: Optional[str] = None):
+        """
+        Build Cache 초기화
+
+        Args:
+            cache_dir: 로컬 캐시 디렉토리
+            max_bytes: 로컬 캐시 용량 상한 (넘으면 오래 쓰지 않은 항목부터 삭제)
+            shared_dir: 공유 캐시 디렉토리 (팀/CI 러너 간 공유, 선택)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.shared_dir = Path(shared_dir) if shared_dir else None
+
+    @staticmethod
+    def _paths(root: Path, key: str) -> Tuple[Path, Path]:
+        base = root / key[:2] / key
+        return base.with_suffix('.tar'), base.with_suffix('.json')
+
+    @staticmethod
+    def _copy(source: Path, target: Path) -> None:
+        """임시 파일 → rename 으로 원자적 복사 (동시에 읽는 쪽이 반쯤 쓴 파일을 보지 않도록)"""
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=target.parent, prefix='.tmp-')
+        os.close(fd)
+        try:
+            shutil.copyfile(source, tmp)
+            os.replace(tmp, target)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시 항목 조회 (로컬에 없으면 공유 디렉토리에서 가져옴, 적중 시 LRU 시각 갱신)
+
+        Args:
+            key: build_key() 결과
+
+        Returns:
+            manifest 또는 None
+        """
+        archive, manifest = self._paths(self.cache_dir, key)
+
+        if not (archive.exists() and manifest.exists()) and self.shared_dir:
+            shared_archive, shared_manifest = self._paths(self.shared_dir, key)
+            if shared_archive.exists() and shared_manifest.exists():
+                try:
+                    self._copy(shared_archive, archive)
+                    self._copy(shared_manifest, manifest)
+                except OSError as e:
+                    print(f"⚠️  공유 빌드 캐시 읽기 실패 ({shared_manifest}): {e}")
+
+        try:
+            with open(manifest, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"⚠️  빌드 캐시 읽기 실패 ({manifest}): {e}")
+            return None
+
+        if not archive.exists():
+            return None
+        os.utime(manifest)
+        return entry
+
+    def restore(self, key: str, workdir: Path) -> List[str]:
+        """
+        산출물을 작업 디렉토리에 복원
+
+        Args:
+            key: build_key() 결과
+            workdir: 작업 디렉토리
+
+        Returns:
+            복원한 산출물 경로 목록
+        """
+        archive, _ = self._paths(self.cache_dir, key)
+        with tarfile.open(archive, 'r') as tar:
+            names = tar.getnames()
+            if hasattr(tarfile, 'data_filter'):
+                tar.extractall(workdir, filter='data')
+            else:
+                tar.extractall(workdir)
+        return names
+
+    def put(self, key: str, workdir: Path, artifacts: List[str], manifest: Dict[str, Any]) -> int:
+        """
+        산출물 저장 후 용량 상한에 맞춰 오래된 항목 삭제
+
+        Args:
+            key: build_key() 결과
+            workdir: 작업 디렉토리
+            artifacts: 저장할 산출물 (작업 디렉토리 기준 상대 경로)
+            manifest: 함께 저장할 빌드 정보 (명령, 툴체인, 빌드 시간 ...)
+
+        Returns:
+            저장한 산출물 크기 (bytes)
+        """
+        archive, manifest_path = self._paths(self.cache_dir, key)
+        archive.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp = tempfile.mkstemp(dir=archive.parent, prefix='.tmp-')
+        os.close(fd)
+        try:
+            with tarfile.open(tmp, 'w') as tar:
+                for path in artifacts:
+                    tar.add(Path(workdir) / path, arcname=path)
+            os.replace(tmp, archive)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+        size = archive.stat().st_size
+        entry = dict(
+            manifest,
+            key=key,
+            artifacts=artifacts,
+            size=size,
+            created_at=datetime.now().isoformat()
+        )
+        fd, tmp = tempfile.mkstemp(dir=archive.parent, prefix='.tmp-')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, indent=2, ensure_ascii=False)
+        os.replace(tmp, manifest_path)
+
+        if self.shared_dir:
+            shared_archive, shared_manifest = self._paths(self.shared_dir, key)
+            try:
+                # manifest 를 나중에 써야 다른 러너가 산출물 없는 항목을 보지 않음
+                self._copy(archive, shared_archive)
+                self._copy(manifest_path, shared_manifest)
+            except OSError as e:
+                print(f"⚠️  공유 빌드 캐시 저장 실패 ({shared_manifest}): {e}")
+
+        self.evict()
+        return size
+
+    def evict(self) -> int:
+        """
+        용량 상한을 넘으면 마지막 사용 시각이 오래된 항목부터 삭제 (로컬 캐시만)
+
+        Returns:
+            삭제한 항목 수
+        """
+        entries = []
+        total = 0
+        for manifest in self.cache_dir.glob('*/*.json'):
+            archive = manifest.with_suffix('.tar')
+            try:
+                used = manifest.stat().st_mtime
+                size = manifest.stat().st_size + (archive.stat().st_size if archive.exists() else 0)
+            except FileNotFoundError:
+                continue
+            entries.append((used, size, manifest, archive))
+            total += size
+
+        evicted = 0
+        for used, size, manifest, archive in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            # manifest 를 먼저 지워야 조회 쪽이 산출물 없는 항목을 적중으로 보지 않음
+            manifest.unlink(missing_ok=True)
+            archive.unlink(missing_ok=True)
+            total -= size
+            evicted += 1
+        return evicted
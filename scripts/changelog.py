@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Claude Code SubAgent - Changelog Builder
+
+두 ref 사이의 git log 를 스트리밍으로 읽어 티켓/변경 유형별 변경 로그 생성
+
+커밋 메시지는 Conventional Commits(`feat(api)!: ...`)로 해석하고, 제목/본문의 티켓 키(예: TERRAFORM-57)로
+항목을 묶습니다. 티켓 요약은 등장한 티켓 전체를 JQL `key in (...)` 한 번(100건 단위)으로 조회합니다.
+git log 출력은 읽는 대로 처리하므로 수천 개 커밋도 전체를 메모리에 올리지 않습니다.
+
+사용법:
+    python scripts/changelog.py --from v1.2.0 --to HEAD
+    python scripts/changelog.py --from v1.2.0 --title v1.3.0 --output CHANGELOG.md
+    python scripts/changelog.py --no-jira          # 마지막 태그부터 HEAD 까지, Jira 조회 없이
+"""
+
+import re
+import sys
+import time
+import argparse
+import subprocess
+from collections import OrderedDict
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+from diff_stats import nul_tokens
+from tracing import span, traced_run
+
+# 커밋 필드 구분자 (%x1f) - 커밋 사이는 git log -z 의 NUL
+_FIELD = '\x1f'
+_FORMAT = _FIELD.join(['%H', '%aI', '%an', '%s', '%b'])
+
+_CONVENTIONAL = re.compile(r'^(?P<type>[a-zA-Z]+)(?:\((?P<scope>[^)]*)\))?(?P<breaking>!)?:\s*(?P<subject>.+)$')
+_TICKET = re.compile(r'\b([A-Z][A-Z0-9]+-[1-9]\d*)\b')
+# 제목 앞의 티켓 표기: "[FINOPS-1] ", "FINOPS-1: ", "FINOPS-1 - "
+_TICKET_PREFIX = re.compile(r'^\s*\[?([A-Z][A-Z0-9]+-[1-9]\d*)\]?\s*[:\-]?\s*')
+_BREAKING_FOOTER = re.compile(r'^BREAKING[ -]CHANGE:', re.MULTILINE)
+
+# 변경 유형 → 섹션 (출력 순서)
+SECTIONS = OrderedDict([
+    ('breaking', 'Breaking Changes'),
+    ('feat', 'Added'),
+    ('fix', 'Fixed'),
+    ('perf', 'Performance'),
+    ('refactor', 'Changed'),
+    ('revert', 'Reverted'),
+    ('docs', 'Documentation'),
+    ('maintenance', 'Maintenance'),
+    ('other', 'Other'),
+])
+
+_TYPE_ALIASES = {
+    'feature': 'feat',
+    'bugfix': 'fix',
+    'hotfix': 'fix',
+    'style': 'refactor',
+    'test': 'maintenance',
+    'tests': 'maintenance',
+    'build': 'maintenance',
+    'ci': 'maintenance',
+    'chore': 'maintenance',
+    'deps': 'maintenance',
+}
+
+# 티켓 없는 커밋의 그룹 키
+NO_TICKET = ''
+
+
+def stream_commits(
+    repo_path: Path,
+    since: Optional[str],
+    until: str = 'HEAD',
+    paths: Iterable[str] = (),
+    include_merges: bool = False
+) -> Iterator[Dict[str, str]]:
+    """
+    since..until 커밋을 최신순으로 스트리밍
+
+    Args:
+        repo_path: Git 저장소 경로
+        since: 시작 ref (제외, None 이면 처음부터)
+        until: 끝 ref (포함)
+        paths: 이 경로를 바꾼 커밋만
+        include_merges: 머지 커밋 포함 여부
+
+    Yields:
+        {'sha', 'date', 'author', 'subject', 'body'}
+
+    Raises:
+        RuntimeError: git log 실패 (ref 없음 등)
+    """
+    argv = ['git', 'log', '-z', f'--format={_FORMAT}', f"{since}..{until}" if since else until]
+    if not include_merges:
+        argv.insert(2, '--no-merges')
+    if paths:
+        argv += ['--', *paths]
+
+    process = subprocess.Popen(argv, cwd=repo_path, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        for record in nul_tokens(process.stdout):
+            sha, date_, author, subject, body = (record.lstrip('\n').split(_FIELD, 4) + [''] * 5)[:5]
+            if sha:
+                yield {'sha': sha, 'date': date_, 'author': author, 'subject': subject, 'body': body.strip()}
+    finally:
+        process.stdout.close()
+        stderr = process.stderr.read().decode('utf-8', errors='replace')
+        process.stderr.close()
+        returncode = process.wait()
+
+    if returncode != 0:
+        raise RuntimeError(f"git log 실패 (exit {returncode}): {stderr.strip()}")
+
+
+def _strip_tickets(subject: str, allowed: Set[str]) -> str:
+    """제목 앞의 티켓 표기 제거 (티켓은 그룹 제목에 표시되므로)"""
+    while True:
+        match = _TICKET_PREFIX.match(subject)
+        if not match or match.end() == len(subject) or (allowed and match.group(1).split('-', 1)[0] not in allowed):
+            return subject
+        subject = subject[match.end():]
+
+
+def parse_commit(commit: Dict[str, str], projects: Iterable[str] = ()) -> Dict[str, Any]:
+    """
+    커밋 메시지 해석 (Conventional Commits + 티켓 키)
+
+    Args:
+        commit: stream_commits() 항목
+        projects: 티켓으로 인정할 프로젝트 키 (비우면 모든 키, 예: UTF-8 같은 오탐 방지용)
+
+    Returns:
+        {'sha', 'type', 'scope', 'breaking', 'subject', 'tickets', 'author', 'date'}
+    """
+    allowed = set(projects)
+    subject = commit['subject'].strip()
+
+    tickets: List[str] = []
+    for key in _TICKET.findall(f"{subject}\n{commit['body']}"):
+        if key not in tickets and (not allowed or key.split('-', 1)[0] in allowed):
+            tickets.append(key)
+
+    # "[FINOPS-1] feat: ..." → "feat: ..." (티켓 표기를 떼고 해석)
+    subject = _strip_tickets(subject, allowed)
+
+    match = _CONVENTIONAL.match(subject)
+    if match:
+        kind = match.group('type').lower()
+        kind = _TYPE_ALIASES.get(kind, kind)
+        if kind not in SECTIONS:
+            kind = 'other'
+        scope = match.group('scope')
+        breaking = bool(match.group('breaking'))
+        subject = _strip_tickets(match.group('subject').strip(), allowed)
+    else:
+        kind, scope, breaking = 'other', None, False
+        if subject.startswith('Revert "'):
+            kind = 'revert'
+
+    return {
+        'sha': commit['sha'],
+        'type': kind,
+        'scope': scope,
+        'breaking': breaking or bool(_BREAKING_FOOTER.search(commit['body'])),
+        'subject': subject,
+        'tickets': tickets,
+        'author': commit['author'],
+        'date': commit['date'],
+    }
+
+
+def group_entries(
+    entries: Iterable[Dict[str, Any]],
+    default_ticket: str = NO_TICKET
+) -> 'OrderedDict[str, Dict[str, List[Dict[str, Any]]]]':
+    """
+    티켓 → 변경 유형 → 항목 (티켓은 처음 등장한 순서, 즉 최신 커밋 순)
+
+    여러 티켓을 언급한 커밋은 첫 번째 티켓에만 넣고, 호환성을 깨는 변경은 'breaking' 섹션에 넣습니다.
+
+    Args:
+        entries: parse_commit() 결과
+        default_ticket: 티켓 키가 없는 커밋의 그룹 (티켓 브랜치의 변경 로그용)
+    """
+    groups: 'OrderedDict[str, Dict[str, List[Dict[str, Any]]]]' = OrderedDict()
+    for entry in entries:
+        ticket = entry['tickets'][0] if entry['tickets'] else default_ticket
+        section = 'breaking' if entry['breaking'] else entry['type']
+        groups.setdefault(ticket, {}).setdefault(section, []).append(entry)
+
+    # 티켓 없는 커밋은 마지막에
+    if NO_TICKET in groups:
+        groups.move_to_end(NO_TICKET)
+    return groups
+
+
+def fetch_summaries(tickets: Iterable[str], jira=None) -> Dict[str, Dict[str, str]]:
+    """
+    티켓 요약 일괄 조회 (JQL key in (...) 한 번, 100건 단위)
+
+    Args:
+        tickets: 티켓 키
+        jira: JiraClient (None 이면 생성, Jira 설정이 없으면 빈 결과)
+
+    Returns:
+        {티켓 키: {'summary', 'type', 'status'}}
+    """
+    keys = [key for key in tickets if key]
+    if not keys:
+        return {}
+
+    if jira is None:
+        try:
+            from jira_client import JiraClient
+            jira = JiraClient()
+        except EnvironmentError as e:
+            print(f"⚠️  Jira 설정이 없어 티켓 요약 없이 생성합니다: {e}")
+            return {}
+
+    with span('changelog.jira_lookup', **{'changelog.tickets': len(keys)}):
+        issues = jira.get_issues(keys) or {}
+
+    return {
+        key: {
+            'summary': issue['fields'].get('summary', ''),
+            'type': (issue['fields'].get('issuetype') or {}).get('name', ''),
+            'status': (issue['fields'].get('status') or {}).get('name', ''),
+        }
+        for key, issue in issues.items()
+    }
+
+
+def render_markdown(
+    title: str,
+    groups: 'OrderedDict[str, Dict[str, List[Dict[str, Any]]]]',
+    summaries: Dict[str, Dict[str, str]],
+    release_date: Optional[str] = None,
+    sha_length: int = 7
+) -> str:
+    """
+    변경 로그 섹션 (Markdown)
+
+    Args:
+        title: 섹션 제목 (버전 또는 티켓)
+        groups: group_entries() 결과
+        summaries: fetch_summaries() 결과
+        release_date: 날짜 (기본: 오늘)
+        sha_length: 커밋 SHA 표시 길이
+
+    Returns:
+        "## [title] - date" 로 시작하는 Markdown
+    """
+    lines = [f"## [{title}] - {release_date or date.today().isoformat()}", ""]
+
+    for ticket, sections in groups.items():
+        if ticket == NO_TICKET:
+            lines.append("### 기타")
+        else:
+            summary = summaries.get(ticket, {}).get('summary')
+            lines.append(f"### {ticket}" + (f": {summary}" if summary else ''))
+        lines.append("")
+
+        for section, heading in SECTIONS.items():
+            if not sections.get(section):
+                continue
+            lines += [f"#### {heading}", ""]
+            for entry in sections[section]:
+                scope = f"**{entry['scope']}**: " if entry['scope'] else ''
+                lines.append(f"- {scope}{entry['subject']} ({entry['sha'][:sha_length]})")
+            lines.append("")
+
+    if not groups:
+        lines += ["변경 사항 없음", ""]
+    return '\n'.join(lines)
+
+
+def last_tag(repo_path: Path, until: str = 'HEAD') -> Optional[str]:
+    """until 에서 도달 가능한 가장 최근 태그 (없으면 None)"""
+    result = traced_run(
+        ['git', 'describe', '--tags', '--abbrev=0', until],
+        cwd=repo_path,
+        capture_output=True,
+        text=True,
+        check=False
+    )
+    return result.stdout.strip() or None
+
+
+def build_changelog(
+    repo_path: Path,
+    since: Optional[str],
+    until: str = 'HEAD',
+    title: Optional[str] = None,
+    projects: Iterable[str] = (),
+    jira=None,
+    use_jira: bool = True,
+    paths: Iterable[str] = (),
+    default_ticket: str = NO_TICKET,
+    known_summaries: Optional[Dict[str, Dict[str, str]]] = None
+) -> Dict[str, Any]:
+    """
+    since..until 변경 로그 생성
+
+    Args:
+        repo_path: Git 저장소 경로
+        since: 시작 ref (제외, None 이면 처음부터)
+        until: 끝 ref (포함)
+        title: 섹션 제목 (기본: until)
+        projects: 티켓으로 인정할 프로젝트 키
+        jira: JiraClient (테스트/재사용용)
+        use_jira: 티켓 요약 조회 여부
+        paths: 이 경로를 바꾼 커밋만
+        default_ticket: 티켓 키가 없는 커밋의 그룹
+        known_summaries: 이미 알고 있는 티켓 요약 (조회에서 제외)
+
+    Returns:
+        {'markdown', 'commits', 'tickets', 'groups', 'duration_seconds'}
+    """
+    started = time.monotonic()
+    projects = list(projects)
+
+    with span('changelog.build', **{'changelog.since': since or '', 'changelog.until': until}):
+        entries = [parse_commit(commit, projects) for commit in stream_commits(repo_path, since, until, paths)]
+        groups = group_entries(entries, default_ticket)
+        tickets = [ticket for ticket in groups if ticket != NO_TICKET]
+        summaries = dict(known_summaries or {})
+        if use_jira:
+            summaries.update(fetch_summaries([ticket for ticket in tickets if ticket not in summaries], jira))
+        markdown = render_markdown(title or until, groups, summaries)
+
+    return {
+        'markdown': markdown,
+        'commits': len(entries),
+        'tickets': tickets,
+        'groups': groups,
+        'duration_seconds': round(time.monotonic() - started, 3),
+    }
+
+
+def write_section(path: Path, markdown: str) -> bool:
+    """
+    변경 로그 파일 맨 위(제목 아래)에 섹션 추가, 같은 제목의 섹션이 있으면 교체
+
+    Args:
+        path: CHANGELOG.md 경로
+        markdown: render_markdown() 결과
+
+    Returns:
+        파일 내용이 바뀌었는지 여부
+    """
+    section = markdown.strip('\n')
+    heading = section.split('\n', 1)[0].rsplit(' - ', 1)[0]
+
+    try:
+        text = Path(path).read_text(encoding='utf-8')
+    except FileNotFoundError:
+        text = "# Changelog\n"
+
+    # 제목/소개(첫 "## " 이전)와 섹션으로 분리
+    parts = re.split(r'(?m)^(?=## )', text)
+    preamble, sections = parts[0].strip('\n'), [part.strip('\n') for part in parts[1:]]
+
+    for index, existing in enumerate(sections):
+        if existing.split('\n', 1)[0].rsplit(' - ', 1)[0] == heading:
+            sections[index] = section
+            break
+    else:
+        sections.insert(0, section)
+
+    updated = '\n\n'.join(part for part in [preamble] + sections if part) + '\n'
+    if updated == text:
+        return False
+    Path(path).write_text(updated, encoding='utf-8')
+    return True
+
+
+def main():
+    """변경 로그 생성"""
+    parser = argparse.ArgumentParser(description="Changelog Builder")
+    parser.add_argument('--from', dest='since', default=None, help='시작 ref (제외, 기본: 마지막 태그)')
+    parser.add_argument('--to', dest='until', default='HEAD', help='끝 ref (포함)')
+    parser.add_argument('--title', default=None, help='섹션 제목 (기본: --to)')
+    parser.add_argument('--output', default=None, help='이 파일 맨 위에 섹션 추가 (같은 제목은 교체)')
+    parser.add_argument('--no-jira', action='store_true', help='티켓 요약 조회 생략')
+    args = parser.parse_args()
+
+    from config import get_config
+
+    settings = get_config().docs
+    repo = Path('.')
+    since = args.since or last_tag(repo, args.until)
+
+    try:
+        result = build_changelog(
+            repo,
+            since,
+            args.until,
+            title=args.title,
+            projects=settings.changelog_projects,
+            use_jira=not args.no_jira
+        )
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    if args.output:
+        updated = write_section(Path(args.output), result['markdown'])
+        print(
+            f"✅ {args.output} {'갱신' if updated else '변경 없음'}: "
+            f"커밋 {result['commits']}개, 티켓 {len(result['tickets'])}개 ({result['duration_seconds']}초)"
+        )
+    else:
+        print(result['markdown'])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+통합 CLI(tkm) import 시간 예산 검사
+
+`--help` 와 단순 조회 명령이 예산(기본 100ms) 안에 끝나는지,
+무거운 의존 모듈을 불필요하게 import 하지 않는지 확인합니다.
+예산은 인터프리터 기동 시간(`python -c pass`)을 뺀 CLI 자체 비용에 적용합니다.
+
+사용법:
+    python scripts/check_import_time.py
+    python scripts/check_import_time.py --budget-ms 150 --runs 7
+"""
+
+import sys
+import time
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+
+CLI_PATH = Path(__file__).resolve().parent / 'cli.py'
+
+# 예산 안에 끝나야 하는 명령 (인터프리터 기동 시간을 뺀 import·실행 시간 기준)
+BUDGETED_COMMANDS = [
+    ['--help'],
+    ['jira', '--help'],
+    ['sprint', '--help'],
+    ['backlog', '--help'],
+    ['agent', '--help'],
+    ['checkpoint', 'list'],
+]
+
+# 위 명령 실행 중 import 되면 안 되는 모듈
+HEAVY_MODULES = [
+    'requests',
+    'atlassian',
+    'slack_sdk',
+    'yaml',
+    'dotenv',
+    'jira',
+    'git',
+]
+
+
+def measure(argv, runs: int, cwd: str) -> float:
+    """명령을 여러 번 실행하여 최소 실행 시간(ms) 반환"""
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *argv],
+            cwd=cwd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False
+        )
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def imported_modules(args, cwd: str) -> set:
+    """`-X importtime` 출력에서 최상위 import 모듈 이름 추출"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', str(CLI_PATH), *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=False
+    )
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        name = line.rsplit('|', 1)[1].strip()
+        modules.add(name.split('.')[0])
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="tkm CLI import 시간 예산 검사")
+    parser.add_argument('--budget-ms', type=float, default=100.0, help='명령별 예산 (ms)')
+    parser.add_argument('--runs', type=int, default=5, help='명령별 반복 횟수 (최소값 사용)')
+    args = parser.parse_args()
+
+    failures = []
+
+    # 빈 디렉토리에서 실행하여 로컬 체크포인트 유무에 영향받지 않도록 함
+    with tempfile.TemporaryDirectory() as workdir:
+        baseline = measure(['-c', 'pass'], args.runs, workdir)
+        print(f"⏱️  tkm import 시간 예산: {args.budget_ms:.0f}ms "
+              f"(인터프리터 기동 {baseline:.1f}ms 제외)\n")
+
+        for command in BUDGETED_COMMANDS:
+            label = ' '.join(command)
+            elapsed = measure([str(CLI_PATH), *command], args.runs, workdir) - baseline
+            heavy = sorted(imported_modules(command, workdir) & set(HEAVY_MODULES))
+
+            ok = elapsed <= args.budget_ms and not heavy
+            icon = '✅' if ok else '❌'
+            print(f"  {icon} tkm {label:20s} {elapsed:7.1f}ms")
+
+            if elapsed > args.budget_ms:
+                failures.append(f"tkm {label}: {elapsed:.1f}ms > {args.budget_ms:.0f}ms")
+            if heavy:
+                print(f"      무거운 모듈 import: {', '.join(heavy)}")
+                failures.append(f"tkm {label}: eager import of {', '.join(heavy)}")
+
+    print()
+    if failures:
+        print(f"❌ 예산 초과 {len(failures)}건")
+        for failure in failures:
+            print(f"   - {failure}")
+        sys.exit(1)
+
+    print("✅ 모든 명령이 예산 안에 실행됩니다.")
+
+
+if __name__ == '__main__':
+    main()
@@ -6,6 +6,7 @@ Claude Code SubAgent - Checkpoint Manager
 """
 
 import json
+import time
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
@@ -39,14 +40,19 @@ class CheckpointManager:
         Returns:
             성공 여부
         """
+        # 조회 명령(tkm checkpoint list 등)이 prometheus_client를 import 하지 않도록 지연 import
+        import metrics
+
         try:
             checkpoint_file = self.checkpoint_dir / f"{ticket_id}.json"
 
             # 타임스탬프 추가
             state["updated_at"] = datetime.now().isoformat()
 
+            start = time.perf_counter()
             with open(checkpoint_file, 'w', encoding='utf-8') as f:
                 json.dump(state, f, indent=2, ensure_ascii=False)
+            metrics.observe_checkpoint_write(time.perf_counter() - start)
 
             print(f"💾 체크포인트 저장: {checkpoint_file}")
             return True
@@ -124,7 +130,8 @@ class CheckpointManager:
         """
         try:
             checkpoints = list(self.checkpoint_dir.glob("*.json"))
-            return [cp.stem for cp in checkpoints]
+            # 타임라인(<ticket>.trace.json) 등 부가 파일 제외
+            return [cp.stem for cp in checkpoints if '.' not in cp.stem]
 
         except Exception as e:
             print(f"❌ 체크포인트 목록 조회 실패: {e}")
@@ -201,6 +208,15 @@ class CheckpointManager:
             if error:
                 print(f"      에러: {error}")
 
+        from resource_monitor import format_table
+
+        resources = format_table(steps)
+        if resources:
+            print()
+            print("단계별 자원 사용량:")
+            for line in resources:
+                print(line)
+
         print("=" * 60)
 
 
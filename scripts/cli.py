@@ -0,0 +1,554 @@
+#!/usr/bin/env python3
+"""
+Claude Code SubAgent - Unified CLI (tkm)
+
+scripts/ 아래의 개별 진입점을 하나의 CLI로 통합
+
+사용법:
+    python scripts/cli.py jira get TERRAFORM-66
+    python scripts/cli.py sprint list
+    python scripts/cli.py backlog top --count 5
+    python scripts/cli.py checkpoint list
+    python scripts/cli.py pr create --title "..." --base main
+    python scripts/cli.py agent main TERRAFORM-66 --resume
+
+각 서브커맨드는 실행 시점에만 의존 모듈(requests, atlassian, slack_sdk 등)을
+import 하므로 `--help` 나 체크포인트 조회 같은 단순 명령은 빠르게 끝납니다.
+모듈 최상단에는 click 외의 무거운 import 를 추가하지 마세요.
+"""
+
+import sys
+from pathlib import Path
+
+import click
+
+# scripts/ 및 scripts/agents/ 를 한 번만 sys.path에 추가
+SCRIPTS_DIR = Path(__file__).resolve().parent
+for _path in (SCRIPTS_DIR, SCRIPTS_DIR / 'agents'):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+
+@click.group(context_settings={'help_option_names': ['-h', '--help']})
+def cli():
+    """Claude Code SubAgent 자동화 CLI"""
+
+
+# ===================================
+# jira
+# ===================================
+@cli.group()
+def jira():
+    """JIRA 이슈 조회/변경"""
+
+
+@jira.command('get')
+@click.argument('issue_key')
+@click.option('--detail', is_flag=True, help='설명까지 포함한 상세 정보 출력')
+def jira_get(issue_key, detail):
+    """이슈 조회"""
+    if detail:
+        from get_issue_detail import get_issue_detail
+        get_issue_detail(issue_key)
+        return
+
+    from jira_client import JiraClient
+    click.echo(JiraClient().get_issue_summary(issue_key))
+
+
+@jira.command('transitions')
+@click.argument('issue_key')
+def jira_transitions(issue_key):
+    """사용 가능한 전환(transition) 목록"""
+    from jira_client import JiraClient
+
+    transitions = JiraClient()._get_transitions(issue_key)
+    if not transitions:
+        click.echo(f"❌ {issue_key}의 전환을 조회할 수 없습니다.")
+        sys.exit(1)
+
+    for trans in transitions:
+        click.echo(f"  ID: {trans['id']:3s} | {trans['name']:20s} → {trans['to']['name']}")
+
+
+@jira.command('status')
+@click.argument('issue_key')
+@click.argument('status')
+def jira_status(issue_key, status):
+    """이슈 상태 변경 (상태명 기준)"""
+    from jira_client import JiraClient
+
+    if not JiraClient().update_status(issue_key, status):
+        sys.exit(1)
+
+
+@jira.command('comment')
+@click.argument('issue_key')
+@click.argument('message')
+def jira_comment(issue_key, message):
+    """이슈에 코멘트 추가"""
+    from jira_client import JiraClient
+
+    if not JiraClient().add_comment(issue_key, message):
+        sys.exit(1)
+
+
+# ===================================
+# sprint
+# ===================================
+@cli.group()
+def sprint():
+    """JIRA 스프린트 관리"""
+
+
+@sprint.command('list')
+def sprint_list():
+    """스프린트 현황 출력"""
+    from sprint_manager import SprintManager
+    SprintManager().print_sprint_summary()
+
+
+@sprint.command('issues')
+@click.argument('sprint_id', type=int)
+def sprint_issues(sprint_id):
+    """스프린트 이슈 목록"""
+    from view_sprint_issues import view_sprint_issues
+    view_sprint_issues(sprint_id)
+
+
+@sprint.command('create')
+@click.argument('name')
+@click.argument('goal', required=False)
+def sprint_create(name, goal):
+    """스프린트 생성"""
+    from sprint_manager import SprintManager
+
+    if not SprintManager().create_sprint(name, goal):
+        sys.exit(1)
+
+
+@sprint.command('update')
+@click.argument('sprint_id', type=int)
+@click.argument('name')
+@click.argument('goal', required=False)
+def sprint_update(sprint_id, name, goal):
+    """스프린트 이름/목표 변경"""
+    from sprint_manager import SprintManager
+
+    if not SprintManager().update_sprint(sprint_id, name, goal):
+        sys.exit(1)
+
+
+@sprint.command('add')
+@click.argument('sprint_id', type=int)
+@click.argument('issue_keys', nargs=-1, required=True)
+def sprint_add(sprint_id, issue_keys):
+    """스프린트에 이슈 추가"""
+    from sprint_manager import SprintManager
+
+    if not SprintManager().add_issues_to_sprint(sprint_id, list(issue_keys)):
+        sys.exit(1)
+
+
+@sprint.command('start')
+@click.argument('sprint_id', type=int)
+def sprint_start(sprint_id):
+    """스프린트 시작"""
+    from sprint_manager import SprintManager
+
+    if not SprintManager().start_sprint(sprint_id):
+        sys.exit(1)
+
+
+# ===================================
+# backlog
+# ===================================
+@cli.group()
+def backlog():
+    """JIRA 백로그 조회"""
+
+
+@backlog.command('list')
+@click.option('--limit', default=10, show_default=True, help='출력할 이슈 수')
+def backlog_list(limit):
+    """백로그 목록 (우선순위 순)"""
+    from backlog_manager import BacklogManager
+    BacklogManager().print_backlog_summary(limit=limit)
+
+
+@backlog.command('top')
+@click.option('--count', default=5, show_default=True, help='조회할 이슈 수')
+def backlog_top(count):
+    """우선순위 상위 N개 이슈 키"""
+    from backlog_manager import BacklogManager
+
+    for key in BacklogManager().get_top_priority_issues(count=count):
+        click.echo(key)
+
+
+@backlog.command('jql')
+@click.argument('query')
+@click.option('--max-results', default=50, show_default=True)
+def backlog_jql(query, max_results):
+    """커스텀 JQL 조회"""
+    from backlog_manager import BacklogManager
+
+    issues = BacklogManager().get_all_issues(jql=query, max_results=max_results)
+    if not issues:
+        click.echo("❌ 이슈를 찾을 수 없습니다.")
+        sys.exit(1)
+
+    for issue in issues:
+        click.echo(f"[{issue['key']}] {issue['fields'].get('summary', 'N/A')}")
+
+
+# ===================================
+# checkpoint
+# ===================================
+@cli.group()
+@click.option('--dir', 'checkpoint_dir', default='./checkpoints', show_default=True,
+              envvar='CHECKPOINT_DIR', help='체크포인트 디렉토리')
+@click.pass_context
+def checkpoint(ctx, checkpoint_dir):
+    """워크플로우 체크포인트 조회"""
+    ctx.obj = checkpoint_dir
+
+
+@checkpoint.command('list')
+@click.pass_obj
+def checkpoint_list(checkpoint_dir):
+    """저장된 체크포인트 목록"""
+    from checkpoint_manager import CheckpointManager
+
+    for ticket_id in sorted(CheckpointManager(checkpoint_dir).list_checkpoints()):
+        click.echo(ticket_id)
+
+
+@checkpoint.command('status')
+@click.argument('ticket_id')
+@click.pass_obj
+def checkpoint_status(checkpoint_dir, ticket_id):
+    """체크포인트 단계별 상태"""
+    from checkpoint_manager import CheckpointManager
+    CheckpointManager(checkpoint_dir).print_status(ticket_id)
+
+
+@checkpoint.command('delete')
+@click.argument('ticket_id')
+@click.pass_obj
+def checkpoint_delete(checkpoint_dir, ticket_id):
+    """체크포인트 삭제 (.bak 으로 백업)"""
+    from checkpoint_manager import CheckpointManager
+
+    if not CheckpointManager(checkpoint_dir).delete(ticket_id):
+        sys.exit(1)
+
+
+# ===================================
+# pr
+# ===================================
+@cli.group()
+def pr():
+    """GitHub Pull Request"""
+
+
+@pr.command('create')
+@click.option('--title', required=True, help='PR 제목')
+@click.option('--body', default='', help='PR 본문')
+@click.option('--base', default='grafana-stage', show_default=True, help='베이스 브랜치')
+@click.option('--head', default=None, help='헤드 브랜치 (기본: 현재 브랜치)')
+@click.option('--draft', is_flag=True, help='Draft PR')
+@click.option('--stats', is_flag=True, help='본문에 변경 통계(파일별 추가/삭제 라인) 추가')
+def pr_create(title, body, base, head, draft, stats):
+    """PR 생성"""
+    from pr_creator import PRCreator
+
+    pr_url = PRCreator().create_pr(
+        title=title,
+        body=body,
+        base_branch=base,
+        head_branch=head,
+        draft=draft,
+        include_stats=stats
+    )
+    if not pr_url:
+        sys.exit(1)
+
+
+@pr.command('push')
+@click.argument('branch', required=False)
+@click.option('--force', is_flag=True, help='Force push')
+def pr_push(branch, force):
+    """브랜치 푸시"""
+    from pr_creator import PRCreator
+
+    if not PRCreator().push_branch(branch, force=force):
+        sys.exit(1)
+
+
+# ===================================
+# changelog
+# ===================================
+@cli.command('changelog')
+@click.option('--from', 'since', default=None, help='시작 ref (제외, 기본: 마지막 태그)')
+@click.option('--to', 'until', default='HEAD', show_default=True, help='끝 ref (포함)')
+@click.option('--title', default=None, help='섹션 제목 (기본: --to)')
+@click.option('--output', default=None, help='이 파일 맨 위에 섹션 추가 (같은 제목은 교체)')
+@click.option('--no-jira', is_flag=True, help='티켓 요약 조회 생략')
+def changelog(since, until, title, output, no_jira):
+    """두 ref 사이 커밋을 티켓/변경 유형별로 묶은 변경 로그"""
+    from pathlib import Path
+    from changelog import build_changelog, last_tag, write_section
+    from config import get_config
+
+    repo = Path('.')
+    try:
+        result = build_changelog(
+            repo,
+            since or last_tag(repo, until),
+            until,
+            title=title,
+            projects=get_config().docs.changelog_projects,
+            use_jira=not no_jira
+        )
+    except RuntimeError as e:
+        raise click.ClickException(str(e))
+
+    if output:
+        updated = write_section(Path(output), result['markdown'])
+        click.echo(
+            f"✅ {output} {'갱신' if updated else '변경 없음'}: "
+            f"커밋 {result['commits']}개, 티켓 {len(result['tickets'])}개 ({result['duration_seconds']}초)"
+        )
+    else:
+        click.echo(result['markdown'])
+
+
+# ===================================
+# workspace
+# ===================================
+@cli.group()
+def workspace():
+    """준비된 작업 디렉토리 풀 (WORKSPACE_POOL_SIZE)"""
+
+
+def _workspace_pool():
+    from workspace_pool import pool_from_config
+
+    pool = pool_from_config()
+    if pool is None:
+        raise click.ClickException("WORKSPACE_POOL_SIZE 가 0 입니다 (작업 디렉토리 풀 비활성화)")
+    return pool
+
+
+@workspace.command('status')
+def workspace_status():
+    """작업 디렉토리별 상태"""
+    from workspace_pool import print_status
+    print_status(_workspace_pool())
+
+
+@workspace.command('refresh')
+@click.option('--name', 'names', multiple=True, help='대상 작업 디렉토리 (반복 지정 가능, 기본: 전체)')
+@click.option('--daemon', is_flag=True, help='WORKSPACE_REFRESH_INTERVAL 마다 반복')
+@click.option('--discard', is_flag=True, help='실패한 실행용으로 보존 중인 작업 디렉토리도 초기화')
+def workspace_refresh(names, daemon, discard):
+    """사용 중이 아닌 작업 디렉토리를 베이스 브랜치 최신 상태로 갱신"""
+    from workspace_pool import refresh_loop
+    refresh_loop(_workspace_pool(), list(names) or None, daemon=daemon, discard=discard)
+
+
+# ===================================
+# agent
+# ===================================
+@cli.group()
+@click.pass_context
+def agent(ctx):
+    """SubAgent 실행"""
+    if ctx.invoked_subcommand and not ctx.resilient_parsing:
+        from tracing import init_tracing
+        init_tracing(f'{ctx.invoked_subcommand}-agent')
+
+
+@agent.command('main')
+@click.argument('ticket_id')
+@click.option('--resume', is_flag=True, help='체크포인트에서 재개')
+@click.option('--restart', is_flag=True, help='처음부터 재시작')
+@click.option('--no-cache', is_flag=True, help='단계 캐시를 사용하지 않고 모든 단계 실행')
+@click.option('--metrics-port', type=int, default=None, help='/metrics 엔드포인트 포트')
+@click.option('--trace', is_flag=True, help='타임라인을 Chrome trace JSON 으로 저장')
+def agent_main(ticket_id, resume, restart, no_cache, metrics_port, trace):
+    """전체 워크플로우 실행 (Main Agent)"""
+    if resume and restart:
+        raise click.UsageError("--resume과 --restart는 동시에 사용할 수 없습니다.")
+
+    import metrics
+    from main_agent import MainAgent
+    from workspace_pool import warm_workspace
+
+    if metrics_port:
+        metrics.start_metrics_server(metrics_port)
+
+    try:
+        with warm_workspace(ticket_id, resume=resume) as lease:
+            MainAgent(
+                ticket_id=ticket_id,
+                resume=resume,
+                restart=restart,
+                trace=trace,
+                use_cache=not no_cache,
+                workspace=lease.name if lease else None
+            ).run()
+    finally:
+        metrics.flush()
+
+
+def _sub_step_progress(ticket_id, agent_class, resume):
+    """SubAgent 단독 실행 시 체크포인트의 하위 단계 상태 연동"""
+    from base_agent import checkpoint_progress
+    from config import get_config
+
+    return checkpoint_progress(
+        ticket_id, agent_class.step_name, get_config().checkpoint_dir, resume=resume
+    )
+
+
+@agent.command('backend')
+@click.argument('ticket_id')
+@click.option('--summary', default='', help='티켓 요약')
+@click.option('--description', default='', help='티켓 설명')
+@click.option('--labels', default='', help='라벨 (콤마 구분)')
+@click.option('--resume', is_flag=True, help='완료된 하위 단계 건너뛰기')
+def agent_backend(ticket_id, summary, description, labels, resume):
+    """Backend Agent 실행"""
+    from backend_agent import BackendAgent
+
+    context = {
+        'summary': summary,
+        'description': description,
+        'labels': labels.split(',') if labels else []
+    }
+    sub_steps, on_progress = _sub_step_progress(ticket_id, BackendAgent, resume)
+    sys.exit(0 if BackendAgent(ticket_id, context, sub_steps, on_progress).run() else 1)
+
+
+@agent.command('qa')
+@click.argument('ticket_id')
+@click.option('--branch', default='', help='Git 브랜치명')
+@click.option('--resume', is_flag=True, help='완료된 하위 단계 건너뛰기')
+@click.option('--full', 'full_run', is_flag=True, help='테스트 영향 분석 없이 전체 테스트 실행')
+def agent_qa(ticket_id, branch, resume, full_run):
+    """QA Agent 실행"""
+    from qa_agent import QAAgent
+
+    sub_steps, on_progress = _sub_step_progress(ticket_id, QAAgent, resume)
+    agent = QAAgent(ticket_id, branch, sub_steps, on_progress, full_run=full_run)
+    sys.exit(0 if agent.run() else 1)
+
+
+@agent.command('review')
+@click.argument('ticket_id')
+@click.option('--branch', default='', help='Git 브랜치명')
+@click.option('--resume', is_flag=True, help='완료된 하위 단계 건너뛰기')
+def agent_review(ticket_id, branch, resume):
+    """Review Agent 실행"""
+    from review_agent import ReviewAgent
+
+    sub_steps, on_progress = _sub_step_progress(ticket_id, ReviewAgent, resume)
+    sys.exit(0 if ReviewAgent(ticket_id, branch, sub_steps, on_progress).run() else 1)
+
+
+@agent.command('docs')
+@click.argument('ticket_id')
+@click.option('--resume', is_flag=True, help='완료된 하위 단계 건너뛰기')
+def agent_docs(ticket_id, resume):
+    """Docs Agent 실행"""
+    from docs_agent import DocsAgent
+
+    sub_steps, on_progress = _sub_step_progress(ticket_id, DocsAgent, resume)
+    sys.exit(0 if DocsAgent(ticket_id, {}, sub_steps, on_progress).run() else 1)
+
+
+# ===================================
+# stub
+# ===================================
+@cli.command('stub')
+@click.option('--host', default='127.0.0.1', show_default=True, help='바인드 주소')
+@click.option('--port', default=8765, show_default=True, help='포트')
+@click.option('--seed-issues', default=0, show_default=True, help='시작 시 생성할 이슈 수')
+@click.option('--latency-ms', default=0.0, show_default=True, help='응답 지연 (ms)')
+@click.option('--jitter-ms', default=0.0, show_default=True, help='추가 무작위 지연 상한 (ms)')
+@click.option('--rate-limit-rps', default=0.0, show_default=True, help='초당 허용 요청 수 (0=무제한)')
+@click.option('--throttle-rate', default=0.0, show_default=True, help='무작위 429 비율 (0~1)')
+@click.option('--error-rate', default=0.0, show_default=True, help='무작위 503 비율 (0~1)')
+@click.option('--verbose', is_flag=True, help='요청 로그 출력')
+def stub(host, port, seed_issues, latency_ms, jitter_ms, rate_limit_rps, throttle_rate, error_rate, verbose):
+    """JIRA/Slack/GitHub 로컬 스텁 서버 실행"""
+    from stub_server import StubFaults, StubServer
+
+    faults = StubFaults(
+        latency_ms=latency_ms,
+        jitter_ms=jitter_ms,
+        rate_limit_rps=rate_limit_rps,
+        throttle_rate=throttle_rate,
+        error_rate=error_rate
+    )
+    server = StubServer(host, port, faults, verbose=verbose)
+    if seed_issues:
+        server.state.seed_issues(seed_issues)
+
+    click.echo(f"🧪 스텁 서버 시작: {server.url}")
+    for key, value in server.env().items():
+        click.echo(f"   export {key}='{value}'")
+
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        click.echo("\n스텁 서버 종료")
+    finally:
+        server.httpd.server_close()
+
+
+@cli.command(
+    'bench',
+    context_settings={'ignore_unknown_options': True, 'help_option_names': []}
+)
+@click.argument('args', nargs=-1, type=click.UNPROCESSED)
+def bench(args):
+    """스텁 서버 대상 벤치마크 (run / compare, 인자는 benchmark.py 로 전달)"""
+    from benchmark import main as benchmark_main
+
+    sys.argv = ['tkm bench', *args]
+    benchmark_main()
+
+
+@cli.command(
+    'load',
+    context_settings={'ignore_unknown_options': True, 'help_option_names': []}
+)
+@click.argument('args', nargs=-1, type=click.UNPROCESSED)
+def load(args):
+    """MainAgent 처리량 부하 테스트 (인자는 load_test.py 로 전달)"""
+    from load_test import main as load_test_main
+
+    sys.argv = ['tkm load', *args]
+    load_test_main()
+
+
+# ===================================
+# config
+# ===================================
+@cli.command('config')
+def show_config():
+    """현재 설정 출력 (민감 정보 제외)"""
+    from config import get_config
+
+    try:
+        get_config().print_config()
+    except EnvironmentError as e:
+        click.echo(f"❌ Configuration Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    cli(prog_name='tkm')
@@ -2,12 +2,429 @@
 Claude Code SubAgent - Configuration Manager
 
 .env 파일을 로드하고 환경변수를 관리하는 Config 클래스
+
+설정은 섹션(SECTIONS: jira, slack, git, redis, workflow, qa, review, build, docs, workspace, sandbox 등) 단위로
+처음 접근할 때 생성되며, 다른 섹션에서 파생되는 기본값(체크포인트 하위 경로 등)은 같은 Config 의 캐시된 섹션에서 읽습니다.
+필수값 검증도 명령이 실제로 사용하는 섹션에 대해서만 수행합니다.
+
+    config = get_config(require=('jira',))   # JIRA 자격증명만 검증
+    config.jira.url                          # 섹션 단위 접근
+    config.jira_url                          # 기존 평면 속성 접근도 그대로 지원
 """
 
-from dotenv import load_dotenv
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_ENV_FILE = PROJECT_ROOT / '.env'
+
+# .env 파싱 결과 캐시: {경로: (mtime, 값 딕셔너리)}
+_env_file_cache: Dict[Path, Tuple[float, Dict[str, str]]] = {}
+
+# .env에서 os.environ으로 주입한 값 (핫 리로드 시 교체 대상)
+_injected_env: Dict[str, str] = {}
+
+
+def _env_file_mtime(env_file: Path) -> Optional[float]:
+    """.env 파일 수정 시각 (파일이 없으면 None)"""
+    try:
+        return env_file.stat().st_mtime
+    except OSError:
+        return None
+
+
+def read_env_file(env_file: Path) -> Dict[str, str]:
+    """
+    .env 파일 파싱 (mtime 기준 캐시)
+
+    Args:
+        env_file: .env 파일 경로
+
+    Returns:
+        키/값 딕셔너리 (파일이 없으면 빈 딕셔너리)
+    """
+    mtime = _env_file_mtime(env_file)
+    if mtime is None:
+        return {}
+
+    cached = _env_file_cache.get(env_file)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    # python-dotenv는 .env 파일이 있을 때만 import
+    from dotenv import dotenv_values
+
+    values = {k: v for k, v in dotenv_values(env_file).items() if v is not None}
+    _env_file_cache[env_file] = (mtime, values)
+    return values
+
+
+def _env_bool(name: str, default: str = 'true') -> bool:
+    return os.getenv(name, default).lower() == 'true'
+
+
+def _env_list(name: str, default: str = '') -> List[str]:
+    return [item.strip() for item in os.getenv(name, default).split(',') if item.strip()]
+
+
+class JiraSettings:
+    """JIRA 설정"""
+
+    required = [('JIRA_URL', 'url'), ('JIRA_EMAIL', 'email'), ('JIRA_API_TOKEN', 'api_token')]
+
+    def __init__(self, config: 'Config'):
+        self.url = os.getenv('JIRA_URL')
+        self.email = os.getenv('JIRA_EMAIL')
+        self.api_token = os.getenv('JIRA_API_TOKEN')
+        self.project_key = os.getenv('JIRA_PROJECT_KEY', 'FINOPS')
+
+
+class SlackSettings:
+    """Slack 설정"""
+
+    required = [('SLACK_WEBHOOK_URL', 'webhook_url')]
+
+    def __init__(self, config: 'Config'):
+        self.webhook_url = os.getenv('SLACK_WEBHOOK_URL')
+        self.channel = os.getenv('SLACK_CHANNEL', '#finops-dev')
+        self.username = os.getenv('SLACK_USERNAME', 'Claude Code Bot')
+
+
+class GitSettings:
+    """Git 설정"""
+
+    required = [('GIT_AUTHOR_NAME', 'author_name'), ('GIT_AUTHOR_EMAIL', 'author_email')]
+
+    def __init__(self, config: 'Config'):
+        self.author_name = os.getenv('GIT_AUTHOR_NAME', 'Claude Code')
+        self.author_email = os.getenv('GIT_AUTHOR_EMAIL', 'claude@company.com')
+        self.main_branch = os.getenv('GIT_MAIN_BRANCH', 'main')
+        self.stage_branch = os.getenv('GIT_STAGE_BRANCH', 'stage')
+        self.github_token = os.getenv('GITHUB_PERSONAL_ACCESS_TOKEN')
+        # 설정 시 gh CLI 대신 REST API로 PR 생성 (예: 로컬 스텁 서버)
+        self.github_api_url = os.getenv('GITHUB_API_URL')
+        self.github_repository = os.getenv('GITHUB_REPOSITORY')
+
+
+class RedisSettings:
+    """Redis 설정"""
+
+    required = []
+
+    def __init__(self, config: 'Config'):
+        self.host = os.getenv('REDIS_HOST', 'localhost')
+        self.port = int(os.getenv('REDIS_PORT', '6379'))
+        self.password = os.getenv('REDIS_PASSWORD', None)
+        self.db = int(os.getenv('REDIS_DB', '0'))
+
+
+class WorkflowSettings:
+    """워크플로우/품질 게이트/SubAgent/테스트 설정"""
+
+    required = []
+
+    def __init__(self, config: 'Config'):
+        self.mode = os.getenv('WORKFLOW_MODE', 'auto')
+        self.checkpoint_dir = os.getenv('CHECKPOINT_DIR', './checkpoints')
+        self.step_cache_enabled = _env_bool('STEP_CACHE_ENABLED')
+        self.step_cache_dir = os.getenv('STEP_CACHE_DIR') or str(Path(self.checkpoint_dir) / 'step-cache')
+        self.log_level = os.getenv('LOG_LEVEL', 'INFO')
+
+        # 단계별 자원 사용량(wall/CPU/최대 RSS/읽기·쓰기) 측정, 자식 프로세스 RSS 표본 추출 간격 (초)
+        self.resource_monitor = _env_bool('RESOURCE_MONITOR_ENABLED')
+        self.resource_sample_interval = float(os.getenv('RESOURCE_SAMPLE_INTERVAL', '0.5'))
+
+        # 품질 게이트
+        self.min_code_coverage = int(os.getenv('MIN_CODE_COVERAGE', '80'))
+        self.sonarqube_url = os.getenv('SONARQUBE_URL')
+        self.sonarqube_token = os.getenv('SONARQUBE_TOKEN')
+
+        # SubAgent
+        self.backend_agent_enabled = _env_bool('BACKEND_AGENT_ENABLED')
+        self.qa_agent_enabled = _env_bool('QA_AGENT_ENABLED')
+        self.review_agent_enabled = _env_bool('REVIEW_AGENT_ENABLED')
+        self.docs_agent_enabled = _env_bool('DOCS_AGENT_ENABLED')
+
+        # 테스트
+        self.test_timeout = int(os.getenv('TEST_TIMEOUT', '300'))
+        self.test_retry_count = int(os.getenv('TEST_RETRY_COUNT', '3'))
+
+        # 실패 알림 (같은 실패 시그니처는 티켓이 달라도 한 번만 Slack/JIRA 알림, 0시간 = 다시 알리지 않음)
+        self.failure_alerts = _env_bool('FAILURE_ALERTS_ENABLED')
+        self.failure_db = os.getenv('FAILURE_DB') or str(Path(self.checkpoint_dir) / 'failures.db')
+        self.failure_realert_hours = int(os.getenv('FAILURE_REALERT_HOURS', '24'))
+
+
+class QASettings:
+    """QA 테스트 스위트 실행 설정"""
+
+    required = []
+
+    SUITES = ('unit', 'integration', 'api')
+
+    def __init__(self, config: 'Config'):
+        # 스위트별 실행 명령/테스트 경로/샤드 수 (명령이 없으면 스위트 건너뜀, 샤드 0 = 자동)
+        self.suites: Dict[str, Dict[str, object]] = {}
+        for name in self.SUITES:
+            prefix = f"QA_{name.upper()}_TEST"
+            self.suites[name] = {
+                'command': os.getenv(f'{prefix}_CMD'),
+                'paths': _env_list(f'{prefix}_PATHS', f'tests/{name}'),
+                'shards': int(os.getenv(f'{prefix}_SHARDS', '0')),
+            }
+
+        self.test_patterns = _env_list('QA_TEST_PATTERNS', 'test_*.py,*_test.py')
+        self.parallel_suites = _env_bool('QA_PARALLEL_SUITES')
+        # 동시에 실행할 최대 러너 프로세스 수 (0 = CPU 코어 수)
+        self.max_workers = int(os.getenv('QA_MAX_WORKERS', '0')) or (os.cpu_count() or 1)
+        self.results_dir = os.getenv('QA_RESULTS_DIR') or str(
+            Path(config.workflow.checkpoint_dir) / 'test-results'
+        )
+
+        # 테스트 영향 분석 (베이스 브랜치 대비 변경 파일에 영향받는 테스트만 실행)
+        self.impact_analysis = _env_bool('QA_IMPACT_ANALYSIS')
+        self.base_branch = os.getenv('QA_BASE_BRANCH') or os.getenv('GIT_MAIN_BRANCH', 'main')
+        self.impact_ignore = _env_list('QA_IMPACT_IGNORE', '*.md,*.rst,*.txt,docs/*')
+        # 안전망: 영향 분석 실행 N회마다 / 마지막 전체 실행 후 N시간이 지나면 전체 실행 (0 = 사용 안 함)
+        self.full_run_every = int(os.getenv('QA_FULL_RUN_EVERY', '20'))
+        self.full_run_max_age_hours = int(os.getenv('QA_FULL_RUN_MAX_AGE_HOURS', '24'))
+
+        # flaky 테스트 기록/격리 (재시도에서 통과한 테스트)
+        self.flake_db = os.getenv('QA_FLAKE_DB') or str(Path(self.results_dir) / 'flaky.db')
+        self.quarantine_threshold = int(os.getenv('QA_QUARANTINE_THRESHOLD', '2'))
+        self.quarantine_release_passes = int(os.getenv('QA_QUARANTINE_RELEASE_PASSES', '10'))
+        self.deselect_format = os.getenv('QA_DESELECT_FORMAT', '--deselect={id}')
+
+        # 커버리지 리포트 (Cobertura/JaCoCo XML, 작업 디렉토리 기준 glob, 쉼표 구분)
+        # QA_RESULTS_DIR 의 *.coverage.xml (예: --cov-report=xml:{coverage}.xml) 은 항상 포함
+        self.coverage_reports = _env_list(
+            'QA_COVERAGE_REPORTS',
+            'coverage.xml,target/site/jacoco/jacoco.xml,build/reports/jacoco/test/jacocoTestReport.xml'
+        )
+        # 리포트가 하나도 없으면 커버리지 단계 실패 (기본: QA_COVERAGE_REPORTS 를 직접 지정했을 때만)
+        self.coverage_required = _env_bool(
+            'QA_COVERAGE_REQUIRED', 'true' if os.getenv('QA_COVERAGE_REPORTS') else 'false'
+        )
+        # 변경 라인 커버리지 기준 (%, 0 = 검사 안 함, 영향받는 테스트만 실행했을 때는 MIN_CODE_COVERAGE 사용)
+        self.min_diff_coverage = int(os.getenv('QA_MIN_DIFF_COVERAGE', '0'))
+
+
+class ReviewSettings:
+    """코드 리뷰 검사 실행 설정"""
+
+    required = []
+
+    PHASES = {
+        'static_analysis': 'STATIC',
+        'coding_style': 'STYLE',
+        'security': 'SECURITY',
+        'complexity': 'COMPLEXITY',
+    }
+
+    def __init__(self, config: 'Config'):
+        # 검사 대상: 베이스 브랜치 대비 변경 파일
+        self.base_branch = os.getenv('REVIEW_BASE_BRANCH') or os.getenv('GIT_MAIN_BRANCH', 'main')
+        self.parallel_phases = _env_bool('REVIEW_PARALLEL_PHASES')
+        # 검사 프로세스 풀 크기 (0 = CPU 코어 수)
+        self.max_workers = int(os.getenv('REVIEW_MAX_WORKERS', '0')) or (os.cpu_count() or 1)
+        self.timeout = int(os.getenv('REVIEW_TIMEOUT', '300'))
+        # 파일 내용 해시별 검사 결과 캐시
+        self.cache_dir = os.getenv('REVIEW_CACHE_DIR') or str(
+            Path(config.workflow.checkpoint_dir) / 'review-cache'
+        )
+
+        # 검사별 외부 도구 명령 (미설정 시 내장 Python 검사, {files} 자리표시자 또는 끝에 파일 목록)
+        # 출력은 "파일:라인[:컬럼]: 메시지" 형식 (flake8, pylint --output-format=parseable, ruff 등)
+        self.phases: Dict[str, Dict[str, object]] = {}
+        for phase, prefix in self.PHASES.items():
+            self.phases[phase] = {
+                'command': os.getenv(f'REVIEW_{prefix}_CMD'),
+                'patterns': _env_list(f'REVIEW_{prefix}_PATTERNS', '*.py'),
+            }
+        # 외부 도구가 보고한 이슈를 에러로 볼 검사 (나머지는 경고)
+        self.fail_on = _env_list('REVIEW_FAIL_ON', 'static_analysis,security')
+
+        # 내장 검사 기준
+        self.max_line_length = int(os.getenv('REVIEW_MAX_LINE_LENGTH', '120'))
+        self.max_complexity = int(os.getenv('REVIEW_MAX_COMPLEXITY', '10'))
+
+        # SonarQube (SONARQUBE_URL 과 프로젝트 키가 모두 있을 때만 실행, 다른 검사와 동시에 진행)
+        self.sonarqube_project_key = os.getenv('SONARQUBE_PROJECT_KEY')
+        self.sonarqube_scanner = os.getenv('SONARQUBE_SCANNER_CMD', 'sonar-scanner')
+        self.sonarqube_timeout = int(os.getenv('SONARQUBE_TIMEOUT', '900'))
+        self.sonarqube_poll_interval = float(os.getenv('SONARQUBE_POLL_INTERVAL', '1'))
+        self.sonarqube_max_poll_interval = float(os.getenv('SONARQUBE_MAX_POLL_INTERVAL', '15'))
+
+
+class BuildSettings:
+    """Backend Agent 빌드/빌드 캐시 설정"""
+
+    required = []
+
+    def __init__(self, config: 'Config'):
+        # 빌드 명령 (미설정 시 gradlew/build.gradle/pom.xml 로 자동 선택, 빌드 파일이 없으면 건너뜀)
+        self.command = os.getenv('BUILD_CMD')
+        # 캐시에 저장/복원할 빌드 산출물 (작업 디렉토리 기준 glob, 미설정 시 빌드 도구 기본값)
+        self.artifacts = _env_list('BUILD_ARTIFACTS', '')
+        self.timeout = int(os.getenv('BUILD_TIMEOUT', '1800'))
+
+        # 캐시 키에 포함할 툴체인 버전 확인 명령 (쉼표 구분)
+        self.toolchain_commands = _env_list('BUILD_TOOLCHAIN_CMDS', 'java -version')
+        # 베이스 브랜치 대비 이 패턴의 파일만 바뀐 티켓은 빌드 생략 (문서 전용 변경)
+        self.base_branch = os.getenv('BUILD_BASE_BRANCH') or os.getenv('GIT_MAIN_BRANCH', 'main')
+        self.skip_patterns = _env_list('BUILD_SKIP_PATTERNS', '*.md,*.rst,*.txt,*.adoc,docs/*')
+
+        # content-addressed 빌드 산출물 캐시 (LRU, 용량 상한), 공유 디렉토리는 로컬에 없을 때 조회/저장 시 함께 기록
+        self.cache_enabled = _env_bool('BUILD_CACHE_ENABLED')
+        self.cache_dir = os.getenv('BUILD_CACHE_DIR') or str(
+            Path(config.workflow.checkpoint_dir) / 'build-cache'
+        )
+        self.cache_max_mb = int(os.getenv('BUILD_CACHE_MAX_MB', '2048'))
+        self.shared_cache_dir = os.getenv('BUILD_SHARED_CACHE_DIR')
+
+
+class DocsSettings:
+    """Docs Agent 증분 문서 생성 설정"""
+
+    required = []
+
+    def __init__(self, config: 'Config'):
+        self.dir = os.getenv('DOCS_DIR', 'docs')
+        # 문서화할 소스 / 제외할 소스 (파일 이름 또는 경로 glob, 쉼표 구분)
+        self.source_patterns = _env_list('DOCS_SOURCE_PATTERNS', '*.py,*.java')
+        self.exclude_patterns = _env_list(
+            'DOCS_EXCLUDE_PATTERNS', 'test_*.py,*_test.py,tests/*,*Test.java,*/src/test/*,src/test/*'
+        )
+        # 모듈 분석 결과 캐시 (경로 + 파일 내용 해시 키)
+        self.cache_dir = os.getenv('DOCS_CACHE_DIR') or str(
+            Path(config.workflow.checkpoint_dir) / 'docs-cache'
+        )
+        # 분석 프로세스 수 (0 이면 CPU 코어 수)
+        self.max_workers = int(os.getenv('DOCS_MAX_WORKERS', '0')) or (os.cpu_count() or 1)
+        self.api_title = os.getenv('DOCS_API_TITLE', Path.cwd().name)
+
+        # 변경 로그: 티켓으로 인정할 프로젝트 키 (쉼표 구분, 기본: jira 섹션의 project_key, 빈 값으로 지정하면 모든 키)
+        self.changelog_path = os.getenv('CHANGELOG_PATH', 'CHANGELOG.md')
+        self.changelog_projects = _env_list('CHANGELOG_PROJECTS', config.jira.project_key)
+        self.changelog_base_branch = os.getenv('CHANGELOG_BASE_BRANCH') or os.getenv('GIT_MAIN_BRANCH', 'main')
+
+
+class WorkspaceSettings:
+    """준비된 작업 디렉토리 풀 설정"""
+
+    required = []
+
+    def __init__(self, config: 'Config'):
+        # 미리 준비해 둘 작업 디렉토리 수 (0 이면 풀을 쓰지 않고 현재 디렉토리에서 실행)
+        self.pool_size = int(os.getenv('WORKSPACE_POOL_SIZE', '0'))
+        self.pool_dir = os.getenv('WORKSPACE_POOL_DIR', str(Path.home() / '.cache' / 'tkm' / 'workspaces'))
+        # clone 할 저장소 (미설정 시 현재 저장소의 origin)
+        self.source = os.getenv('WORKSPACE_SOURCE')
+        self.base_branch = os.getenv('WORKSPACE_BASE_BRANCH') or os.getenv('GIT_MAIN_BRANCH', 'main')
+        # 의존성 준비 명령 (쉼표 구분, 미설정 시 requirements.txt/package.json/gradlew/pom.xml 로 자동 감지)
+        self.prepare_commands = _env_list('WORKSPACE_PREPARE_CMDS', '')
+        self.prepare_timeout = int(os.getenv('WORKSPACE_PREPARE_TIMEOUT', '1800'))
+
+        # pip/npm/Maven/Gradle 다운로드 캐시 (모든 작업 디렉토리가 공유)
+        self.cache_dir = os.getenv('WORKSPACE_CACHE_DIR') or str(Path(self.pool_dir) / 'cache')
+        # 마지막 갱신 후 이 시간이 지난 작업 디렉토리는 대여 전에 다시 fetch
+        self.max_age_minutes = int(os.getenv('WORKSPACE_MAX_AGE_MINUTES', '30'))
+        # refresh --daemon 갱신 주기 (초)
+        self.refresh_interval = int(os.getenv('WORKSPACE_REFRESH_INTERVAL', '60'))
+
+
+class MetricsSettings:
+    """단발성 실행 종료 시 Prometheus 메트릭 내보내기 설정"""
+
+    required = []
+
+    def __init__(self, config: 'Config'):
+        # node_exporter textfile collector 용 .prom 파일 경로
+        self.textfile = os.getenv('METRICS_TEXTFILE')
+        # Pushgateway 주소 (예: http://pushgateway:9091)와 job 이름
+        self.pushgateway_url = os.getenv('PUSHGATEWAY_URL')
+        self.job = os.getenv('METRICS_JOB', 'tkm-automation')
+
+
+class SandboxSettings:
+    """외부 명령 실행 계층(출력 로그, 타임아웃, 자원 한도) 설정"""
+
+    required = []
+
+    def __init__(self, config: 'Config'):
+        # 명령별 출력 로그 (<이름>.log, 크기를 넘으면 .1, .2 ... 로 회전)
+        self.log_dir = os.getenv('SANDBOX_LOG_DIR') or str(
+            Path(config.workflow.checkpoint_dir) / 'process-logs'
+        )
+        self.log_max_mb = int(os.getenv('SANDBOX_LOG_MAX_MB', '20'))
+        self.log_backups = int(os.getenv('SANDBOX_LOG_BACKUPS', '2'))
+        # 실행 결과에 담을 stdout/stderr 끝부분 (KB, 스트림별 메모리 상한)
+        self.tail_kb = int(os.getenv('SANDBOX_TAIL_KB', '64'))
+        # 호출하는 쪽에서 타임아웃을 정하지 않은 명령(git/gh 등)의 wall 타임아웃 (초, 0 이면 제한 없음)
+        self.timeout = int(os.getenv('SANDBOX_TIMEOUT', '600'))
+        # 프로세스 그룹 CPU 시간 / 프로세스별 주소 공간 / 파일 크기 한도 (0 이면 제한 없음)
+        self.cpu_seconds = int(os.getenv('SANDBOX_CPU_SECONDS', '0'))
+        self.memory_mb = int(os.getenv('SANDBOX_MEMORY_MB', '0'))
+        self.file_size_mb = int(os.getenv('SANDBOX_FILE_SIZE_MB', '0'))
+
+
+SECTIONS = {
+    'jira': JiraSettings,
+    'slack': SlackSettings,
+    'git': GitSettings,
+    'redis': RedisSettings,
+    'workflow': WorkflowSettings,
+    'qa': QASettings,
+    'review': ReviewSettings,
+    'build': BuildSettings,
+    'workspace': WorkspaceSettings,
+    'docs': DocsSettings,
+    'sandbox': SandboxSettings,
+    'metrics': MetricsSettings,
+}
+
+# 기존 평면 속성 → (섹션, 섹션 속성)
+_FLAT_ATTRIBUTES = {
+    'jira_url': ('jira', 'url'),
+    'jira_email': ('jira', 'email'),
+    'jira_api_token': ('jira', 'api_token'),
+    'jira_project_key': ('jira', 'project_key'),
+    'slack_webhook_url': ('slack', 'webhook_url'),
+    'slack_channel': ('slack', 'channel'),
+    'slack_username': ('slack', 'username'),
+    'git_author_name': ('git', 'author_name'),
+    'git_author_email': ('git', 'author_email'),
+    'git_main_branch': ('git', 'main_branch'),
+    'git_stage_branch': ('git', 'stage_branch'),
+    'github_token': ('git', 'github_token'),
+    'github_api_url': ('git', 'github_api_url'),
+    'github_repository': ('git', 'github_repository'),
+    'redis_host': ('redis', 'host'),
+    'redis_port': ('redis', 'port'),
+    'redis_password': ('redis', 'password'),
+    'redis_db': ('redis', 'db'),
+    'workflow_mode': ('workflow', 'mode'),
+    'checkpoint_dir': ('workflow', 'checkpoint_dir'),
+    'step_cache_enabled': ('workflow', 'step_cache_enabled'),
+    'step_cache_dir': ('workflow', 'step_cache_dir'),
+    'log_level': ('workflow', 'log_level'),
+    'min_code_coverage': ('workflow', 'min_code_coverage'),
+    'sonarqube_url': ('workflow', 'sonarqube_url'),
+    'sonarqube_token': ('workflow', 'sonarqube_token'),
+    'backend_agent_enabled': ('workflow', 'backend_agent_enabled'),
+    'qa_agent_enabled': ('workflow', 'qa_agent_enabled'),
+    'review_agent_enabled': ('workflow', 'review_agent_enabled'),
+    'docs_agent_enabled': ('workflow', 'docs_agent_enabled'),
+    'test_timeout': ('workflow', 'test_timeout'),
+    'test_retry_count': ('workflow', 'test_retry_count'),
+    'failure_alerts': ('workflow', 'failure_alerts'),
+    'failure_db': ('workflow', 'failure_db'),
+    'failure_realert_hours': ('workflow', 'failure_realert_hours'),
+}
+
+# validate()가 섹션 지정 없이 호출될 때 검증하는 섹션 (기존 동작과 동일)
+DEFAULT_REQUIRED_SECTIONS = ('jira', 'slack', 'git')
 
 
 class Config:
@@ -20,91 +437,135 @@ class Config:
         Args:
             env_file: .env 파일 경로 (기본값: 프로젝트 루트의 .env)
         """
-        # .env 파일 로드
-        if env_file:
-            load_dotenv(env_file)
-        else:
-            # 프로젝트 루트의 .env 파일 자동 로드
-            project_root = Path(__file__).parent.parent
-            env_path = project_root / '.env'
-            load_dotenv(env_path)
-
-        # ===================================
-        # JIRA 설정
-        # ===================================
-        self.jira_url = os.getenv('JIRA_URL')
-        self.jira_email = os.getenv('JIRA_EMAIL')
-        self.jira_api_token = os.getenv('JIRA_API_TOKEN')
-        self.jira_project_key = os.getenv('JIRA_PROJECT_KEY', 'FINOPS')
-
-        # ===================================
-        # Slack 설정
-        # ===================================
-        self.slack_webhook_url = os.getenv('SLACK_WEBHOOK_URL')
-        self.slack_channel = os.getenv('SLACK_CHANNEL', '#finops-dev')
-        self.slack_username = os.getenv('SLACK_USERNAME', 'Claude Code Bot')
-
-        # ===================================
-        # Git 설정
-        # ===================================
-        self.git_author_name = os.getenv('GIT_AUTHOR_NAME', 'Claude Code')
-        self.git_author_email = os.getenv('GIT_AUTHOR_EMAIL', 'claude@company.com')
-        self.git_main_branch = os.getenv('GIT_MAIN_BRANCH', 'main')
-        self.git_stage_branch = os.getenv('GIT_STAGE_BRANCH', 'stage')
-
-        # ===================================
-        # Redis 설정
-        # ===================================
-        self.redis_host = os.getenv('REDIS_HOST', 'localhost')
-        self.redis_port = int(os.getenv('REDIS_PORT', '6379'))
-        self.redis_password = os.getenv('REDIS_PASSWORD', None)
-        self.redis_db = int(os.getenv('REDIS_DB', '0'))
-
-        # ===================================
-        # 워크플로우 설정
-        # ===================================
-        self.workflow_mode = os.getenv('WORKFLOW_MODE', 'auto')
-        self.checkpoint_dir = os.getenv('CHECKPOINT_DIR', './checkpoints')
-        self.log_level = os.getenv('LOG_LEVEL', 'INFO')
+        self.env_file = Path(env_file) if env_file else DEFAULT_ENV_FILE
+        self._sections: Dict[str, object] = {}
+        self._validated = set()
+        self._env_mtime = None
+        self._load_env()
 
-        # ===================================
-        # 품질 게이트 설정
-        # ===================================
-        self.min_code_coverage = int(os.getenv('MIN_CODE_COVERAGE', '80'))
-        self.sonarqube_url = os.getenv('SONARQUBE_URL')
-        self.sonarqube_token = os.getenv('SONARQUBE_TOKEN')
+    def _load_env(self) -> None:
+        """
+        .env 값을 os.environ에 반영
 
-        # ===================================
-        # SubAgent 설정
-        # ===================================
-        self.backend_agent_enabled = os.getenv('BACKEND_AGENT_ENABLED', 'true').lower() == 'true'
-        self.qa_agent_enabled = os.getenv('QA_AGENT_ENABLED', 'true').lower() == 'true'
-        self.review_agent_enabled = os.getenv('REVIEW_AGENT_ENABLED', 'true').lower() == 'true'
-        self.docs_agent_enabled = os.getenv('DOCS_AGENT_ENABLED', 'true').lower() == 'true'
-
-        # ===================================
-        # 테스트 설정
-        # ===================================
-        self.test_timeout = int(os.getenv('TEST_TIMEOUT', '300'))
-        self.test_retry_count = int(os.getenv('TEST_RETRY_COUNT', '3'))
+        load_dotenv와 마찬가지로 이미 설정된 환경변수는 덮어쓰지 않으며,
+        이전에 .env에서 주입한 값만 새 값으로 교체합니다.
+        """
+        self._env_mtime = _env_file_mtime(self.env_file)
+        values = read_env_file(self.env_file)
+
+        for key in list(_injected_env):
+            if key not in values and os.environ.get(key) == _injected_env[key]:
+                del os.environ[key]
+                del _injected_env[key]
 
-    def validate(self) -> None:
+        for key, value in values.items():
+            if key not in os.environ or os.environ[key] == _injected_env.get(key):
+                os.environ[key] = value
+                _injected_env[key] = value
+
+    def section(self, name: str):
+        """
+        설정 섹션 반환 (처음 접근할 때 생성)
+
+        Args:
+            name: 섹션 이름 (SECTIONS 의 키)
+        """
+        if name not in self._sections:
+            if name not in SECTIONS:
+                raise KeyError(f"Unknown config section: {name}")
+            # 섹션은 이 Config 를 받아 다른 섹션의 값(workflow.checkpoint_dir 등)으로 기본값을 정함
+            self._sections[name] = SECTIONS[name](self)
+        return self._sections[name]
+
+    @property
+    def jira(self) -> JiraSettings:
+        return self.section('jira')
+
+    @property
+    def slack(self) -> SlackSettings:
+        return self.section('slack')
+
+    @property
+    def git(self) -> GitSettings:
+        return self.section('git')
+
+    @property
+    def redis(self) -> RedisSettings:
+        return self.section('redis')
+
+    @property
+    def workflow(self) -> WorkflowSettings:
+        return self.section('workflow')
+
+    @property
+    def qa(self) -> QASettings:
+        return self.section('qa')
+
+    @property
+    def review(self) -> ReviewSettings:
+        return self.section('review')
+
+    @property
+    def build(self) -> BuildSettings:
+        return self.section('build')
+
+    @property
+    def workspace(self) -> WorkspaceSettings:
+        return self.section('workspace')
+
+    @property
+    def docs(self) -> DocsSettings:
+        return self.section('docs')
+
+    @property
+    def sandbox(self) -> SandboxSettings:
+        return self.section('sandbox')
+
+    @property
+    def metrics(self) -> MetricsSettings:
+        return self.section('metrics')
+
+    def __getattr__(self, name: str):
+        # 기존 코드 호환: config.jira_url → config.jira.url
+        mapping = _FLAT_ATTRIBUTES.get(name)
+        if mapping is None:
+            raise AttributeError(f"'Config' object has no attribute '{name}'")
+        section_name, attr = mapping
+        return getattr(self.section(section_name), attr)
+
+    def reload_if_changed(self) -> bool:
+        """
+        .env 파일이 변경되었으면 다시 로드 (장시간 실행 모드용 핫 리로드)
+
+        Returns:
+            다시 로드했는지 여부
+        """
+        if _env_file_mtime(self.env_file) == self._env_mtime:
+            return False
+
+        self._load_env()
+        self._sections.clear()
+        self._validated.clear()
+        return True
+
+    def validate(self, sections: Optional[Iterable[str]] = None) -> None:
         """
         필수 환경변수 검증
 
+        Args:
+            sections: 검증할 섹션 목록 (기본값: jira, slack, git)
+
         Raises:
             EnvironmentError: 필수 환경변수가 누락된 경우
         """
-        required_vars = [
-            ('JIRA_URL', self.jira_url),
-            ('JIRA_EMAIL', self.jira_email),
-            ('JIRA_API_TOKEN', self.jira_api_token),
-            ('SLACK_WEBHOOK_URL', self.slack_webhook_url),
-            ('GIT_AUTHOR_NAME', self.git_author_name),
-            ('GIT_AUTHOR_EMAIL', self.git_author_email),
-        ]
+        sections = tuple(sections) if sections is not None else DEFAULT_REQUIRED_SECTIONS
+        missing_vars = []
 
-        missing_vars = [name for name, value in required_vars if not value]
+        for name in sections:
+            if name in self._validated:
+                continue
+            section = self.section(name)
+            missing_vars += [env for env, attr in section.required if not getattr(section, attr)]
 
         if missing_vars:
             raise EnvironmentError(
@@ -113,6 +574,8 @@ class Config:
                 f"You can copy .env.example to .env and fill in the values."
             )
 
+        self._validated.update(sections)
+
     def print_config(self) -> None:
         """설정 정보 출력 (민감 정보 제외)"""
         print("=" * 50)
@@ -151,21 +614,34 @@ class Config:
 _config_instance = None
 
 
-def get_config(reload: bool = False) -> Config:
+def get_config(
+    reload: bool = False,
+    require: Iterable[str] = (),
+    hot_reload: bool = False
+) -> Config:
     """
     전역 Config 인스턴스 반환 (싱글톤)
 
     Args:
         reload: True일 경우 config를 다시 로드
+        require: 필수값을 검증할 섹션 목록 (예: ('jira', 'slack'))
+        hot_reload: True일 경우 .env 변경 시에만 다시 로드 (데몬/워커 모드용)
 
     Returns:
         Config 인스턴스
+
+    Raises:
+        EnvironmentError: require로 지정한 섹션의 필수 환경변수가 누락된 경우
     """
     global _config_instance
 
     if _config_instance is None or reload:
         _config_instance = Config()
-        _config_instance.validate()
+    elif hot_reload:
+        _config_instance.reload_if_changed()
+
+    if require:
+        _config_instance.validate(require)
 
     return _config_instance
 
@@ -173,7 +649,7 @@ def get_config(reload: bool = False) -> Config:
 # 사용 예시
 if __name__ == '__main__':
     try:
-        config = get_config()
+        config = get_config(require=DEFAULT_REQUIRED_SECTIONS)
         config.print_config()
     except EnvironmentError as e:
         print(f"❌ Configuration Error: {e}")
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Claude Code SubAgent - Diff Stats
+
+베이스 브랜치 대비 변경 통계 (파일별 추가/삭제 라인, 이름 변경, 바이너리)
+
+`git diff --raw --numstat -z` 한 번의 출력을 스트리밍으로 읽어 name-status(상태/이름 변경)와
+numstat(라인 수/바이너리)를 파일별로 합칩니다. 비교 대상은 merge-base 커밋과
+작업 디렉토리(미커밋/미추적 변경 포함)의 tree 해시이며, 결과는 (base SHA, head tree) 키로
+프로세스 안에서는 메모리, 프로세스 간에는 content-addressed 캐시(StepCache)에 저장합니다.
+Review Agent(변경 검토/검사 대상), QA Agent(테스트 영향 분석), PR 본문 생성이 같은 결과를 재사용합니다.
+
+    stats = diff_stats(Path('.'), 'main', exclude=workspace_excludes(config), cache_dir=config.step_cache_dir)
+    stats['files_changed'], stats['additions'], stats['deletions']
+    changed_paths(stats)   # 이름 변경은 이전/새 경로 모두
+"""
+
+import subprocess
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from step_cache import StepCache, git_tree_hash, input_key
+from tracing import span, traced_run
+
+# 프로세스 내 캐시: {(base, head): stats}
+_memory: Dict[Tuple[str, str], Dict[str, Any]] = {}
+_memory_lock = threading.Lock()
+
+# 파이프 읽기 단위
+_READ_SIZE = 1 << 16
+
+
+def workspace_excludes(config) -> List[Path]:
+    """
+    변경 통계/트리 해시에서 제외할 실행 산출물 경로 (체크포인트, 캐시, 테스트 결과)
+
+    Args:
+        config: Config 인스턴스
+
+    Returns:
+        제외 경로 목록
+    """
+    return [
+        Path(config.checkpoint_dir),
+        Path(config.step_cache_dir),
+        Path(config.qa.results_dir),
+        Path(config.review.cache_dir),
+        Path(config.build.cache_dir),
+        Path(config.docs.cache_dir),
+        Path(config.sandbox.log_dir),
+    ]
+
+
+def merge_base(repo_path: Path, base_branch: str) -> Optional[str]:
+    """
+    HEAD 와 베이스 브랜치의 merge-base
+
+    Args:
+        repo_path: Git 저장소 경로
+        base_branch: 베이스 브랜치 (로컬에 없으면 origin/<브랜치>)
+
+    Returns:
+        커밋 SHA (찾을 수 없으면 None)
+    """
+    for ref in (base_branch, f"origin/{base_branch}"):
+        result = traced_run(
+            ['git', 'merge-base', 'HEAD', ref],
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+            check=False
+        )
+        if result.returncode == 0:
+            return result.stdout.strip()
+    return None
+
+
+def nul_tokens(stream) -> Iterator[str]:
+    """NUL 구분 출력을 읽는 대로 토큰 단위로 돌려줌 (전체 출력을 메모리에 올리지 않음)"""
+    pending = b''
+    while True:
+        chunk = stream.read(_READ_SIZE)
+        if not chunk:
+            break
+        parts = (pending + chunk).split(b'\0')
+        pending = parts.pop()
+        for part in parts:
+            yield part.decode('utf-8', errors='surrogateescape')
+    if pending:
+        yield pending.decode('utf-8', errors='surrogateescape')
+
+
+def _entry(path: str) -> Dict[str, Any]:
+    return {
+        'path': path,
+        'old_path': None,
+        'status': 'M',
+        'similarity': None,
+        'added': 0,
+        'deleted': 0,
+        'binary': False,
+    }
+
+
+def parse_diff(tokens: Iterable[str]) -> List[Dict[str, Any]]:
+    """
+    `git diff --raw --numstat -z` 출력 파싱
+
+    raw:     ":<모드> <모드> <sha> <sha> <상태>\\0<경로>\\0"  (R/C 는 "\\0<이전 경로>\\0<새 경로>\\0")
+    numstat: "<추가>\\t<삭제>\\t<경로>\\0"                    (이름 변경은 "<추가>\\t<삭제>\\t\\0<이전>\\0<새>\\0",
+                                                            바이너리는 추가/삭제가 "-")
+
+    Args:
+        tokens: NUL 로 나눈 출력 토큰
+
+    Returns:
+        [{'path', 'old_path', 'status', 'added', 'deleted', 'binary', 'similarity'}] (경로순)
+    """
+    files: Dict[str, Dict[str, Any]] = {}
+    iterator = iter(tokens)
+
+    for token in iterator:
+        if not token:
+            continue
+
+        if token.startswith(':'):
+            status = token.split(' ')[-1]
+            letter = status[0]
+            old_path = None
+            if letter in ('R', 'C'):
+                old_path, path = next(iterator), next(iterator)
+            else:
+                path = next(iterator)
+            entry = files.setdefault(path, _entry(path))
+            entry.update(
+                status=letter,
+                old_path=old_path,
+                similarity=int(status[1:]) if status[1:].isdigit() else None
+            )
+            continue
+
+        added, deleted, path = token.split('\t', 2)
+        if not path:
+            next(iterator)
+            path = next(iterator)
+        entry = files.setdefault(path, _entry(path))
+        entry['binary'] = added == '-'
+        entry['added'] = 0 if entry['binary'] else int(added)
+        entry['deleted'] = 0 if entry['binary'] else int(deleted)
+
+    return [files[path] for path in sorted(files)]
+
+
+def _summarize(base: str, head: str, files: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        'base': base,
+        'head': head,
+        'files': files,
+        'files_changed': len(files),
+        'additions': sum(f['added'] for f in files),
+        'deletions': sum(f['deleted'] for f in files),
+        'renames': sum(1 for f in files if f['status'] == 'R'),
+        'binary': sum(1 for f in files if f['binary']),
+    }
+
+
+def _compute(repo_path: Path, base: str, head: str) -> Dict[str, Any]:
+    """git diff 를 실행하며 출력을 스트리밍으로 파싱"""
+    argv = [
+        'git', 'diff', '--raw', '--numstat', '-z', '-M',
+        '--no-color', '--no-ext-diff', '--no-textconv', base, head,
+    ]
+    with span('git.diff_stats', **{'git.base': base, 'git.head': head}):
+        process = subprocess.Popen(argv, cwd=repo_path, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            files = parse_diff(nul_tokens(process.stdout))
+        finally:
+            process.stdout.close()
+            stderr = process.stderr.read().decode('utf-8', errors='replace')
+            process.stderr.close()
+            returncode = process.wait()
+
+    if returncode != 0:
+        raise RuntimeError(f"git diff 실패 (exit {returncode}): {stderr.strip()}")
+    return _summarize(base, head, files)
+
+
+def diff_stats(
+    repo_path: Path,
+    base_branch: str,
+    exclude: Iterable[Path] = (),
+    cache_dir: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    베이스 브랜치 merge-base 대비 작업 디렉토리의 변경 통계
+
+    Args:
+        repo_path: Git 저장소 경로
+        base_branch: 베이스 브랜치
+        exclude: 제외 경로 (workspace_excludes() 참고)
+        cache_dir: 프로세스 간 공유 캐시 디렉토리 (None 이면 메모리 캐시만)
+
+    Returns:
+        {'base', 'head', 'files', 'files_changed', 'additions', 'deletions', 'renames', 'binary'}
+        (Git 저장소가 아니거나 베이스와 비교할 수 없으면 None)
+    """
+    repo_path = Path(repo_path)
+    base = merge_base(repo_path, base_branch)
+    if base is None:
+        return None
+    head = git_tree_hash(repo_path, exclude=exclude)
+    if head is None:
+        return None
+
+    with _memory_lock:
+        stats = _memory.get((base, head))
+    if stats is not None:
+        return stats
+
+    cache = StepCache(cache_dir) if cache_dir else None
+    key = input_key('diff_stats', {'base': base, 'head': head})
+    entry = cache.get(key) if cache else None
+    if entry is not None:
+        stats = entry['outputs']
+    else:
+        stats = _compute(repo_path, base, head)
+        if cache:
+            cache.put(key, 'diff_stats', {'base': base, 'head': head}, stats)
+
+    with _memory_lock:
+        _memory[(base, head)] = stats
+    return stats
+
+
+def changed_paths(stats: Dict[str, Any], include_deleted: bool = True) -> List[str]:
+    """
+    변경 파일 경로 (이름 변경은 이전/새 경로 모두)
+
+    Args:
+        stats: diff_stats() 결과
+        include_deleted: 삭제된 파일(과 이름 변경 전 경로) 포함 여부
+
+    Returns:
+        정렬된 경로 목록
+    """
+    paths = set()
+    for entry in stats['files']:
+        if entry['status'] != 'D' or include_deleted:
+            paths.add(entry['path'])
+        if entry['old_path'] and include_deleted:
+            paths.add(entry['old_path'])
+    return sorted(paths)
+
+
+def markdown_summary(stats: Dict[str, Any], limit: int = 20) -> str:
+    """
+    PR 본문용 변경 통계 (Markdown)
+
+    Args:
+        stats: diff_stats() 결과
+        limit: 표에 나열할 최대 파일 수 (변경 라인이 많은 순)
+
+    Returns:
+        Markdown 문자열
+    """
+    lines = [
+        "## 변경 통계",
+        "",
+        f"- 변경 파일: {stats['files_changed']}개 (이름 변경 {stats['renames']}개, 바이너리 {stats['binary']}개)",
+        f"- 추가: +{stats['additions']} / 삭제: -{stats['deletions']}",
+    ]
+
+    files = sorted(stats['files'], key=lambda f: f['added'] + f['deleted'], reverse=True)[:limit]
+    if files:
+        lines += ["", "| 파일 | 상태 | + | - |", "|------|------|---|---|"]
+        for entry in files:
+            path = f"{entry['old_path']} → {entry['path']}" if entry['old_path'] else entry['path']
+            counts = ("bin", "bin") if entry['binary'] else (entry['added'], entry['deleted'])
+            lines.append(f"| `{path}` | {entry['status']} | {counts[0]} | {counts[1]} |")
+        if stats['files_changed'] > limit:
+            lines.append(f"| … 외 {stats['files_changed'] - limit}개 | | | |")
+
+    return '\n'.join(lines)
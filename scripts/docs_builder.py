@@ -0,0 +1,593 @@
+#!/usr/bin/env python3
+"""
+Claude Code SubAgent - Docs Builder
+
+증분 문서 생성 엔진 (모듈별 코드 문서, API 엔드포인트 문서)
+
+마지막 문서 빌드의 manifest(<DOCS_DIR>/.manifest.json)와 소스 파일 내용 해시를 비교해
+바뀐 모듈만 다시 분석하고 해당 페이지만 다시 씁니다. 파일 크기/mtime 이 manifest 와 같으면 해시도 다시 계산하지 않습니다.
+분석 결과는 (경로, 파일 내용 해시) 키로 캐시하므로 브랜치를 오가며 같은 내용으로 돌아온 파일도 다시 분석하지 않고,
+캐시에 없는 파일은 프로세스 풀에 나눠 분석합니다.
+
+분석기는 표준 라이브러리만 사용합니다.
+    - Python: ast (모듈/클래스/함수 docstring, FastAPI/Flask 라우트 데코레이터)
+    - Java: 정규식 (Javadoc, public 메서드, Spring @*Mapping 어노테이션)
+
+출력 구조:
+    <DOCS_DIR>/code/<소스 경로>.md   모듈 문서
+    <DOCS_DIR>/code/index.md         모듈 목록
+    <DOCS_DIR>/api/<소스 경로>.md    소스 파일별 엔드포인트
+    <DOCS_DIR>/api/index.md          전체 엔드포인트
+    <DOCS_DIR>/api/openapi.json      OpenAPI 3 paths (요약만)
+
+    builder = DocsBuilder(workdir, docs_dir, cache_dir, ['*.py', '*.java'])
+    scan = builder.scan(executor_factory)
+    builder.write_code_docs(); builder.write_api_docs(); builder.save_manifest()
+"""
+
+import os
+import re
+import ast
+import json
+import math
+import fnmatch
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from lint_runner import file_digest
+from step_cache import StepCache, input_key
+from tracing import span, traced_run
+
+# 분석기/페이지 형식을 바꾸면 올려서 캐시와 manifest 를 무효화
+DOCS_VERSION = 1
+
+# 프로세스 풀 작업 하나에 묶을 최대 파일 수
+MAX_BATCH = 50
+
+# 이 수 이하의 파일은 프로세스 풀 없이 바로 분석 (풀 시작 비용이 더 큼)
+INLINE_LIMIT = 8
+
+MANIFEST_NAME = '.manifest.json'
+
+HTTP_METHODS = ('get', 'post', 'put', 'delete', 'patch')
+
+# Java 선언
+_JAVA_PACKAGE = re.compile(r'^\s*package\s+([\w.]+)\s*;')
+_JAVA_TYPE = re.compile(
+    r'^\s*(?:public\s+|protected\s+|private\s+)?(?:abstract\s+|final\s+|static\s+|sealed\s+)*'
+    r'(class|interface|enum|record)\s+(\w+)'
+)
+_JAVA_METHOD = re.compile(
+    r'^\s*public\s+(?:static\s+|final\s+|synchronized\s+|abstract\s+|default\s+)*'
+    r'(?:<[^>]+>\s+)?([\w.<>\[\], ?]+?)\s+(\w+)\s*\(([^)]*)\)?'
+)
+_JAVA_MAPPING = re.compile(r'@(Get|Post|Put|Delete|Patch|Request)Mapping\b(?:\s*\((.*)\))?')
+_JAVA_STRING = re.compile(r'"([^"]*)"')
+_JAVA_REQUEST_METHOD = re.compile(r'RequestMethod\.(\w+)')
+
+# Flask 경로 변수 <int:id> → OpenAPI {id}
+_FLASK_PARAM = re.compile(r'<(?:[^:<>]+:)?([^<>]+)>')
+
+
+def _first_paragraph(doc: Optional[str]) -> str:
+    """docstring/Javadoc 첫 문단 (한 줄로)"""
+    if not doc:
+        return ''
+    paragraph = doc.strip().split('\n\n')[0]
+    return ' '.join(line.strip() for line in paragraph.splitlines() if line.strip())
+
+
+def _join_path(base: str, path: str) -> str:
+    joined = '/'.join(part.strip('/') for part in (base, path) if part and part.strip('/'))
+    return '/' + joined
+
+
+def _python_endpoints(node: ast.AST, prefix: str = '') -> List[Dict[str, Any]]:
+    """FastAPI(@app.get/@router.post ...)/Flask(@app.route) 데코레이터의 엔드포인트"""
+    endpoints = []
+    for decorator in getattr(node, 'decorator_list', []):
+        if not (isinstance(decorator, ast.Call) and isinstance(decorator.func, ast.Attribute)):
+            continue
+        if not (decorator.args and isinstance(decorator.args[0], ast.Constant)
+                and isinstance(decorator.args[0].value, str)):
+            continue
+
+        attr = decorator.func.attr
+        if attr in HTTP_METHODS:
+            methods = [attr.upper()]
+        elif attr == 'route':
+            methods = ['GET']
+            for keyword in decorator.keywords:
+                if keyword.arg == 'methods' and isinstance(keyword.value, (ast.List, ast.Tuple)):
+                    methods = [
+                        element.value.upper() for element in keyword.value.elts
+                        if isinstance(element, ast.Constant) and isinstance(element.value, str)
+                    ] or methods
+        else:
+            continue
+
+        path = _FLASK_PARAM.sub(r'{\1}', decorator.args[0].value)
+        for method in methods:
+            endpoints.append({
+                'method': method,
+                'path': _join_path('', path),
+                'handler': f"{prefix}{node.name}",
+                'summary': _first_paragraph(ast.get_docstring(node)),
+            })
+    return endpoints
+
+
+def _python_module(source: str) -> Dict[str, Any]:
+    """Python 모듈 분석 (공개 클래스/함수와 라우트)"""
+    tree = ast.parse(source)
+    symbols: List[Dict[str, Any]] = []
+    endpoints: List[Dict[str, Any]] = []
+
+    def signature(function: ast.AST) -> str:
+        returns = f" -> {ast.unparse(function.returns)}" if function.returns else ''
+        return f"{function.name}({ast.unparse(function.args)}){returns}"
+
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            endpoints.extend(_python_endpoints(node))
+            if not node.name.startswith('_'):
+                symbols.append({
+                    'kind': 'function',
+                    'name': node.name,
+                    'signature': signature(node),
+                    'doc': _first_paragraph(ast.get_docstring(node)),
+                })
+        elif isinstance(node, ast.ClassDef):
+            methods = []
+            for child in node.body:
+                if not isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    continue
+                endpoints.extend(_python_endpoints(child, f"{node.name}."))
+                if not child.name.startswith('_') or child.name == '__init__':
+                    methods.append({'signature': signature(child), 'doc': _first_paragraph(ast.get_docstring(child))})
+            if not node.name.startswith('_'):
+                bases = ', '.join(ast.unparse(base) for base in node.bases)
+                symbols.append({
+                    'kind': 'class',
+                    'name': node.name,
+                    'signature': f"{node.name}({bases})" if bases else node.name,
+                    'doc': _first_paragraph(ast.get_docstring(node)),
+                    'methods': methods,
+                })
+
+    return {
+        'language': 'python',
+        'summary': _first_paragraph(ast.get_docstring(tree)),
+        'symbols': symbols,
+        'endpoints': endpoints,
+    }
+
+
+def _java_mapping(annotation: str) -> Optional[Dict[str, Any]]:
+    """Spring @*Mapping 어노테이션 → {'methods', 'path'}"""
+    match = _JAVA_MAPPING.search(annotation)
+    if not match:
+        return None
+    kind, arguments = match.group(1), match.group(2) or ''
+    strings = _JAVA_STRING.findall(arguments)
+    if kind == 'Request':
+        methods = [method.upper() for method in _JAVA_REQUEST_METHOD.findall(arguments)] or ['ANY']
+    else:
+        methods = [kind.upper()]
+    return {'methods': methods, 'path': strings[0] if strings else ''}
+
+
+def _java_module(source: str) -> Dict[str, Any]:
+    """Java 소스 분석 (최상위 타입, public 메서드, Spring 엔드포인트)"""
+    package = ''
+    symbols: List[Dict[str, Any]] = []
+    endpoints: List[Dict[str, Any]] = []
+    current: Optional[Dict[str, Any]] = None
+    base_path = ''
+
+    doc: Optional[str] = None
+    annotations: List[str] = []
+    in_doc = False
+    doc_lines: List[str] = []
+
+    for line in source.splitlines():
+        stripped = line.strip()
+
+        if in_doc:
+            end = stripped.find('*/')
+            doc_lines.append(stripped[:end] if end >= 0 else stripped)
+            if end >= 0:
+                in_doc = False
+                doc = '\n'.join(
+                    re.sub(r'^\*\s?', '', text) for text in doc_lines
+                    if not re.sub(r'^\*\s?', '', text).startswith('@')
+                )
+            continue
+        if stripped.startswith('/**'):
+            rest = stripped[3:]
+            if '*/' in rest:
+                doc = rest[:rest.find('*/')].strip()
+            else:
+                in_doc, doc_lines = True, [rest]
+            continue
+        if stripped.startswith('@'):
+            annotations.append(stripped)
+            continue
+        if not stripped or stripped.startswith(('//', '*', '/*')):
+            continue
+
+        match = _JAVA_PACKAGE.match(line)
+        if match:
+            package = match.group(1)
+        elif current is None and _JAVA_TYPE.match(line):
+            match = _JAVA_TYPE.match(line)
+            current = {
+                'kind': match.group(1),
+                'name': match.group(2),
+                'signature': f"{match.group(1)} {match.group(2)}",
+                'doc': _first_paragraph(doc),
+                'methods': [],
+            }
+            symbols.append(current)
+            for annotation in annotations:
+                mapping = _java_mapping(annotation)
+                if mapping:
+                    base_path = mapping['path']
+        elif current is not None and _JAVA_METHOD.match(line):
+            match = _JAVA_METHOD.match(line)
+            name = match.group(2)
+            parameters = ' '.join(match.group(3).split())
+            current['methods'].append({
+                'signature': f"{match.group(1)} {name}({parameters})",
+                'doc': _first_paragraph(doc),
+            })
+            for annotation in annotations:
+                mapping = _java_mapping(annotation)
+                if mapping:
+                    for method in mapping['methods']:
+                        endpoints.append({
+                            'method': method,
+                            'path': _join_path(base_path, mapping['path']),
+                            'handler': f"{current['name']}.{name}",
+                            'summary': _first_paragraph(doc),
+                        })
+
+        doc, annotations = None, []
+
+    return {
+        'language': 'java',
+        'summary': symbols[0]['doc'] if symbols else '',
+        'package': package,
+        'symbols': symbols,
+        'endpoints': endpoints,
+    }
+
+
+def analyze_source(root: Path, path: str) -> Dict[str, Any]:
+    """
+    소스 파일 하나 분석
+
+    Args:
+        root: 작업 디렉토리
+        path: 작업 디렉토리 기준 경로
+
+    Returns:
+        {'language', 'summary', 'symbols', 'endpoints', ('error')}
+    """
+    try:
+        source = (Path(root) / path).read_text(encoding='utf-8', errors='replace')
+        if path.endswith('.java'):
+            return _java_module(source)
+        return _python_module(source)
+    except (SyntaxError, ValueError) as e:
+        return {'language': Path(path).suffix.lstrip('.'), 'summary': '', 'symbols': [], 'endpoints': [], 'error': str(e)}
+
+
+def analyze_batch(root: str, paths: List[str]) -> Dict[str, Dict[str, Any]]:
+    """파일 묶음 분석 (프로세스 풀 작업 단위)"""
+    return {path: analyze_source(Path(root), path) for path in paths}
+
+
+def render_module(path: str, info: Dict[str, Any]) -> str:
+    """모듈 문서 페이지 (Markdown)"""
+    lines = [f"# `{path}`", ""]
+    if info.get('package'):
+        lines += [f"패키지: `{info['package']}`", ""]
+    # Java 는 최상위 타입의 Javadoc 이 곧 모듈 설명이므로 타입 아래에만 출력
+    if info.get('summary') and info.get('language') != 'java':
+        lines += [info['summary'], ""]
+    if info.get('error'):
+        lines += [f"> ⚠️ 분석 실패: {info['error']}", ""]
+
+    for symbol in info['symbols']:
+        lines += [f"## `{symbol['signature']}`", ""]
+        if symbol['doc']:
+            lines += [symbol['doc'], ""]
+        for method in symbol.get('methods', []):
+            lines.append(f"- `{method['signature']}`" + (f" — {method['doc']}" if method['doc'] else ''))
+        if symbol.get('methods'):
+            lines.append("")
+
+    if info['endpoints']:
+        lines += ["## API 엔드포인트", "", f"[API 문서](../{'../' * path.count('/')}api/{path}.md)", ""]
+    return '\n'.join(lines).rstrip() + '\n'
+
+
+def endpoint_table(endpoints: Iterable[Dict[str, Any]], with_source: bool = False) -> List[str]:
+    header = "| Method | Path | Handler | 설명 |" + (" 소스 |" if with_source else '')
+    lines = [header, "|---|---|---|---|" + ("---|" if with_source else '')]
+    for endpoint in endpoints:
+        row = f"| {endpoint['method']} | `{endpoint['path']}` | `{endpoint['handler']}` | {endpoint['summary']} |"
+        if with_source:
+            row += f" `{endpoint['source']}` |"
+        lines.append(row)
+    return lines
+
+
+def render_api_page(path: str, endpoints: List[Dict[str, Any]]) -> str:
+    """소스 파일별 API 문서 페이지 (Markdown)"""
+    return '\n'.join([f"# API: `{path}`", ""] + endpoint_table(endpoints)) + '\n'
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """내용이 다를 때만 쓰기 (변경 없는 페이지의 mtime/diff 를 건드리지 않음)"""
+    try:
+        if path.read_text(encoding='utf-8') == text:
+            return False
+    except FileNotFoundError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(text, encoding='utf-8')
+    os.replace(tmp, path)
+    return True
+
+
+def _remove(path: Path) -> bool:
+    try:
+        path.unlink()
+        return True
+    except FileNotFoundError:
+        return False
+
+
+class DocsBuilder:
+    """manifest/내용 해시 기반 증분 문서 생성"""
+
+    def __init__(
+        self,
+        workdir: Path,
+        docs_dir: str,
+        cache_dir: str,
+        patterns: List[str],
+        exclude_patterns: Iterable[str] = (),
+        exclude: Iterable[Path] = (),
+        max_workers: int = 1
+    ):
+        """
+        Docs Builder 초기화
+
+        Args:
+            workdir: 작업 디렉토리
+            docs_dir: 문서 출력 디렉토리 (작업 디렉토리 기준)
+            cache_dir: 분석 결과 캐시 디렉토리
+            patterns: 문서화할 소스 파일 패턴 (파일 이름 또는 경로 기준)
+            exclude_patterns: 제외할 소스 파일 패턴 (테스트 등)
+            exclude: 제외할 경로 (체크포인트/캐시 디렉토리)
+            max_workers: 프로세스 풀 크기 (파일 묶음 크기 계산용)
+        """
+        self.workdir = Path(workdir)
+        self.docs_dir = self.workdir / docs_dir
+        self.cache = StepCache(cache_dir)
+        self.patterns = list(patterns)
+        self.exclude_patterns = list(exclude_patterns)
+        self.max_workers = max(max_workers, 1)
+
+        root = self.workdir.resolve()
+        self.exclude_prefixes = [Path(docs_dir).as_posix().rstrip('/') + '/']
+        for path in exclude:
+            try:
+                self.exclude_prefixes.append(Path(path).resolve().relative_to(root).as_posix() + '/')
+            except ValueError:
+                continue
+
+        self.previous: Dict[str, Dict[str, Any]] = {}
+        self.modules: Dict[str, Dict[str, Any]] = {}
+        self.changed: List[str] = []
+        self.removed: List[str] = []
+        self.scanned = False
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.docs_dir / MANIFEST_NAME
+
+    def _matches(self, path: str, patterns: List[str]) -> bool:
+        return any(fnmatch.fnmatch(path, p) or fnmatch.fnmatch(Path(path).name, p) for p in patterns)
+
+    def sources(self) -> List[str]:
+        """문서화 대상 소스 (추적 + 미추적 비무시 파일, 정렬)"""
+        result = traced_run(
+            ['git', 'ls-files', '-z', '--cached', '--others', '--exclude-standard'],
+            cwd=self.workdir,
+            capture_output=True,
+            text=True,
+            check=False
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"git ls-files 실패: {result.stderr.strip()}")
+        return sorted({
+            path for path in result.stdout.split('\0')
+            if path
+            and self._matches(path, self.patterns)
+            and not self._matches(path, self.exclude_patterns)
+            and not any(path.startswith(prefix) for prefix in self.exclude_prefixes)
+            and (self.workdir / path).is_file()
+        })
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get('version') != DOCS_VERSION:
+            return {}
+        return manifest.get('sources', {})
+
+    def _batches(self, files: List[str]) -> List[List[str]]:
+        """작업자 수만큼 고르게 나누되 묶음당 MAX_BATCH 개 이하"""
+        size = min(MAX_BATCH, math.ceil(len(files) / self.max_workers))
+        return [files[start:start + size] for start in range(0, len(files), size)]
+
+    def scan(self, executor_factory: Callable[[], Executor]) -> Dict[str, Any]:
+        """
+        마지막 문서 빌드 이후 바뀐 소스 찾기 + 바뀐 소스만 분석
+
+        Args:
+            executor_factory: 분석할 파일이 INLINE_LIMIT 보다 많을 때 프로세스 풀을 만드는 함수
+
+        Returns:
+            {'modules', 'changed', 'removed', 'cached', 'analyzed', 'hashed'}
+        """
+        with span('docs.scan'):
+            self.previous = self._load_manifest()
+            hashed = 0
+            pending: Dict[str, str] = {}
+            keys: Dict[str, str] = {}
+
+            for path in self.sources():
+                stat = (self.workdir / path).stat()
+                entry = self.previous.get(path)
+                if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+                    digest = entry['digest']
+                else:
+                    digest = file_digest(self.workdir / path)
+                    hashed += 1
+
+                if entry and entry['digest'] == digest:
+                    self.modules[path] = dict(entry, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+                    continue
+
+                self.changed.append(path)
+                keys[path] = input_key('docs.module', {'version': DOCS_VERSION, 'path': path, 'content': digest})
+                cached = self.cache.get(keys[path])
+                stamp = {'digest': digest, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+                if cached is not None:
+                    self.modules[path] = dict(cached['outputs'], **stamp)
+                else:
+                    pending[path] = digest
+                    self.modules[path] = stamp
+
+            analyzed = list(pending)
+            if len(analyzed) <= INLINE_LIMIT:
+                results = [analyze_batch(str(self.workdir), analyzed)]
+            else:
+                executor = executor_factory()
+                futures = [
+                    executor.submit(analyze_batch, str(self.workdir), batch)
+                    for batch in self._batches(analyzed)
+                ]
+                results = [future.result() for future in futures]
+
+            for batch in results:
+                for path, info in batch.items():
+                    self.cache.put(keys[path], 'documentation', {'path': path, 'content': pending[path]}, info)
+                    self.modules[path].update(info)
+
+            self.removed = sorted(set(self.previous) - set(self.modules))
+            self.scanned = True
+
+        return {
+            'modules': len(self.modules),
+            'changed': len(self.changed),
+            'removed': len(self.removed),
+            'cached': len(self.changed) - len(analyzed),
+            'analyzed': len(analyzed),
+            'hashed': hashed,
+        }
+
+    def write_code_docs(self) -> Dict[str, Any]:
+        """
+        바뀐 모듈의 문서 페이지만 다시 쓰고 삭제된 모듈의 페이지 제거
+
+        Returns:
+            {'written', 'removed', 'index_updated', 'errors'}
+        """
+        code_dir = self.docs_dir / 'code'
+        written = sum(
+            write_if_changed(code_dir / f"{path}.md", render_module(path, self.modules[path]))
+            for path in self.changed
+        )
+        removed = sum(_remove(code_dir / f"{path}.md") for path in self.removed)
+
+        index = ["# 코드 문서", "", "| 모듈 | 설명 |", "|---|---|"]
+        for path, info in sorted(self.modules.items()):
+            index.append(f"| [`{path}`]({path}.md) | {info.get('summary', '')} |")
+        index_updated = write_if_changed(code_dir / 'index.md', '\n'.join(index) + '\n')
+
+        return {
+            'written': written,
+            'removed': removed,
+            'index_updated': index_updated,
+            'errors': [path for path in self.changed if self.modules[path].get('error')],
+        }
+
+    def endpoints(self) -> List[Dict[str, Any]]:
+        """전체 엔드포인트 (경로, 메서드 순)"""
+        return sorted(
+            (dict(endpoint, source=path) for path, info in self.modules.items() for endpoint in info.get('endpoints', [])),
+            key=lambda endpoint: (endpoint['path'], endpoint['method'])
+        )
+
+    def write_api_docs(self, title: str = 'API') -> Dict[str, Any]:
+        """
+        엔드포인트가 바뀐 소스의 API 페이지만 다시 쓰고, 엔드포인트 목록이 바뀌면 색인/OpenAPI 갱신
+
+        Args:
+            title: OpenAPI info.title
+
+        Returns:
+            {'endpoints', 'written', 'removed', 'index_updated'}
+        """
+        api_dir = self.docs_dir / 'api'
+        written = 0
+        removed = sum(_remove(api_dir / f"{path}.md") for path in self.removed)
+
+        for path in self.changed:
+            endpoints = self.modules[path].get('endpoints', [])
+            if endpoints:
+                written += write_if_changed(api_dir / f"{path}.md", render_api_page(path, endpoints))
+            else:
+                removed += _remove(api_dir / f"{path}.md")
+
+        endpoints = self.endpoints()
+        index = ["# API 엔드포인트", ""] + endpoint_table(endpoints, with_source=True)
+        index_updated = write_if_changed(api_dir / 'index.md', '\n'.join(index) + '\n')
+
+        paths: Dict[str, Dict[str, Any]] = {}
+        for endpoint in endpoints:
+            methods = HTTP_METHODS if endpoint['method'] == 'ANY' else (endpoint['method'].lower(),)
+            for method in methods:
+                paths.setdefault(endpoint['path'], {})[method] = {
+                    'summary': endpoint['summary'] or endpoint['handler'],
+                    'operationId': endpoint['handler'],
+                }
+        spec = {'openapi': '3.0.3', 'info': {'title': title, 'version': 'generated'}, 'paths': paths}
+        index_updated |= write_if_changed(
+            api_dir / 'openapi.json', json.dumps(spec, indent=2, ensure_ascii=False) + '\n'
+        )
+
+        return {
+            'endpoints': len(endpoints),
+            'written': written,
+            'removed': removed,
+            'index_updated': index_updated,
+        }
+
+    def save_manifest(self) -> None:
+        """이번 빌드 결과를 다음 빌드의 비교 기준으로 저장"""
+        write_if_changed(
+            self.manifest_path,
+            json.dumps({'version': DOCS_VERSION, 'sources': self.modules}, indent=1, ensure_ascii=False) + '\n'
+        )
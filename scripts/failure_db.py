@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Claude Code SubAgent - Failure DB
+
+티켓 간 실패 시그니처(fingerprint) 저장소 (SQLite)
+
+공통 의존성이 깨지면 여러 티켓이 같은 에러로 실패합니다. 실패마다 log_analyzer 의
+fingerprint(정규화한 에러 텍스트 + 위치의 해시)로 발생을 묶어 기록하고,
+처음 보는 시그니처(또는 FAILURE_REALERT_HOURS 가 지난 시그니처)일 때만 알림 대상으로 돌려줍니다.
+나머지 발생은 누적 횟수/티켓 수만 올리고, 다음 알림에 그 수치가 함께 실립니다.
+
+    db = FailureDB('checkpoints/failures.db', realert_hours=24)
+    occurrence = db.record(signature, 'FINOPS-350', 'qa_test')
+    if occurrence['notify']:
+        ...  # Slack/JIRA 알림 (occurrence['occurrences'], occurrence['tickets'])
+"""
+
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS failures (
+    fingerprint TEXT PRIMARY KEY,
+    kind TEXT,
+    message TEXT NOT NULL,
+    location TEXT,
+    first_ticket TEXT NOT NULL,
+    first_seen_at TEXT NOT NULL,
+    last_seen_at TEXT NOT NULL,
+    occurrences INTEGER NOT NULL DEFAULT 0,
+    notified_at TEXT,
+    notified_occurrences INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS failure_occurrences (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    fingerprint TEXT NOT NULL,
+    ticket_id TEXT NOT NULL,
+    step TEXT,
+    log TEXT,
+    recorded_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_failure_occurrences_fingerprint ON failure_occurrences (fingerprint, ticket_id);
+"""
+
+
+class FailureDB:
+    """실패 시그니처별 발생 기록/알림 중복 제거"""
+
+    def __init__(self, path: str, realert_hours: int = 24):
+        """
+        Failure DB 초기화
+
+        Args:
+            path: SQLite 파일 경로
+            realert_hours: 같은 시그니처를 다시 알리기까지의 시간 (0 = 처음 한 번만)
+        """
+        self.path = Path(path)
+        self.realert_hours = realert_hours
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as connection, connection:
+            connection.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # 여러 워크플로우 프로세스가 동시에 기록하므로 호출마다 연결을 새로 엶
+        return sqlite3.connect(self.path, timeout=30)
+
+    def record(self, signature: Dict[str, Any], ticket_id: str, step: str) -> Dict[str, Any]:
+        """
+        실패 발생 기록 및 알림 여부 판단
+
+        알림 여부 판단과 알림 시각 기록을 한 트랜잭션(BEGIN IMMEDIATE)에서 처리하므로
+        같은 시그니처로 동시에 실패한 워크플로우 중 하나만 알림 대상이 됩니다.
+
+        Args:
+            signature: log_analyzer 결과 ('fingerprint', 'kind', 'message', 'frame', 'log')
+            ticket_id: JIRA 티켓 ID
+            step: 실패한 워크플로우 단계
+
+        Returns:
+            {'fingerprint', 'new', 'notify', 'occurrences', 'tickets', 'suppressed',
+             'first_ticket', 'first_seen_at'}
+            (suppressed: 직전 알림 이후 알림 없이 누적된 발생 횟수)
+        """
+        now = datetime.now()
+        frame = signature.get('frame')
+        location = f"{frame['file']}:{frame['line']}" if frame else None
+        fingerprint = signature['fingerprint']
+
+        with closing(self._connect()) as connection, connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                """
+                INSERT INTO failures (
+                    fingerprint, kind, message, location, first_ticket, first_seen_at, last_seen_at, occurrences
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, 1)
+                ON CONFLICT (fingerprint) DO UPDATE SET
+                    occurrences = occurrences + 1,
+                    last_seen_at = excluded.last_seen_at
+                """,
+                (
+                    fingerprint,
+                    signature.get('kind'),
+                    signature.get('message') or '',
+                    location,
+                    ticket_id,
+                    now.isoformat(),
+                    now.isoformat()
+                )
+            )
+            connection.execute(
+                "INSERT INTO failure_occurrences (fingerprint, ticket_id, step, log, recorded_at) VALUES (?, ?, ?, ?, ?)",
+                (fingerprint, ticket_id, step, signature.get('log'), now.isoformat())
+            )
+
+            occurrences, first_ticket, first_seen_at, notified_at, notified_occurrences = connection.execute(
+                """
+                SELECT occurrences, first_ticket, first_seen_at, notified_at, notified_occurrences
+                FROM failures WHERE fingerprint = ?
+                """,
+                (fingerprint,)
+            ).fetchone()
+            tickets = connection.execute(
+                "SELECT COUNT(DISTINCT ticket_id) FROM failure_occurrences WHERE fingerprint = ?",
+                (fingerprint,)
+            ).fetchone()[0]
+
+            notify = notified_at is None or bool(
+                self.realert_hours
+                and now - datetime.fromisoformat(notified_at) >= timedelta(hours=self.realert_hours)
+            )
+            if notify:
+                connection.execute(
+                    "UPDATE failures SET notified_at = ?, notified_occurrences = occurrences WHERE fingerprint = ?",
+                    (now.isoformat(), fingerprint)
+                )
+
+        return {
+            'fingerprint': fingerprint,
+            'new': occurrences == 1,
+            'notify': notify,
+            'occurrences': occurrences,
+            'tickets': tickets,
+            'suppressed': occurrences - notified_occurrences - 1 if notify else occurrences - notified_occurrences,
+            'first_ticket': first_ticket,
+            'first_seen_at': first_seen_at,
+        }
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Claude Code SubAgent - Flake DB
+
+불안정(flaky) 테스트 기록 저장소 (SQLite)
+
+실패했다가 재시도에서 통과한 테스트를 flaky 로 기록하고,
+flaky 횟수가 기준(QA_QUARANTINE_THRESHOLD)에 이르면 격리(quarantine)합니다.
+격리된 테스트는 QA Agent가 별도 레인에서 실행하며 실패해도 QA를 막지 않고,
+격리 레인에서 연속으로 통과하면(QA_QUARANTINE_RELEASE_PASSES) 격리를 해제합니다.
+"""
+
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS flaky_tests (
+    test_id TEXT PRIMARY KEY,
+    suite TEXT NOT NULL,
+    flaky_count INTEGER NOT NULL DEFAULT 0,
+    quarantined INTEGER NOT NULL DEFAULT 0,
+    consecutive_passes INTEGER NOT NULL DEFAULT 0,
+    first_seen_at TEXT NOT NULL,
+    last_flaky_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS flaky_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    test_id TEXT NOT NULL,
+    ticket_id TEXT,
+    attempt INTEGER NOT NULL,
+    recorded_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_flaky_tests_suite ON flaky_tests (suite, quarantined);
+"""
+
+
+class FlakeDB:
+    """flaky 테스트 기록/격리 관리"""
+
+    def __init__(self, path: str, quarantine_threshold: int = 2, release_passes: int = 10):
+        """
+        Flake DB 초기화
+
+        Args:
+            path: SQLite 파일 경로
+            quarantine_threshold: 격리할 flaky 횟수 (0 = 격리 안 함)
+            release_passes: 격리 해제에 필요한 격리 레인 연속 통과 횟수
+        """
+        self.path = Path(path)
+        self.quarantine_threshold = quarantine_threshold
+        self.release_passes = release_passes
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as connection, connection:
+            connection.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # 스위트가 스레드로 동시에 기록하므로 호출마다 연결을 새로 엶
+        return sqlite3.connect(self.path, timeout=30)
+
+    def record_flaky(self, suite: str, test_ids: Iterable[str], ticket_id: str, attempt: int) -> List[str]:
+        """
+        재시도에서 통과한 테스트를 flaky 로 기록
+
+        Args:
+            suite: 스위트 이름
+            test_ids: 재시도에서 통과한 테스트 ID
+            ticket_id: JIRA 티켓 ID
+            attempt: 통과한 재시도 회차
+
+        Returns:
+            이번 기록으로 새로 격리된 테스트 ID
+        """
+        now = datetime.now().isoformat()
+        newly_quarantined = []
+
+        with closing(self._connect()) as connection, connection:
+            for test_id in test_ids:
+                connection.execute(
+                    """
+                    INSERT INTO flaky_tests (test_id, suite, flaky_count, first_seen_at, last_flaky_at)
+                    VALUES (?, ?, 1, ?, ?)
+                    ON CONFLICT (test_id) DO UPDATE SET
+                        flaky_count = flaky_count + 1,
+                        consecutive_passes = 0,
+                        last_flaky_at = excluded.last_flaky_at
+                    """,
+                    (test_id, suite, now, now)
+                )
+                connection.execute(
+                    "INSERT INTO flaky_events (test_id, ticket_id, attempt, recorded_at) VALUES (?, ?, ?, ?)",
+                    (test_id, ticket_id, attempt, now)
+                )
+
+                if self.quarantine_threshold:
+                    updated = connection.execute(
+                        """
+                        UPDATE flaky_tests SET quarantined = 1
+                        WHERE test_id = ? AND quarantined = 0 AND flaky_count >= ?
+                        """,
+                        (test_id, self.quarantine_threshold)
+                    )
+                    if updated.rowcount:
+                        newly_quarantined.append(test_id)
+
+        return newly_quarantined
+
+    def quarantined(self, suite: str) -> List[str]:
+        """스위트의 격리된 테스트 ID"""
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT test_id FROM flaky_tests WHERE suite = ? AND quarantined = 1 ORDER BY test_id",
+                (suite,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def record_quarantine_results(self, results: Dict[str, bool]) -> List[str]:
+        """
+        격리 레인 실행 결과 기록
+
+        Args:
+            results: {테스트 ID: 통과 여부}
+
+        Returns:
+            연속 통과로 격리가 해제된 테스트 ID
+        """
+        released = []
+
+        with closing(self._connect()) as connection, connection:
+            for test_id, passed in results.items():
+                if not passed:
+                    connection.execute(
+                        "UPDATE flaky_tests SET consecutive_passes = 0 WHERE test_id = ?",
+                        (test_id,)
+                    )
+                    continue
+
+                connection.execute(
+                    "UPDATE flaky_tests SET consecutive_passes = consecutive_passes + 1 WHERE test_id = ?",
+                    (test_id,)
+                )
+                updated = connection.execute(
+                    """
+                    UPDATE flaky_tests SET quarantined = 0, flaky_count = 0, consecutive_passes = 0
+                    WHERE test_id = ? AND quarantined = 1 AND consecutive_passes >= ?
+                    """,
+                    (test_id, self.release_passes)
+                )
+                if updated.rowcount:
+                    released.append(test_id)
+
+        return released
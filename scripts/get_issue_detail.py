@@ -3,7 +3,7 @@
 JIRA 이슈 상세 정보 조회 스크립트
 """
 
-import requests
+import http_client
 import base64
 import sys
 from config import get_config
@@ -11,7 +11,7 @@ from config import get_config
 
 def get_issue_detail(issue_key):
     """JIRA 이슈 상세 정보 조회"""
-    config = get_config()
+    config = get_config(require=('jira',))
 
     # 인증 헤더 생성
     auth_string = f"{config.jira_email}:{config.jira_api_token}"
@@ -27,7 +27,13 @@ def get_issue_detail(issue_key):
     # 이슈 조회
     url = f"{config.jira_url}/rest/api/2/issue/{issue_key}"
 
-    response = requests.get(url, headers=headers, timeout=10)
+    response = http_client.get(
+        url,
+        endpoint='/rest/api/2/issue/{issueKey}',
+        service='jira',
+        headers=headers,
+        timeout=10
+    )
 
     if response.status_code == 200:
         data = response.json()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Claude Code SubAgent - HTTP Client
+
+JIRA/Slack/GitHub 호출에 공통으로 사용하는 계측(instrumented) HTTP 요청 함수
+
+- span 기록 (tracing.py)
+- 지연 시간/오류/재시도/429 메트릭 기록 (metrics.py)
+- --trace 실행 시 타임라인 구간 기록 (timeline.py)
+- 429 응답은 Retry-After를 존중하여 재시도하고,
+  502/503/504 응답은 멱등 메서드(GET/PUT/DELETE)에 한해 재시도
+"""
+
+import time
+from typing import Any, Optional
+
+import requests
+
+import metrics
+import timeline
+from tracing import span, set_attributes
+
+# 재시도 정책
+MAX_RETRIES = 3
+BACKOFF_BASE_SECONDS = 0.5
+MAX_RETRY_AFTER_SECONDS = 30.0
+RETRYABLE_STATUS = (502, 503, 504)
+IDEMPOTENT_METHODS = ('GET', 'PUT', 'DELETE', 'HEAD')
+
+
+def _retry_delay(response: requests.Response, attempt: int) -> float:
+    """Retry-After 헤더 또는 지수 백오프로 대기 시간 계산"""
+    retry_after = response.headers.get('Retry-After')
+    if retry_after:
+        try:
+            return min(float(retry_after), MAX_RETRY_AFTER_SECONDS)
+        except ValueError:
+            pass
+    return BACKOFF_BASE_SECONDS * (2 ** attempt)
+
+
+def _should_retry(method: str, status: int) -> bool:
+    if status == 429:
+        return True
+    return status in RETRYABLE_STATUS and method in IDEMPOTENT_METHODS
+
+
+def request(
+    method: str,
+    url: str,
+    endpoint: Optional[str] = None,
+    service: Optional[str] = None,
+    retries: int = MAX_RETRIES,
+    **kwargs: Any
+) -> requests.Response:
+    """
+    HTTP 요청 실행 (span/메트릭 기록 및 재시도 포함)
+
+    Args:
+        method: HTTP 메서드 (GET, POST, PUT ...)
+        url: 요청 URL
+        endpoint: 엔드포인트 템플릿 (예: /rest/api/3/issue/{issueKey}).
+                  이슈 키 같은 식별자로 span 이름/메트릭 라벨이 폭증하지 않도록 사용
+        service: 대상 서비스 이름 (jira, slack, github)
+        retries: 429/5xx 응답 시 최대 재시도 횟수
+        **kwargs: requests.request 인자 (headers, json, params, timeout ...)
+
+    Returns:
+        requests.Response (재시도 후에도 실패하면 마지막 응답)
+
+    Raises:
+        requests.RequestException: 연결 실패/타임아웃
+    """
+    method = method.upper()
+    kwargs.setdefault('timeout', 10)
+
+    name = f"{method} {endpoint or ''}".strip()
+
+    with timeline.span(name, 'http', service=service) as event_args, span(
+        f"HTTP {name}",
+        **{
+            'http.method': method,
+            'http.route': endpoint,
+            'peer.service': service,
+        }
+    ) as current:
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                response = requests.request(method, url, **kwargs)
+            except requests.RequestException as e:
+                metrics.observe_http(
+                    service, method, endpoint, time.perf_counter() - start, error=type(e).__name__
+                )
+                raise
+
+            metrics.observe_http(
+                service, method, endpoint, time.perf_counter() - start, status=response.status_code
+            )
+
+            if attempt >= retries or not _should_retry(method, response.status_code):
+                break
+
+            delay = _retry_delay(response, attempt)
+            metrics.count_retry(service, endpoint)
+            attempt += 1
+            time.sleep(delay)
+
+        request_body = response.request.body if response.request is not None else None
+        set_attributes(
+            current,
+            **{
+                'http.status_code': response.status_code,
+                'http.request_content_length': len(request_body) if request_body else 0,
+                'http.response_content_length': len(response.content),
+                'http.retry_count': attempt,
+            }
+        )
+        event_args.update(status=response.status_code, bytes=len(response.content), retries=attempt)
+        return response
+
+
+def get(url: str, endpoint: Optional[str] = None, service: Optional[str] = None, **kwargs: Any) -> requests.Response:
+    """GET 요청"""
+    return request('GET', url, endpoint=endpoint, service=service, **kwargs)
+
+
+def post(url: str, endpoint: Optional[str] = None, service: Optional[str] = None, **kwargs: Any) -> requests.Response:
+    """POST 요청"""
+    return request('POST', url, endpoint=endpoint, service=service, **kwargs)
+
+
+def put(url: str, endpoint: Optional[str] = None, service: Optional[str] = None, **kwargs: Any) -> requests.Response:
+    """PUT 요청"""
+    return request('PUT', url, endpoint=endpoint, service=service, **kwargs)
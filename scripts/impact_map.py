@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Claude Code SubAgent - Test Impact Map
+
+테스트 영향 분석 (변경 파일 → 영향받는 테스트)
+
+전체 실행 때 러너가 남긴 coverage.py 데이터 파일(테스트별 동적 컨텍스트,
+`pytest --cov --cov-context=test`)에서 "소스 파일 → 그 파일을 실행한 테스트 파일" 맵을 만들고,
+이후 실행에서는 베이스 브랜치 대비 변경 파일에 해당하는 테스트만 고릅니다.
+맵에 없는 파일이 바뀌었거나 전체 실행 주기가 돌아오면 전체 실행으로 되돌아갑니다.
+
+저장 구조 (<QA_RESULTS_DIR>/impact-map.json):
+    {
+        "sources": {"app/service.py": ["tests/unit/test_service.py", ...]},
+        "last_full_run": "2025-11-07T10:00:00",
+        "runs_since_full": 3
+    }
+"""
+
+import os
+import json
+import fnmatch
+import sqlite3
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from tracing import traced_run
+from diff_stats import changed_paths, diff_stats, merge_base
+
+
+def _untracked_files(repo_path: Path) -> Optional[List[str]]:
+    result = traced_run(
+        ['git', 'ls-files', '--others', '--exclude-standard', '-z'],
+        cwd=repo_path,
+        capture_output=True,
+        text=True,
+        check=False
+    )
+    if result.returncode != 0:
+        return None
+    return [path for path in result.stdout.split('\0') if path]
+
+
+def changed_files(
+    repo_path: Path,
+    base_branch: str,
+    exclude: Iterable[Path] = (),
+    cache_dir: Optional[str] = None
+) -> Optional[List[str]]:
+    """
+    베이스 브랜치와의 merge-base 대비 변경 파일 (커밋/미커밋/미추적 포함)
+
+    diff_stats 결과(base SHA, 작업 디렉토리 tree 해시 기준 캐시)를 재사용하며,
+    이름 변경은 이전/새 경로가 모두 포함됩니다.
+
+    Args:
+        repo_path: Git 저장소 경로
+        base_branch: 베이스 브랜치 (로컬에 없으면 origin/<브랜치>)
+        exclude: 제외 경로 (diff_stats.workspace_excludes() 참고)
+        cache_dir: 변경 통계 캐시 디렉토리
+
+    Returns:
+        저장소 기준 상대 경로 목록 (비교할 수 없으면 None)
+    """
+    stats = diff_stats(repo_path, base_branch, exclude=exclude, cache_dir=cache_dir)
+    if stats is None:
+        return None
+    return changed_paths(stats)
+
+
+def changed_lines(repo_path: Path, base_branch: str) -> Optional[Dict[str, Optional[Set[int]]]]:
+    """
+    베이스 브랜치와의 merge-base 대비 추가/변경된 라인 (diff 커버리지용)
+
+    Args:
+        repo_path: Git 저장소 경로
+        base_branch: 베이스 브랜치
+
+    Returns:
+        {파일: 새 버전 기준 라인 번호 집합} (미추적 파일은 None = 파일 전체, 비교할 수 없으면 None)
+    """
+    base = merge_base(repo_path, base_branch)
+    if base is None:
+        return None
+
+    result = traced_run(
+        ['git', 'diff', '--unified=0', '--no-renames', '--no-color', '--no-ext-diff', base],
+        cwd=repo_path,
+        capture_output=True,
+        text=True,
+        errors='replace',
+        check=False
+    )
+    untracked = _untracked_files(repo_path)
+    if result.returncode != 0 or untracked is None:
+        return None
+
+    lines: Dict[str, Optional[Set[int]]] = {}
+    current: Optional[Set[int]] = None
+
+    for row in result.stdout.splitlines():
+        if row.startswith('+++ '):
+            target = row[4:]
+            current = None
+            if target.startswith('b/'):
+                current = lines.setdefault(target[2:], set())
+        elif row.startswith('@@') and current is not None:
+            # @@ -a,b +c,d @@ → c 부터 d 줄 (d 생략 시 1, 0 이면 삭제만 있는 hunk)
+            added = row.split('+', 1)[1].split(' ', 1)[0]
+            start, _, count = added.partition(',')
+            current.update(range(int(start), int(start) + int(count or 1)))
+
+    for path in untracked:
+        lines[path] = None
+
+    return lines
+
+
+def read_coverage_contexts(data_file: Path, repo_path: Path) -> Dict[str, Set[str]]:
+    """
+    coverage.py 데이터 파일(SQLite)에서 소스 파일별 테스트 파일 추출
+
+    컨텍스트는 pytest-cov 형식("tests/unit/test_x.py::TestA::test_a|run")을 기준으로
+    '::' 앞부분을 테스트 파일로 봅니다. 컨텍스트가 빈 줄(수집/import 시 실행)은 제외합니다.
+
+    Args:
+        data_file: coverage 데이터 파일
+        repo_path: 소스 경로를 상대 경로로 바꿀 저장소 루트
+
+    Returns:
+        {소스 파일: {테스트 파일}}
+    """
+    root = Path(repo_path).resolve()
+    sources: Dict[str, Set[str]] = {}
+
+    query = """
+        SELECT DISTINCT file.path, context.context
+        FROM {table} JOIN file ON file.id = {table}.file_id
+        JOIN context ON context.id = {table}.context_id
+    """
+
+    connection = sqlite3.connect(f"file:{data_file}?mode=ro", uri=True)
+    try:
+        tables = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        for table in ('line_bits', 'arc'):
+            if table not in tables:
+                continue
+            for path, context in connection.execute(query.format(table=table)):
+                test_file = context.split('::', 1)[0] if '::' in context else None
+                if not test_file:
+                    continue
+                try:
+                    source = Path(path).resolve().relative_to(root).as_posix()
+                except ValueError:
+                    continue
+                sources.setdefault(source, set()).add(test_file)
+    finally:
+        connection.close()
+
+    return sources
+
+
+class ImpactMap:
+    """소스 파일 → 테스트 파일 맵 (전체 실행 결과로 갱신)"""
+
+    def __init__(self, path: Path):
+        """
+        Impact Map 초기화
+
+        Args:
+            path: 맵 파일 경로
+        """
+        self.path = Path(path)
+        self.sources: Dict[str, List[str]] = {}
+        self.last_full_run: Optional[str] = None
+        self.runs_since_full = 0
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"⚠️  테스트 영향 맵 읽기 실패 ({self.path}): {e}")
+            return
+
+        self.sources = data.get('sources', {})
+        self.last_full_run = data.get('last_full_run')
+        self.runs_since_full = data.get('runs_since_full', 0)
+
+    def save(self) -> None:
+        """맵 저장 (임시 파일 → rename 으로 원자적 기록)"""
+        data = {
+            'sources': self.sources,
+            'last_full_run': self.last_full_run,
+            'runs_since_full': self.runs_since_full,
+        }
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, sort_keys=True, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"⚠️  테스트 영향 맵 저장 실패 ({self.path}): {e}")
+
+    def full_run_reason(self, every: int, max_age_hours: int) -> Optional[str]:
+        """
+        전체 실행이 필요한 이유 (안전망)
+
+        Args:
+            every: 영향 분석 실행 N회마다 전체 실행 (0 = 사용 안 함)
+            max_age_hours: 마지막 전체 실행 후 경과 시간 한도 (0 = 사용 안 함)
+
+        Returns:
+            이유 문자열 (필요 없으면 None)
+        """
+        if not self.sources or not self.last_full_run:
+            return "영향 맵 없음"
+        if every and self.runs_since_full >= every:
+            return f"영향 분석 실행 {self.runs_since_full}회 누적"
+        if max_age_hours:
+            age = datetime.now() - datetime.fromisoformat(self.last_full_run)
+            if age > timedelta(hours=max_age_hours):
+                return f"마지막 전체 실행 후 {int(age.total_seconds() // 3600)}시간 경과"
+        return None
+
+    def affected_tests(
+        self,
+        changed: Iterable[str],
+        test_files: Iterable[str],
+        ignore: Iterable[str] = ()
+    ) -> Tuple[Optional[Set[str]], Optional[str]]:
+        """
+        변경 파일에 영향받는 테스트 파일
+
+        Args:
+            changed: 변경 파일 목록
+            test_files: 전체 테스트 파일 (변경된 테스트 파일은 그대로 실행)
+            ignore: 테스트에 영향을 주지 않는 파일 패턴 (문서 등)
+
+        Returns:
+            (영향받는 테스트 파일, None) 또는 맵에 없는 파일이 있으면 (None, 그 파일)
+        """
+        test_files = set(test_files)
+        ignore = list(ignore)
+        affected: Set[str] = set()
+
+        for path in changed:
+            if path in test_files:
+                affected.add(path)
+            elif path in self.sources:
+                affected.update(self.sources[path])
+            elif not any(fnmatch.fnmatch(path, pattern) for pattern in ignore):
+                return None, path
+
+        return affected, None
+
+    def refresh(self, coverage_files: Iterable[Path], repo_path: Path) -> int:
+        """
+        전체 실행의 coverage 데이터로 맵을 새로 구성
+
+        Args:
+            coverage_files: 이번 전체 실행의 coverage 데이터 파일
+            repo_path: 저장소 루트
+
+        Returns:
+            맵에 기록된 소스 파일 수
+        """
+        sources: Dict[str, Set[str]] = {}
+        for data_file in coverage_files:
+            try:
+                contexts = read_coverage_contexts(data_file, repo_path)
+            except sqlite3.Error as e:
+                print(f"⚠️  coverage 데이터 읽기 실패 ({data_file}): {e}")
+                continue
+            for source, tests in contexts.items():
+                sources.setdefault(source, set()).update(tests)
+
+        if sources:
+            self.sources = {source: sorted(tests) for source, tests in sorted(sources.items())}
+        return len(sources)
+
+    def record_run(self, full: bool) -> None:
+        """실행 기록 (전체 실행이면 주기 카운터 초기화) 후 저장"""
+        if full:
+            self.last_full_run = datetime.now().isoformat()
+            self.runs_since_full = 0
+        else:
+            self.runs_since_full += 1
+        self.save()
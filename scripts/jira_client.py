@@ -5,7 +5,7 @@ Claude Code SubAgent - JIRA Client
 JIRA REST API를 사용한 티켓 관리 클라이언트
 """
 
-import requests
+import http_client
 import base64
 from typing import Optional, Dict, Any, List
 from config import get_config
@@ -16,7 +16,7 @@ class JiraClient:
 
     def __init__(self):
         """JIRA 클라이언트 초기화"""
-        self.config = get_config()
+        self.config = get_config(require=('jira',))
         self.base_url = self.config.jira_url
         self.email = self.config.jira_email
         self.api_token = self.config.jira_api_token
@@ -45,7 +45,13 @@ class JiraClient:
         """
         try:
             url = f"{self.base_url}/rest/api/3/issue/{issue_key}"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = http_client.get(
+                url,
+                endpoint='/rest/api/3/issue/{issueKey}',
+                service='jira',
+                headers=self.headers,
+                timeout=10
+            )
 
             if response.status_code == 200:
                 return response.json()
@@ -61,6 +67,58 @@ class JiraClient:
             print(f"❌ JIRA 이슈 조회 실패: {e}")
             return None
 
+    def get_issues(
+        self,
+        issue_keys: List[str],
+        fields: List[str] = ('summary', 'issuetype', 'status'),
+        batch_size: int = 100
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        여러 이슈를 JQL `key in (...)` 로 한 번에 조회 (batch_size 개씩, Jira 검색 1회 최대 100건)
+
+        Args:
+            issue_keys: 이슈 키 목록
+            fields: 조회할 필드
+            batch_size: 검색 한 번에 넣을 키 수
+
+        Returns:
+            {이슈 키: 이슈} (없는 키는 빠짐) 또는 None (검색 실패)
+        """
+        keys = sorted(set(issue_keys))
+        issues: Dict[str, Dict[str, Any]] = {}
+
+        try:
+            for start in range(0, len(keys), batch_size):
+                batch = keys[start:start + batch_size]
+                response = http_client.post(
+                    f"{self.base_url}/rest/api/3/search",
+                    endpoint='/rest/api/3/search',
+                    service='jira',
+                    json={
+                        'jql': f"key in ({', '.join(batch)})",
+                        'maxResults': len(batch),
+                        'fields': list(fields),
+                        # 삭제/권한 없는 키가 섞여 있어도 나머지는 조회
+                        'validateQuery': 'warn',
+                    },
+                    headers=self.headers,
+                    timeout=30
+                )
+
+                if response.status_code != 200:
+                    print(f"❌ JIRA 이슈 검색 실패: HTTP {response.status_code}")
+                    print(f"   {response.text}")
+                    return None
+
+                for issue in response.json().get('issues', []):
+                    issues[issue['key']] = issue
+
+            return issues
+
+        except Exception as e:
+            print(f"❌ JIRA 이슈 검색 실패: {e}")
+            return None
+
     def create_issue(
         self,
         summary: str,
@@ -114,8 +172,10 @@ class JiraClient:
             if labels:
                 payload["fields"]["labels"] = labels
 
-            response = requests.post(
+            response = http_client.post(
                 url,
+                endpoint='/rest/api/3/issue',
+                service='jira',
                 json=payload,
                 headers=self.headers,
                 timeout=10
@@ -173,8 +233,10 @@ class JiraClient:
             url = f"{self.base_url}/rest/api/3/issue/{issue_key}/transitions"
             payload = {"transition": {"id": transition_id}}
 
-            response = requests.post(
+            response = http_client.post(
                 url,
+                endpoint='/rest/api/3/issue/{issueKey}/transitions',
+                service='jira',
                 json=payload,
                 headers=self.headers,
                 timeout=10
@@ -227,8 +289,10 @@ class JiraClient:
                 }
             }
 
-            response = requests.post(
+            response = http_client.post(
                 url,
+                endpoint='/rest/api/3/issue/{issueKey}/comment',
+                service='jira',
                 json=payload,
                 headers=self.headers,
                 timeout=10
@@ -257,7 +321,13 @@ class JiraClient:
         """
         try:
             url = f"{self.base_url}/rest/api/3/issue/{issue_key}/transitions"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = http_client.get(
+                url,
+                endpoint='/rest/api/3/issue/{issueKey}/transitions',
+                service='jira',
+                headers=self.headers,
+                timeout=10
+            )
 
             if response.status_code == 200:
                 data = response.json()
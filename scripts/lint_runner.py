@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""
+Claude Code SubAgent - Lint Runner
+
+코드 리뷰 검사(정적 분석, 코딩 스타일, 보안, 복잡도) 병렬 실행 엔진
+
+검사 대상은 베이스 브랜치 대비 변경 파일로 한정하고, 파일 묶음을 프로세스 풀에 나눠 실행합니다.
+결과는 (검사, 검사기, 파일 경로, 파일 내용 해시) 키로 파일마다 캐시하므로
+내용이 바뀌지 않은 파일은 티켓이나 재실행이 달라도 다시 검사하지 않습니다.
+
+검사기는 두 종류입니다.
+    - 외부 도구: REVIEW_<검사>_CMD (예: "flake8", "ruff check", "bandit -f custom")
+      ProcessSandbox 로 실행하고, 로그 파일에 흘려 쓴 출력의 "파일:라인[:컬럼]: 메시지" 줄을 이슈로 읽습니다.
+    - 내장 검사: 명령이 없으면 표준 라이브러리 ast 로 Python 파일을 검사합니다.
+
+    runner = LintRunner(workdir, cache_dir, executor, options)
+    result = runner.run_phase('security', None, ['*.py'], changed_files)
+"""
+
+import os
+import re
+import ast
+import math
+import shlex
+import fnmatch
+import time
+import hashlib
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from sandbox import ProcessSandbox, failure_reason, iter_log_lines
+from step_cache import StepCache, input_key
+
+SEVERITY_ERROR = 'error'
+SEVERITY_WARNING = 'warning'
+
+# 내장 검사 규칙을 바꾸면 올려서 캐시를 무효화
+BUILTIN_VERSION = 1
+
+# 프로세스 풀 작업 하나에 묶을 최대 파일 수
+MAX_BATCH = 50
+
+# 외부 도구 출력의 이슈 줄: 파일:라인[:컬럼]: 메시지
+_ISSUE_LINE = re.compile(r'^(?P<file>[^:\s][^:]*):(?P<line>\d+):(?:(?P<column>\d+):)?\s*(?P<message>.+)$')
+
+# 하드코딩된 비밀값으로 볼 변수 이름
+_SECRET_NAME = re.compile(r'(?i)(password|passwd|secret|api_?key|access_?key|token)$')
+
+
+def _issue(path: str, line: int, severity: str, rule: str, message: str) -> Dict[str, Any]:
+    return {'file': path, 'line': line, 'severity': severity, 'rule': rule, 'message': message}
+
+
+def _dotted_name(node: ast.AST) -> str:
+    """호출 대상 이름 (os.system, subprocess.run 등)"""
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if isinstance(node, ast.Name):
+        parts.append(node.id)
+    return '.'.join(reversed(parts))
+
+
+def _check_static(path: str, source: str, tree: ast.AST, options: Dict[str, Any]) -> Dict[str, Any]:
+    """정적 분석: bare except, 가변 기본 인자, None 비교, 사용하지 않는 import"""
+    issues = []
+    imported: Dict[str, int] = {}
+    used = set()
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ExceptHandler) and node.type is None:
+            issues.append(_issue(
+                path, node.lineno, SEVERITY_WARNING, 'bare-except',
+                "bare except 는 KeyboardInterrupt/SystemExit 까지 삼킵니다"
+            ))
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            for default in node.args.defaults + [d for d in node.args.kw_defaults if d is not None]:
+                if isinstance(default, (ast.List, ast.Dict, ast.Set)):
+                    issues.append(_issue(
+                        path, default.lineno, SEVERITY_WARNING, 'mutable-default',
+                        f"{node.name}(): 가변 객체를 기본 인자로 사용"
+                    ))
+        elif isinstance(node, ast.Compare):
+            for op, comparator in zip(node.ops, node.comparators):
+                if isinstance(op, (ast.Eq, ast.NotEq)) and isinstance(comparator, ast.Constant) \
+                        and comparator.value is None:
+                    issues.append(_issue(
+                        path, node.lineno, SEVERITY_WARNING, 'none-comparison',
+                        "None 비교는 is / is not 사용"
+                    ))
+        elif isinstance(node, ast.Name):
+            used.add(node.id)
+        elif isinstance(node, ast.Attribute):
+            root = node
+            while isinstance(root, ast.Attribute):
+                root = root.value
+            if isinstance(root, ast.Name):
+                used.add(root.id)
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+            # __all__ 재노출, 문자열 타입 힌트
+            used.update(re.findall(r'\w+', node.value))
+
+    # 모듈 최상위 import 만 검사 (__init__.py 는 재노출 목적이라 제외)
+    if not path.endswith('__init__.py'):
+        for node in getattr(tree, 'body', []):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    imported[alias.asname or alias.name.split('.')[0]] = node.lineno
+            elif isinstance(node, ast.ImportFrom) and node.module != '__future__':
+                for alias in node.names:
+                    if alias.name != '*':
+                        imported[alias.asname or alias.name] = node.lineno
+
+    for name, line in sorted(imported.items(), key=lambda item: item[1]):
+        if name not in used:
+            issues.append(_issue(path, line, SEVERITY_WARNING, 'unused-import', f"사용하지 않는 import: {name}"))
+
+    return {'issues': issues, 'metrics': {}}
+
+
+def _check_style(path: str, source: str, tree: ast.AST, options: Dict[str, Any]) -> Dict[str, Any]:
+    """코딩 스타일: 줄 길이, 줄 끝 공백, 탭 들여쓰기, 파일 끝 개행"""
+    issues = []
+    max_length = options.get('max_line_length', 120)
+    lines = source.splitlines()
+
+    for number, line in enumerate(lines, 1):
+        if len(line) > max_length:
+            issues.append(_issue(
+                path, number, SEVERITY_WARNING, 'line-too-long', f"줄 길이 {len(line)} (기준 {max_length})"
+            ))
+        if line != line.rstrip():
+            issues.append(_issue(path, number, SEVERITY_WARNING, 'trailing-whitespace', "줄 끝 공백"))
+        if line.startswith('\t'):
+            issues.append(_issue(path, number, SEVERITY_WARNING, 'tab-indent', "탭 들여쓰기"))
+
+    if source and not source.endswith('\n'):
+        issues.append(_issue(path, len(lines), SEVERITY_WARNING, 'missing-final-newline', "파일 끝 개행 없음"))
+
+    return {'issues': issues, 'metrics': {}}
+
+
+def _check_security(path: str, source: str, tree: ast.AST, options: Dict[str, Any]) -> Dict[str, Any]:
+    """보안: eval/exec, shell=True, os.system, 안전하지 않은 역직렬화, TLS 검증 해제, 하드코딩된 비밀값"""
+    issues = []
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call):
+            name = _dotted_name(node.func)
+            keywords = {keyword.arg: keyword.value for keyword in node.keywords if keyword.arg}
+
+            if name in ('eval', 'exec'):
+                issues.append(_issue(path, node.lineno, SEVERITY_WARNING, 'eval', f"{name}() 사용"))
+            elif name in ('os.system', 'os.popen'):
+                issues.append(_issue(path, node.lineno, SEVERITY_WARNING, 'os-system', f"{name}() 는 셸을 거칩니다"))
+            elif name in ('pickle.load', 'pickle.loads', 'marshal.load', 'marshal.loads'):
+                issues.append(_issue(path, node.lineno, SEVERITY_WARNING, 'unsafe-deserialization', f"{name}() 사용"))
+            elif name == 'yaml.load' and 'Loader' not in keywords and len(node.args) < 2:
+                issues.append(_issue(
+                    path, node.lineno, SEVERITY_WARNING, 'yaml-load', "yaml.load() 는 Loader 지정 또는 safe_load 사용"
+                ))
+
+            shell = keywords.get('shell')
+            if isinstance(shell, ast.Constant) and shell.value is True:
+                issues.append(_issue(path, node.lineno, SEVERITY_WARNING, 'shell-true', f"{name}(shell=True)"))
+            verify = keywords.get('verify')
+            if isinstance(verify, ast.Constant) and verify.value is False:
+                issues.append(_issue(path, node.lineno, SEVERITY_WARNING, 'tls-verify-disabled', "TLS 인증서 검증 해제"))
+
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)) and isinstance(node.value, ast.Constant):
+            value = node.value.value
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                name = target.id if isinstance(target, ast.Name) else getattr(target, 'attr', '')
+                if _SECRET_NAME.search(name or '') and isinstance(value, str) and len(value) >= 8 \
+                        and not value.startswith(('$', '<', '{')) and ' ' not in value:
+                    issues.append(_issue(
+                        path, node.lineno, SEVERITY_ERROR, 'hardcoded-secret', f"{name}: 하드코딩된 비밀값"
+                    ))
+
+    return {'issues': issues, 'metrics': {}}
+
+
+def _cyclomatic(function: ast.AST) -> int:
+    """함수의 순환 복잡도 (중첩 함수/클래스 본문은 제외)"""
+    complexity = 1
+    stack = list(ast.iter_child_nodes(function))
+
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)):
+            continue
+        if isinstance(node, (ast.If, ast.For, ast.AsyncFor, ast.While, ast.ExceptHandler, ast.IfExp)):
+            complexity += 1
+        elif isinstance(node, ast.BoolOp):
+            complexity += len(node.values) - 1
+        elif isinstance(node, ast.comprehension):
+            complexity += 1 + len(node.ifs)
+        elif isinstance(node, getattr(ast, 'match_case', ())):
+            complexity += 1
+        stack.extend(ast.iter_child_nodes(node))
+
+    return complexity
+
+
+def _check_complexity(path: str, source: str, tree: ast.AST, options: Dict[str, Any]) -> Dict[str, Any]:
+    """복잡도: 함수별 순환 복잡도가 기준을 넘으면 경고"""
+    issues = []
+    limit = options.get('max_complexity', 10)
+    functions = total = 0
+
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            complexity = _cyclomatic(node)
+            functions += 1
+            total += complexity
+            if complexity > limit:
+                issues.append(_issue(
+                    path, node.lineno, SEVERITY_WARNING, 'complexity',
+                    f"{node.name}(): 순환 복잡도 {complexity} (기준 {limit})"
+                ))
+
+    return {'issues': issues, 'metrics': {'functions': functions, 'complexity': total}}
+
+
+BUILTIN_CHECKS: Dict[str, Callable[[str, str, ast.AST, Dict[str, Any]], Dict[str, Any]]] = {
+    'static_analysis': _check_static,
+    'coding_style': _check_style,
+    'security': _check_security,
+    'complexity': _check_complexity,
+}
+
+
+def _check_builtin(phase: str, workdir: Path, path: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """내장 검사 (Python 파일만, 구문 오류는 정적 분석에서만 보고)"""
+    if not path.endswith('.py'):
+        return {'issues': [], 'metrics': {}}
+
+    with open(workdir / path, 'r', encoding='utf-8', errors='replace') as f:
+        source = f.read()
+
+    try:
+        tree = ast.parse(source, filename=path)
+    except SyntaxError as e:
+        if phase != 'static_analysis':
+            return {'issues': [], 'metrics': {}}
+        return {
+            'issues': [_issue(path, e.lineno or 0, SEVERITY_ERROR, 'syntax-error', f"구문 오류: {e.msg}")],
+            'metrics': {},
+        }
+
+    return BUILTIN_CHECKS[phase](path, source, tree, options)
+
+
+def _run_command(
+    phase: str,
+    command: str,
+    files: List[str],
+    workdir: Path,
+    options: Dict[str, Any],
+    timeout: int,
+    sandbox: ProcessSandbox,
+    log_name: str
+) -> Dict[str, Dict[str, Any]]:
+    """외부 도구를 sandbox 로 실행한 뒤 로그의 "파일:라인: 메시지" 줄을 파일별 이슈로 분류"""
+    argv: List[str] = []
+    for token in shlex.split(command):
+        if token == '{files}':
+            argv.extend(files)
+        else:
+            argv.append(token)
+    if '{files}' not in command:
+        argv.extend(files)
+
+    # 출력은 메모리에 모으지 않고 로그 파일로 흘려 쓴 뒤 줄 단위로 읽음
+    started = time.time()
+    result = sandbox.run(argv, cwd=workdir, timeout=timeout, name=log_name)
+    if result['limit'] or result['error']:
+        raise RuntimeError(f"{argv[0]} {failure_reason(result)} (로그: {result['log']})")
+
+    severity = SEVERITY_ERROR if phase in options.get('fail_on', ()) else SEVERITY_WARNING
+    results: Dict[str, Dict[str, Any]] = {path: {'issues': [], 'metrics': {}} for path in files}
+    root = workdir.resolve()
+    parsed = 0
+
+    for row in iter_log_lines(result['log'], started):
+        match = _ISSUE_LINE.match(row.strip())
+        if not match:
+            continue
+        reported = Path(match.group('file'))
+        if reported.is_absolute():
+            try:
+                reported = reported.resolve().relative_to(root)
+            except ValueError:
+                continue
+        path = os.path.normpath(reported.as_posix())
+        if path in results:
+            results[path]['issues'].append(
+                _issue(path, int(match.group('line')), severity, argv[0], match.group('message').strip())
+            )
+            parsed += 1
+
+    if result['returncode'] != 0 and not parsed:
+        # 이슈 없이 실패했다면 도구 자체 오류 (설정/설치 문제) - 캐시하지 않도록 예외로 전달
+        output = (result['stderr'] or result['stdout']).strip().splitlines()[-5:]
+        raise RuntimeError(f"{argv[0]} 종료 코드 {result['returncode']}: {' / '.join(output)}")
+
+    return results
+
+
+def analyze_batch(
+    phase: str,
+    command: Optional[str],
+    files: List[str],
+    workdir: str,
+    options: Dict[str, Any],
+    timeout: int,
+    sandbox: ProcessSandbox,
+    log_name: str
+) -> Dict[str, Dict[str, Any]]:
+    """
+    파일 묶음 검사 (프로세스 풀 작업 단위)
+
+    Args:
+        phase: 검사 이름 (static_analysis, coding_style, security, complexity)
+        command: 외부 도구 명령 (None 이면 내장 검사)
+        files: 작업 디렉토리 기준 파일 경로
+        workdir: 작업 디렉토리
+        options: 검사 기준 (max_line_length, max_complexity, fail_on)
+        timeout: 외부 도구 타임아웃 (초)
+        sandbox: 외부 도구 실행기
+        log_name: 외부 도구 출력 로그 이름 (동시에 실행되는 묶음끼리 겹치지 않게)
+
+    Returns:
+        {파일: {'issues': [...], 'metrics': {...}}}
+    """
+    root = Path(workdir)
+    if command:
+        return _run_command(phase, command, files, root, options, timeout, sandbox, log_name)
+    return {path: _check_builtin(phase, root, path, options) for path in files}
+
+
+def file_digest(path: Path) -> str:
+    """파일 내용 SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class LintRunner:
+    """변경 파일 대상 검사 실행 (프로세스 풀 + 파일 내용 해시 캐시)"""
+
+    def __init__(
+        self,
+        workdir: Path,
+        cache_dir: str,
+        executor: Executor,
+        options: Dict[str, Any],
+        timeout: int = 300,
+        max_workers: int = 1,
+        sandbox: Optional[ProcessSandbox] = None,
+        log_name: str = 'lint'
+    ):
+        """
+        Lint Runner 초기화
+
+        Args:
+            workdir: 검사할 작업 디렉토리
+            cache_dir: 파일별 결과 캐시 디렉토리
+            executor: 검사 작업을 실행할 프로세스 풀 (검사 간 공유)
+            options: 검사 기준 (캐시 키에 포함)
+            timeout: 외부 도구 타임아웃 (초)
+            max_workers: 프로세스 풀 크기 (파일 묶음 크기 계산용)
+            sandbox: 외부 도구 실행기 (자원 한도/로그 회전 설정, 기본값: 한도 없음)
+            log_name: 외부 도구 출력 로그 이름 접두어 (<접두어>-<검사>-<묶음 번호>.log)
+        """
+        self.workdir = Path(workdir)
+        self.cache = StepCache(cache_dir)
+        self.executor = executor
+        self.options = options
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.sandbox = sandbox or ProcessSandbox(str(Path(cache_dir) / 'logs'))
+        self.log_name = log_name
+
+    def _batches(self, files: List[str]) -> List[List[str]]:
+        """작업자 수만큼 고르게 나누되 묶음당 MAX_BATCH 개 이하"""
+        if not files:
+            return []
+        size = min(MAX_BATCH, math.ceil(len(files) / self.max_workers))
+        return [files[start:start + size] for start in range(0, len(files), size)]
+
+    def run_phase(
+        self,
+        phase: str,
+        command: Optional[str],
+        patterns: List[str],
+        files: List[str]
+    ) -> Dict[str, Any]:
+        """
+        검사 하나 실행 (캐시에 없는 파일만 프로세스 풀로 검사)
+
+        Args:
+            phase: 검사 이름
+            command: 외부 도구 명령 (None 이면 내장 검사)
+            patterns: 대상 파일 패턴 (파일 이름 또는 경로 기준)
+            files: 변경 파일 목록
+
+        Returns:
+            {'files', 'cached', 'issues', 'errors', 'warnings', 'metrics'}
+        """
+        targets = [
+            path for path in files
+            if any(fnmatch.fnmatch(path, p) or fnmatch.fnmatch(Path(path).name, p) for p in patterns)
+        ]
+        checker = command or f"builtin:{BUILTIN_VERSION}"
+
+        results: Dict[str, Dict[str, Any]] = {}
+        keys: Dict[str, str] = {}
+        pending: List[str] = []
+
+        for path in targets:
+            digest = file_digest(self.workdir / path)
+            keys[path] = input_key(
+                f"review.{phase}",
+                {'checker': checker, 'options': self.options, 'path': path, 'content': digest}
+            )
+            entry = self.cache.get(keys[path])
+            if entry is not None:
+                results[path] = entry['outputs']
+            else:
+                pending.append(path)
+
+        futures = [
+            self.executor.submit(
+                analyze_batch, phase, command, batch, str(self.workdir), self.options, self.timeout,
+                self.sandbox, f"{self.log_name}-{phase}-{index}"
+            )
+            for index, batch in enumerate(self._batches(pending))
+        ]
+        for future in futures:
+            for path, result in future.result().items():
+                results[path] = result
+                self.cache.put(keys[path], phase, {'path': path, 'checker': checker}, result)
+
+        issues = sorted(
+            (issue for result in results.values() for issue in result['issues']),
+            key=lambda issue: (issue['file'], issue['line'])
+        )
+        metrics: Dict[str, int] = {}
+        for result in results.values():
+            for name, value in result['metrics'].items():
+                metrics[name] = metrics.get(name, 0) + value
+
+        return {
+            'files': len(targets),
+            'cached': len(targets) - len(pending),
+            'issues': issues,
+            'errors': sum(1 for issue in issues if issue['severity'] == SEVERITY_ERROR),
+            'warnings': sum(1 for issue in issues if issue['severity'] == SEVERITY_WARNING),
+            'metrics': metrics,
+        }
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Claude Code SubAgent - Load Test
+
+합성 티켓 N개를 MainAgent 전체 워크플로우로 동시에 실행하여
+처리량 한계를 측정하는 부하 테스트 드라이버 (로컬 스텁 서버 대상)
+
+측정 항목:
+    - 처리량 (tickets/min)
+    - 단계별 지연 시간 p50/p95/p99
+    - 워커 프로세스 peak RSS
+    - 티켓당 API 호출 수, 429/5xx 응답 수
+
+워커(프로세스) 수 × 동시성(워커당 스레드 수) 만큼 티켓이 동시에 처리됩니다.
+워커마다 이 저장소 HEAD 의 일회용 clone 에서 단계 캐시 없이 실행하므로 개발 중인 작업 트리는 건드리지 않습니다.
+(같은 워커의 티켓은 작업 디렉토리와 리뷰/문서 증분 캐시를 공유: 장시간 실행 워커의 정상 상태 처리량)
+
+사용법:
+    python scripts/load_test.py --tickets 300 --workers 4 --concurrency 8
+    python scripts/load_test.py --tickets 200 --latency-ms 80 --jitter-ms 40 --rate-limit-rps 50
+    python scripts/load_test.py --tickets 500 --output load/result.json
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+# scripts/ 및 scripts/agents/ 를 sys.path에 추가
+SCRIPTS_DIR = Path(__file__).resolve().parent
+for _path in (SCRIPTS_DIR, SCRIPTS_DIR / 'agents'):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+from benchmark import clone_workspace, isolated_workspace, percentile
+from stub_server import StubFaults, StubServer
+
+
+def _run_ticket(ticket_id: str) -> Dict[str, Any]:
+    """티켓 하나를 MainAgent로 실행하고 단계별 소요 시간 수집"""
+    from main_agent import MainAgent
+
+    start = time.perf_counter()
+    agent = MainAgent(ticket_id, use_cache=False)
+    try:
+        agent.run()
+    except SystemExit:
+        # 워크플로우 실패 시 MainAgent는 sys.exit(1) 호출
+        pass
+
+    return {
+        'ticket_id': ticket_id,
+        'status': agent.state['status'],
+        'seconds': time.perf_counter() - start,
+        'steps': {
+            name: step.get('duration_seconds')
+            for name, step in agent.state['steps'].items()
+            if step.get('duration_seconds') is not None
+        },
+    }
+
+
+def _run_worker(ticket_ids: List[str], concurrency: int, workspace: str) -> Dict[str, Any]:
+    """
+    워커 프로세스: 할당된 티켓을 일회용 작업 디렉토리에서 스레드 풀로 실행
+
+    Returns:
+        티켓별 결과 목록과 워커 peak RSS (KB)
+    """
+    with isolated_workspace(Path(workspace)), redirect_stdout(io.StringIO()), \
+            ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(_run_ticket, ticket_ids))
+
+    return {
+        'results': results,
+        # Linux 기준 KB 단위
+        'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def run_load_test(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    스텁 서버를 띄우고 합성 티켓을 워커에 분배하여 실행
+
+    Returns:
+        집계된 부하 테스트 결과
+    """
+    faults = StubFaults(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit_rps=args.rate_limit_rps,
+        throttle_rate=args.throttle_rate,
+        error_rate=args.error_rate,
+        seed=0
+    )
+
+    with tempfile.TemporaryDirectory(prefix='tkm-load-') as tmp, StubServer(faults=faults) as server:
+        # 워커 프로세스가 환경변수를 상속받도록 풀 생성 전에 설정
+        os.environ.update(server.env())
+        os.environ['CHECKPOINT_DIR'] = str(Path(tmp) / 'checkpoints')
+
+        ticket_ids = server.state.seed_issues(args.tickets)
+        chunks = [ticket_ids[i::args.workers] for i in range(args.workers)]
+        chunks = [chunk for chunk in chunks if chunk]
+        # clone 은 측정 구간 밖에서 준비
+        workspaces = [str(clone_workspace(Path(tmp) / 'workspaces' / f"worker-{i}")) for i in range(len(chunks))]
+
+        print(f"🔥 부하 테스트: 티켓 {args.tickets}개, 워커 {args.workers} × 동시성 {args.concurrency}, "
+              f"지연 {args.latency_ms}ms(+{args.jitter_ms}ms)")
+
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            futures = [
+                pool.submit(_run_worker, chunk, args.concurrency, workspace)
+                for chunk, workspace in zip(chunks, workspaces)
+            ]
+            workers = [future.result() for future in futures]
+        wall = time.perf_counter() - start
+
+        with server.state.lock:
+            api_calls = sum(server.state.requests.values())
+            statuses = dict(server.state.statuses)
+
+    results = [r for worker in workers for r in worker['results']]
+    completed = [r for r in results if r['status'] == 'completed']
+
+    step_samples: Dict[str, List[float]] = {}
+    for result in results:
+        for name, seconds in result['steps'].items():
+            step_samples.setdefault(name, []).append(seconds * 1000)
+
+    ticket_ms = [r['seconds'] * 1000 for r in results]
+
+    return {
+        'created_at': datetime.now().isoformat(),
+        'options': {
+            'tickets': args.tickets,
+            'workers': args.workers,
+            'concurrency': args.concurrency,
+            'latency_ms': args.latency_ms,
+            'jitter_ms': args.jitter_ms,
+            'rate_limit_rps': args.rate_limit_rps,
+            'throttle_rate': args.throttle_rate,
+            'error_rate': args.error_rate,
+        },
+        'wall_seconds': round(wall, 3),
+        'tickets_completed': len(completed),
+        'tickets_failed': len(results) - len(completed),
+        'tickets_per_min': round(len(completed) / wall * 60, 1) if wall > 0 else 0.0,
+        'ticket_latency_ms': {
+            'p50': round(percentile(ticket_ms, 50), 2),
+            'p95': round(percentile(ticket_ms, 95), 2),
+            'p99': round(percentile(ticket_ms, 99), 2),
+        },
+        'step_latency_ms': {
+            name: {
+                'p50': round(percentile(samples, 50), 2),
+                'p95': round(percentile(samples, 95), 2),
+                'p99': round(percentile(samples, 99), 2),
+            }
+            for name, samples in step_samples.items()
+        },
+        'peak_rss_mb': round(max(w['peak_rss_kb'] for w in workers) / 1024, 1) if workers else 0.0,
+        'api_calls': api_calls,
+        'api_calls_per_ticket': round(api_calls / len(results), 2) if results else 0.0,
+        'http_statuses': {str(k): v for k, v in statuses.items()},
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    """부하 테스트 결과 출력"""
+    print(f"\n📊 결과 ({report['wall_seconds']}s)")
+    print(f"  처리량:        {report['tickets_per_min']} tickets/min")
+    print(f"  완료/실패:     {report['tickets_completed']} / {report['tickets_failed']}")
+    latency = report['ticket_latency_ms']
+    print(f"  티켓 지연:     p50 {latency['p50']}ms  p95 {latency['p95']}ms  p99 {latency['p99']}ms")
+    print(f"  peak RSS:      {report['peak_rss_mb']}MB (워커 최대값)")
+    print(f"  API 호출/티켓: {report['api_calls_per_ticket']} (총 {report['api_calls']})")
+    print(f"  HTTP 상태:     {report['http_statuses']}")
+
+    print(f"\n  {'단계':16s} {'p50':>10s} {'p95':>10s} {'p99':>10s}")
+    for name, latency in report['step_latency_ms'].items():
+        print(f"  {name:16s} {latency['p50']:>8.2f}ms {latency['p95']:>8.2f}ms {latency['p99']:>8.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MainAgent 처리량 부하 테스트 (로컬 스텁 서버 대상)")
+    parser.add_argument('--tickets', type=int, default=200, help='합성 티켓 수')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 2, help='워커 프로세스 수')
+    parser.add_argument('--concurrency', type=int, default=4, help='워커당 동시 실행 티켓 수')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='스텁 응답 지연 (ms)')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='스텁 추가 무작위 지연 (ms)')
+    parser.add_argument('--rate-limit-rps', type=float, default=0.0, help='스텁 초당 허용 요청 수 (0=무제한)')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='스텁 무작위 429 비율 (0~1)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='스텁 무작위 503 비율 (0~1)')
+    parser.add_argument('--output', type=Path, default=None, help='결과 JSON 저장 경로')
+    args = parser.parse_args()
+
+    if args.workers < 1 or args.concurrency < 1:
+        parser.error("--workers와 --concurrency는 1 이상이어야 합니다.")
+
+    report = run_load_test(args)
+    print_report(report)
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 결과 저장: {args.output}")
+
+    sys.exit(0 if report['tickets_failed'] == 0 else 1)
+
+
+if __name__ == '__main__':
+    main()
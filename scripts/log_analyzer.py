@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Claude Code SubAgent - Log Analyzer
+
+테스트/빌드 로그에서 실패 시그니처 추출
+
+로그를 처음부터 한 번만 읽으면서 하나로 합친 정규식(assertion / 에러 / 스택 프레임)으로
+첫 번째 실패 assertion(없으면 첫 에러)과 그 위치(스택 프레임), 앞뒤 문맥을 뽑고,
+숫자/주소/임시 경로 등을 정규화한 해시로 실패를 식별(fingerprint)합니다.
+첫 assertion 의 문맥을 다 모으면 나머지 로그는 읽지 않으므로 수 GB 로그도 빠르게 끝납니다.
+
+    signature = analyze_log('checkpoints/test-results/unit-0.log')
+    signature['excerpt']       # 알림에 보낼 짧은 발췌
+    signature['fingerprint']   # 같은 실패를 묶는 식별자
+
+Usage:
+    python log_analyzer.py <로그 파일>
+"""
+
+import re
+import sys
+import json
+import hashlib
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+# 시그니처 앞/뒤 문맥 줄 수
+CONTEXT_LINES = 5
+
+# 발췌 길이 제한 (Slack 블록 텍스트 한도 3000자 안쪽)
+MAX_LINE_LENGTH = 300
+MAX_EXCERPT_LENGTH = 1500
+
+# 에러 뒤에 나오는 스택 프레임(Java/JS)을 찾을 최대 줄 수
+FRAME_LOOKAHEAD = 50
+
+# 파일 읽기 단위 (문자)
+CHUNK_SIZE = 1 << 20
+
+_ASSERTION = [
+    r'^E\s+(?:assert\b|AssertionError\b).*',                               # pytest
+    r'^.*?\b(?:AssertionError|AssertionFailedError|ComparisonFailure)\b.*',  # Python/JUnit/Node
+    r'\bexpect\(.*\)\.(?:not\.)?to\w*\(.*',                                 # Jest
+    r'^--- FAIL: .*',                                                       # go test
+]
+
+_ERROR = [
+    r'^(?:[\w$]+\.)*[A-Z]\w*(?:Error|Exception)(?::\s.*)?$',                # Python/Java 예외
+    r'^Exception in thread .*',
+    r'^panic: .*',
+    r'^\[ERROR\] .+',                                                       # Maven
+    r'^npm ERR! .+',
+]
+
+_FRAME = [
+    r'^\s*File "(?P<py_file>[^"]+)", line (?P<py_line>\d+), in (?P<py_func>\S+)',
+    r'^\s+at (?P<java_func>[\w.$<>]+)\((?P<java_file>[\w.$-]+):(?P<java_line>\d+)\)',
+    r'^\s+at (?:(?P<js_func>[^\s(]+) \()?(?P<js_file>[^\s()]+):(?P<js_line>\d+):\d+\)?$',
+    r'^(?P<pt_file>[\w./-]+\.py):(?P<pt_line>\d+): \w+',                    # pytest 실패 위치
+]
+
+# 세 종류를 하나의 정규식으로 합쳐 한 줄에 한 번만 검사
+# (같은 위치에서 겹치면 앞쪽 우선: "tests/x.py:12: AssertionError" 는 프레임)
+_MATCHER = re.compile(
+    f"(?P<frame>{'|'.join(_FRAME)})"
+    f"|(?P<assertion>{'|'.join(_ASSERTION)})"
+    f"|(?P<error>{'|'.join(_ERROR)})"
+)
+
+# 후보 줄 사전 필터 (위 패턴들이 반드시 포함하는 리터럴)
+_PREFILTER = re.compile(r'ssert|ComparisonFailure|expect\(|FAIL|Error|Exception|panic: |ERR|File "|\sat |\.py:\d')
+
+# 읽기 묶음 사전 필터 (str.find 로 검사, 에러 뒤에 나오는 프레임은 문맥 수집 중에 처리되므로 제외)
+_CHUNK_KEYWORDS = ('ssert', 'ComparisonFailure', 'expect(', 'FAIL', 'Error', 'Exception', 'panic: ', 'ERR', 'File "')
+
+# 실패 위치에서 제외할 프레임워크/라이브러리 프레임
+_LIBRARY_FUNCTIONS = (
+    'org.junit.', 'org.opentest4j.', 'org.assertj.', 'org.testng.',
+    'java.', 'javax.', 'jdk.', 'sun.', 'kotlin.',
+)
+_LIBRARY_PATHS = ('site-packages/', '/_pytest/', '/unittest/', 'node_modules/', 'node:internal')
+
+_ANSI = re.compile(r'\x1b\[[0-9;]*[A-Za-z]')
+
+# fingerprint 정규화: 실행마다 달라지는 값 제거
+_NORMALIZERS = [
+    (re.compile(r'0x[0-9a-fA-F]+'), '0x?'),
+    (re.compile(r'\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b', re.I), '<uuid>'),
+    (re.compile(r'\b\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?(?:Z|[+-]\d{2}:?\d{2})?'), '<time>'),
+    (re.compile(r'(?:/tmp|/var/folders|/private/var)/\S+'), '<tmp>'),
+    (re.compile(r'\b[0-9a-f]{12,}\b'), '<hex>'),
+    (re.compile(r'\d+(?:\.\d+)?'), 'N'),
+    (re.compile(r'\s+'), ' '),
+]
+
+
+def normalize(text: str) -> str:
+    """
+    에러 텍스트 정규화 (숫자, 주소, UUID, 시각, 임시 경로 등 실행마다 달라지는 값 제거)
+
+    Args:
+        text: 에러 텍스트
+
+    Returns:
+        정규화된 텍스트
+    """
+    text = _ANSI.sub('', text)
+    for pattern, replacement in _NORMALIZERS:
+        text = pattern.sub(replacement, text)
+    return text.strip()
+
+
+def fingerprint(*parts: Optional[str]) -> str:
+    """정규화한 텍스트 조각들의 해시 (12자리)"""
+    canonical = '\n'.join(normalize(part or '') for part in parts)
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()[:12]
+
+
+def _frame(match: re.Match) -> Dict[str, Any]:
+    """스택 프레임 매치 → {'file', 'line', 'function'}"""
+    for prefix in ('py', 'java', 'js', 'pt'):
+        path = match.group(f'{prefix}_file')
+        if path:
+            function = match.group(f'{prefix}_func') if prefix != 'pt' else None
+            return {'file': path, 'line': int(match.group(f'{prefix}_line')), 'function': function}
+    return {}
+
+
+def _is_library(frame: Dict[str, Any]) -> bool:
+    """테스트 프레임워크/표준 라이브러리 프레임 여부 (실패 위치로는 프로젝트 코드 프레임을 우선)"""
+    function = frame.get('function') or ''
+    path = frame['file']
+    return function.startswith(_LIBRARY_FUNCTIONS) or any(part in path for part in _LIBRARY_PATHS)
+
+
+def _clip(line: str) -> str:
+    line = _ANSI.sub('', line.rstrip('\r\n'))
+    return line if len(line) <= MAX_LINE_LENGTH else line[:MAX_LINE_LENGTH] + '…'
+
+
+def _excerpt(lines: Iterable[str]) -> str:
+    text = '\n'.join(lines).strip('\n')
+    return text if len(text) <= MAX_EXCERPT_LENGTH else text[:MAX_EXCERPT_LENGTH] + '\n…'
+
+
+class _Scanner:
+    """줄 단위 상태 머신 (앞 문맥 deque + 시그니처 뒤 문맥/프레임 수집)"""
+
+    def __init__(self, context: int):
+        self.context = context
+        self.before: Deque[str] = deque(maxlen=context)
+        self.number = 0
+        # 마지막 스택 프레임 (줄 번호, 프레임) - Python 은 프레임이 에러 줄 앞에 나옴
+        self.last_frame: Optional[Tuple[int, Dict[str, Any]]] = None
+        self.last_own_frame: Optional[Tuple[int, Dict[str, Any]]] = None
+        # {'kind', 'line', 'message', 'frame', 'before', 'after', 'fallback'}
+        self.found: Optional[Dict[str, Any]] = None
+
+    @property
+    def collecting(self) -> bool:
+        """시그니처 뒤 문맥이나 (Java/JS) 뒤따르는 프레임을 아직 모으는 중인지"""
+        found = self.found
+        if found is None:
+            return False
+        pending_frame = found['frame'] is None and self.number - found['line'] <= FRAME_LOOKAHEAD
+        return len(found['after']) < self.context or pending_frame
+
+    @property
+    def done(self) -> bool:
+        """첫 assertion 의 문맥을 다 모았으면 나머지 로그는 읽지 않음"""
+        return self.found is not None and self.found['kind'] == 'assertion' and not self.collecting
+
+    def skip(self, count: int, tail: List[str]) -> None:
+        """매칭 후보가 없는 줄 묶음 건너뛰기 (줄 번호와 앞 문맥만 갱신)"""
+        self.number += count
+        self.before.extend(_clip(line) for line in tail[-self.context:])
+
+    def feed(self, raw: str) -> None:
+        """한 줄 처리"""
+        self.number += 1
+        number = self.number
+        line = _clip(raw)
+        match = _MATCHER.search(line) if _PREFILTER.search(line) else None
+        found = self.found
+
+        if found is not None and self.collecting:
+            if len(found['after']) < self.context:
+                found['after'].append(line)
+            # Java/JS 는 프레임이 에러 줄 뒤에 나옴
+            if found['frame'] is None and match and match.group('frame'):
+                frame = _frame(match)
+                if not _is_library(frame):
+                    found['frame'] = frame
+                elif found['fallback'] is None:
+                    found['fallback'] = frame
+
+        if match:
+            if match.group('frame'):
+                frame = _frame(match)
+                self.last_frame = (number, frame)
+                if not _is_library(frame):
+                    self.last_own_frame = (number, frame)
+            else:
+                kind = 'assertion' if match.group('assertion') else 'error'
+                # 첫 assertion 이 있으면 그것을, 없으면 첫 에러를 시그니처로 사용
+                if found is None or (kind == 'assertion' and found['kind'] == 'error'):
+                    self.found = {
+                        'kind': kind,
+                        'line': number,
+                        'message': line.strip(),
+                        'frame': self._preceding_frame(number),
+                        'before': list(self.before),
+                        'after': [],
+                        'fallback': None,
+                    }
+
+        self.before.append(line)
+
+    def _preceding_frame(self, number: int) -> Optional[Dict[str, Any]]:
+        """시그니처 바로 앞(문맥 범위 안)의 프레임 - 프로젝트 코드 프레임 우선"""
+        window = self.context * 4
+        for candidate in (self.last_own_frame, self.last_frame):
+            if candidate and number - candidate[0] <= window:
+                return candidate[1]
+        return None
+
+    def result(self) -> Dict[str, Any]:
+        """시그니처 결과"""
+        found = self.found
+        if found is None:
+            tail = list(self.before)
+            message = next((line.strip() for line in reversed(tail) if line.strip()), '')
+            return {
+                'kind': None,
+                'message': message,
+                'line': self.number or None,
+                'frame': None,
+                'excerpt': _excerpt(tail),
+                'fingerprint': fingerprint(message),
+            }
+
+        frame = found['frame'] or found['fallback']
+        location = f"{frame['file']}:{frame.get('function') or ''}" if frame else ''
+        return {
+            'kind': found['kind'],
+            'message': found['message'],
+            'line': found['line'],
+            'frame': frame,
+            'excerpt': _excerpt(found['before'] + [found['message']] + found['after']),
+            'fingerprint': fingerprint(found['message'], location),
+        }
+
+
+def analyze_lines(lines: Iterable[str], context: int = CONTEXT_LINES) -> Dict[str, Any]:
+    """
+    로그 줄에서 실패 시그니처 추출 (한 번만 순회)
+
+    Args:
+        lines: 로그 줄
+        context: 시그니처 앞/뒤 문맥 줄 수
+
+    Returns:
+        {'kind', 'message', 'line', 'frame', 'excerpt', 'fingerprint'}
+        kind 는 assertion/error, 찾지 못하면 None (로그 끝부분을 발췌)
+    """
+    scanner = _Scanner(context)
+    for line in lines:
+        scanner.feed(line)
+        if scanner.done:
+            break
+    return scanner.result()
+
+
+def analyze_text(text: str, context: int = CONTEXT_LINES) -> Dict[str, Any]:
+    """문자열(에러 메시지, 캡처된 출력)에서 실패 시그니처 추출"""
+    return analyze_lines(text.splitlines(), context)
+
+
+def analyze_log(path: str, context: int = CONTEXT_LINES) -> Dict[str, Any]:
+    """
+    로그 파일에서 실패 시그니처 추출 (스트리밍, 인코딩 오류는 대체 문자로)
+
+    CHUNK_SIZE 단위로 읽어 키워드가 하나도 없는 묶음은 줄 단위 처리 없이 건너뛰므로
+    대부분이 정상 출력인 대용량 로그도 디스크 읽기 속도에 가깝게 훑습니다.
+
+    Args:
+        path: 로그 파일 경로
+        context: 시그니처 앞/뒤 문맥 줄 수
+
+    Returns:
+        analyze_lines() 결과에 'log' (파일 경로) 추가
+    """
+    scanner = _Scanner(context)
+    remainder = ''
+
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        while not scanner.done:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                if remainder:
+                    scanner.feed(remainder)
+                break
+
+            # 마지막 줄이 잘렸을 수 있으므로 다음 묶음으로 넘김
+            chunk = remainder + chunk
+            cut = chunk.rfind('\n') + 1
+            chunk, remainder = chunk[:cut], chunk[cut:]
+            if not chunk:
+                continue
+
+            lines = chunk.splitlines()
+            if not scanner.collecting and not any(keyword in chunk for keyword in _CHUNK_KEYWORDS):
+                scanner.skip(len(lines), lines)
+                continue
+
+            for line in lines:
+                scanner.feed(line)
+                if scanner.done:
+                    break
+
+    signature = scanner.result()
+    signature['log'] = str(path)
+    return signature
+
+
+def main():
+    """메인 함수"""
+    if len(sys.argv) != 2:
+        print("Usage: python log_analyzer.py <로그 파일>")
+        sys.exit(1)
+
+    path = Path(sys.argv[1])
+    if not path.exists():
+        print(f"❌ 파일 없음: {path}")
+        sys.exit(1)
+
+    print(json.dumps(analyze_log(str(path)), indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Claude Code SubAgent - Metrics
+
+Prometheus 메트릭 수집 및 노출
+
+노출 방식:
+    - 데몬/워커 모드: start_metrics_server(port) 로 /metrics 엔드포인트 제공
+    - 단발성 CLI: 종료 시 flush() 가 metrics 설정 섹션에 따라 기록
+        METRICS_TEXTFILE  node_exporter textfile collector 용 .prom 파일 경로
+        PUSHGATEWAY_URL   Pushgateway 주소 (예: http://pushgateway:9091)
+        METRICS_JOB       Pushgateway job 이름 (기본값: tkm-automation)
+
+prometheus_client 패키지가 설치되어 있지 않으면 모든 함수는 아무 일도 하지 않습니다.
+"""
+
+from typing import Optional
+
+try:
+    from prometheus_client import CollectorRegistry, Counter, Histogram
+    _ENABLED = True
+except ImportError:
+    _ENABLED = False
+
+# 단계 소요 시간 버킷 (초): 수 초 ~ 수십 분
+STEP_BUCKETS = (1, 5, 15, 30, 60, 120, 300, 600, 1200, 1800, 3600)
+
+# API 지연 시간 버킷 (초)
+HTTP_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30)
+
+# 체크포인트 쓰기 지연 시간 버킷 (초)
+CHECKPOINT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1)
+
+
+if _ENABLED:
+    REGISTRY = CollectorRegistry()
+
+    STEP_DURATION = Histogram(
+        'tkm_workflow_step_duration_seconds',
+        'MainAgent 단계별 소요 시간',
+        ['step', 'status'],
+        buckets=STEP_BUCKETS,
+        registry=REGISTRY,
+    )
+    WORKFLOW_RUNS = Counter(
+        'tkm_workflow_runs_total',
+        'MainAgent 워크플로우 실행 횟수',
+        ['status'],
+        registry=REGISTRY,
+    )
+    HTTP_DURATION = Histogram(
+        'tkm_http_request_duration_seconds',
+        'JIRA/Slack/GitHub API 지연 시간',
+        ['service', 'method', 'endpoint'],
+        buckets=HTTP_BUCKETS,
+        registry=REGISTRY,
+    )
+    HTTP_REQUESTS = Counter(
+        'tkm_http_requests_total',
+        'API 요청 수 (상태 코드별)',
+        ['service', 'method', 'endpoint', 'status'],
+        registry=REGISTRY,
+    )
+    HTTP_ERRORS = Counter(
+        'tkm_http_errors_total',
+        'API 오류 수 (4xx/5xx 응답 또는 연결 실패)',
+        ['service', 'endpoint', 'reason'],
+        registry=REGISTRY,
+    )
+    HTTP_RETRIES = Counter(
+        'tkm_http_retries_total',
+        'API 재시도 횟수',
+        ['service', 'endpoint'],
+        registry=REGISTRY,
+    )
+    HTTP_THROTTLED = Counter(
+        'tkm_http_throttled_total',
+        'HTTP 429 (rate limit) 응답 수',
+        ['service', 'endpoint'],
+        registry=REGISTRY,
+    )
+    CHECKPOINT_WRITE = Histogram(
+        'tkm_checkpoint_write_duration_seconds',
+        '체크포인트 파일 쓰기 지연 시간',
+        buckets=CHECKPOINT_BUCKETS,
+        registry=REGISTRY,
+    )
+    STEP_CACHE = Counter(
+        'tkm_step_cache_total',
+        '단계 캐시 조회 결과 (hit/miss)',
+        ['step', 'result'],
+        registry=REGISTRY,
+    )
+
+
+def observe_step(step: str, status: str, seconds: float) -> None:
+    """MainAgent 단계 소요 시간 기록"""
+    if _ENABLED:
+        STEP_DURATION.labels(step=step, status=status).observe(seconds)
+
+
+def count_workflow_run(status: str) -> None:
+    """워크플로우 종료 상태 집계"""
+    if _ENABLED:
+        WORKFLOW_RUNS.labels(status=status).inc()
+
+
+def observe_http(
+    service: Optional[str],
+    method: str,
+    endpoint: Optional[str],
+    seconds: float,
+    status: Optional[int] = None,
+    error: Optional[str] = None
+) -> None:
+    """
+    API 호출 한 건 기록
+
+    Args:
+        service: 대상 서비스 (jira, slack, github)
+        method: HTTP 메서드
+        endpoint: 엔드포인트 템플릿
+        seconds: 소요 시간
+        status: HTTP 상태 코드 (연결 실패 시 None)
+        error: 연결 실패 시 예외 클래스 이름
+    """
+    if not _ENABLED:
+        return
+
+    service = service or 'unknown'
+    endpoint = endpoint or 'unknown'
+
+    HTTP_DURATION.labels(service=service, method=method, endpoint=endpoint).observe(seconds)
+    HTTP_REQUESTS.labels(
+        service=service, method=method, endpoint=endpoint, status=str(status or 'error')
+    ).inc()
+
+    if status == 429:
+        HTTP_THROTTLED.labels(service=service, endpoint=endpoint).inc()
+    if error or (status is not None and status >= 400):
+        HTTP_ERRORS.labels(service=service, endpoint=endpoint, reason=error or str(status)).inc()
+
+
+def count_retry(service: Optional[str], endpoint: Optional[str]) -> None:
+    """API 재시도 기록"""
+    if _ENABLED:
+        HTTP_RETRIES.labels(service=service or 'unknown', endpoint=endpoint or 'unknown').inc()
+
+
+def observe_checkpoint_write(seconds: float) -> None:
+    """체크포인트 쓰기 지연 시간 기록"""
+    if _ENABLED:
+        CHECKPOINT_WRITE.observe(seconds)
+
+
+def count_step_cache(step: str, hit: bool) -> None:
+    """단계 캐시 hit/miss 집계"""
+    if _ENABLED:
+        STEP_CACHE.labels(step=step, result='hit' if hit else 'miss').inc()
+
+
+def start_metrics_server(port: int, addr: str = '0.0.0.0') -> bool:
+    """
+    /metrics HTTP 엔드포인트 시작 (데몬 스레드)
+
+    Args:
+        port: 리슨 포트
+        addr: 리슨 주소
+
+    Returns:
+        시작 여부
+    """
+    if not _ENABLED:
+        print("⚠️  prometheus_client 패키지가 없어 /metrics 서버를 시작하지 않습니다.")
+        return False
+
+    from prometheus_client import start_http_server
+
+    start_http_server(port, addr=addr, registry=REGISTRY)
+    print(f"📈 메트릭 엔드포인트: http://{addr}:{port}/metrics")
+    return True
+
+
+def flush() -> None:
+    """
+    단발성 CLI 종료 시 메트릭 내보내기
+
+    METRICS_TEXTFILE 이 지정되면 .prom 파일을 원자적으로 기록하고,
+    PUSHGATEWAY_URL 이 지정되면 Pushgateway로 전송합니다.
+    """
+    if not _ENABLED:
+        return
+
+    from config import get_config
+
+    settings = get_config().metrics
+    textfile = settings.textfile
+    if textfile:
+        from prometheus_client import write_to_textfile
+        try:
+            write_to_textfile(textfile, REGISTRY)
+        except Exception as e:
+            print(f"⚠️  메트릭 textfile 기록 실패: {e}")
+
+    gateway = settings.pushgateway_url
+    if gateway:
+        from prometheus_client import push_to_gateway
+        try:
+            push_to_gateway(gateway, job=settings.job, registry=REGISTRY)
+        except Exception as e:
+            print(f"⚠️  Pushgateway 전송 실패: {e}")
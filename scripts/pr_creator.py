@@ -3,13 +3,18 @@
 Claude Code SubAgent - PR Creator
 
 GitHub Pull Request 자동 생성 클라이언트
+
+GITHUB_API_URL/GITHUB_REPOSITORY가 설정되어 있으면 gh CLI 대신
+GitHub REST API로 PR을 생성합니다 (로컬 스텁 서버 대상 벤치마크/CI 용).
 """
 
-import subprocess
 import sys
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from pathlib import Path
 
+from config import get_config
+from sandbox import failure_reason, sandbox_from_config
+
 
 class PRCreator:
     """Pull Request 생성 클래스"""
@@ -23,13 +28,22 @@ class PRCreator:
         """
         self.repo_path = Path(repo_path)
 
+        config = get_config()
+        git = config.git
+        # git/gh 출력은 로그 파일로, 결과에는 끝부분만 (SANDBOX_TIMEOUT 안에 끝나지 않으면 프로세스 그룹 종료)
+        self.sandbox = sandbox_from_config(config)
+        self.api_url = git.github_api_url.rstrip('/') if git.github_api_url else None
+        self.repository = git.github_repository
+        self.token = git.github_token
+
     def create_pr(
         self,
         title: str,
         body: str,
         base_branch: str = "grafana-stage",
         head_branch: Optional[str] = None,
-        draft: bool = False
+        draft: bool = False,
+        include_stats: bool = False
     ) -> Optional[str]:
         """
         Pull Request 생성
@@ -40,6 +54,7 @@ class PRCreator:
             base_branch: 베이스 브랜치 (기본: grafana-stage)
             head_branch: 헤드 브랜치 (기본: 현재 브랜치)
             draft: Draft PR 여부
+            include_stats: 본문 끝에 변경 통계(파일별 추가/삭제 라인) 추가 여부
 
         Returns:
             생성된 PR URL 또는 None
@@ -54,6 +69,12 @@ class PRCreator:
             print(f"  Head: {head_branch}")
             print(f"  Title: {title}")
 
+            if include_stats:
+                body = self.build_body(body, base_branch)
+
+            if self.api_url:
+                return self._create_pr_via_api(title, body, base_branch, head_branch, draft)
+
             # gh CLI를 사용한 PR 생성
             cmd = [
                 "gh", "pr", "create",
@@ -66,27 +87,119 @@ class PRCreator:
             if draft:
                 cmd.append("--draft")
 
-            result = subprocess.run(
-                cmd,
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                check=False
-            )
+            result = self._run(cmd, name="gh-pr-create")
 
-            if result.returncode == 0:
-                pr_url = result.stdout.strip()
+            if result['success']:
+                pr_url = result['stdout'].strip()
                 print(f"✅ PR 생성 완료: {pr_url}")
                 return pr_url
             else:
-                print(f"❌ PR 생성 실패:")
-                print(result.stderr)
+                self._print_failure("PR 생성 실패", result)
                 return None
 
         except Exception as e:
             print(f"❌ PR 생성 실패: {e}")
             return None
 
+    def build_body(self, body: str, base_branch: str) -> str:
+        """
+        PR 본문에 변경 통계 섹션 추가
+
+        Review 단계와 같은 (base SHA, tree 해시) 캐시를 쓰므로 보통 git diff 를 다시 실행하지 않습니다.
+
+        Args:
+            body: PR 본문
+            base_branch: 베이스 브랜치
+
+        Returns:
+            변경 통계가 추가된 본문 (비교할 수 없으면 원래 본문)
+        """
+        from diff_stats import diff_stats, markdown_summary, workspace_excludes
+
+        config = get_config()
+        stats = diff_stats(
+            self.repo_path,
+            base_branch,
+            exclude=workspace_excludes(config),
+            cache_dir=config.step_cache_dir
+        )
+        if stats is None:
+            print(f"⚠️  {base_branch} 브랜치와 비교할 수 없어 변경 통계를 생략합니다")
+            return body
+
+        summary = markdown_summary(stats)
+        return f"{body.rstrip()}\n\n{summary}" if body.strip() else summary
+
+    def _create_pr_via_api(
+        self,
+        title: str,
+        body: str,
+        base_branch: str,
+        head_branch: str,
+        draft: bool
+    ) -> Optional[str]:
+        """
+        GitHub REST API로 Pull Request 생성
+
+        Returns:
+            생성된 PR URL 또는 None
+        """
+        import http_client
+
+        if not self.repository:
+            print("❌ PR 생성 실패: GITHUB_REPOSITORY가 설정되지 않았습니다.")
+            return None
+
+        headers = {"Accept": "application/vnd.github+json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+
+        response = http_client.post(
+            f"{self.api_url}/repos/{self.repository}/pulls",
+            endpoint='/repos/{repo}/pulls',
+            service='github',
+            json={
+                "title": title,
+                "body": body,
+                "base": base_branch,
+                "head": head_branch,
+                "draft": draft
+            },
+            headers=headers,
+            timeout=10
+        )
+
+        if response.status_code == 201:
+            pr_url = response.json().get("html_url")
+            print(f"✅ PR 생성 완료: {pr_url}")
+            return pr_url
+
+        print(f"❌ PR 생성 실패: {response.status_code}")
+        print(response.text)
+        return None
+
+    def _run(self, cmd: List[str], name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        저장소에서 명령 실행 (sandbox: 출력 로그/타임아웃/프로세스 그룹 종료)
+
+        Args:
+            cmd: 실행할 명령
+            name: 로그 파일 이름 (기본: 실행 파일-하위 명령)
+
+        Returns:
+            ProcessSandbox.run 결과
+        """
+        return self.sandbox.run(cmd, cwd=self.repo_path, name=name)
+
+    @staticmethod
+    def _print_failure(message: str, result: Dict[str, Any]) -> None:
+        """실패 원인과 stderr 끝부분, 전체 로그 경로 출력"""
+        print(f"❌ {message}: {failure_reason(result)}")
+        output = (result['stderr'] or result['stdout']).strip()
+        if output:
+            print(output)
+        print(f"   로그: {result['log']}")
+
     def _get_current_branch(self) -> str:
         """
         현재 Git 브랜치명 조회
@@ -94,19 +207,11 @@ class PRCreator:
         Returns:
             브랜치명
         """
-        try:
-            result = subprocess.run(
-                ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return result.stdout.strip()
-
-        except subprocess.CalledProcessError as e:
-            print(f"❌ 현재 브랜치 조회 실패: {e}")
+        result = self._run(["git", "rev-parse", "--abbrev-ref", "HEAD"])
+        if not result['success']:
+            self._print_failure("현재 브랜치 조회 실패", result)
             return "main"
+        return result['stdout'].strip()
 
     def push_branch(
         self,
@@ -134,20 +239,13 @@ class PRCreator:
             if force:
                 cmd.append("--force")
 
-            result = subprocess.run(
-                cmd,
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                check=False
-            )
+            result = self._run(cmd)
 
-            if result.returncode == 0:
+            if result['success']:
                 print(f"✅ 브랜치 푸시 완료: {branch}")
                 return True
             else:
-                print(f"❌ 브랜치 푸시 실패:")
-                print(result.stderr)
+                self._print_failure("브랜치 푸시 실패", result)
                 return False
 
         except Exception as e:
@@ -172,32 +270,24 @@ class PRCreator:
         try:
             # 변경사항 스테이징
             if add_all:
-                subprocess.run(
-                    ["git", "add", "."],
-                    cwd=self.repo_path,
-                    check=True
-                )
+                result = self._run(["git", "add", "."])
+                if not result['success']:
+                    self._print_failure("스테이징 실패", result)
+                    return False
 
             # 커밋
-            result = subprocess.run(
-                ["git", "commit", "-m", message],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                check=False
-            )
-
-            if result.returncode == 0:
+            result = self._run(["git", "commit", "-m", message])
+
+            if result['success']:
                 print(f"✅ 커밋 완료: {message}")
                 return True
             else:
                 # 변경사항이 없으면 에러가 아님
-                if "nothing to commit" in result.stdout:
+                if "nothing to commit" in result['stdout']:
                     print("ℹ️  변경사항이 없습니다.")
                     return True
                 else:
-                    print(f"❌ 커밋 실패:")
-                    print(result.stderr)
+                    self._print_failure("커밋 실패", result)
                     return False
 
         except Exception as e:
@@ -219,39 +309,24 @@ class PRCreator:
         Returns:
             성공 여부
         """
-        try:
-            print(f"🌿 브랜치 생성: {branch_name} (from {base_branch})")
+        print(f"🌿 브랜치 생성: {branch_name} (from {base_branch})")
 
+        steps = [
             # 베이스 브랜치 체크아웃
-            subprocess.run(
-                ["git", "checkout", base_branch],
-                cwd=self.repo_path,
-                capture_output=True,
-                check=True
-            )
-
+            ["git", "checkout", base_branch],
             # 최신 상태로 업데이트
-            subprocess.run(
-                ["git", "pull", "origin", base_branch],
-                cwd=self.repo_path,
-                capture_output=True,
-                check=True
-            )
-
+            ["git", "pull", "origin", base_branch],
             # 새 브랜치 생성 및 체크아웃
-            subprocess.run(
-                ["git", "checkout", "-b", branch_name],
-                cwd=self.repo_path,
-                capture_output=True,
-                check=True
-            )
-
-            print(f"✅ 브랜치 생성 완료: {branch_name}")
-            return True
-
-        except subprocess.CalledProcessError as e:
-            print(f"❌ 브랜치 생성 실패: {e}")
-            return False
+            ["git", "checkout", "-b", branch_name],
+        ]
+        for cmd in steps:
+            result = self._run(cmd)
+            if not result['success']:
+                self._print_failure(f"브랜치 생성 실패 ({' '.join(cmd[:2])})", result)
+                return False
+
+        print(f"✅ 브랜치 생성 완료: {branch_name}")
+        return True
 
 
 def main():
@@ -263,6 +338,7 @@ def main():
     parser.add_argument("--body", default="", help="PR 본문")
     parser.add_argument("--base", default="grafana-stage", help="베이스 브랜치")
     parser.add_argument("--draft", action="store_true", help="Draft PR")
+    parser.add_argument("--stats", action="store_true", help="본문에 변경 통계 추가")
 
     args = parser.parse_args()
 
@@ -271,7 +347,8 @@ def main():
         title=args.title,
         body=args.body,
         base_branch=args.base,
-        draft=args.draft
+        draft=args.draft,
+        include_stats=args.stats
     )
 
     sys.exit(0 if pr_url else 1)
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Claude Code SubAgent - Report Parser
+
+JUnit XML / Cobertura / JaCoCo 리포트 스트리밍 파서
+
+수백 MB 리포트도 문서 전체를 메모리에 올리지 않도록 iterparse 로 요소를 하나씩 읽고,
+처리한 요소는 즉시 비웁니다. 커버리지는 파일별 라인 비트맵(라인당 1비트)으로만 보관하므로
+메모리는 리포트 크기가 아니라 소스 라인 수에 비례하며, 샤드별 리포트 여러 개를 합쳐도
+같은 라인을 중복 집계하지 않습니다.
+
+    report = CoverageReport(repo_root)
+    report.add('coverage.xml')                    # Cobertura (pytest-cov, coverage.py)
+    report.add('target/site/jacoco/jacoco.xml')   # JaCoCo
+    report.percent                                # 전체 라인 커버리지
+    report.diff_coverage(changed_lines)           # 변경 라인 커버리지
+"""
+
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+# 실패 메시지 발췌 길이
+EXCERPT_LENGTH = 500
+
+
+def _local(tag: str) -> str:
+    """네임스페이스를 뗀 태그 이름"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def iter_junit(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    JUnit XML testcase 스트리밍 파싱
+
+    Args:
+        path: JUnit XML 파일 경로
+
+    Yields:
+        {'classname', 'name', 'file', 'status', 'duration', 'message'}
+        (status: passed/failed/skipped, message: 실패/건너뜀 사유 발췌)
+    """
+    for _, element in ET.iterparse(str(path), events=('end',)):
+        if _local(element.tag) != 'testcase':
+            continue
+
+        status, message = 'passed', None
+        for child in element:
+            tag = _local(child.tag)
+            if tag in ('failure', 'error', 'skipped'):
+                status = 'skipped' if tag == 'skipped' else 'failed'
+                text = child.get('message') or (child.text or '').strip()
+                message = text[:EXCERPT_LENGTH] or None
+                break
+
+        yield {
+            'classname': element.get('classname', ''),
+            'name': element.get('name', ''),
+            'file': element.get('file'),
+            'status': status,
+            'duration': float(element.get('time') or 0),
+            'message': message,
+        }
+
+        # 처리한 testcase 는 바로 비워 메모리 사용량을 일정하게 유지
+        element.clear()
+
+
+class CoverageReport:
+    """Cobertura/JaCoCo 라인 커버리지 집계 (파일별 라인 비트맵)"""
+
+    def __init__(self, repo_root: Optional[Path] = None):
+        """
+        Coverage Report 초기화
+
+        Args:
+            repo_root: 리포트의 파일 경로를 저장소 기준 상대 경로로 바꿀 루트
+        """
+        self.repo_root = Path(repo_root).resolve() if repo_root else None
+        # {파일: 라인 비트맵} (비트 n = n번째 라인)
+        self.lines: Dict[str, int] = {}
+        self.covered: Dict[str, int] = {}
+        self.reports = 0
+
+    def add(self, path: Path) -> None:
+        """
+        리포트 추가 (루트 요소로 형식 판별: coverage → Cobertura, report → JaCoCo)
+
+        Args:
+            path: 리포트 파일 경로
+
+        Raises:
+            ValueError: 지원하지 않는 형식
+            xml.etree.ElementTree.ParseError: XML 오류
+        """
+        events = ET.iterparse(str(path), events=('start', 'end'))
+        _, root = next(events)
+        kind = _local(root.tag)
+
+        if kind == 'coverage':
+            self._add_cobertura(events, root)
+        elif kind == 'report':
+            self._add_jacoco(events, root)
+        else:
+            raise ValueError(f"지원하지 않는 커버리지 리포트 형식: <{kind}> ({path})")
+
+        self.reports += 1
+
+    def _record(self, source: str, line: int, hit: bool) -> None:
+        bit = 1 << line
+        self.lines[source] = self.lines.get(source, 0) | bit
+        if hit:
+            self.covered[source] = self.covered.get(source, 0) | bit
+
+    def _normalize(self, filename: str, roots: List[str]) -> str:
+        """리포트 경로 → 저장소 기준 상대 경로 (알 수 없으면 리포트 경로 그대로)"""
+        if self.repo_root is None:
+            return Path(filename).as_posix()
+
+        for root in roots or ['']:
+            candidate = Path(root) / filename
+            if not candidate.is_absolute():
+                candidate = self.repo_root / candidate
+            try:
+                relative = candidate.resolve().relative_to(self.repo_root)
+            except ValueError:
+                continue
+            if (self.repo_root / relative).exists():
+                return relative.as_posix()
+
+        return Path(filename).as_posix()
+
+    def _add_cobertura(self, events, root: ET.Element) -> None:
+        """<coverage><sources/><packages><package><classes><class filename><lines><line number hits/>"""
+        roots: List[str] = []
+        source: Optional[str] = None
+        stack = [root]
+
+        for event, element in events:
+            tag = _local(element.tag)
+
+            if event == 'start':
+                stack.append(element)
+                if tag == 'class':
+                    source = self._normalize(element.get('filename', ''), roots)
+                continue
+
+            stack.pop()
+            if tag == 'source':
+                roots.append((element.text or '').strip())
+            elif tag == 'line' and source is not None:
+                # methods/lines 양쪽에 같은 라인이 나와도 비트맵이라 중복 집계되지 않음
+                self._record(source, int(element.get('number', 0)), int(element.get('hits', 0)) > 0)
+            elif tag == 'class':
+                source = None
+                # 처리한 class 를 부모(classes)에서 떼어내 메모리 사용량을 일정하게 유지
+                stack[-1].clear()
+
+    def _add_jacoco(self, events, root: ET.Element) -> None:
+        """<report><package name><class/><sourcefile name><line nr mi ci/>"""
+        package = ''
+        source: Optional[str] = None
+        stack = [root]
+
+        for event, element in events:
+            tag = _local(element.tag)
+
+            if event == 'start':
+                stack.append(element)
+                if tag == 'package':
+                    package = element.get('name', '')
+                elif tag == 'sourcefile':
+                    source = self._jacoco_path(package, element.get('name', ''))
+                continue
+
+            stack.pop()
+            if tag == 'line' and source is not None:
+                self._record(source, int(element.get('nr', 0)), int(element.get('ci', 0)) > 0)
+            elif tag in ('class', 'sourcefile'):
+                source = None
+                # 패키지 이름은 이미 읽었으므로 처리한 자식을 부모(package)째 비움
+                stack[-1].clear()
+            elif tag == 'package':
+                root.clear()
+
+    def _jacoco_path(self, package: str, name: str) -> str:
+        """JaCoCo 패키지 경로 + 파일명 → 저장소 경로 (소스 루트는 변경 파일 접미사 매칭으로 해결)"""
+        return f"{package}/{name}" if package else name
+
+    @property
+    def total_lines(self) -> int:
+        return sum(bin(bits).count('1') for bits in self.lines.values())
+
+    @property
+    def covered_lines(self) -> int:
+        return sum(bin(bits).count('1') for bits in self.covered.values())
+
+    @property
+    def percent(self) -> Optional[float]:
+        """전체 라인 커버리지 (%) - 측정된 라인이 없으면 None"""
+        total = self.total_lines
+        return round(self.covered_lines * 100 / total, 2) if total else None
+
+    def _match(self, changed: Dict[str, Optional[Set[int]]]) -> Dict[str, str]:
+        """리포트 파일 → 변경 파일 (경로가 같거나 변경 파일이 리포트 경로로 끝나는 경우)"""
+        suffixes: Dict[str, str] = {}
+        for path in changed:
+            parts = path.split('/')
+            for start in range(len(parts)):
+                suffixes.setdefault('/'.join(parts[start:]), path)
+
+        return {source: suffixes[source] for source in self.lines if source in suffixes}
+
+    def diff_coverage(self, changed: Dict[str, Optional[Set[int]]]) -> Tuple[int, int]:
+        """
+        변경 라인 커버리지
+
+        Args:
+            changed: {변경 파일: 변경 라인 집합 (None 이면 파일 전체)}
+
+        Returns:
+            (커버된 변경 라인 수, 측정 대상 변경 라인 수)
+        """
+        covered = total = 0
+
+        for source, path in self._match(changed).items():
+            measured = self.lines[source]
+            hit = self.covered.get(source, 0)
+            if changed[path] is not None:
+                mask = 0
+                for line in changed[path]:
+                    mask |= 1 << line
+                measured &= mask
+                hit &= mask
+            total += bin(measured).count('1')
+            covered += bin(hit).count('1')
+
+        return covered, total
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Claude Code SubAgent - Resource Monitor
+
+MainAgent 단계별 자원 사용량 측정 (wall/CPU 시간, 최대 RSS, 디스크 읽기/쓰기)
+
+    with ResourceMonitor(interval=0.5) as monitor:
+        runner()
+    monitor.result  # {'wall_seconds', 'cpu_seconds', 'cpu_utilization', 'peak_rss_mb', ...}
+
+측정 방법:
+    - CPU 시간: resource.getrusage(RUSAGE_SELF) + getrusage(RUSAGE_CHILDREN) 의 단계 전후 차이
+      (RUSAGE_CHILDREN 은 종료 후 회수(wait)된 자식 프로세스만 포함: git/gradle/pytest 등 traced_run 실행분)
+    - 최대 RSS: 이 프로세스는 /proc/self/clear_refs 로 VmHWM 을 초기화한 뒤 단계 끝의 VmHWM,
+      자식 프로세스는 interval 마다 /proc 을 훑어 자손 프로세스 RSS 를 표본 추출한 최대값
+    - 읽기/쓰기: /proc/self/io 의 read_bytes/write_bytes 차이 (회수된 자식 프로세스 포함, 스토리지 기준)
+
+/proc 이 없는 환경(macOS)은 getrusage 만 사용합니다 (최대 RSS 는 프로세스 전체 기간 기준, I/O 는 블록 수 × 512).
+"""
+
+import os
+import sys
+import time
+import resource
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+_PROC = Path('/proc')
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+# ru_maxrss 단위: Linux KB, macOS bytes
+MAXRSS_UNIT = 1 if sys.platform == 'darwin' else 1024
+
+# CPU 사용률(코어 수 환산)이 이 값 이상이면 CPU 위주, 이하이면 대기 위주로 분류
+CPU_BOUND_UTILIZATION = 0.7
+WAIT_BOUND_UTILIZATION = 0.2
+
+MB = 1024 * 1024
+
+
+def _proc_io() -> Optional[Dict[str, int]]:
+    """/proc/self/io (없거나 읽을 수 없으면 None)"""
+    try:
+        with open(_PROC / 'self' / 'io', 'r') as f:
+            return {key: int(value) for key, value in (line.split(':') for line in f if ':' in line)}
+    except (OSError, ValueError):
+        return None
+
+
+def _status_kb(pid: str, field: str) -> Optional[int]:
+    """/proc/<pid>/status 의 KB 항목 (VmHWM, VmRSS)"""
+    try:
+        with open(_PROC / pid / 'status', 'r') as f:
+            for line in f:
+                if line.startswith(f"{field}:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _reset_peak_rss() -> bool:
+    """이 프로세스의 VmHWM 초기화 (Linux 4.0+, 실패하면 False)"""
+    try:
+        with open(_PROC / 'self' / 'clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def _descendants_rss(root: int) -> List[int]:
+    """root 의 자손 프로세스별 RSS (bytes)"""
+    children: Dict[int, List[int]] = {}
+    rss: Dict[int, int] = {}
+    for entry in _PROC.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            with open(entry / 'stat', 'r') as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # comm 에 공백/괄호가 있을 수 있으므로 마지막 ')' 뒤부터 해석
+        fields = stat[stat.rfind(')') + 2:].split()
+        pid = int(entry.name)
+        children.setdefault(int(fields[1]), []).append(pid)
+        rss[pid] = int(fields[21]) * _PAGE_SIZE
+
+    result = []
+    stack = list(children.get(root, []))
+    while stack:
+        pid = stack.pop()
+        result.append(rss.get(pid, 0))
+        stack.extend(children.get(pid, []))
+    return result
+
+
+class ResourceMonitor:
+    """with 블록 동안의 자원 사용량 측정"""
+
+    def __init__(self, interval: float = 0.5):
+        """
+        Resource Monitor 초기화
+
+        Args:
+            interval: 자식 프로세스 RSS 표본 추출 간격 (초, 0 이면 표본 추출 안 함)
+        """
+        self.interval = interval
+        self.result: Dict[str, Any] = {}
+
+        self._proc = _PROC.joinpath('self', 'stat').exists()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._samples = 0
+        self._children_peak = 0
+        self._tree_peak = 0
+
+    def _sample(self) -> None:
+        pid = os.getpid()
+        while True:
+            try:
+                children = _descendants_rss(pid)
+            except OSError:
+                children = []
+            own = (_status_kb('self', 'VmRSS') or 0) * 1024
+            self._samples += 1
+            self._children_peak = max(self._children_peak, max(children, default=0))
+            self._tree_peak = max(self._tree_peak, own + sum(children))
+            if self._stop.wait(self.interval):
+                return
+
+    def __enter__(self) -> 'ResourceMonitor':
+        self._hwm_reset = self._proc and _reset_peak_rss()
+        self._self = resource.getrusage(resource.RUSAGE_SELF)
+        self._children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        self._io = _proc_io() if self._proc else None
+        self._wall = time.perf_counter()
+
+        if self._proc and self.interval > 0:
+            self._thread = threading.Thread(target=self._sample, name='resource-monitor', daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        wall = time.perf_counter() - self._wall
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+
+        own = resource.getrusage(resource.RUSAGE_SELF)
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+
+        user = (own.ru_utime - self._self.ru_utime) + (children.ru_utime - self._children.ru_utime)
+        system = (own.ru_stime - self._self.ru_stime) + (children.ru_stime - self._children.ru_stime)
+
+        # 이 프로세스: VmHWM 을 초기화했으면 단계 동안의 최대값, 아니면 프로세스 전체 기간 최대값
+        hwm = _status_kb('self', 'VmHWM') if self._hwm_reset else None
+        peak = hwm * 1024 if hwm is not None else own.ru_maxrss * MAXRSS_UNIT
+
+        # 자식: 표본 최대값과, 단계 중 회수된 자식의 ru_maxrss(이전보다 커졌을 때만 이 단계 값으로 봄)
+        children_peak = self._children_peak
+        if children.ru_maxrss > self._children.ru_maxrss:
+            children_peak = max(children_peak, children.ru_maxrss * MAXRSS_UNIT)
+
+        io = _proc_io() if self._io is not None else None
+        if io is not None:
+            read_bytes = io['read_bytes'] - self._io['read_bytes']
+            write_bytes = io['write_bytes'] - self._io['write_bytes']
+        else:
+            blocks_in = (own.ru_inblock - self._self.ru_inblock) + (children.ru_inblock - self._children.ru_inblock)
+            blocks_out = (own.ru_oublock - self._self.ru_oublock) + (children.ru_oublock - self._children.ru_oublock)
+            read_bytes, write_bytes = blocks_in * 512, blocks_out * 512
+
+        cpu = user + system
+        utilization = cpu / wall if wall > 0 else 0.0
+        self.result = {
+            'wall_seconds': round(wall, 3),
+            'cpu_seconds': round(cpu, 3),
+            'cpu_user_seconds': round(user, 3),
+            'cpu_system_seconds': round(system, 3),
+            'cpu_utilization': round(utilization, 2),
+            'peak_rss_mb': round(peak / MB, 1),
+            'children_peak_rss_mb': round(children_peak / MB, 1),
+            'peak_total_rss_mb': round(max(self._tree_peak, peak) / MB, 1),
+            'read_bytes': read_bytes,
+            'write_bytes': write_bytes,
+            'samples': self._samples,
+            'profile': classify(utilization),
+        }
+
+
+def classify(utilization: float) -> str:
+    """
+    CPU 사용률로 단계 성격 분류
+
+    Args:
+        utilization: CPU 시간 / wall 시간 (코어 수 환산, 1.0 = 한 코어를 계속 사용)
+
+    Returns:
+        'cpu' (CPU 위주), 'wait' (I/O/네트워크/외부 대기 위주), 'mixed'
+    """
+    if utilization >= CPU_BOUND_UTILIZATION:
+        return 'cpu'
+    if utilization <= WAIT_BOUND_UTILIZATION:
+        return 'wait'
+    return 'mixed'
+
+
+def _size(value: int) -> str:
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if abs(value) < 1024 or unit == 'GB':
+            return f"{value:.0f}{unit}" if unit == 'B' else f"{value:.1f}{unit}"
+        value /= 1024
+    return str(value)
+
+
+def format_table(steps: Dict[str, Dict[str, Any]]) -> List[str]:
+    """
+    단계별 자원 사용량 표 (체크포인트 steps 항목의 'resources')
+
+    Args:
+        steps: state["steps"]
+
+    Returns:
+        출력할 줄 목록 (측정한 단계가 없으면 빈 목록)
+    """
+    rows = [(name, step['resources']) for name, step in steps.items() if step.get('resources')]
+    if not rows:
+        return []
+
+    # 한글은 폭이 2칸이라 정렬이 어긋나므로 열 제목은 영문
+    header = f"  {'step':<16}{'wall':>9}{'cpu':>9}{'util':>8}{'rss':>9}{'child rss':>10}{'read':>9}{'write':>9}  profile"
+    lines = [header]
+    for name, usage in rows:
+        lines.append(
+            f"  {name:<16}{usage['wall_seconds']:>8.1f}s{usage['cpu_seconds']:>8.1f}s"
+            f"{usage['cpu_utilization'] * 100:>7.0f}%{usage['peak_rss_mb']:>7.0f}MB{usage['children_peak_rss_mb']:>8.0f}MB"
+            f"{_size(usage['read_bytes']):>9}{_size(usage['write_bytes']):>9}  {usage['profile']}"
+        )
+    return lines
@@ -0,0 +1,566 @@
+#!/usr/bin/env python3
+"""
+Claude Code SubAgent - Process Sandbox
+
+빌드/테스트/검사/git·gh 등 외부 명령 공통 실행 계층
+
+    sandbox = sandbox_from_config(get_config())
+    result = sandbox.run(['gh', 'pr', 'create', ...], cwd=repo, name='gh-pr-create')
+    result['returncode'], result['stdout'], result['log']
+
+capture_output=True 와 달리 출력 전체를 메모리에 모으지 않습니다:
+    - stdout/stderr 는 <SANDBOX_LOG_DIR>/<name>.log 로 흘려 쓰고 (크기 초과 시 .1, .2 ... 로 회전,
+      실행마다 이전 로그를 .1 로 밀어냄), 결과에는 스트림별 마지막 SANDBOX_TAIL_KB 만 담습니다.
+    - 명령은 새 세션(프로세스 그룹)에서 실행하고, wall/CPU 타임아웃이 나면 그룹 전체에
+      SIGTERM → (유예) → SIGKILL 을 보냅니다 (러너가 띄운 워커/데몬 자식까지 정리).
+    - CPU 타임아웃은 그룹 전체 CPU 시간(/proc, 종료된 자식 포함)으로 판단하고,
+      프로세스별 RLIMIT_CPU 를 함께 걸어 /proc 이 없는 환경에서도 제한합니다.
+    - RLIMIT_AS(메모리)/RLIMIT_FSIZE(파일 크기)는 프로세스별 한도입니다.
+
+출력 전체가 필요하면 (예: 검사 도구의 이슈 목록) iter_log_lines 로 로그 파일을 줄 단위로 읽습니다.
+
+결과는 {'command', 'returncode', 'success', 'timed_out', 'limit', 'signal', 'error', 'duration_seconds',
+'cpu_seconds', 'peak_rss_mb', 'output_bytes', 'truncated', 'stdout', 'stderr', 'log'} 딕셔너리입니다.
+명령을 시작하지 못했거나(실행 파일 없음 127, 실행 권한 없음 126) 종료 상태를 회수하지 못한 경우(255)에도
+예외 대신 success=False 와 'error' 에 사유를 담아 돌려줍니다.
+"""
+
+import os
+import sys
+import time
+import signal
+import resource
+import selectors
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import timeline
+from resource_monitor import MAXRSS_UNIT
+from tracing import inject_env, set_attributes, span
+
+# 타임아웃 후 SIGTERM → SIGKILL 유예 (초)
+KILL_GRACE_SECONDS = 5
+
+# 주 프로세스 종료 후 남은 자식이 파이프를 잡고 있을 때 출력을 더 기다리는 시간 (초)
+DRAIN_SECONDS = 2
+
+# 출력 읽기/타임아웃 확인 주기 (초), 그룹 CPU 시간 확인 주기 (초)
+POLL_INTERVAL = 0.2
+CPU_CHECK_INTERVAL = 1.0
+IDLE_WAIT = 0.002
+
+# 명령을 시작하지 못했거나 종료 상태를 잃었을 때의 종료 코드 (셸 관례)
+EXIT_CANNOT_EXECUTE = 126
+EXIT_NOT_FOUND = 127
+EXIT_STATUS_LOST = 255
+
+# _reap: 이미 다른 곳에서 회수되어 알 수 없는 wait status (실제 wait status 는 0 이상)
+_STATUS_LOST = -1
+
+CHUNK_SIZE = 64 * 1024
+MB = 1024 * 1024
+
+_PROC = Path('/proc')
+_CLOCK_TICKS = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+
+
+class RotatingLog:
+    """크기 상한이 있는 출력 로그 파일 (초과 시 path.1, path.2 ... 로 회전)"""
+
+    def __init__(self, path: Path, max_bytes: int, backups: int):
+        """
+        Rotating Log 초기화
+
+        Args:
+            path: 로그 파일 경로
+            max_bytes: 파일 하나의 최대 크기 (0 이면 회전하지 않음)
+            backups: 보관할 이전 파일 수
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._file = None
+        self._size = 0
+
+    def __enter__(self) -> 'RotatingLog':
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # 실행마다 새 파일로 시작 (이전 실행 출력은 .1 로 보관)
+        if self.path.exists() and self.path.stat().st_size > 0:
+            self._rotate()
+        self._file = open(self.path, 'wb')
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _rotate(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        if self.backups > 0:
+            for index in range(self.backups - 1, 0, -1):
+                older = self.path.with_name(f"{self.path.name}.{index}")
+                if older.exists():
+                    older.replace(self.path.with_name(f"{self.path.name}.{index + 1}"))
+            if self.path.exists():
+                self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+        if self._file is not None:
+            self._file = open(self.path, 'wb')
+        self._size = 0
+
+    def write(self, chunk: bytes) -> None:
+        if self.max_bytes and self._size and self._size + len(chunk) > self.max_bytes:
+            self._rotate()
+        self._file.write(chunk)
+        self._file.flush()
+        self._size += len(chunk)
+
+
+class _Tail:
+    """스트림의 마지막 limit 바이트"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.buffer = bytearray()
+        self.total = 0
+
+    def append(self, chunk: bytes) -> None:
+        self.total += len(chunk)
+        self.buffer += chunk
+        if len(self.buffer) > self.limit:
+            del self.buffer[:len(self.buffer) - self.limit]
+
+    @property
+    def truncated(self) -> bool:
+        return self.total > len(self.buffer)
+
+    def text(self) -> str:
+        data = bytes(self.buffer)
+        if self.truncated:
+            # 잘린 첫 줄은 버림
+            newline = data.find(b'\n')
+            data = data[newline + 1:] if newline >= 0 else data
+        return data.decode('utf-8', errors='replace')
+
+
+def _group_cpu_seconds(pgid: int) -> Optional[float]:
+    """프로세스 그룹의 CPU 시간 합 (회수된 자식 포함, /proc 이 없으면 None)"""
+    if not _PROC.is_dir():
+        return None
+
+    ticks = 0
+    for entry in _PROC.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            with open(entry / 'stat', 'r') as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # 마지막 ')' 뒤: state ppid pgrp session ... utime(11) stime(12) cutime(13) cstime(14)
+        fields = stat[stat.rfind(')') + 2:].split()
+        if int(fields[2]) == pgid:
+            ticks += sum(int(value) for value in fields[11:15])
+    return ticks / _CLOCK_TICKS
+
+
+def _reap(pid: int, block: bool = False) -> Tuple[Optional[int], Any]:
+    """
+    종료된 주 프로세스 회수 → (wait status, rusage)
+
+    아직 실행 중이면 (None, None), 이미 회수되어 종료 상태를 알 수 없으면 (_STATUS_LOST, None)
+    """
+    try:
+        reaped, status, usage = os.wait4(pid, 0 if block else os.WNOHANG)
+    except ChildProcessError:
+        return _STATUS_LOST, None
+    if reaped == 0:
+        return None, None
+    return status, usage
+
+
+def _signal_group(pgid: int, sig: int) -> bool:
+    try:
+        os.killpg(pgid, sig)
+        return True
+    except (ProcessLookupError, PermissionError):
+        return False
+
+
+def _limit_values(
+    cpu_seconds: int,
+    memory_mb: int,
+    file_size_mb: int
+) -> List[Tuple[int, Tuple[int, int]]]:
+    """적용할 (RLIMIT_*, (soft, hard)) 목록 (현재 hard 한도를 넘지 않게)"""
+    wanted = []
+    if cpu_seconds:
+        # soft 에서 SIGXCPU, hard 에서 SIGKILL
+        wanted.append((resource.RLIMIT_CPU, cpu_seconds, cpu_seconds + KILL_GRACE_SECONDS))
+    if memory_mb:
+        wanted.append((resource.RLIMIT_AS, memory_mb * MB, memory_mb * MB))
+    if file_size_mb:
+        wanted.append((resource.RLIMIT_FSIZE, file_size_mb * MB, file_size_mb * MB))
+
+    limits = []
+    for name, soft, hard in wanted:
+        _, current = resource.getrlimit(name)
+        if current != resource.RLIM_INFINITY:
+            soft, hard = min(soft, current), min(hard, current)
+        limits.append((name, (soft, hard)))
+    return limits
+
+
+def _set_limits(limits: List[Tuple[int, Tuple[int, int]]]) -> None:
+    for name, value in limits:
+        resource.setrlimit(name, value)
+
+
+class ProcessSandbox:
+    """출력/시간/자원 한도를 두고 외부 명령을 실행하는 실행기"""
+
+    def __init__(
+        self,
+        log_dir: str,
+        log_max_mb: int = 20,
+        log_backups: int = 2,
+        tail_kb: int = 64,
+        timeout: int = 600,
+        cpu_seconds: int = 0,
+        memory_mb: int = 0,
+        file_size_mb: int = 0
+    ):
+        """
+        Process Sandbox 초기화
+
+        Args:
+            log_dir: 명령별 출력 로그 디렉토리
+            log_max_mb: 로그 파일 하나의 최대 크기 (MB, 0 이면 회전하지 않음)
+            log_backups: 보관할 이전 로그 파일 수
+            tail_kb: 결과에 담을 스트림별 출력 끝부분 크기 (KB)
+            timeout: 기본 wall 타임아웃 (초, 0 이면 제한 없음)
+            cpu_seconds: 프로세스 그룹 CPU 시간 한도 (초, 0 이면 제한 없음)
+            memory_mb: 프로세스별 주소 공간 한도 (MB, 0 이면 제한 없음)
+            file_size_mb: 프로세스가 쓸 수 있는 파일 크기 한도 (MB, 0 이면 제한 없음)
+        """
+        self.log_dir = Path(log_dir)
+        self.log_max_bytes = log_max_mb * MB
+        self.log_backups = log_backups
+        self.tail_bytes = tail_kb * 1024
+        self.timeout = timeout
+        self.cpu_seconds = cpu_seconds
+        self.memory_mb = memory_mb
+        self.file_size_mb = file_size_mb
+
+    def log_path(self, cmd: List[str], name: Optional[str] = None) -> Path:
+        """명령의 출력 로그 경로 (기본 이름: 실행 파일-하위 명령, 예: git-push.log)"""
+        if not name:
+            parts = [Path(cmd[0]).name] + [arg for arg in cmd[1:2] if not arg.startswith('-')]
+            name = '-'.join(parts)
+        return self.log_dir / f"{name}.log"
+
+    def run(
+        self,
+        cmd: List[str],
+        cwd: Optional[Path] = None,
+        env: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        name: Optional[str] = None,
+        log: Optional[Path] = None,
+        **event_args: Any
+    ) -> Dict[str, Any]:
+        """
+        명령 실행 (span/타임라인 기록, trace 컨텍스트 환경변수 전달)
+
+        Args:
+            cmd: 실행할 명령
+            cwd: 작업 디렉토리
+            env: 환경변수 (기본값: os.environ)
+            timeout: wall 타임아웃 (초, 기본값: SANDBOX_TIMEOUT, 0 이면 제한 없음)
+            name: 로그 파일 이름 (동시에 같은 명령을 실행하면 서로 다른 이름을 지정)
+            log: 로그 파일 경로 (name 대신 직접 지정)
+            **event_args: 타임라인 이벤트 인자
+
+        Returns:
+            실행 결과 딕셔너리 (모듈 docstring 참고)
+        """
+        timeout = self.timeout if timeout is None else timeout
+        log = Path(log) if log else self.log_path(cmd, name)
+        limits = _limit_values(self.cpu_seconds, self.memory_mb, self.file_size_mb)
+        # 하위 단계가 스레드로 도는 중에는 preexec_fn 이 안전하지 않으므로 가능하면 실행 직후 prlimit 으로 적용
+        use_prlimit = hasattr(resource, 'prlimit')
+        command = ' '.join(cmd[:3])
+
+        with timeline.span(command, 'subprocess', **event_args) as trace_args, span(
+            f"subprocess {cmd[0]}",
+            **{
+                'process.executable.name': cmd[0],
+                'process.command': command,
+            }
+        ) as current, RotatingLog(log, self.log_max_bytes, self.log_backups) as writer:
+            started = time.monotonic()
+            error = None
+            try:
+                process = subprocess.Popen(
+                    cmd,
+                    cwd=cwd,
+                    env=inject_env(env),
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    start_new_session=True,
+                    preexec_fn=None if use_prlimit or not limits else lambda: _set_limits(limits)
+                )
+            except OSError as e:
+                # 실행 파일/작업 디렉토리 없음, 실행 권한 없음 → 예외 대신 실패 결과
+                process = None
+                error = f"{cmd[0]} 실행 실패: {e.strerror or e}"
+                status, usage, limit = None, None, None
+                tails = {'stdout': _Tail(self.tail_bytes), 'stderr': _Tail(self.tail_bytes)}
+                message = f"{error}\n".encode('utf-8')
+                writer.write(message)
+                tails['stderr'].append(message)
+                returncode = EXIT_NOT_FOUND if isinstance(e, FileNotFoundError) else EXIT_CANNOT_EXECUTE
+
+            if process is not None:
+                if use_prlimit:
+                    for limit, value in limits:
+                        try:
+                            resource.prlimit(process.pid, limit, value)
+                        except (OSError, ValueError):
+                            pass
+
+                deadline = started + timeout if timeout else None
+                status, usage, limit, tails = self._communicate(process, writer, deadline)
+
+                if status == _STATUS_LOST:
+                    returncode = EXIT_STATUS_LOST
+                    error = f"{cmd[0]} 종료 상태를 회수하지 못했습니다"
+                else:
+                    returncode = os.waitstatus_to_exitcode(status)
+                process.returncode = returncode
+            duration = time.monotonic() - started
+
+            cpu = usage.ru_utime + usage.ru_stime if usage is not None else 0.0
+            if limit is None and returncode < 0:
+                # 프로세스별 RLIMIT 초과 (SIGXCPU / CPU hard 한도의 SIGKILL / SIGXFSZ)
+                if -returncode == signal.SIGXCPU or (
+                    -returncode == signal.SIGKILL and self.cpu_seconds and cpu >= self.cpu_seconds
+                ):
+                    limit = 'cpu'
+                elif -returncode == signal.SIGXFSZ:
+                    limit = 'file_size'
+
+            result = {
+                'command': command,
+                'returncode': returncode,
+                'success': returncode == 0 and limit is None and error is None,
+                'timed_out': limit in ('wall', 'cpu'),
+                'limit': limit,
+                'signal': signal.Signals(-returncode).name if returncode < 0 else None,
+                'error': error,
+                'duration_seconds': round(duration, 3),
+                'cpu_seconds': round(cpu, 3),
+                'peak_rss_mb': round(usage.ru_maxrss * MAXRSS_UNIT / MB, 1) if usage is not None else 0.0,
+                'output_bytes': tails['stdout'].total + tails['stderr'].total,
+                'truncated': tails['stdout'].truncated or tails['stderr'].truncated,
+                'stdout': tails['stdout'].text(),
+                'stderr': tails['stderr'].text(),
+                'log': str(log),
+            }
+
+            set_attributes(current, **{'process.exit_code': returncode})
+            trace_args['exit_code'] = returncode
+            if limit:
+                trace_args['limit'] = limit
+            return result
+
+    def _communicate(
+        self,
+        process: subprocess.Popen,
+        writer: RotatingLog,
+        deadline: Optional[float]
+    ) -> Tuple[Optional[int], Any, Optional[str], Dict[str, _Tail]]:
+        """
+        출력을 로그/끝부분 버퍼로 흘려 쓰면서 종료 또는 한도 초과까지 대기
+
+        Returns:
+            (wait status, rusage, 초과한 한도 'wall'/'cpu' 또는 None, 스트림별 _Tail)
+        """
+        tails = {'stdout': _Tail(self.tail_bytes), 'stderr': _Tail(self.tail_bytes)}
+        selector = selectors.DefaultSelector()
+        selector.register(process.stdout, selectors.EVENT_READ, 'stdout')
+        selector.register(process.stderr, selectors.EVENT_READ, 'stderr')
+
+        status = usage = limit = None
+        drain_until = None
+        idle = IDLE_WAIT
+        stragglers_killed = False
+        next_cpu_check = time.monotonic() + CPU_CHECK_INTERVAL
+
+        try:
+            while selector.get_map() or status is None:
+                if selector.get_map():
+                    for key, _ in selector.select(POLL_INTERVAL):
+                        chunk = os.read(key.fd, CHUNK_SIZE)
+                        if not chunk:
+                            selector.unregister(key.fileobj)
+                            continue
+                        writer.write(chunk)
+                        tails[key.data].append(chunk)
+                else:
+                    # 출력은 닫혔고 종료만 기다리는 중 (짧은 명령이 POLL_INTERVAL 만큼 늦어지지 않도록 점점 늘림)
+                    time.sleep(idle)
+                    idle = min(idle * 2, POLL_INTERVAL)
+
+                now = time.monotonic()
+                if status is None:
+                    status, usage = _reap(process.pid)
+                    if status is None:
+                        if deadline is not None and now >= deadline:
+                            limit = 'wall'
+                        elif self.cpu_seconds and now >= next_cpu_check:
+                            next_cpu_check = now + CPU_CHECK_INTERVAL
+                            used = _group_cpu_seconds(process.pid)
+                            if used is not None and used >= self.cpu_seconds:
+                                limit = 'cpu'
+                        if limit:
+                            status, usage = self._terminate(process.pid)
+                    if status is not None:
+                        drain_until = time.monotonic() + DRAIN_SECONDS
+                elif now >= drain_until:
+                    # 주 프로세스는 끝났는데 같은 그룹의 자식이 파이프를 잡고 있음 → 정리 후 잠깐 더 읽고 종료
+                    if stragglers_killed:
+                        break
+                    _signal_group(process.pid, signal.SIGKILL)
+                    stragglers_killed = True
+                    drain_until = now + DRAIN_SECONDS
+        finally:
+            selector.close()
+            process.stdout.close()
+            process.stderr.close()
+
+        return status, usage, limit, tails
+
+    @staticmethod
+    def _terminate(pgid: int) -> Tuple[Optional[int], Any]:
+        """그룹 전체 SIGTERM → 유예 → SIGKILL 후 주 프로세스 회수"""
+        if _signal_group(pgid, signal.SIGTERM):
+            give_up = time.monotonic() + KILL_GRACE_SECONDS
+            while time.monotonic() < give_up:
+                status, usage = _reap(pgid)
+                if status is not None:
+                    # 주 프로세스가 먼저 끝나도 SIGTERM 을 무시한 자식은 남아 있을 수 있음
+                    _signal_group(pgid, signal.SIGKILL)
+                    return status, usage
+                time.sleep(POLL_INTERVAL)
+        _signal_group(pgid, signal.SIGKILL)
+        return _reap(pgid, block=True)
+
+
+def failure_reason(result: Dict[str, Any]) -> str:
+    """
+    실패한 실행 결과 한 줄 요약
+
+    Args:
+        result: ProcessSandbox.run 결과
+
+    Returns:
+        예: 'wall 타임아웃 (600.0초)', 'file_size 한도 초과 (SIGXFSZ)', 'gradle 실행 실패: No such file or directory', 'exit 1'
+    """
+    if result.get('error'):
+        return result['error']
+    if result['timed_out']:
+        return f"{result['limit']} 타임아웃 ({result['duration_seconds']}초, CPU {result['cpu_seconds']}초)"
+    if result['limit']:
+        return f"{result['limit']} 한도 초과 ({result['signal']})"
+    if result['signal']:
+        return f"시그널 {result['signal']}"
+    return f"exit {result['returncode']}"
+
+
+def iter_log_lines(log: str, since: float) -> Iterator[str]:
+    """
+    실행 출력 로그를 줄 단위로 읽기 (실행 중 크기 초과로 회전된 이전 파일부터 순서대로)
+
+    stdout/stderr 는 읽은 순서대로 한 파일에 섞여 기록됩니다. 회전으로 SANDBOX_LOG_BACKUPS 를 넘어
+    삭제된 앞부분은 읽을 수 없습니다.
+
+    Args:
+        log: ProcessSandbox.run 결과의 'log'
+        since: 실행 시작 시각 (time.time(), 이보다 먼저 회전된 이전 실행의 로그는 제외)
+
+    Yields:
+        개행을 뺀 줄
+    """
+    path = Path(log)
+    rotated = sorted(
+        path.parent.glob(f"{path.name}.[0-9]*"),
+        key=lambda older: int(older.name.rsplit('.', 1)[1]),
+        reverse=True
+    )
+    partial = ''
+    for part in [older for older in rotated if older.stat().st_mtime >= since] + [path]:
+        try:
+            with open(part, 'r', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    if not line.endswith('\n'):
+                        # 회전 경계에서 잘린 줄은 다음 파일 첫 줄과 이어 붙임
+                        partial += line
+                        continue
+                    yield (partial + line).rstrip('\r\n')
+                    partial = ''
+        except FileNotFoundError:
+            continue
+    if partial:
+        yield partial.rstrip('\r')
+
+
+def sandbox_from_config(config) -> ProcessSandbox:
+    """
+    설정(SANDBOX_*)으로 ProcessSandbox 생성
+
+    Args:
+        config: Config 인스턴스
+
+    Returns:
+        ProcessSandbox
+    """
+    settings = config.sandbox
+    return ProcessSandbox(
+        settings.log_dir,
+        log_max_mb=settings.log_max_mb,
+        log_backups=settings.log_backups,
+        tail_kb=settings.tail_kb,
+        timeout=settings.timeout,
+        cpu_seconds=settings.cpu_seconds,
+        memory_mb=settings.memory_mb,
+        file_size_mb=settings.file_size_mb
+    )
+
+
+def main():
+    """명령 하나를 sandbox 로 실행하고 결과 출력 (한도 확인용)"""
+    import json
+    import argparse
+    from config import get_config
+
+    parser = argparse.ArgumentParser(description="외부 명령을 출력/시간/자원 한도 안에서 실행")
+    parser.add_argument("--timeout", type=float, help="wall 타임아웃 (초, 기본값: SANDBOX_TIMEOUT)")
+    parser.add_argument("--name", help="로그 파일 이름")
+    parser.add_argument("cmd", nargs=argparse.REMAINDER, help="실행할 명령 (-- 뒤에)")
+
+    args = parser.parse_args()
+    cmd = args.cmd[1:] if args.cmd[:1] == ['--'] else args.cmd
+    if not cmd:
+        parser.error("실행할 명령이 없습니다")
+
+    result = sandbox_from_config(get_config()).run(cmd, timeout=args.timeout, name=args.name)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    sys.exit(0 if result['success'] else 1)
+
+
+if __name__ == "__main__":
+    main()
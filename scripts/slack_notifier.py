@@ -5,11 +5,12 @@ Claude Code SubAgent - Slack Notifier
 Slack Webhook을 통한 알림 전송 클라이언트
 """
 
-import requests
+import http_client
 import json
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 from config import get_config
+from log_analyzer import analyze_log, analyze_text
 
 
 class SlackNotifier:
@@ -17,7 +18,7 @@ class SlackNotifier:
 
     def __init__(self):
         """Slack Notifier 초기화"""
-        self.config = get_config()
+        self.config = get_config(require=('slack',))
         self.webhook_url = self.config.slack_webhook_url
         self.channel = self.config.slack_channel
         self.username = self.config.slack_username
@@ -53,8 +54,10 @@ class SlackNotifier:
             if blocks:
                 payload["blocks"] = blocks
 
-            response = requests.post(
+            response = http_client.post(
                 self.webhook_url,
+                endpoint='/webhook',
+                service='slack',
                 json=payload,
                 timeout=10
             )
@@ -123,11 +126,67 @@ class SlackNotifier:
             blocks=blocks
         )
 
+    def _failure_blocks(
+        self,
+        error_message: str,
+        log_path: Optional[str] = None,
+        signature: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        실패 시그니처 블록 (전체 로그 대신 첫 실패 assertion/스택 프레임 주변 발췌만 전송)
+
+        Args:
+            error_message: 에러 메시지 (캡처된 출력 전체여도 됨)
+            log_path: 테스트/빌드 로그 파일 (있으면 메시지 대신 로그에서 추출)
+            signature: 이미 추출한 시그니처 (있으면 다시 분석하지 않음,
+                'occurrences'/'tickets' 가 있으면 누적 발생 수 표시)
+
+        Returns:
+            Block Kit 블록 (에러 발췌, 위치/시그니처)
+        """
+        if signature is None and log_path:
+            try:
+                signature = analyze_log(log_path)
+            except OSError as e:
+                print(f"⚠️  로그 분석 실패 ({log_path}): {e}")
+        if signature is None:
+            signature = analyze_text(error_message)
+
+        details = [f"시그니처: `{signature['fingerprint']}`"]
+        if signature.get('occurrences'):
+            details.append(f"발생: {signature['occurrences']}회 (티켓 {signature.get('tickets', 1)}개)")
+        frame = signature['frame']
+        if frame:
+            details.append(f"위치: `{frame['file']}:{frame['line']}`")
+        if signature.get('log'):
+            details.append(f"로그: `{signature['log']}`")
+
+        return [
+            {
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": f"*에러:*\n```{signature['excerpt'] or error_message[:500]}```"
+                }
+            },
+            {
+                "type": "context",
+                "elements": [
+                    {
+                        "type": "mrkdwn",
+                        "text": " | ".join(details)
+                    }
+                ]
+            }
+        ]
+
     def notify_test_failed(
         self,
         ticket_id: str,
         error_message: str,
-        branch: str
+        branch: str,
+        log_path: Optional[str] = None,
+        signature: Optional[Dict[str, Any]] = None
     ) -> bool:
         """
         테스트 실패 알림
@@ -136,6 +195,8 @@ class SlackNotifier:
             ticket_id: JIRA 티켓 ID
             error_message: 에러 메시지
             branch: Git 브랜치명
+            log_path: 테스트 로그 파일 (옵션, 있으면 로그에서 실패 시그니처 추출)
+            signature: 이미 추출한 실패 시그니처 (옵션, 누적 발생 수 포함 가능)
 
         Returns:
             성공 여부
@@ -161,13 +222,7 @@ class SlackNotifier:
                     }
                 ]
             },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*에러:*\n```{error_message[:500]}```"
-                }
-            },
+            *self._failure_blocks(error_message, log_path, signature),
             {
                 "type": "context",
                 "elements": [
@@ -323,7 +378,9 @@ class SlackNotifier:
         self,
         ticket_id: str,
         error_message: str,
-        step: Optional[str] = None
+        step: Optional[str] = None,
+        log_path: Optional[str] = None,
+        signature: Optional[Dict[str, Any]] = None
     ) -> bool:
         """
         에러 알림
@@ -332,6 +389,8 @@ class SlackNotifier:
             ticket_id: JIRA 티켓 ID
             error_message: 에러 메시지
             step: 실패한 단계 (옵션)
+            log_path: 빌드/테스트 로그 파일 (옵션, 있으면 로그에서 실패 시그니처 추출)
+            signature: 이미 추출한 실패 시그니처 (옵션, 누적 발생 수 포함 가능)
 
         Returns:
             성공 여부
@@ -361,13 +420,7 @@ class SlackNotifier:
                 "text": f"*실패 단계:*\n{step}"
             })
 
-        blocks.append({
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": f"*에러:*\n```{error_message[:500]}```"
-            }
-        })
+        blocks.extend(self._failure_blocks(error_message, log_path, signature))
 
         blocks.append({
             "type": "context",
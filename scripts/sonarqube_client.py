@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Claude Code SubAgent - SonarQube Client
+
+SonarQube 분석 제출 및 품질 게이트 결과 조회
+
+스캐너(`SONARQUBE_SCANNER_CMD`)가 분석 보고서를 올리면 서버는 compute engine(CE) 작업으로 처리합니다.
+이 클라이언트는 스캐너가 남긴 report-task.txt 의 ceTaskId 로 작업 완료를 지수 백오프로 기다린 뒤,
+품질 게이트 상태와 신규 코드(new code period)의 미해결 이슈만 조회합니다.
+
+start() 는 이 과정을 백그라운드 스레드에서 실행하고 Future 를 돌려주므로,
+호출한 쪽(Review Agent)은 그동안 다른 검사를 계속 진행하고 마지막에 결과만 기다립니다.
+
+    client = SonarQubeClient(url, token, 'finops-api', workdir=Path('.'))
+    future = client.start()
+    ...                       # 다른 검사
+    result = future.result()  # {'task', 'quality_gate', 'conditions', 'issues', 'new_issues', ...}
+"""
+
+import os
+import shlex
+import time
+import tempfile
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from sandbox import ProcessSandbox, failure_reason
+from tracing import span
+
+# CE 작업 종료 상태
+TASK_DONE = ('SUCCESS', 'FAILED', 'CANCELED')
+
+# 이슈 검색 페이지 크기 (API 최대값)
+PAGE_SIZE = 500
+
+
+class SonarQubeClient:
+    """SonarQube 분석 제출/CE 작업 대기/품질 게이트 조회"""
+
+    def __init__(
+        self,
+        url: str,
+        token: Optional[str],
+        project_key: str,
+        workdir: Path = Path('.'),
+        scanner: str = 'sonar-scanner',
+        timeout: float = 900,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 15.0,
+        max_issues: int = 1000,
+        sandbox: Optional[ProcessSandbox] = None,
+        log_name: str = 'sonar-scanner'
+    ):
+        """
+        SonarQube Client 초기화
+
+        Args:
+            url: SonarQube 서버 주소
+            token: 사용자 토큰 (Basic 인증 사용자명으로 전달)
+            project_key: 프로젝트 키
+            workdir: 분석할 저장소 경로
+            scanner: 스캐너 명령 (sonar.* 속성은 -D 로 덧붙임)
+            timeout: 스캐너 실행 + CE 작업 대기 전체 제한 시간 (초)
+            poll_interval: CE 작업 첫 조회 간격 (초, 이후 1.5배씩 증가)
+            max_poll_interval: 조회 간격 상한 (초)
+            max_issues: 조회할 신규 코드 이슈 최대 수
+            sandbox: 스캐너 실행기 (자원 한도/로그 회전 설정, 기본값: 임시 디렉토리에 로그, 한도 없음)
+            log_name: 스캐너 출력 로그 이름
+        """
+        self.url = url.rstrip('/')
+        self.token = token
+        self.project_key = project_key
+        self.workdir = Path(workdir)
+        self.scanner = scanner
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.max_issues = max_issues
+        self.sandbox = sandbox or ProcessSandbox(str(Path(tempfile.gettempdir()) / 'tkm-sonar'))
+        self.log_name = log_name
+
+    def _get(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        import http_client
+
+        response = http_client.get(
+            f"{self.url}{endpoint}",
+            endpoint=endpoint,
+            service='sonarqube',
+            params=params,
+            auth=(self.token, '') if self.token else None,
+            timeout=10
+        )
+        if response.status_code != 200:
+            raise RuntimeError(f"SonarQube {endpoint} 실패: {response.status_code} {response.text[:200]}")
+        return response.json()
+
+    def submit(self, deadline: float) -> Dict[str, str]:
+        """
+        스캐너 실행 (분석 보고서 업로드)
+
+        Args:
+            deadline: time.monotonic() 기준 제한 시각
+
+        Returns:
+            report-task.txt 속성 ('ceTaskId', 'dashboardUrl' ...)
+
+        Raises:
+            RuntimeError: 스캐너 실패 또는 report-task.txt 없음
+            TimeoutError: 제한 시각까지 스캐너가 끝나지 않음
+        """
+        with tempfile.TemporaryDirectory(prefix='tkm-sonar-') as working:
+            argv = shlex.split(self.scanner) + [
+                f"-Dsonar.projectKey={self.project_key}",
+                f"-Dsonar.working.directory={working}",
+            ]
+            # 토큰은 명령줄(프로세스 목록)에 남지 않도록 환경변수로 전달
+            env = dict(os.environ, SONAR_HOST_URL=self.url)
+            if self.token:
+                env['SONAR_TOKEN'] = self.token
+
+            result = self.sandbox.run(
+                argv,
+                cwd=self.workdir,
+                env=env,
+                timeout=max(0.001, deadline - time.monotonic()),
+                name=self.log_name
+            )
+            if result['limit'] == 'wall':
+                raise TimeoutError(f"SonarQube 스캐너 실행 시간 초과 ({self.timeout}초, 로그: {result['log']})")
+            if not result['success']:
+                tail = (result['stderr'] or result['stdout']).strip().splitlines()[-5:]
+                raise RuntimeError(
+                    f"SonarQube 스캐너 실패 ({failure_reason(result)}): {' / '.join(tail)} (로그: {result['log']})"
+                )
+
+            report = Path(working) / 'report-task.txt'
+            if not report.exists():
+                raise RuntimeError(f"SonarQube 스캐너가 {report.name} 를 남기지 않았습니다")
+
+            properties: Dict[str, str] = {}
+            for line in report.read_text(encoding='utf-8').splitlines():
+                key, sep, value = line.partition('=')
+                if sep:
+                    properties[key.strip()] = value.strip()
+
+        if not properties.get('ceTaskId'):
+            raise RuntimeError("SonarQube report-task.txt 에 ceTaskId 가 없습니다")
+        return properties
+
+    def wait_for_task(self, task_id: str, deadline: float) -> Dict[str, Any]:
+        """
+        CE 작업 완료 대기 (지수 백오프 조회)
+
+        Args:
+            task_id: CE 작업 ID
+            deadline: time.monotonic() 기준 제한 시각
+
+        Returns:
+            CE 작업 정보 ('status', 'analysisId' ...)
+
+        Raises:
+            TimeoutError: 제한 시각까지 끝나지 않음
+        """
+        interval = self.poll_interval
+        polls = 0
+
+        with span('sonarqube.wait_task', **{'sonarqube.task_id': task_id}):
+            while True:
+                task = self._get('/api/ce/task', {'id': task_id})['task']
+                polls += 1
+                if task['status'] in TASK_DONE:
+                    task['polls'] = polls
+                    return task
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"SonarQube 분석 작업 {task_id} 대기 시간 초과 ({task['status']})")
+                time.sleep(min(interval, remaining))
+                interval = min(interval * 1.5, self.max_poll_interval)
+
+    def quality_gate(self, analysis_id: str) -> Dict[str, Any]:
+        """
+        분석의 품질 게이트 상태
+
+        Args:
+            analysis_id: CE 작업의 analysisId
+
+        Returns:
+            {'status': OK|WARN|ERROR|NONE, 'conditions': [...]}
+        """
+        status = self._get(
+            '/api/qualitygates/project_status',
+            {'analysisId': analysis_id}
+        )['projectStatus']
+        return {'status': status['status'], 'conditions': status.get('conditions', [])}
+
+    def new_issues(self) -> Dict[str, Any]:
+        """
+        신규 코드 기간의 미해결 이슈 (max_issues 까지)
+
+        Returns:
+            {'total': 전체 수, 'issues': [{'file', 'line', 'rule', 'severity', 'type', 'message'}]}
+        """
+        issues: List[Dict[str, Any]] = []
+        total = 0
+        page = 1
+        prefix = f"{self.project_key}:"
+
+        while len(issues) < self.max_issues:
+            data = self._get(
+                '/api/issues/search',
+                {
+                    'componentKeys': self.project_key,
+                    'inNewCodePeriod': 'true',
+                    'resolved': 'false',
+                    'ps': PAGE_SIZE,
+                    'p': page,
+                }
+            )
+            total = data.get('paging', {}).get('total', data.get('total', 0))
+            for issue in data.get('issues', []):
+                component = issue.get('component', '')
+                issues.append({
+                    'file': component[len(prefix):] if component.startswith(prefix) else component,
+                    'line': issue.get('line'),
+                    'rule': issue.get('rule'),
+                    'severity': issue.get('severity'),
+                    'type': issue.get('type'),
+                    'message': issue.get('message'),
+                })
+            if not data.get('issues') or page * PAGE_SIZE >= total:
+                break
+            page += 1
+
+        return {'total': total, 'issues': issues[:self.max_issues]}
+
+    def analyze(self) -> Dict[str, Any]:
+        """
+        분석 제출 → CE 작업 대기 → 품질 게이트/신규 이슈 조회
+
+        Returns:
+            {'task', 'dashboard', 'polls', 'quality_gate', 'conditions', 'new_issues', 'issues', 'duration_seconds'}
+
+        Raises:
+            RuntimeError: 스캐너/API 실패 또는 CE 작업 실패
+            TimeoutError: 제한 시간 초과
+        """
+        started = time.monotonic()
+        deadline = started + self.timeout
+
+        with span('sonarqube.analyze', **{'sonarqube.project': self.project_key}):
+            report = self.submit(deadline)
+            task = self.wait_for_task(report['ceTaskId'], deadline)
+            if task['status'] != 'SUCCESS':
+                raise RuntimeError(
+                    f"SonarQube 분석 작업 {task['id']} {task['status']}: {task.get('errorMessage', '')}".strip()
+                )
+
+            gate = self.quality_gate(task['analysisId'])
+            issues = self.new_issues()
+
+        return {
+            'task': task['id'],
+            'dashboard': report.get('dashboardUrl'),
+            'polls': task['polls'],
+            'quality_gate': gate['status'],
+            'conditions': [
+                condition for condition in gate['conditions'] if condition.get('status') != 'OK'
+            ],
+            'new_issues': issues['total'],
+            'issues': issues['issues'],
+            'duration_seconds': round(time.monotonic() - started, 3),
+        }
+
+    def start(self) -> Future:
+        """
+        백그라운드 스레드에서 analyze() 시작
+
+        Returns:
+            analyze() 결과를 담을 Future
+        """
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sonarqube')
+        # span 이 시작한 쪽 span 아래에 기록되도록 컨텍스트 복사
+        future = executor.submit(contextvars.copy_context().run, self.analyze)
+        executor.shutdown(wait=False)
+        return future
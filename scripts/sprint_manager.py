@@ -5,7 +5,7 @@ Claude Code SubAgent - Sprint Manager
 JIRA Agile API를 사용한 스프린트 관리
 """
 
-import requests
+import http_client
 import base64
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
@@ -17,7 +17,7 @@ class SprintManager:
 
     def __init__(self):
         """Sprint Manager 초기화"""
-        self.config = get_config()
+        self.config = get_config(require=('jira',))
         self.base_url = self.config.jira_url
         self.email = self.config.jira_email
         self.api_token = self.config.jira_api_token
@@ -47,8 +47,10 @@ class SprintManager:
                 "projectKeyOrId": self.project_key
             }
 
-            response = requests.get(
+            response = http_client.get(
                 url,
+                endpoint='/rest/agile/1.0/board',
+                service='jira',
                 headers=self.headers,
                 params=params,
                 timeout=10
@@ -119,8 +121,10 @@ class SprintManager:
             if end_date:
                 payload["endDate"] = end_date
 
-            response = requests.post(
+            response = http_client.post(
                 url,
+                endpoint='/rest/agile/1.0/sprint',
+                service='jira',
                 json=payload,
                 headers=self.headers,
                 timeout=10
@@ -164,8 +168,10 @@ class SprintManager:
             if state:
                 params['state'] = state
 
-            response = requests.get(
+            response = http_client.get(
                 url,
+                endpoint='/rest/agile/1.0/board/{boardId}/sprint',
+                service='jira',
                 headers=self.headers,
                 params=params,
                 timeout=10
@@ -204,8 +210,10 @@ class SprintManager:
                 "issues": issue_keys
             }
 
-            response = requests.post(
+            response = http_client.post(
                 url,
+                endpoint='/rest/agile/1.0/sprint/{sprintId}/issue',
+                service='jira',
                 json=payload,
                 headers=self.headers,
                 timeout=10
@@ -257,8 +265,10 @@ class SprintManager:
                 "endDate": end_date
             }
 
-            response = requests.post(
+            response = http_client.post(
                 url,
+                endpoint='/rest/agile/1.0/sprint/{sprintId}',
+                service='jira',
                 json=payload,
                 headers=self.headers,
                 timeout=10
@@ -293,8 +303,10 @@ class SprintManager:
                 "state": "closed"
             }
 
-            response = requests.post(
+            response = http_client.post(
                 url,
+                endpoint='/rest/agile/1.0/sprint/{sprintId}',
+                service='jira',
                 json=payload,
                 headers=self.headers,
                 timeout=10
@@ -331,8 +343,10 @@ class SprintManager:
         try:
             # 먼저 현재 스프린트 정보 조회
             get_url = f"{self.base_url}/rest/agile/1.0/sprint/{sprint_id}"
-            get_response = requests.get(
+            get_response = http_client.get(
                 get_url,
+                endpoint='/rest/agile/1.0/sprint/{sprintId}',
+                service='jira',
                 headers=self.headers,
                 timeout=10
             )
@@ -356,8 +370,10 @@ class SprintManager:
             if goal:
                 payload["goal"] = goal
 
-            response = requests.put(
+            response = http_client.put(
                 url,
+                endpoint='/rest/agile/1.0/sprint/{sprintId}',
+                service='jira',
                 json=payload,
                 headers=self.headers,
                 timeout=10
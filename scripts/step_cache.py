@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Claude Code SubAgent - Step Cache
+
+입력 해시 기반(content-addressed) 워크플로우 단계 캐시
+
+단계가 선언한 입력(티켓 필드, Git 작업 트리 해시, 설정 값)을 정규화된 JSON으로
+직렬화해 SHA-256 키를 만들고, 성공한 단계의 출력을 그 키로 저장합니다.
+같은 입력으로 다시 실행하면 --restart 나 새 실행이라도 저장된 출력을 즉시 재사용합니다.
+
+저장 구조:
+    <cache_dir>/<key[:2]>/<key>.json   {"step", "key", "inputs", "outputs", "created_at"}
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from tracing import traced_run
+
+
+def input_key(step_name: str, inputs: Dict[str, Any]) -> str:
+    """
+    단계 입력의 캐시 키 계산
+
+    Args:
+        step_name: 단계 이름
+        inputs: 단계 입력 (JSON 직렬화 가능해야 함)
+
+    Returns:
+        SHA-256 hex digest
+    """
+    canonical = json.dumps(
+        {'step': step_name, 'inputs': inputs},
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(',', ':'),
+        default=str
+    )
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def git_tree_hash(repo_path: Path, exclude: Iterable[Path] = ()) -> Optional[str]:
+    """
+    작업 디렉토리(미커밋/미추적 변경 포함)의 Git tree 해시
+
+    실제 인덱스를 건드리지 않도록 인덱스 사본에 `git add -A` 후 `git write-tree` 를 실행합니다.
+    인덱스 사본의 stat 캐시 덕분에 변경되지 않은 파일은 다시 읽지 않습니다.
+
+    Args:
+        repo_path: Git 저장소 경로
+        exclude: 해시에서 제외할 경로 (체크포인트/캐시 디렉토리 등 실행 중 바뀌는 파일)
+
+    Returns:
+        tree 해시 (Git 저장소가 아니면 None)
+    """
+    result = traced_run(
+        ['git', 'rev-parse', '--git-path', 'index'],
+        cwd=repo_path,
+        capture_output=True,
+        text=True,
+        check=False
+    )
+    if result.returncode != 0:
+        return None
+
+    index_path = Path(repo_path) / result.stdout.strip()
+
+    with tempfile.TemporaryDirectory(prefix='tkm-index-') as tmp:
+        temp_index = Path(tmp) / 'index'
+        if index_path.exists():
+            shutil.copyfile(index_path, temp_index)
+
+        env = dict(os.environ, GIT_INDEX_FILE=str(temp_index))
+        excluded = []
+        for path in exclude:
+            try:
+                excluded.append(str(Path(path).resolve().relative_to(Path(repo_path).resolve())))
+            except ValueError:
+                continue
+
+        # .gitignore 로 이미 제외된 경로를 pathspec 에 넣으면 `git add` 가 실패하므로 빼고 넘김
+        if excluded:
+            ignored = traced_run(
+                ['git', 'check-ignore', '--stdin', '-z'],
+                cwd=repo_path,
+                input='\0'.join(excluded) + '\0',
+                capture_output=True,
+                text=True,
+                check=False
+            )
+            excluded = [path for path in excluded if path not in set(ignored.stdout.split('\0'))]
+        pathspec = ['.'] + [f":(exclude){path}" for path in excluded]
+
+        added = traced_run(
+            ['git', 'add', '-A', '--', *pathspec],
+            cwd=repo_path,
+            env=env,
+            capture_output=True,
+            check=False
+        )
+        if added.returncode != 0:
+            return None
+
+        tree = traced_run(
+            ['git', 'write-tree'],
+            cwd=repo_path,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=False
+        )
+        return tree.stdout.strip() if tree.returncode == 0 else None
+
+
+class StepCache:
+    """content-addressed 단계 출력 저장소"""
+
+    def __init__(self, cache_dir: str):
+        """
+        Step Cache 초기화
+
+        Args:
+            cache_dir: 캐시 디렉토리
+        """
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시 항목 조회
+
+        Args:
+            key: input_key() 결과
+
+        Returns:
+            저장된 항목 또는 None
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"⚠️  단계 캐시 읽기 실패 ({path}): {e}")
+            return None
+
+    def put(
+        self,
+        key: str,
+        step_name: str,
+        inputs: Dict[str, Any],
+        outputs: Optional[Dict[str, Any]]
+    ) -> None:
+        """
+        캐시 항목 저장 (임시 파일 → rename 으로 원자적 기록)
+
+        Args:
+            key: input_key() 결과
+            step_name: 단계 이름
+            inputs: 단계 입력 (디버깅용으로 함께 저장)
+            outputs: 단계 출력
+        """
+        path = self._path(key)
+        entry = {
+            'step': step_name,
+            'key': key,
+            'inputs': inputs,
+            'outputs': outputs,
+            'created_at': datetime.now().isoformat(),
+        }
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False, default=str)
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"⚠️  단계 캐시 저장 실패 ({path}): {e}")
@@ -0,0 +1,784 @@
+#!/usr/bin/env python3
+"""
+Claude Code SubAgent - Stub Server
+
+JIRA/Slack/GitHub/SonarQube API를 흉내 내는 인메모리 로컬 서버 (벤치마크/CI 오프라인 실행용)
+
+지원 엔드포인트:
+    JIRA   /rest/api/{2,3}/issue, issue/{key}, issue/{key}/transitions, issue/{key}/comment,
+           /rest/api/{2,3}/search, /rest/api/{2,3}/project/{key}
+    Agile  /rest/agile/1.0/board, board/{id}/sprint, board/{id}/backlog,
+           /rest/agile/1.0/sprint, sprint/{id}, sprint/{id}/issue
+    Slack  /slack/webhook
+    GitHub /repos/{owner}/{repo}/pulls
+    Sonar  /api/ce/submit, /api/ce/task, /api/qualitygates/project_status, /api/issues/search
+    관리   /_stub/stats, /_stub/reset, /_stub/faults, /_stub/sonar
+
+장애 주입:
+    latency_ms / jitter_ms   모든 응답 지연
+    rate_limit_rps           초당 허용 요청 수 초과 시 429 + Retry-After
+    throttle_rate            무작위 429 비율 (0~1)
+    error_rate               무작위 503 비율 (0~1)
+
+사용법:
+    python scripts/stub_server.py --port 8765 --latency-ms 50 --rate-limit-rps 20
+    eval "$(python scripts/stub_server.py --print-env --port 8765)"   # 환경변수만 출력
+"""
+
+import re
+import json
+import time
+import random
+import argparse
+import threading
+from collections import Counter
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+DEFAULT_PROJECT_KEY = 'STUB'
+DEFAULT_BOARD_ID = 1
+
+# 허용되는 전환: 상태명 → 전환 ID
+TRANSITIONS = {
+    '해야 할 일': '11',
+    '진행 중': '21',
+    '완료': '31',
+    '재작업': '41',
+}
+
+
+class StubFaults:
+    """장애 주입 설정"""
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        rate_limit_rps: float = 0.0,
+        throttle_rate: float = 0.0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit_rps = rate_limit_rps
+        self.throttle_rate = throttle_rate
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+
+    def update(self, values: Dict[str, Any]) -> None:
+        for key in ('latency_ms', 'jitter_ms', 'rate_limit_rps', 'throttle_rate', 'error_rate'):
+            if key in values:
+                setattr(self, key, float(values[key]))
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            'latency_ms': self.latency_ms,
+            'jitter_ms': self.jitter_ms,
+            'rate_limit_rps': self.rate_limit_rps,
+            'throttle_rate': self.throttle_rate,
+            'error_rate': self.error_rate,
+        }
+
+
+class StubState:
+    """인메모리 JIRA/GitHub/SonarQube 상태"""
+
+    def __init__(self, project_key: str = DEFAULT_PROJECT_KEY):
+        self.project_key = project_key
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self.lock:
+            self.issues: Dict[str, Dict[str, Any]] = {}
+            self.comments: Dict[str, List[Dict[str, Any]]] = {}
+            self.sprints: Dict[int, Dict[str, Any]] = {}
+            self.sprint_issues: Dict[int, List[str]] = {}
+            self.pulls: Dict[str, List[Dict[str, Any]]] = {}
+            self.slack_messages: List[Dict[str, Any]] = []
+            # SonarQube: CE 작업은 제출 후 sonar_task_seconds 가 지나면 SUCCESS
+            self.sonar_tasks: Dict[str, Dict[str, Any]] = {}
+            self.sonar_task_seconds = 2.0
+            self.sonar_gate = 'OK'
+            self.sonar_conditions: List[Dict[str, Any]] = []
+            self.sonar_issues: List[Dict[str, Any]] = []
+            self.requests: Counter = Counter()
+            self.statuses: Counter = Counter()
+            self._next_issue = 1
+            self._next_sprint = 1
+            self._window_start = time.monotonic()
+            self._window_count = 0
+
+    # ---------------------------------------------------------------
+    # 이슈
+    # ---------------------------------------------------------------
+    def create_issue(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        with self.lock:
+            project = (fields.get('project') or {}).get('key') or self.project_key
+            number = self._next_issue
+            self._next_issue += 1
+
+        key = f"{project}-{number}"
+        now = datetime.now().isoformat()
+        issue = {
+            'id': str(10000 + number),
+            'key': key,
+            'self': f"/rest/api/3/issue/{key}",
+            'fields': {
+                'summary': fields.get('summary', ''),
+                'description': fields.get('description'),
+                'issuetype': fields.get('issuetype') or {'name': 'Task'},
+                'project': {'key': project},
+                'priority': fields.get('priority') or {'name': 'Medium'},
+                'labels': fields.get('labels', []),
+                'status': {'name': '해야 할 일'},
+                'assignee': None,
+                'created': now,
+                'updated': now,
+            },
+        }
+        for extra in ('parent', 'customfield_10014', 'customfield_10016'):
+            if extra in fields:
+                issue['fields'][extra] = fields[extra]
+
+        with self.lock:
+            self.issues[key] = issue
+        return issue
+
+    def seed_issues(self, count: int, labels: Optional[List[str]] = None) -> List[str]:
+        """벤치마크용 이슈 일괄 생성"""
+        keys = []
+        for i in range(count):
+            issue = self.create_issue({
+                'summary': f"Synthetic ticket {i + 1}",
+                'description': f"Generated by stub server ({i + 1}/{count})",
+                'labels': labels or ['backend', 'api'],
+            })
+            keys.append(issue['key'])
+        return keys
+
+    def in_sprint(self, key: str) -> bool:
+        return any(key in keys for keys in self.sprint_issues.values())
+
+    def search(self, jql: str, max_results: int) -> List[Dict[str, Any]]:
+        """
+        최소한의 JQL 해석: `key in (A, B)`, `key = A`, `project = X`, `sprint = N`
+        그 외 조건은 무시하고 생성 순서의 역순으로 반환합니다.
+        """
+        with self.lock:
+            issues = list(self.issues.values())
+
+        match = re.search(r'key\s+in\s*\(([^)]*)\)', jql, re.IGNORECASE)
+        if match:
+            keys = {k.strip().strip('"\'') for k in match.group(1).split(',')}
+            issues = [i for i in issues if i['key'] in keys]
+
+        match = re.search(r'key\s*=\s*"?([\w-]+)"?', jql, re.IGNORECASE)
+        if match:
+            issues = [i for i in issues if i['key'] == match.group(1)]
+
+        match = re.search(r'project\s*=\s*"?(\w+)"?', jql, re.IGNORECASE)
+        if match:
+            issues = [i for i in issues if i['fields']['project']['key'] == match.group(1)]
+
+        match = re.search(r'sprint\s*=\s*(\d+)', jql, re.IGNORECASE)
+        if match:
+            keys = set(self.sprint_issues.get(int(match.group(1)), []))
+            issues = [i for i in issues if i['key'] in keys]
+
+        return list(reversed(issues))[:max_results]
+
+    # ---------------------------------------------------------------
+    # 스프린트
+    # ---------------------------------------------------------------
+    def create_sprint(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        with self.lock:
+            sprint_id = self._next_sprint
+            self._next_sprint += 1
+            sprint = {
+                'id': sprint_id,
+                'name': payload.get('name', f"Sprint {sprint_id}"),
+                'state': 'future',
+                'goal': payload.get('goal', ''),
+                'originBoardId': payload.get('originBoardId', DEFAULT_BOARD_ID),
+                'startDate': payload.get('startDate'),
+                'endDate': payload.get('endDate'),
+            }
+            self.sprints[sprint_id] = sprint
+            self.sprint_issues[sprint_id] = []
+        return sprint
+
+    # ---------------------------------------------------------------
+    # SonarQube
+    # ---------------------------------------------------------------
+    def submit_sonar_task(self, project_key: str) -> Dict[str, Any]:
+        with self.lock:
+            task_id = f"AX{len(self.sonar_tasks) + 1:06d}"
+            self.sonar_tasks[task_id] = {
+                'id': task_id,
+                'componentKey': project_key,
+                'submitted': time.monotonic(),
+            }
+        return {'taskId': task_id, 'projectId': project_key}
+
+    def sonar_task(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """제출 후 경과 시간에 따라 PENDING → IN_PROGRESS → SUCCESS"""
+        with self.lock:
+            task = self.sonar_tasks.get(task_id)
+            if task is None:
+                return None
+            elapsed = time.monotonic() - task['submitted']
+            if elapsed >= self.sonar_task_seconds:
+                status = 'SUCCESS'
+            elif elapsed >= self.sonar_task_seconds / 2:
+                status = 'IN_PROGRESS'
+            else:
+                status = 'PENDING'
+
+        result = {'id': task_id, 'type': 'REPORT', 'componentKey': task['componentKey'], 'status': status}
+        if status == 'SUCCESS':
+            result['analysisId'] = f"{task_id}-analysis"
+        return result
+
+    # ---------------------------------------------------------------
+    # 장애 주입용 요청 집계
+    # ---------------------------------------------------------------
+    def over_rate_limit(self, rps: float) -> bool:
+        """1초 고정 윈도우 기준 rate limit 초과 여부"""
+        if rps <= 0:
+            return False
+
+        with self.lock:
+            now = time.monotonic()
+            if now - self._window_start >= 1.0:
+                self._window_start = now
+                self._window_count = 0
+            self._window_count += 1
+            return self._window_count > rps
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """라우팅 및 장애 주입을 수행하는 요청 핸들러"""
+
+    server_version = 'tkm-stub/1.0'
+    protocol_version = 'HTTP/1.1'
+
+    # (메서드, 경로 정규식, 핸들러 메서드 이름, 메트릭용 엔드포인트 템플릿)
+    ROUTES: List[Tuple[str, str, str, Optional[str]]] = [
+        ('GET', r'/rest/api/[23]/issue/(?P<key>[\w-]+)', 'get_issue', '/issue/{key}'),
+        ('PUT', r'/rest/api/[23]/issue/(?P<key>[\w-]+)', 'update_issue', '/issue/{key}'),
+        ('POST', r'/rest/api/[23]/issue', 'create_issue', '/issue'),
+        ('GET', r'/rest/api/[23]/issue/(?P<key>[\w-]+)/transitions', 'get_transitions', '/issue/{key}/transitions'),
+        ('POST', r'/rest/api/[23]/issue/(?P<key>[\w-]+)/transitions', 'do_transition', '/issue/{key}/transitions'),
+        ('POST', r'/rest/api/[23]/issue/(?P<key>[\w-]+)/comment', 'add_comment', '/issue/{key}/comment'),
+        ('GET', r'/rest/api/[23]/search', 'search', '/search'),
+        ('POST', r'/rest/api/[23]/search', 'search', '/search'),
+        ('GET', r'/rest/api/[23]/project/(?P<key>\w+)', 'get_project', '/project/{key}'),
+        ('GET', r'/rest/agile/1\.0/board', 'get_boards', '/board'),
+        ('GET', r'/rest/agile/1\.0/board/(?P<board>\d+)/sprint', 'get_board_sprints', '/board/{id}/sprint'),
+        ('GET', r'/rest/agile/1\.0/board/(?P<board>\d+)/backlog', 'get_backlog', '/board/{id}/backlog'),
+        ('POST', r'/rest/agile/1\.0/sprint', 'create_sprint', '/sprint'),
+        ('GET', r'/rest/agile/1\.0/sprint/(?P<sprint>\d+)', 'get_sprint', '/sprint/{id}'),
+        ('POST', r'/rest/agile/1\.0/sprint/(?P<sprint>\d+)', 'update_sprint', '/sprint/{id}'),
+        ('PUT', r'/rest/agile/1\.0/sprint/(?P<sprint>\d+)', 'update_sprint', '/sprint/{id}'),
+        ('GET', r'/rest/agile/1\.0/sprint/(?P<sprint>\d+)/issue', 'get_sprint_issues', '/sprint/{id}/issue'),
+        ('POST', r'/rest/agile/1\.0/sprint/(?P<sprint>\d+)/issue', 'add_sprint_issues', '/sprint/{id}/issue'),
+        ('POST', r'/slack/webhook', 'slack_webhook', '/slack/webhook'),
+        ('GET', r'/repos/(?P<repo>[\w.-]+/[\w.-]+)/pulls', 'list_pulls', '/repos/{repo}/pulls'),
+        ('POST', r'/repos/(?P<repo>[\w.-]+/[\w.-]+)/pulls', 'create_pull', '/repos/{repo}/pulls'),
+        ('POST', r'/api/ce/submit', 'sonar_submit', '/api/ce/submit'),
+        ('GET', r'/api/ce/task', 'sonar_get_task', '/api/ce/task'),
+        ('GET', r'/api/qualitygates/project_status', 'sonar_gate_status', '/api/qualitygates/project_status'),
+        ('GET', r'/api/issues/search', 'sonar_issues', '/api/issues/search'),
+        ('GET', r'/_stub/stats', 'stub_stats', None),
+        ('POST', r'/_stub/reset', 'stub_reset', None),
+        ('POST', r'/_stub/faults', 'stub_faults', None),
+        ('POST', r'/_stub/sonar', 'stub_sonar', None),
+    ]
+
+    _compiled = [(m, re.compile(p + r'/?$'), h, e) for m, p, h, e in ROUTES]
+
+    @property
+    def state(self) -> StubState:
+        return self.server.state
+
+    @property
+    def faults(self) -> StubFaults:
+        return self.server.faults
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    # ---------------------------------------------------------------
+    # 요청 처리
+    # ---------------------------------------------------------------
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_PUT(self):
+        self._dispatch('PUT')
+
+    def _dispatch(self, method: str) -> None:
+        parsed = urlparse(self.path)
+        self.query = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+        self.body = self._read_body()
+
+        for route_method, pattern, handler_name, endpoint in self._compiled:
+            if route_method != method:
+                continue
+            match = pattern.match(parsed.path)
+            if not match:
+                continue
+
+            if endpoint is not None:
+                with self.state.lock:
+                    self.state.requests[f"{method} {endpoint}"] += 1
+                if self._inject_faults():
+                    return
+
+            handler: Callable[..., None] = getattr(self, handler_name)
+            handler(**match.groupdict())
+            return
+
+        self._send(404, {'errorMessages': [f"No stub route for {method} {parsed.path}"]})
+
+    def _read_body(self) -> Any:
+        length = int(self.headers.get('Content-Length') or 0)
+        if not length:
+            return None
+        raw = self.rfile.read(length)
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return raw.decode('utf-8', errors='replace')
+
+    def _inject_faults(self) -> bool:
+        """지연/429/503 주입 (응답을 보냈으면 True)"""
+        faults = self.faults
+        delay = faults.latency_ms
+        if faults.jitter_ms:
+            delay += faults.random.uniform(0, faults.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+
+        if self.state.over_rate_limit(faults.rate_limit_rps) or (
+            faults.throttle_rate and faults.random.random() < faults.throttle_rate
+        ):
+            self._send(429, {'errorMessages': ['Rate limit exceeded']}, headers={'Retry-After': '1'})
+            return True
+
+        if faults.error_rate and faults.random.random() < faults.error_rate:
+            self._send(503, {'errorMessages': ['Injected failure']})
+            return True
+
+        return False
+
+    def _send(
+        self,
+        status: int,
+        payload: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        content_type: str = 'application/json'
+    ) -> None:
+        if payload is None:
+            body = b''
+        elif isinstance(payload, (bytes, str)):
+            body = payload.encode('utf-8') if isinstance(payload, str) else payload
+        else:
+            body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+        with self.state.lock:
+            self.state.statuses[status] += 1
+
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def _issue_or_404(self, key: str) -> Optional[Dict[str, Any]]:
+        issue = self.state.issues.get(key)
+        if issue is None:
+            self._send(404, {'errorMessages': ['Issue does not exist or you do not have permission to see it.']})
+        return issue
+
+    # ---------------------------------------------------------------
+    # JIRA REST
+    # ---------------------------------------------------------------
+    def get_issue(self, key: str) -> None:
+        issue = self._issue_or_404(key)
+        if issue is not None:
+            self._send(200, issue)
+
+    def update_issue(self, key: str) -> None:
+        issue = self._issue_or_404(key)
+        if issue is None:
+            return
+        with self.state.lock:
+            issue['fields'].update((self.body or {}).get('fields', {}))
+            issue['fields']['updated'] = datetime.now().isoformat()
+        self._send(204)
+
+    def create_issue(self) -> None:
+        fields = (self.body or {}).get('fields')
+        if not fields or not fields.get('summary'):
+            self._send(400, {'errors': {'summary': 'You must specify a summary of the issue.'}})
+            return
+        issue = self.state.create_issue(fields)
+        self._send(201, {'id': issue['id'], 'key': issue['key'], 'self': issue['self']})
+
+    def get_transitions(self, key: str) -> None:
+        if self._issue_or_404(key) is None:
+            return
+        transitions = [
+            {'id': tid, 'name': name, 'to': {'name': name}}
+            for name, tid in TRANSITIONS.items()
+        ]
+        self._send(200, {'transitions': transitions})
+
+    def do_transition(self, key: str) -> None:
+        issue = self._issue_or_404(key)
+        if issue is None:
+            return
+        transition_id = ((self.body or {}).get('transition') or {}).get('id')
+        names = {tid: name for name, tid in TRANSITIONS.items()}
+        if transition_id not in names:
+            self._send(400, {'errorMessages': [f"Transition id '{transition_id}' is not valid"]})
+            return
+        with self.state.lock:
+            issue['fields']['status'] = {'name': names[transition_id]}
+        self._send(204)
+
+    def add_comment(self, key: str) -> None:
+        if self._issue_or_404(key) is None:
+            return
+        with self.state.lock:
+            comments = self.state.comments.setdefault(key, [])
+            comment = {'id': str(len(comments) + 1), 'body': (self.body or {}).get('body')}
+            comments.append(comment)
+        self._send(201, comment)
+
+    def search(self) -> None:
+        params = self.body if isinstance(self.body, dict) else self.query
+        jql = params.get('jql', '')
+        max_results = int(params.get('maxResults', 50))
+        issues = self.state.search(jql, max_results)
+        self._send(200, {'startAt': 0, 'maxResults': max_results, 'total': len(issues), 'issues': issues})
+
+    def get_project(self, key: str) -> None:
+        self._send(200, {'id': '10000', 'key': key, 'name': f"{key} (stub)"})
+
+    # ---------------------------------------------------------------
+    # JIRA Agile
+    # ---------------------------------------------------------------
+    def get_boards(self) -> None:
+        self._send(200, {'values': [{
+            'id': DEFAULT_BOARD_ID,
+            'name': f"{self.state.project_key} board",
+            'type': 'scrum',
+        }]})
+
+    def get_board_sprints(self, board: str) -> None:
+        state_filter = self.query.get('state')
+        sprints = [
+            s for s in self.state.sprints.values()
+            if not state_filter or s['state'] in state_filter.split(',')
+        ]
+        self._send(200, {'values': sprints})
+
+    def get_backlog(self, board: str) -> None:
+        max_results = int(self.query.get('maxResults', 50))
+        with self.state.lock:
+            issues = [i for i in self.state.issues.values() if not self.state.in_sprint(i['key'])]
+        self._send(200, {'startAt': 0, 'total': len(issues), 'issues': issues[:max_results]})
+
+    def create_sprint(self) -> None:
+        sprint = self.state.create_sprint(self.body or {})
+        self._send(201, sprint)
+
+    def get_sprint(self, sprint: str) -> None:
+        found = self.state.sprints.get(int(sprint))
+        if found is None:
+            self._send(404, {'errorMessages': ['Sprint does not exist']})
+            return
+        self._send(200, found)
+
+    def update_sprint(self, sprint: str) -> None:
+        found = self.state.sprints.get(int(sprint))
+        if found is None:
+            self._send(404, {'errorMessages': ['Sprint does not exist']})
+            return
+        with self.state.lock:
+            for field in ('name', 'goal', 'state', 'startDate', 'endDate'):
+                if field in (self.body or {}):
+                    found[field] = self.body[field]
+        self._send(200, found)
+
+    def get_sprint_issues(self, sprint: str) -> None:
+        keys = self.state.sprint_issues.get(int(sprint), [])
+        issues = [self.state.issues[k] for k in keys if k in self.state.issues]
+        self._send(200, {'startAt': 0, 'total': len(issues), 'issues': issues})
+
+    def add_sprint_issues(self, sprint: str) -> None:
+        sprint_id = int(sprint)
+        if sprint_id not in self.state.sprints:
+            self._send(404, {'errorMessages': ['Sprint does not exist']})
+            return
+        with self.state.lock:
+            for key in (self.body or {}).get('issues', []):
+                for keys in self.state.sprint_issues.values():
+                    if key in keys:
+                        keys.remove(key)
+                self.state.sprint_issues[sprint_id].append(key)
+        self._send(204)
+
+    # ---------------------------------------------------------------
+    # Slack / GitHub
+    # ---------------------------------------------------------------
+    def slack_webhook(self) -> None:
+        with self.state.lock:
+            self.state.slack_messages.append(self.body)
+        self._send(200, 'ok', content_type='text/plain')
+
+    def list_pulls(self, repo: str) -> None:
+        self._send(200, self.state.pulls.get(repo, []))
+
+    def create_pull(self, repo: str) -> None:
+        body = self.body or {}
+        if not body.get('title') or not body.get('head') or not body.get('base'):
+            self._send(422, {'message': 'Validation Failed'})
+            return
+        with self.state.lock:
+            pulls = self.state.pulls.setdefault(repo, [])
+            number = len(pulls) + 1
+            pull = {
+                'number': number,
+                'title': body['title'],
+                'body': body.get('body', ''),
+                'head': {'ref': body['head']},
+                'base': {'ref': body['base']},
+                'draft': bool(body.get('draft')),
+                'html_url': f"https://github.com/{repo}/pull/{number}",
+                'state': 'open',
+            }
+            pulls.append(pull)
+        self._send(201, pull)
+
+    # ---------------------------------------------------------------
+    # SonarQube
+    # ---------------------------------------------------------------
+    def sonar_submit(self) -> None:
+        project_key = self.query.get('projectKey')
+        if not project_key:
+            self._send(400, {'errors': [{'msg': "The 'projectKey' parameter is missing"}]})
+            return
+        self._send(200, {'task': self.state.submit_sonar_task(project_key)})
+
+    def sonar_get_task(self) -> None:
+        task = self.state.sonar_task(self.query.get('id', ''))
+        if task is None:
+            self._send(404, {'errors': [{'msg': 'No activity found'}]})
+            return
+        self._send(200, {'task': task})
+
+    def sonar_gate_status(self) -> None:
+        with self.state.lock:
+            status = {'status': self.state.sonar_gate, 'conditions': list(self.state.sonar_conditions)}
+        self._send(200, {'projectStatus': status})
+
+    def sonar_issues(self) -> None:
+        page_size = int(self.query.get('ps', 100))
+        page = int(self.query.get('p', 1))
+        prefix = f"{self.query.get('componentKeys', '')}:"
+        with self.state.lock:
+            issues = [dict(issue, component=prefix + issue.get('component', '')) for issue in self.state.sonar_issues]
+        self._send(200, {
+            'paging': {'pageIndex': page, 'pageSize': page_size, 'total': len(issues)},
+            'issues': issues[(page - 1) * page_size:page * page_size],
+        })
+
+    # ---------------------------------------------------------------
+    # 관리용
+    # ---------------------------------------------------------------
+    def stub_stats(self) -> None:
+        with self.state.lock:
+            stats = {
+                'requests': dict(self.state.requests),
+                'statuses': {str(k): v for k, v in self.state.statuses.items()},
+                'issues': len(self.state.issues),
+                'sprints': len(self.state.sprints),
+                'slack_messages': len(self.state.slack_messages),
+                'pulls': sum(len(p) for p in self.state.pulls.values()),
+                'sonar_tasks': len(self.state.sonar_tasks),
+                'faults': self.faults.to_dict(),
+            }
+        self._send(200, stats)
+
+    def stub_reset(self) -> None:
+        self.state.reset()
+        self._send(204)
+
+    def stub_faults(self) -> None:
+        self.faults.update(self.body or {})
+        self._send(200, self.faults.to_dict())
+
+    def stub_sonar(self) -> None:
+        """SonarQube 응답 설정: {'task_seconds', 'gate', 'conditions', 'issues': [{'component', 'line', ...}]}"""
+        body = self.body or {}
+        with self.state.lock:
+            self.state.sonar_task_seconds = float(body.get('task_seconds', self.state.sonar_task_seconds))
+            self.state.sonar_gate = body.get('gate', self.state.sonar_gate)
+            self.state.sonar_conditions = body.get('conditions', self.state.sonar_conditions)
+            self.state.sonar_issues = body.get('issues', self.state.sonar_issues)
+        self._send(204)
+
+
+def stub_env(url: str, project_key: str = DEFAULT_PROJECT_KEY, repository: str = 'stub/repo') -> Dict[str, str]:
+    """
+    스크립트가 스텁 서버를 바라보도록 하는 환경변수
+
+    Args:
+        url: 스텁 서버 주소 (예: http://127.0.0.1:8765)
+        project_key: JIRA 프로젝트 키
+        repository: GitHub 저장소 (owner/repo)
+
+    Returns:
+        JIRA/Slack/GitHub/SonarQube 접속 환경변수
+    """
+    return {
+        'JIRA_URL': url,
+        'JIRA_EMAIL': 'stub@example.com',
+        'JIRA_API_TOKEN': 'stub-token',
+        'JIRA_PROJECT_KEY': project_key,
+        'SLACK_WEBHOOK_URL': f"{url}/slack/webhook",
+        'GITHUB_API_URL': url,
+        'GITHUB_REPOSITORY': repository,
+        'GITHUB_PERSONAL_ACCESS_TOKEN': 'stub-token',
+        'SONARQUBE_URL': url,
+        'SONARQUBE_TOKEN': 'stub-token',
+    }
+
+
+class StubServer:
+    """백그라운드 스레드에서 실행되는 스텁 서버"""
+
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        faults: Optional[StubFaults] = None,
+        project_key: str = DEFAULT_PROJECT_KEY,
+        verbose: bool = False
+    ):
+        """
+        Stub Server 초기화
+
+        Args:
+            host: 바인드 주소
+            port: 포트 (0이면 임의의 빈 포트)
+            faults: 장애 주입 설정
+            project_key: 기본 JIRA 프로젝트 키
+            verbose: 요청 로그 출력 여부
+        """
+        self.httpd = ThreadingHTTPServer((host, port), StubRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.state = StubState(project_key)
+        self.httpd.faults = faults or StubFaults()
+        self.httpd.verbose = verbose
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def state(self) -> StubState:
+        return self.httpd.state
+
+    @property
+    def faults(self) -> StubFaults:
+        return self.httpd.faults
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def env(self, repository: str = 'stub/repo') -> Dict[str, str]:
+        """스크립트가 스텁 서버를 바라보도록 하는 환경변수"""
+        return stub_env(self.url, self.state.project_key, repository)
+
+    def start(self) -> 'StubServer':
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='stub-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> 'StubServer':
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+def main():
+    """스텁 서버 실행"""
+    parser = argparse.ArgumentParser(description="JIRA/Slack/GitHub 로컬 스텁 서버")
+    parser.add_argument('--host', default='127.0.0.1', help='바인드 주소')
+    parser.add_argument('--port', type=int, default=8765, help='포트')
+    parser.add_argument('--project-key', default=DEFAULT_PROJECT_KEY, help='JIRA 프로젝트 키')
+    parser.add_argument('--seed-issues', type=int, default=0, help='시작 시 생성할 이슈 수')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='응답 지연 (ms)')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='추가 무작위 지연 상한 (ms)')
+    parser.add_argument('--rate-limit-rps', type=float, default=0.0, help='초당 허용 요청 수 (0=무제한)')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='무작위 429 비율 (0~1)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='무작위 503 비율 (0~1)')
+    parser.add_argument('--sonar-task-seconds', type=float, default=2.0, help='SonarQube 분석 작업 처리 시간 (초)')
+    parser.add_argument('--seed', type=int, default=None, help='난수 시드')
+    parser.add_argument('--print-env', action='store_true', help='환경변수 export 문만 출력하고 종료')
+    parser.add_argument('--verbose', action='store_true', help='요청 로그 출력')
+    args = parser.parse_args()
+
+    if args.print_env:
+        for key, value in stub_env(f"http://{args.host}:{args.port}", args.project_key).items():
+            print(f"export {key}='{value}'")
+        return
+
+    faults = StubFaults(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit_rps=args.rate_limit_rps,
+        throttle_rate=args.throttle_rate,
+        error_rate=args.error_rate,
+        seed=args.seed
+    )
+    server = StubServer(args.host, args.port, faults, args.project_key, args.verbose)
+    if args.seed_issues:
+        server.state.seed_issues(args.seed_issues)
+    server.state.sonar_task_seconds = args.sonar_task_seconds
+
+    print(f"🧪 스텁 서버 시작: {server.url}")
+    print(f"   장애 주입: {faults.to_dict()}")
+    print(f"   환경변수: eval \"$(python {__file__} --print-env --port {args.port})\"")
+
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("\n스텁 서버 종료")
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""
+Claude Code SubAgent - Suite Runner
+
+테스트 스위트 병렬 실행/샤딩 엔진
+
+스위트(unit/integration/api)마다 실행 명령 템플릿을 설정하면 테스트 파일을 찾아
+샤드로 나누고, 샤드별 러너 프로세스를 CPU 코어 수만큼 동시에 실행한 뒤
+JUnit XML 결과를 테스트 단위로 병합합니다. 여러 스위트가 같은 SuiteRunner를 공유하면
+전체 러너 프로세스 수와 타임아웃(TEST_TIMEOUT)도 함께 제한됩니다.
+
+명령 템플릿 자리표시자:
+    {tests}   이 샤드에 배정된 테스트 파일 목록 (각각 별도 인자로 확장)
+    {junit}   JUnit XML 결과 파일 경로
+    {shard}   샤드 번호 (0부터)
+    {shards}  전체 샤드 수
+    {coverage} coverage.py 데이터 파일 경로 (COVERAGE_FILE 환경변수로도 전달)
+    {deselect} 제외할 테스트 ID 목록 (QA_DESELECT_FORMAT 형식, 기본 --deselect={id})
+
+    QA_UNIT_TEST_CMD="pytest -q {tests} --junitxml={junit} --cov --cov-context=test"
+
+{tests} 가 없는 명령은 샤딩하지 않고 한 번만 실행합니다.
+샤드 번호는 TEST_SHARD_INDEX/TEST_SHARD_TOTAL 환경변수로도 전달됩니다.
+테스트별 컨텍스트가 담긴 coverage 데이터는 테스트 영향 맵(impact_map.py) 갱신에 쓰입니다.
+"""
+
+import os
+import json
+import time
+import shlex
+import contextvars
+import fnmatch
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from xml.etree.ElementTree import ParseError
+from typing import Any, Dict, List, Optional
+
+from report_parser import iter_junit
+from sandbox import ProcessSandbox
+
+# 테스트 상태
+TEST_PASSED = "passed"
+TEST_FAILED = "failed"
+TEST_SKIPPED = "skipped"
+
+# 이력이 없는 테스트 파일의 예상 실행 시간 (초)
+DEFAULT_FILE_DURATION = 1.0
+
+
+def discover_tests(root: Path, paths: List[str], patterns: List[str]) -> List[str]:
+    """
+    테스트 파일 탐색
+
+    Args:
+        root: 작업 디렉토리
+        paths: 테스트 디렉토리/파일 (root 기준 상대 경로)
+        patterns: 테스트 파일명 패턴 (예: test_*.py)
+
+    Returns:
+        root 기준 상대 경로 목록 (정렬됨)
+    """
+    found = set()
+
+    for entry in paths:
+        base = Path(root) / entry
+        if base.is_file():
+            found.add(Path(entry).as_posix())
+            continue
+        if not base.is_dir():
+            continue
+        for path in base.rglob('*'):
+            if path.is_file() and any(fnmatch.fnmatch(path.name, p) for p in patterns):
+                found.add(path.relative_to(root).as_posix())
+
+    return sorted(found)
+
+
+def shard_tests(
+    tests: List[str],
+    shards: int,
+    durations: Optional[Dict[str, float]] = None
+) -> List[List[str]]:
+    """
+    테스트 파일을 샤드로 분할
+
+    이전 실행의 파일별 실행 시간을 기준으로 가장 오래 걸리는 파일부터
+    현재 가장 가벼운 샤드에 배정합니다 (LPT). 그래서 샤드 간 실행 시간이 고르게 나뉩니다.
+
+    Args:
+        tests: 테스트 파일 목록
+        shards: 최대 샤드 수
+        durations: 파일별 이전 실행 시간 (초)
+
+    Returns:
+        샤드별 테스트 파일 목록 (빈 샤드 제외)
+    """
+    durations = durations or {}
+    count = max(1, min(shards, len(tests)))
+    buckets: List[List[str]] = [[] for _ in range(count)]
+    loads = [0.0] * count
+
+    ordered = sorted(tests, key=lambda t: (-durations.get(t, DEFAULT_FILE_DURATION), t))
+    for test in ordered:
+        lightest = loads.index(min(loads))
+        buckets[lightest].append(test)
+        loads[lightest] += durations.get(test, DEFAULT_FILE_DURATION)
+
+    return [sorted(bucket) for bucket in buckets if bucket]
+
+
+def _module_files(tests: List[str]) -> Dict[str, str]:
+    """모듈 경로(tests.unit.test_x) → 테스트 파일 매핑"""
+    modules = {}
+    for test in tests:
+        # 테스트 ID(file::Class::name)로 재실행한 경우 파일 부분만 사용
+        test = test.split('::', 1)[0]
+        module = str(Path(test).with_suffix('')).replace('/', '.').replace('\\', '.')
+        modules[module] = test
+    return modules
+
+
+def _test_file(classname: str, file_attr: Optional[str], modules: Dict[str, str]) -> Optional[str]:
+    """JUnit testcase 의 테스트 파일 추정 (file 속성 → classname 모듈 경로 순)"""
+    if file_attr:
+        return Path(file_attr).as_posix()
+
+    parts = classname.split('.')
+    for end in range(len(parts), 0, -1):
+        test = modules.get('.'.join(parts[:end]))
+        if test:
+            return test
+    return None
+
+
+def parse_junit(path: Path, tests: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    JUnit XML 결과 파싱 (report_parser.iter_junit 스트리밍)
+
+    Args:
+        path: JUnit XML 파일 경로
+        tests: 이 실행에 전달한 테스트 파일 (classname → 파일 매핑용)
+
+    Returns:
+        테스트 결과 목록 ({'id', 'file', 'name', 'status', 'duration', 'message'})
+    """
+    modules = _module_files(tests or [])
+    results = []
+
+    for case in iter_junit(path):
+        name = case['name']
+        classname = case['classname']
+        test_file = _test_file(classname, case['file'], modules)
+
+        # 파일을 알면 러너에 그대로 다시 넘길 수 있는 ID (file::Class::name)
+        if test_file:
+            module = str(Path(test_file).with_suffix('')).replace('/', '.')
+            inner = classname[len(module):].lstrip('.') if classname.startswith(module) else ''
+            test_id = '::'.join(part for part in (test_file, *inner.split('.'), name) if part)
+        else:
+            test_id = f"{classname}::{name}" if classname else name
+
+        results.append({
+            'id': test_id,
+            'file': test_file,
+            'name': name,
+            'status': case['status'],
+            'duration': case['duration'],
+            'message': case['message'],
+        })
+
+    return results
+
+
+class SuiteRunner:
+    """여러 스위트가 공유하는 테스트 러너 (프로세스 수/타임아웃 공동 제한)"""
+
+    def __init__(
+        self,
+        workdir: Path,
+        results_dir: str,
+        timeout: int,
+        max_workers: int,
+        deselect_format: str = '--deselect={id}',
+        sandbox: Optional[ProcessSandbox] = None
+    ):
+        """
+        Suite Runner 초기화
+
+        Args:
+            workdir: 테스트를 실행할 작업 디렉토리
+            results_dir: JUnit XML/로그/실행 시간 이력 저장 디렉토리
+            timeout: 전체 테스트 타임아웃 (초, 첫 스위트 시작 시점부터)
+            max_workers: 동시에 실행할 최대 러너 프로세스 수
+            deselect_format: {deselect} 자리표시자의 테스트 ID 하나당 인자 형식
+            sandbox: 러너 실행기 (자원 한도/로그 회전 설정, 기본값: 한도 없음)
+        """
+        self.workdir = Path(workdir)
+        self.results_dir = Path(results_dir)
+        self.timeout = timeout
+        self.max_workers = max(1, max_workers)
+        self.deselect_format = deselect_format
+        self.sandbox = sandbox or ProcessSandbox(results_dir)
+
+        self._slots = threading.BoundedSemaphore(self.max_workers)
+        self._lock = threading.Lock()
+        self._deadline: Optional[float] = None
+        self._durations: Optional[Dict[str, float]] = None
+
+    @property
+    def durations_file(self) -> Path:
+        return self.results_dir / 'durations.json'
+
+    def coverage_files(self, suite: str) -> List[Path]:
+        """스위트의 마지막 실행이 남긴 샤드별 coverage 데이터 파일"""
+        return sorted(self.results_dir.glob(f"{suite}-*.coverage"))
+
+    def _clean(self, suite: str) -> None:
+        """이전 실행의 샤드 결과 파일 삭제 (샤드 수가 줄어도 남지 않도록)"""
+        for pattern in (f"{suite}-*.xml", f"{suite}-*.coverage"):
+            for path in self.results_dir.glob(pattern):
+                path.unlink(missing_ok=True)
+
+    def _remaining(self) -> float:
+        """타임아웃까지 남은 시간 (초)"""
+        with self._lock:
+            if self._deadline is None:
+                self._deadline = time.monotonic() + self.timeout
+            return self._deadline - time.monotonic()
+
+    def file_durations(self) -> Dict[str, float]:
+        """이전 실행의 파일별 실행 시간"""
+        with self._lock:
+            if self._durations is None:
+                try:
+                    with open(self.durations_file, 'r', encoding='utf-8') as f:
+                        self._durations = json.load(f)
+                except (OSError, ValueError):
+                    self._durations = {}
+            return dict(self._durations)
+
+    def _save_durations(self, results: List[Dict[str, Any]]) -> None:
+        """이번 실행의 파일별 실행 시간을 이력에 반영"""
+        per_file: Dict[str, float] = {}
+        for result in results:
+            if result.get('file'):
+                per_file[result['file']] = per_file.get(result['file'], 0.0) + result['duration']
+        if not per_file:
+            return
+
+        self.file_durations()
+        with self._lock:
+            self._durations.update({k: round(v, 3) for k, v in per_file.items()})
+            try:
+                self.results_dir.mkdir(parents=True, exist_ok=True)
+                with open(self.durations_file, 'w', encoding='utf-8') as f:
+                    json.dump(self._durations, f, indent=2, sort_keys=True)
+            except OSError as e:
+                print(f"⚠️  테스트 실행 시간 이력 저장 실패: {e}")
+
+    def run_suite(
+        self,
+        suite: str,
+        command: str,
+        tests: List[str],
+        shards: int = 0,
+        label: Optional[str] = None,
+        deselect: List[str] = ()
+    ) -> Dict[str, Any]:
+        """
+        스위트 실행 (샤드별 러너 프로세스를 동시에 실행하고 결과 병합)
+
+        Args:
+            suite: 스위트 이름 (unit, integration, api)
+            command: 명령 템플릿
+            tests: 실행할 테스트 파일 (또는 재실행할 테스트 ID) 목록
+            shards: 최대 샤드 수 (0 = max_workers)
+            label: 결과 파일 이름 (재시도/격리 레인 구분용, 지정 시 실행 시간 이력은 갱신 안 함)
+            deselect: 제외할 테스트 ID
+
+        Returns:
+            스위트 결과 ({'type', 'passed', 'failed', 'skipped', 'shards', 'duration',
+            'timed_out', 'logs', 'failures', 'tests'}, logs 는 실패한 샤드의 로그 파일)
+        """
+        label = label or suite
+        template = []
+        for token in shlex.split(command):
+            if token == '{deselect}':
+                template.extend(self.deselect_format.format(id=test_id) for test_id in deselect)
+            else:
+                template.append(token)
+
+        if '{tests}' in template:
+            groups = shard_tests(tests, shards or self.max_workers, self.file_durations())
+        else:
+            groups = [tests]
+
+        self._clean(label)
+        started = time.monotonic()
+        shard_results = self._run_shards(label, template, groups) if groups else []
+
+        results = [test for shard in shard_results for test in shard['tests']]
+        if label == suite:
+            self._save_durations(results)
+
+        return {
+            'type': suite,
+            'passed': sum(1 for t in results if t['status'] == TEST_PASSED),
+            'failed': sum(1 for t in results if t['status'] == TEST_FAILED),
+            'skipped': sum(1 for t in results if t['status'] == TEST_SKIPPED),
+            'shards': len(groups),
+            'duration': round(time.monotonic() - started, 3),
+            'timed_out': any(shard['timed_out'] for shard in shard_results),
+            'logs': [shard['log'] for shard in shard_results if shard['log']],
+            'failures': [
+                {'id': t['id'], 'message': t['message']}
+                for t in results if t['status'] == TEST_FAILED
+            ],
+            'tests': results,
+        }
+
+    def _run_shards(
+        self,
+        suite: str,
+        template: List[str],
+        groups: List[List[str]]
+    ) -> List[Dict[str, Any]]:
+        """샤드를 동시에 실행 (실제 동시 프로세스 수는 공유 슬롯으로 제한)"""
+        with ThreadPoolExecutor(max_workers=len(groups), thread_name_prefix=f"qa-{suite}") as executor:
+            futures = [
+                # 샤드 span 이 현재 span 아래에 기록되도록 컨텍스트 복사
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._run_shard, suite, template, group, index, len(groups)
+                )
+                for index, group in enumerate(groups)
+            ]
+            return [future.result() for future in futures]
+
+    def _run_shard(
+        self,
+        suite: str,
+        template: List[str],
+        tests: List[str],
+        index: int,
+        total: int
+    ) -> Dict[str, Any]:
+        """샤드 하나 실행 (프로세스 슬롯을 얻은 뒤 실행, 타임아웃 시 프로세스 그룹 종료)"""
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+        junit = self.results_dir / f"{suite}-{index}.xml"
+        log = self.results_dir / f"{suite}-{index}.log"
+        coverage = self.results_dir / f"{suite}-{index}.coverage"
+
+        values = {'junit': str(junit), 'coverage': str(coverage), 'shard': index, 'shards': total}
+        argv: List[str] = []
+        for token in template:
+            if token == '{tests}':
+                argv.extend(tests)
+            else:
+                try:
+                    argv.append(token.format(**values))
+                except (KeyError, IndexError, ValueError):
+                    # 테스트 ID 등 자리표시자가 아닌 중괄호는 그대로 전달
+                    argv.append(token)
+
+        # 슬롯 대기도 타임아웃에 포함 (QA 전체가 TEST_TIMEOUT 안에 끝나도록)
+        acquired = self._slots.acquire(timeout=max(0.0, self._remaining()))
+        try:
+            returncode, timed_out = None, not acquired
+            if acquired:
+                returncode, timed_out = self._execute(argv, log, coverage, index, total)
+        finally:
+            if acquired:
+                self._slots.release()
+
+        tests_run: List[Dict[str, Any]] = []
+        if junit.exists():
+            try:
+                tests_run = parse_junit(junit, tests)
+            except ParseError as e:
+                print(f"⚠️  JUnit XML 파싱 실패 ({junit}): {e}")
+                tests_run = [self._synthetic(suite, index, f"invalid JUnit XML: {e}")]
+
+        if timed_out:
+            tests_run.append(self._synthetic(suite, index, f"timeout after {self.timeout}s"))
+        elif not tests_run:
+            # JUnit 결과가 없으면 종료 코드로 샤드 전체를 하나의 테스트로 기록
+            message = None if returncode == 0 else f"exit code {returncode} (see {log})"
+            tests_run.append(self._synthetic(suite, index, message))
+        elif returncode not in (0, None) and not any(t['status'] == TEST_FAILED for t in tests_run):
+            # 수집 오류 등으로 러너가 실패했는데 실패한 테스트가 없는 경우
+            tests_run.append(self._synthetic(suite, index, f"exit code {returncode} (see {log})"))
+
+        failed = timed_out or any(t['status'] == TEST_FAILED for t in tests_run)
+        return {'tests': tests_run, 'timed_out': timed_out, 'log': str(log) if failed and log.exists() else None}
+
+    def _execute(self, argv: List[str], log: Path, coverage: Path, index: int, total: int):
+        """러너 프로세스 실행 → (종료 코드, 타임아웃 여부)"""
+        env = dict(
+            os.environ,
+            TEST_SHARD_INDEX=str(index),
+            TEST_SHARD_TOTAL=str(total),
+            COVERAGE_FILE=str(coverage)
+        )
+        # 남은 시간이 없어도 0(제한 없음)이 되지 않도록
+        result = self.sandbox.run(
+            argv,
+            cwd=self.workdir,
+            env=env,
+            timeout=max(0.001, self._remaining()),
+            log=log,
+            shard=index
+        )
+        return result['returncode'], result['timed_out']
+
+    @staticmethod
+    def _synthetic(suite: str, index: int, message: Optional[str]) -> Dict[str, Any]:
+        """샤드 단위 가상 테스트 결과"""
+        return {
+            'id': f"{suite}[shard {index}]",
+            'file': None,
+            'name': f"shard {index}",
+            'status': TEST_PASSED if message is None else TEST_FAILED,
+            'duration': 0.0,
+            'message': message,
+        }
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Claude Code SubAgent - Timeline
+
+워크플로우 실행 구간을 Chrome trace-event JSON 으로 기록
+
+MainAgent --trace 실행 시 단계(step), 하위 단계(substep), 외부 호출(http, subprocess)의
+시작/종료 시각을 모아 체크포인트 옆에 <ticket>.trace.json 으로 저장합니다.
+결과 파일은 https://ui.perfetto.dev 또는 chrome://tracing 에서 열 수 있습니다.
+
+타임라인이 시작되지 않은 상태에서는 span()이 아무 일도 하지 않습니다.
+"""
+
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+def _now_us() -> int:
+    """epoch 기준 마이크로초 (프로세스 간 타임라인 병합이 가능하도록)"""
+    return time.time_ns() // 1000
+
+
+class Timeline:
+    """Chrome trace-event 수집기"""
+
+    def __init__(self, name: str):
+        """
+        Timeline 초기화
+
+        Args:
+            name: 프로세스 이름으로 표시할 값 (예: 티켓 ID)
+        """
+        self.name = name
+        self.pid = os.getpid()
+        self.events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._threads: Dict[int, str] = {}
+
+    def _append(self, event: Dict[str, Any]) -> None:
+        tid = threading.get_ident()
+        event.setdefault('pid', self.pid)
+        event.setdefault('tid', tid)
+        with self._lock:
+            self._threads.setdefault(tid, threading.current_thread().name)
+            self.events.append(event)
+
+    @contextmanager
+    def span(self, name: str, cat: str = 'step', **args: Any) -> Iterator[Dict[str, Any]]:
+        """
+        구간 기록 (complete event, ph=X)
+
+        Args:
+            name: 구간 이름
+            cat: 분류 (step, substep, http, subprocess, checkpoint)
+            **args: 이벤트 인자 (Perfetto 상세 패널에 표시)
+
+        Yields:
+            args 딕셔너리 (구간 안에서 결과 값을 추가할 수 있음)
+        """
+        event_args = {k: v for k, v in args.items() if v is not None}
+        start = _now_us()
+        try:
+            yield event_args
+        except BaseException as e:
+            event_args['error'] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self._append({
+                'name': name,
+                'cat': cat,
+                'ph': 'X',
+                'ts': start,
+                'dur': _now_us() - start,
+                'args': event_args,
+            })
+
+    def instant(self, name: str, cat: str = 'mark', **args: Any) -> None:
+        """순간 이벤트 기록 (ph=i)"""
+        self._append({
+            'name': name,
+            'cat': cat,
+            'ph': 'i',
+            's': 't',
+            'ts': _now_us(),
+            'args': args,
+        })
+
+    def to_dict(self) -> Dict[str, Any]:
+        """trace-event JSON 객체 반환 (메타데이터 이벤트 포함)"""
+        with self._lock:
+            events = list(self.events)
+            threads = dict(self._threads)
+
+        metadata = [{
+            'name': 'process_name',
+            'ph': 'M',
+            'pid': self.pid,
+            'args': {'name': self.name},
+        }]
+        for tid, thread_name in threads.items():
+            metadata.append({
+                'name': 'thread_name',
+                'ph': 'M',
+                'pid': self.pid,
+                'tid': tid,
+                'args': {'name': thread_name},
+            })
+
+        return {
+            'traceEvents': metadata + sorted(events, key=lambda e: e['ts']),
+            'displayTimeUnit': 'ms',
+        }
+
+    def export(self, path: Path) -> Path:
+        """
+        trace-event JSON 파일로 저장
+
+        Args:
+            path: 저장 경로
+
+        Returns:
+            저장된 파일 경로
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        return path
+
+
+# 현재 프로세스에서 활성화된 타임라인
+_active: Optional[Timeline] = None
+
+
+def start(name: str) -> Timeline:
+    """타임라인 기록 시작"""
+    global _active
+    _active = Timeline(name)
+    return _active
+
+
+def stop() -> Optional[Timeline]:
+    """타임라인 기록 종료 (기록된 Timeline 반환)"""
+    global _active
+    timeline, _active = _active, None
+    return timeline
+
+
+def current() -> Optional[Timeline]:
+    """활성 타임라인 (없으면 None)"""
+    return _active
+
+
+@contextmanager
+def span(name: str, cat: str = 'step', **args: Any) -> Iterator[Dict[str, Any]]:
+    """활성 타임라인이 있을 때만 구간 기록"""
+    timeline = _active
+    if timeline is None:
+        yield {}
+        return
+
+    with timeline.span(name, cat, **args) as event_args:
+        yield event_args
+
+
+def trace_path(checkpoint_dir: Path, ticket_id: str) -> Path:
+    """체크포인트 옆 trace 파일 경로"""
+    return Path(checkpoint_dir) / f"{ticket_id}.trace.json"
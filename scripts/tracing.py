@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Claude Code SubAgent - Tracing
+
+OpenTelemetry 기반 분산 트레이싱 헬퍼
+
+Exporter는 환경변수로 선택합니다:
+    OTEL_TRACES_EXPORTER=otlp      OTLP/HTTP 전송 (OTEL_EXPORTER_OTLP_ENDPOINT, 기본 http://localhost:4318)
+    OTEL_TRACES_EXPORTER=console   표준 출력으로 span 출력
+    OTEL_TRACES_EXPORTER=file      TRACE_FILE (기본 ./checkpoints/traces.jsonl) 에 JSON 한 줄씩 기록
+    OTEL_TRACES_EXPORTER=none      비활성화 (기본값, OTEL_EXPORTER_OTLP_ENDPOINT 지정 시 otlp)
+
+opentelemetry 패키지가 설치되어 있지 않거나 exporter가 none이면 모든 함수는
+아무 일도 하지 않으므로 호출부에서 분기할 필요가 없습니다.
+
+서브 프로세스로 실행되는 SubAgent에는 TRACEPARENT 환경변수로 컨텍스트를 전달하고,
+init_tracing()이 이를 읽어 부모 span 아래에 이어 붙입니다.
+"""
+
+import os
+import atexit
+import subprocess
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import timeline
+
+# init_tracing() 이후 설정되는 전역 상태
+_tracer = None
+_initialized = False
+
+# 서브 프로세스 전파용 환경변수 이름 ↔ W3C 헤더 이름
+_PROPAGATION_ENV = {
+    'TRACEPARENT': 'traceparent',
+    'TRACESTATE': 'tracestate',
+}
+
+
+def _exporter_name() -> str:
+    name = os.getenv('OTEL_TRACES_EXPORTER')
+    if name:
+        return name.lower()
+    return 'otlp' if os.getenv('OTEL_EXPORTER_OTLP_ENDPOINT') else 'none'
+
+
+def _build_exporter(name: str):
+    """exporter 이름에 맞는 SpanExporter 생성"""
+    if name == 'otlp':
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        return OTLPSpanExporter()
+
+    from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+
+    if name == 'console':
+        return ConsoleSpanExporter()
+
+    if name == 'file':
+        trace_file = Path(os.getenv('TRACE_FILE', './checkpoints/traces.jsonl'))
+        trace_file.parent.mkdir(parents=True, exist_ok=True)
+        out = open(trace_file, 'a', encoding='utf-8')
+        atexit.register(out.close)
+        return ConsoleSpanExporter(
+            out=out,
+            formatter=lambda span: span.to_json(indent=None) + "\n"
+        )
+
+    raise ValueError(f"Unknown OTEL_TRACES_EXPORTER: {name}")
+
+
+def init_tracing(service_name: str) -> bool:
+    """
+    TracerProvider 초기화 (프로세스당 한 번만 적용)
+
+    Args:
+        service_name: service.name 리소스 속성 (예: main-agent, qa-agent)
+
+    Returns:
+        트레이싱 활성화 여부
+    """
+    global _tracer, _initialized
+
+    if _initialized:
+        return _tracer is not None
+    _initialized = True
+
+    exporter_name = _exporter_name()
+    if exporter_name == 'none':
+        return False
+
+    try:
+        from opentelemetry import context, trace
+        from opentelemetry.propagate import extract
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    except ImportError:
+        print("⚠️  opentelemetry 패키지가 없어 트레이싱을 건너뜁니다.")
+        return False
+
+    try:
+        exporter = _build_exporter(exporter_name)
+    except Exception as e:
+        print(f"⚠️  트레이싱 exporter 초기화 실패: {e}")
+        return False
+
+    provider = TracerProvider(resource=Resource.create({'service.name': service_name}))
+    provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    atexit.register(provider.shutdown)
+
+    # 부모 프로세스(MainAgent)가 넘겨준 컨텍스트 이어받기
+    carrier = {
+        header: os.environ[env]
+        for env, header in _PROPAGATION_ENV.items()
+        if os.environ.get(env)
+    }
+    if carrier:
+        context.attach(extract(carrier))
+
+    _tracer = trace.get_tracer('tkm.automation')
+    return True
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Any]]:
+    """
+    span 컨텍스트 매니저
+
+    예외가 발생하면 span에 기록하고 ERROR 상태로 표시한 뒤 다시 던집니다.
+
+    Args:
+        name: span 이름
+        **attributes: span 속성 (None 값은 무시)
+
+    Yields:
+        Span 객체 (트레이싱 비활성화 시 None)
+    """
+    if _tracer is None:
+        yield None
+        return
+
+    attrs = {k: v for k, v in attributes.items() if v is not None}
+    with _tracer.start_as_current_span(name, attributes=attrs) as current:
+        yield current
+
+
+def set_attributes(current: Optional[Any], **attributes: Any) -> None:
+    """span이 있을 때만 속성 추가"""
+    if current is None:
+        return
+    for key, value in attributes.items():
+        if value is not None:
+            current.set_attribute(key, value)
+
+
+def inject_env(env: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """
+    현재 trace 컨텍스트를 서브 프로세스용 환경변수에 주입
+
+    Args:
+        env: 기반 환경변수 (기본값: os.environ 복사본)
+
+    Returns:
+        TRACEPARENT/TRACESTATE가 추가된 환경변수 딕셔너리
+    """
+    env = dict(os.environ if env is None else env)
+    if _tracer is None:
+        return env
+
+    from opentelemetry.propagate import inject
+
+    carrier: Dict[str, str] = {}
+    inject(carrier)
+    for env_name, header in _PROPAGATION_ENV.items():
+        if header in carrier:
+            env[env_name] = carrier[header]
+    return env
+
+
+def traced_run(cmd: List[str], **kwargs: Any) -> subprocess.CompletedProcess:
+    """
+    subprocess.run 래퍼 (git/gh 등 외부 명령 span 기록)
+
+    trace 컨텍스트를 환경변수로 전달하므로 SubAgent 스크립트를 실행하면
+    자식 프로세스의 span이 현재 span 아래에 연결됩니다.
+
+    Args:
+        cmd: 실행할 명령
+        **kwargs: subprocess.run 인자
+
+    Returns:
+        subprocess.CompletedProcess
+    """
+    command = ' '.join(cmd[:3])
+
+    with timeline.span(command, 'subprocess') as event_args, span(
+        f"subprocess {cmd[0]}",
+        **{
+            'process.executable.name': cmd[0],
+            'process.command': command,
+        }
+    ) as current:
+        kwargs['env'] = inject_env(kwargs.get('env'))
+        result = subprocess.run(cmd, **kwargs)
+        set_attributes(current, **{'process.exit_code': result.returncode})
+        event_args['exit_code'] = result.returncode
+        return result
@@ -4,14 +4,14 @@ JIRA 이슈 상태 업데이트 스크립트
 """
 
 import sys
-import requests
+import http_client
 import base64
 from config import get_config
 
 
 def update_status(issue_key, transition_id):
     """JIRA 이슈 상태 전환"""
-    config = get_config()
+    config = get_config(require=('jira',))
 
     # 인증 헤더 생성
     auth_string = f"{config.jira_email}:{config.jira_api_token}"
@@ -28,7 +28,14 @@ def update_status(issue_key, transition_id):
     url = f"{config.jira_url}/rest/api/2/issue/{issue_key}/transitions"
     payload = {"transition": {"id": transition_id}}
 
-    response = requests.post(url, json=payload, headers=headers, timeout=10)
+    response = http_client.post(
+        url,
+        endpoint='/rest/api/2/issue/{issueKey}/transitions',
+        service='jira',
+        json=payload,
+        headers=headers,
+        timeout=10
+    )
 
     if response.status_code == 204:
         print(f"✅ JIRA 이슈 상태 변경 완료: {issue_key}")
@@ -3,7 +3,7 @@
 Sprint 이슈 목록 조회 스크립트
 """
 
-import requests
+import http_client
 import base64
 import sys
 from config import get_config
@@ -11,7 +11,7 @@ from config import get_config
 
 def view_sprint_issues(sprint_id):
     """Sprint의 이슈 목록 조회"""
-    config = get_config()
+    config = get_config(require=('jira',))
 
     # 인증 헤더 생성
     auth_string = f"{config.jira_email}:{config.jira_api_token}"
@@ -31,7 +31,14 @@ def view_sprint_issues(sprint_id):
         'fields': 'summary,status,priority,assignee,labels,description'
     }
 
-    response = requests.get(url, headers=headers, params=params, timeout=10)
+    response = http_client.get(
+        url,
+        endpoint='/rest/agile/1.0/sprint/{sprintId}/issue',
+        service='jira',
+        headers=headers,
+        params=params,
+        timeout=10
+    )
 
     if response.status_code == 200:
         data = response.json()
@@ -0,0 +1,630 @@
+#!/usr/bin/env python3
+"""
+Claude Code SubAgent - Warm Workspace Pool
+
+미리 준비해 둔 작업 디렉토리(저장소 fetch, 의존성 설치, 캐시 예열 완료) N개를 MainAgent 실행에 빌려주는 풀
+
+티켓마다 새로 clone 하고 pip/npm/Maven/Gradle 의존성을 다시 받는 대신, 풀에서 준비된 작업 디렉토리를 빌려
+바로 워크플로우를 시작합니다. 완료된 실행이 반납한 작업 디렉토리는 백그라운드에서 베이스 브랜치 최신 상태로 되돌리고,
+의존성 매니페스트(requirements.txt, package-lock.json, pom.xml, build.gradle ...)가 바뀐 경우에만 준비 명령을 다시 실행합니다.
+실패/중단된 실행의 작업 디렉토리는 작업 트리를 그대로 보존(held)해 두었다가 같은 티켓의 --resume 에 다시 빌려줍니다
+(같은 티켓의 새 실행/--restart 또는 `refresh --discard` 때만 초기화).
+의존성 다운로드 캐시(pip, npm, Maven, Gradle)는 모든 작업 디렉토리가 WORKSPACE_CACHE_DIR 를 공유합니다.
+
+저장 구조 (<WORKSPACE_POOL_DIR>):
+    ws-0/repo/             작업 디렉토리 (저장소 checkout)
+    ws-0/workspace.json    상태 {"status": "ready", "head": ..., "deps": ..., "prepared_at": ..., "lease": ...}
+    ws-0.lock              대여 잠금 (flock, 프로세스가 죽으면 자동 해제)
+    ws-0.log               백그라운드 갱신 로그
+    cache/                 공유 의존성 캐시
+
+사용법:
+    python scripts/workspace_pool.py status
+    python scripts/workspace_pool.py refresh            # 반납/오래된 작업 디렉토리 갱신
+    python scripts/workspace_pool.py refresh --daemon   # WORKSPACE_REFRESH_INTERVAL 마다 반복
+    python scripts/workspace_pool.py refresh --name ws-0 --discard   # 보존 중인 작업 디렉토리 초기화
+"""
+
+import os
+import sys
+import json
+import time
+import fcntl
+import shlex
+import shutil
+import hashlib
+import argparse
+import subprocess
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from sandbox import ProcessSandbox, failure_reason, sandbox_from_config
+from tracing import span, traced_run
+
+# 작업 디렉토리 상태
+STATUS_READY = "ready"
+STATUS_DIRTY = "dirty"
+STATUS_LEASED = "leased"
+STATUS_HELD = "held"
+STATUS_BROKEN = "broken"
+
+# 의존성 해시에 포함할 매니페스트 (하위 디렉토리 포함)
+DEPENDENCY_FILES = [
+    'requirements*.txt', 'pyproject.toml', 'poetry.lock', 'Pipfile.lock',
+    'package.json', 'package-lock.json', 'yarn.lock', 'pnpm-lock.yaml',
+    'pom.xml', 'build.gradle', 'build.gradle.kts', 'settings.gradle', 'settings.gradle.kts',
+    'gradle-wrapper.properties',
+]
+
+# 대여 중인 작업 디렉토리로 옮길 때 절대 경로로 고정할 경로 설정 (체크포인트/캐시는 원래 위치에 계속 기록)
+PATH_VARIABLES = (
+    'CHECKPOINT_DIR', 'STEP_CACHE_DIR', 'QA_RESULTS_DIR', 'QA_FLAKE_DB',
+    'REVIEW_CACHE_DIR', 'BUILD_CACHE_DIR', 'DOCS_CACHE_DIR', 'FAILURE_DB',
+    'SANDBOX_LOG_DIR',
+)
+
+
+def _git(repo: Path, *args: str, check: bool = True) -> str:
+    result = traced_run(['git', *args], cwd=repo, capture_output=True, text=True, check=False)
+    if check and result.returncode != 0:
+        raise RuntimeError(f"git {' '.join(args[:2])} 실패: {result.stderr.strip()}")
+    return result.stdout.strip()
+
+
+def cache_env(cache_dir: Path, repo: Optional[Path] = None) -> Dict[str, str]:
+    """
+    공유 의존성 캐시와 작업 디렉토리 가상환경을 가리키는 환경변수
+
+    Args:
+        cache_dir: 공유 캐시 디렉토리
+        repo: 작업 디렉토리 (.venv 가 있으면 PATH 앞에 추가)
+
+    Returns:
+        os.environ 에 덮어쓸 환경변수
+    """
+    env = {
+        'PIP_CACHE_DIR': str(cache_dir / 'pip'),
+        'npm_config_cache': str(cache_dir / 'npm'),
+        'GRADLE_USER_HOME': str(cache_dir / 'gradle'),
+        'MAVEN_OPTS': f"{os.environ.get('MAVEN_OPTS', '')} -Dmaven.repo.local={cache_dir / 'm2'}".strip(),
+    }
+    venv = repo / '.venv' if repo else None
+    if venv and venv.is_dir():
+        env['VIRTUAL_ENV'] = str(venv)
+        env['PATH'] = f"{venv / 'bin'}{os.pathsep}{os.environ.get('PATH', '')}"
+    return env
+
+
+def detect_prepare_commands(repo: Path) -> List[List[str]]:
+    """
+    작업 디렉토리의 의존성 준비 명령 감지
+
+    Args:
+        repo: 작업 디렉토리
+
+    Returns:
+        실행할 명령 목록 (argv)
+    """
+    commands: List[List[str]] = []
+    if (repo / 'requirements.txt').exists():
+        commands.append([sys.executable, '-m', 'venv', '.venv'])
+        commands.append(['.venv/bin/python', '-m', 'pip', 'install', '-q', '-r', 'requirements.txt'])
+    if (repo / 'package-lock.json').exists():
+        commands.append(['npm', 'ci', '--prefer-offline', '--no-audit', '--no-fund'])
+    elif (repo / 'package.json').exists():
+        commands.append(['npm', 'install', '--prefer-offline', '--no-audit', '--no-fund'])
+    if (repo / 'gradlew').exists():
+        commands.append(['./gradlew', '--quiet', 'dependencies'])
+    elif (repo / 'build.gradle').exists() or (repo / 'build.gradle.kts').exists():
+        commands.append(['gradle', '--quiet', 'dependencies'])
+    if (repo / 'pom.xml').exists():
+        commands.append(['mvn', '-B', '-q', 'dependency:go-offline'])
+    return commands
+
+
+class Lease:
+    """대여한 작업 디렉토리 (with 블록 동안 cwd/환경변수를 작업 디렉토리로 전환)"""
+
+    def __init__(self, pool: 'WorkspacePool', name: str, lock_fd: int):
+        self.pool = pool
+        self.name = name
+        self.repo = pool.root / name / 'repo'
+        self._lock_fd = lock_fd
+        self._cwd: Optional[str] = None
+        self._env: Dict[str, Optional[str]] = {}
+
+    def __enter__(self) -> 'Lease':
+        overrides = cache_env(self.pool.cache_dir, self.repo)
+        for name in PATH_VARIABLES:
+            value = os.environ.get(name) or ('./checkpoints' if name == 'CHECKPOINT_DIR' else None)
+            if value:
+                overrides[name] = str(Path(value).resolve())
+
+        for name, value in overrides.items():
+            self._env[name] = os.environ.get(name)
+            os.environ[name] = value
+
+        self._cwd = os.getcwd()
+        os.chdir(self.repo)
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if self._cwd:
+            os.chdir(self._cwd)
+        for name, value in self._env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+        # MainAgent 는 워크플로우 실패/중단 시 sys.exit(1) 로 끝남
+        completed = exc_type is None or (exc_type is SystemExit and exc.code in (None, 0))
+        self.release(completed=completed)
+
+    def release(self, completed: bool = True, refresh: bool = True) -> None:
+        """
+        반납 후 잠금 해제
+
+        완료된 실행이면 상태를 dirty 로 바꾸고 백그라운드 갱신을 시작합니다.
+        실패/중단된 실행이면 --resume 에 쓸 수 있도록 작업 트리를 그대로 두고 해당 티켓용으로 보존(held)합니다.
+
+        Args:
+            completed: 워크플로우가 끝까지 완료되었는지 여부
+            refresh: 완료된 경우 반납 직후 이 작업 디렉토리를 백그라운드로 갱신할지 여부
+        """
+        if self._lock_fd < 0:
+            return
+        state = self.pool._read_state(self.name)
+        if completed:
+            state = dict(state, status=STATUS_DIRTY, lease=None)
+        else:
+            lease = dict(state.get('lease') or {}, pid=None, released_at=datetime.now().isoformat())
+            state = dict(state, status=STATUS_HELD, lease=lease)
+        self.pool._write_state(self.name, state)
+        os.close(self._lock_fd)
+        self._lock_fd = -1
+
+        if not completed:
+            print(f"📌 작업 디렉토리 {self.name} 보존 (--resume 시 재사용): {self.repo}")
+        elif refresh:
+            log = open(self.pool.root / f"{self.name}.log", 'ab')
+            subprocess.Popen(
+                [sys.executable, str(Path(__file__).resolve()), 'refresh', '--name', self.name],
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                stdin=subprocess.DEVNULL,
+                start_new_session=True
+            )
+            log.close()
+
+
+class WorkspacePool:
+    """준비된 작업 디렉토리 풀"""
+
+    def __init__(
+        self,
+        root: str,
+        source: str,
+        size: int,
+        base_branch: str,
+        prepare_commands: Optional[List[str]] = None,
+        cache_dir: Optional[str] = None,
+        max_age_minutes: int = 30,
+        prepare_timeout: int = 1800,
+        sandbox: Optional[ProcessSandbox] = None
+    ):
+        """
+        Workspace Pool 초기화
+
+        Args:
+            root: 풀 디렉토리
+            source: clone 할 저장소 (URL 또는 경로)
+            size: 작업 디렉토리 수
+            base_branch: 준비 상태의 기준 브랜치 (origin/<브랜치>)
+            prepare_commands: 의존성 준비 명령 (없으면 매니페스트로 자동 감지)
+            cache_dir: 공유 의존성 캐시 디렉토리 (기본: <root>/cache)
+            max_age_minutes: 마지막 갱신 후 이 시간이 지나면 대여 전에 다시 fetch
+            prepare_timeout: 준비 명령 하나의 제한 시간 (초)
+            sandbox: 준비 명령 실행기 (자원 한도/로그 회전 설정, 기본값: <root>/logs, 한도 없음)
+        """
+        self.root = Path(root).expanduser().resolve()
+        self.source = source
+        self.size = size
+        self.base_branch = base_branch
+        self.prepare_commands = prepare_commands or []
+        self.cache_dir = Path(cache_dir).expanduser().resolve() if cache_dir else self.root / 'cache'
+        self.max_age = timedelta(minutes=max_age_minutes)
+        self.prepare_timeout = prepare_timeout
+        self.sandbox = sandbox or ProcessSandbox(str(self.root / 'logs'))
+
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def names(self) -> List[str]:
+        return [f"ws-{index}" for index in range(self.size)]
+
+    def _state_path(self, name: str) -> Path:
+        return self.root / name / 'workspace.json'
+
+    def _read_state(self, name: str) -> Dict[str, Any]:
+        try:
+            with open(self._state_path(name), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_state(self, name: str, state: Dict[str, Any]) -> None:
+        path = self._state_path(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def _try_lock(self, name: str) -> int:
+        """대여 잠금 시도 (성공 시 fd, 이미 사용 중이면 -1)"""
+        fd = os.open(self.root / f"{name}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return -1
+        return fd
+
+    @staticmethod
+    def _held_for(state: Dict[str, Any]) -> Optional[str]:
+        """작업 트리를 보존 중인 티켓 ID (실패/중단으로 반납됐거나 대여 중 프로세스가 죽은 경우)"""
+        if state.get('status') in (STATUS_HELD, STATUS_LEASED):
+            return (state.get('lease') or {}).get('ticket_id')
+        return None
+
+    def _fresh(self, state: Dict[str, Any]) -> bool:
+        if state.get('status') != STATUS_READY or not state.get('prepared_at'):
+            return False
+        return datetime.now() - datetime.fromisoformat(state['prepared_at']) < self.max_age
+
+    def _dependency_hash(self, repo: Path) -> str:
+        """의존성 매니페스트의 blob 해시 (파일을 읽지 않고 Git 인덱스에서 계산)"""
+        pathspec = [f":(glob)**/{pattern}" for pattern in DEPENDENCY_FILES]
+        listing = _git(repo, 'ls-files', '-s', '--', *pathspec)
+        return hashlib.sha256(listing.encode('utf-8')).hexdigest()
+
+    def refresh(self, name: str) -> Dict[str, Any]:
+        """
+        작업 디렉토리를 준비 상태로 갱신 (호출 측이 잠금 보유)
+
+        clone(처음) → fetch → 베이스 브랜치로 reset/clean(무시 파일의 의존성은 유지) →
+        의존성 매니페스트가 바뀌었으면 준비 명령 실행
+
+        Args:
+            name: 작업 디렉토리 이름
+
+        Returns:
+            갱신된 상태
+        """
+        repo = self.root / name / 'repo'
+        state = self._read_state(name)
+        started = time.monotonic()
+
+        with span('workspace.refresh', **{'workspace.name': name}):
+            try:
+                if not (repo / '.git').exists():
+                    # 이전 clone 이 중간에 실패했으면 남은 파일 정리
+                    shutil.rmtree(repo, ignore_errors=True)
+                    repo.parent.mkdir(parents=True, exist_ok=True)
+                    _git(repo.parent, 'clone', '--quiet', self.source, str(repo))
+                    state = {}
+
+                _git(repo, 'fetch', '--quiet', '--prune', 'origin')
+                _git(repo, 'checkout', '--quiet', '--force', '-B', self.base_branch, f"origin/{self.base_branch}")
+                _git(repo, 'clean', '-fdq')
+
+                deps = self._dependency_hash(repo)
+                prepared = False
+                if deps != state.get('deps') or state.get('status') == STATUS_BROKEN:
+                    env = dict(os.environ, **cache_env(self.cache_dir))
+                    commands = (
+                        [shlex.split(command) for command in self.prepare_commands]
+                        or detect_prepare_commands(repo)
+                    )
+                    for index, argv in enumerate(commands):
+                        print(f"   $ {' '.join(argv)}")
+                        result = self.sandbox.run(
+                            argv,
+                            cwd=repo,
+                            env=env,
+                            timeout=self.prepare_timeout,
+                            name=f"workspace-{name}-prepare-{index}"
+                        )
+                        if not result['success']:
+                            tail = (result['stdout'] + result['stderr']).strip().splitlines()[-5:]
+                            raise RuntimeError(
+                                f"{argv[0]} 실패 ({failure_reason(result)}): {' / '.join(tail)} (로그: {result['log']})"
+                            )
+                    prepared = True
+
+                state = {
+                    'status': STATUS_READY,
+                    'head': _git(repo, 'rev-parse', 'HEAD'),
+                    'deps': deps,
+                    'prepared_at': datetime.now().isoformat(),
+                    'dependencies_installed': prepared,
+                    'duration_seconds': round(time.monotonic() - started, 3),
+                    'error': None,
+                }
+            except Exception as e:
+                state = dict(state, status=STATUS_BROKEN, error=str(e))
+
+        self._write_state(name, state)
+        return state
+
+    def acquire(
+        self,
+        ticket_id: str,
+        resume: bool = False,
+        workspace: Optional[str] = None,
+        branch: Optional[str] = None
+    ) -> Optional[Lease]:
+        """
+        작업 디렉토리 대여 (준비되고 최신인 것 우선, 없으면 비어 있는 것을 그 자리에서 갱신)
+
+        재개(resume)이면 이 티켓용으로 보존 중인 작업 디렉토리를 갱신 없이 그대로 빌려줍니다.
+        보존된 것이 없으면 준비된 작업 디렉토리에서 origin/<branch> 를 checkout 합니다.
+        새 실행/재시작이면 이 티켓용으로 보존 중이던 작업 디렉토리는 초기화해서 다시 씁니다.
+        다른 티켓용으로 보존 중인 작업 디렉토리는 건너뜁니다.
+
+        Args:
+            ticket_id: 대여하는 티켓 ID
+            resume: 체크포인트에서 재개하는 실행인지 여부
+            workspace: 체크포인트에 기록된 이전 실행의 작업 디렉토리 이름
+            branch: 체크포인트에 기록된 작업 브랜치 (보존된 작업 디렉토리가 없을 때 checkout)
+
+        Returns:
+            Lease 또는 None (모두 사용 중이거나 준비 실패)
+        """
+        states = {name: self._read_state(name) for name in self.names}
+
+        if resume:
+            held = [name for name in self.names if self._held_for(states[name]) == ticket_id]
+            held.sort(key=lambda name: name != workspace)
+            for name in held:
+                fd = self._try_lock(name)
+                if fd < 0:
+                    continue
+                state = self._read_state(name)
+                if self._held_for(state) != ticket_id:
+                    os.close(fd)
+                    continue
+                print(f"♻️  이전 실행의 작업 디렉토리 {name} 재사용 (작업 트리 보존)")
+                return self._lease(name, fd, state, ticket_id)
+
+        order = sorted(self.names, key=lambda name: (not self._fresh(states[name]), name))
+        for name in order:
+            fd = self._try_lock(name)
+            if fd < 0:
+                continue
+
+            state = self._read_state(name)
+            owner = self._held_for(state)
+            if owner and owner != ticket_id:
+                os.close(fd)
+                continue
+
+            if not self._fresh(state):
+                print(f"🔄 작업 디렉토리 {name} 갱신 중 (대기 중인 준비된 작업 디렉토리 없음)")
+                state = self.refresh(name)
+                if state['status'] != STATUS_READY:
+                    print(f"⚠️  작업 디렉토리 {name} 준비 실패: {state.get('error')}")
+                    os.close(fd)
+                    continue
+
+            if resume and branch:
+                self._checkout_branch(name, branch)
+            return self._lease(name, fd, state, ticket_id)
+
+        return None
+
+    def _lease(self, name: str, fd: int, state: Dict[str, Any], ticket_id: str) -> Lease:
+        self._write_state(name, dict(
+            state,
+            status=STATUS_LEASED,
+            lease={'ticket_id': ticket_id, 'pid': os.getpid(), 'leased_at': datetime.now().isoformat()}
+        ))
+        return Lease(self, name, fd)
+
+    def _checkout_branch(self, name: str, branch: str) -> None:
+        """보존된 작업 트리가 없는 재개: 원격에 올라간 작업 브랜치를 checkout"""
+        repo = self.root / name / 'repo'
+        if _git(repo, 'rev-parse', '--verify', '--quiet', f"origin/{branch}", check=False):
+            _git(repo, 'checkout', '--quiet', '-B', branch, f"origin/{branch}")
+            print(f"🌿 작업 브랜치 checkout: origin/{branch}")
+        else:
+            print(f"⚠️  이전 작업 트리와 origin/{branch} 가 없어 {self.base_branch} 기준으로 재개합니다")
+
+    def refresh_idle(self, names: Optional[List[str]] = None, discard: bool = False) -> int:
+        """
+        사용 중이 아닌 작업 디렉토리 중 준비되지 않았거나 오래된 것을 갱신
+
+        Args:
+            names: 대상 작업 디렉토리 (기본: 전체)
+            discard: 실패한 실행용으로 보존 중인 작업 디렉토리도 초기화할지 여부
+
+        Returns:
+            갱신한 작업 디렉토리 수
+        """
+        refreshed = 0
+        for name in names or self.names:
+            if self._fresh(self._read_state(name)):
+                continue
+            fd = self._try_lock(name)
+            if fd < 0:
+                continue
+            try:
+                owner = self._held_for(self._read_state(name))
+                if owner and not discard:
+                    print(f"📌 {name}: {owner} 재개용으로 보존 중 (초기화하려면 --discard)")
+                    continue
+                state = self.refresh(name)
+                refreshed += 1
+                icon = "✅" if state['status'] == STATUS_READY else "❌"
+                print(f"{icon} {name}: {state['status']} ({state.get('duration_seconds', 0)}초) {state.get('error') or ''}")
+            finally:
+                os.close(fd)
+        return refreshed
+
+    def status(self) -> List[Dict[str, Any]]:
+        """작업 디렉토리별 상태 (대여 잠금 여부 포함)"""
+        rows = []
+        for name in self.names:
+            state = self._read_state(name)
+            fd = self._try_lock(name)
+            if fd >= 0:
+                os.close(fd)
+            rows.append(dict(state, name=name, locked=fd < 0, fresh=self._fresh(state)))
+        return rows
+
+
+def pool_from_config(config=None) -> Optional[WorkspacePool]:
+    """
+    설정의 작업 디렉토리 풀 (WORKSPACE_POOL_SIZE=0 이면 None)
+
+    Args:
+        config: Config 인스턴스 (기본: get_config())
+    """
+    if config is None:
+        from config import get_config
+        config = get_config()
+
+    settings = config.workspace
+    if settings.pool_size <= 0:
+        return None
+
+    source = settings.source
+    if not source:
+        # 기본: 현재 저장소의 origin (없으면 현재 저장소 경로)
+        source = _git(Path('.'), 'remote', 'get-url', 'origin', check=False) or str(Path('.').resolve())
+
+    return WorkspacePool(
+        settings.pool_dir,
+        source,
+        settings.pool_size,
+        settings.base_branch,
+        prepare_commands=settings.prepare_commands,
+        cache_dir=settings.cache_dir,
+        max_age_minutes=settings.max_age_minutes,
+        prepare_timeout=settings.prepare_timeout,
+        sandbox=sandbox_from_config(config)
+    )
+
+
+def _checkpoint_lease(checkpoint_dir: str, ticket_id: str) -> Dict[str, Optional[str]]:
+    """체크포인트에 기록된 이전 실행의 작업 디렉토리 이름과 작업 브랜치"""
+    try:
+        with open(Path(checkpoint_dir) / f"{ticket_id}.json", 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return {'workspace': (state.get('metadata') or {}).get('workspace'), 'branch': state.get('branch')}
+
+
+@contextmanager
+def warm_workspace(ticket_id: str, resume: bool = False) -> Iterator[Optional[Lease]]:
+    """
+    MainAgent 실행용 작업 디렉토리 대여 (풀을 쓰지 않거나 빈 작업 디렉토리가 없으면 현재 디렉토리에서 실행)
+
+    with 블록 동안 cwd 와 의존성 캐시 환경변수가 대여한 작업 디렉토리로 바뀌고, 끝나면 반납됩니다.
+    블록이 예외(sys.exit(1) 포함)로 끝나면 작업 트리를 이 티켓용으로 보존하고,
+    resume 이면 체크포인트 metadata.workspace 에 기록된 작업 디렉토리를 다시 빌립니다.
+
+    Args:
+        ticket_id: JIRA 티켓 ID
+        resume: 체크포인트에서 재개하는 실행인지 여부
+
+    Yields:
+        Lease 또는 None
+    """
+    from config import get_config
+
+    pool = pool_from_config()
+    previous = _checkpoint_lease(get_config().checkpoint_dir, ticket_id) if pool and resume else {}
+    lease = pool.acquire(ticket_id, resume=resume, **previous) if pool else None
+    if pool and lease is None:
+        print("⚠️  사용할 수 있는 준비된 작업 디렉토리가 없어 현재 디렉토리에서 실행합니다")
+    if lease is None:
+        yield None
+        return
+
+    started = time.monotonic()
+    with lease:
+        # 체크포인트/캐시 경로를 절대 경로로 고정한 환경변수로 설정 다시 읽기
+        get_config(reload=True)
+        print(f"🏎️  준비된 작업 디렉토리 사용: {lease.repo} ({time.monotonic() - started:.2f}초)")
+        try:
+            yield lease
+        finally:
+            get_config(reload=True)
+
+
+def print_status(pool: WorkspacePool) -> None:
+    """작업 디렉토리별 상태 출력"""
+    for row in pool.status():
+        lease = row.get('lease') or {}
+        print(
+            f"{row['name']}: {row.get('status', 'empty')}"
+            f"{' (사용 중: ' + str(lease.get('ticket_id')) + ')' if row['locked'] else ''}"
+            f"{' (보존: ' + str(lease.get('ticket_id')) + ')' if not row['locked'] and lease else ''}"
+            f"{'' if row['fresh'] else ' [갱신 필요]'} head={str(row.get('head', ''))[:10]} "
+            f"prepared_at={row.get('prepared_at')} {row.get('error') or ''}"
+        )
+
+
+def refresh_loop(
+    pool: WorkspacePool,
+    names: Optional[List[str]] = None,
+    daemon: bool = False,
+    discard: bool = False
+) -> None:
+    """
+    사용 중이 아닌 작업 디렉토리 갱신 (daemon 이면 WORKSPACE_REFRESH_INTERVAL 마다 반복)
+
+    Args:
+        pool: 작업 디렉토리 풀
+        names: 대상 작업 디렉토리 (기본: 전체)
+        daemon: 반복 실행 여부
+        discard: 실패한 실행용으로 보존 중인 작업 디렉토리도 초기화할지 여부
+    """
+    from config import get_config
+
+    while True:
+        pool.refresh_idle(names, discard=discard)
+        if not daemon:
+            return
+        time.sleep(get_config(hot_reload=True).workspace.refresh_interval)
+
+
+def main():
+    """작업 디렉토리 풀 상태 조회/갱신"""
+    parser = argparse.ArgumentParser(description="Warm Workspace Pool")
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('status', help='작업 디렉토리별 상태')
+    refresh = sub.add_parser('refresh', help='사용 중이 아닌 작업 디렉토리 갱신')
+    refresh.add_argument('--name', action='append', help='대상 작업 디렉토리 (반복 지정 가능)')
+    refresh.add_argument('--daemon', action='store_true', help='WORKSPACE_REFRESH_INTERVAL 마다 반복')
+    refresh.add_argument('--discard', action='store_true', help='실패한 실행용으로 보존 중인 작업 디렉토리도 초기화')
+    args = parser.parse_args()
+
+    pool = pool_from_config()
+    if pool is None:
+        print("❌ WORKSPACE_POOL_SIZE 가 0 입니다 (작업 디렉토리 풀 비활성화)")
+        sys.exit(1)
+
+    if args.command == 'status':
+        print_status(pool)
+    else:
+        refresh_loop(pool, args.name, daemon=args.daemon, discard=args.discard)
+
+
+if __name__ == '__main__':
+    main()